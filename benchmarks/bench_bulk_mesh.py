@@ -0,0 +1,85 @@
+"""Benchmark the construction of orphan meshes with ``PartFromNodesAndElements`` from NumPy arrays.
+
+Run this script from the root of the repository::
+
+    python benchmarks/bench_bulk_mesh.py --size 60
+
+A structured block of size**3 hexahedra is created from C-contiguous arrays, then from tuples of tuples as a script
+reading an input file would, and by creating the MeshNode and MeshElement objects one at a time. The first query
+of the coordinates of the nodes is timed too: it is free for the parts created from arrays, whose coordinates are
+shared with the node array.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=60, help="number of elements along each axis of the block")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(SRC))
+    os.environ["ABQPY_SKIP_ABAQUS"] = "true"
+    import numpy as np
+
+    from abaqus.Mesh.MeshElement import MeshElement
+    from abaqus.Mesh.MeshElementArray import MeshElementArray
+    from abaqus.Mesh.MeshNode import MeshNode
+    from abaqus.Mesh.MeshNodeArray import MeshNodeArray
+    from abaqus.Part.Part import Part
+    from abaqus.UtilityAndView.abaqusConstants import C3D8R, DEFORMABLE_BODY, THREE_D
+
+    n = args.size
+    coordinates = np.indices((n + 1,) * 3, dtype=np.float64).reshape(3, -1).T.copy()
+    nodeLabels = np.arange(1, len(coordinates) + 1)
+    ids = np.arange((n + 1) ** 3).reshape(n + 1, n + 1, n + 1)[:-1, :-1, :-1].ravel()
+    dx, dy = (n + 1) ** 2, n + 1
+    bottom = np.stack((ids, ids + dx, ids + dx + dy, ids + dy), axis=1)
+    connectivity = np.concatenate((bottom, bottom + 1), axis=1) + 1
+    elementLabels = np.arange(1, len(connectivity) + 1)
+
+    def fromArrays():
+        return Part("block", THREE_D, DEFORMABLE_BODY).PartFromNodesAndElements(
+            "block", THREE_D, DEFORMABLE_BODY, (nodeLabels, coordinates), (("C3D8R", elementLabels, connectivity),)
+        )
+
+    nodes = (tuple(nodeLabels.tolist()), tuple(map(tuple, coordinates.tolist())))
+    elements = (("C3D8R", tuple(elementLabels.tolist()), tuple(map(tuple, connectivity.tolist()))),)
+
+    def fromTuples():
+        return Part("block", THREE_D, DEFORMABLE_BODY).PartFromNodesAndElements(
+            "block", THREE_D, DEFORMABLE_BODY, nodes, elements
+        )
+
+    def oneByOne():
+        part = Part("block", THREE_D, DEFORMABLE_BODY)
+        part.nodes = MeshNodeArray(
+            [MeshNode(tuple(point), label=label) for label, point in zip(nodeLabels.tolist(), coordinates.tolist())]
+        )
+        part.elements = MeshElementArray([])
+        for label, nodes in zip(elementLabels.tolist(), (connectivity - 1).tolist()):
+            element = MeshElement()
+            element.label, element.type, element.connectivity = label, C3D8R, tuple(nodes)
+            part.elements.append(element)
+        return part
+
+    print(f"{'construction':<14} {'nodes':>10} {'elements':>10} {'create':>10} {'coordinates':>12}")
+    for name, build in (("arrays", fromArrays), ("tuples", fromTuples), ("one by one", oneByOne)):
+        start = time.perf_counter()
+        part = build()
+        created = time.perf_counter() - start
+        start = time.perf_counter()
+        part.nodes._coordinates()
+        queried = time.perf_counter() - start
+        print(f"{name:<14} {len(part.nodes):>10} {len(part.elements):>10} {created:>9.3f}s {queried:>11.3f}s")
+
+
+if __name__ == "__main__":
+    main()
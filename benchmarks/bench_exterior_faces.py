@@ -0,0 +1,88 @@
+"""Benchmark ``getExteriorFaces`` and ``getExteriorEdges`` of the MeshElementArray object on synthetic meshes.
+
+Run this script from the root of the repository::
+
+    python benchmarks/bench_exterior_faces.py --size 100
+
+Structured blocks of size**3 hexahedra, 6 * size**3 tetrahedra, a mix of hexahedra and wedges, and size**2 shells
+are generated. The grouping of the elements by topology, which reads the connectivity of the MeshElement objects
+once and is cached by the array, is timed separately from the exterior faces and edges. The exterior faces are
+also counted with a Python dictionary, as a script would, for comparison.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=100, help="number of elements along each axis of the blocks")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(SRC))
+    os.environ["ABQPY_SKIP_ABAQUS"] = "true"
+    import numpy as np
+
+    from abaqus.Mesh.MeshElement import MeshElement
+    from abaqus.Mesh.MeshElementArray import MeshElementArray
+    from abaqus.UtilityAndView.abaqusConstants import C3D4, C3D6, C3D8R, S4R
+
+    n = args.size
+    ids = np.arange((n + 1) ** 3).reshape(n + 1, n + 1, n + 1)[:-1, :-1, :-1].ravel()
+    dx, dy = (n + 1) ** 2, n + 1
+    bottom = np.stack((ids, ids + dx, ids + dx + dy, ids + dy), axis=1)
+    hexahedra = np.concatenate((bottom, bottom + 1), axis=1)
+    splits = ((0, 1, 2, 6), (0, 2, 3, 6), (0, 3, 7, 6), (0, 7, 4, 6), (0, 4, 5, 6), (0, 5, 1, 6))
+    half = len(hexahedra) // 2
+    ids = np.arange((n + 1) ** 2).reshape(n + 1, n + 1)[:-1, :-1].ravel()
+    meshes = {
+        "C3D8R": [(hexahedra, C3D8R)],
+        "C3D4": [(np.concatenate([hexahedra[:, split] for split in splits]), C3D4)],
+        "C3D8R + C3D6": [
+            (hexahedra[:half], C3D8R),
+            (np.concatenate((hexahedra[half:, [0, 1, 2, 4, 5, 6]], hexahedra[half:, [0, 2, 3, 4, 6, 7]])), C3D6),
+        ],
+        "S4R": [(np.stack((ids, ids + n + 1, ids + n + 2, ids + 1), axis=1), S4R)],
+    }
+
+    print(f"{'mesh':<14} {'elements':>10} {'topology':>10} {'faces':>10} {'edges':>10} {'dict':>10} {'exterior':>10}")
+    for name, parts in meshes.items():
+        elements = []
+        for connectivity, elementType in parts:
+            for nodes in connectivity.tolist():
+                element = MeshElement()
+                element.label, element.type, element.connectivity = len(elements) + 1, elementType, tuple(nodes)
+                elements.append(element)
+        array = MeshElementArray(elements)
+        timings = []
+        for function in (array._topology, array.getExteriorFaces, array.getExteriorEdges):
+            start = time.perf_counter()
+            function()
+            timings.append(time.perf_counter() - start)
+        exterior = len(array.getExteriorFaces())
+        if name == "C3D8R":
+            start = time.perf_counter()
+            faces = Counter(
+                frozenset(element.connectivity[corner] for corner in face)
+                for element in array
+                for face in ((0, 1, 2, 3), (4, 7, 6, 5), (0, 4, 5, 1), (1, 5, 6, 2), (2, 6, 7, 3), (3, 7, 4, 0))
+            )
+            assert sum(count == 1 for count in faces.values()) == exterior
+            timings.append(time.perf_counter() - start)
+        print(
+            f"{name:<14} {len(array):>10} "
+            + " ".join(f"{timing:>9.3f}s" for timing in timings)
+            + " " * 11 * (4 - len(timings))
+            + f" {exterior:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
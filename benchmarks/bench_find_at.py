@@ -0,0 +1,56 @@
+"""Benchmark batched ``findAt`` calls of the geometry arrays.
+
+Run this script from the root of the repository::
+
+    python benchmarks/bench_find_at.py --entities 100000 --points 10000
+
+A FaceArray of faces at random points is searched for some of its faces, with one ``findAt`` call per point, as
+generated scripts do, and with a single ``findAt`` call for all the points.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import timeit
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entities", type=int, default=100_000, help="number of faces")
+    parser.add_argument("--points", type=int, default=10_000, help="number of points to find")
+    parser.add_argument("--repeat", type=int, default=3, help="number of timings, the best one is kept")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(SRC))
+    os.environ["ABQPY_SKIP_ABAQUS"] = "true"
+    import numpy as np
+
+    from abaqus.BasicGeometry.Face import Face
+    from abaqus.BasicGeometry.FaceArray import FaceArray
+
+    rng = np.random.default_rng(0)
+    faces = FaceArray([Face() for _ in range(args.entities)])
+    for face, point in zip(faces, rng.uniform(-100.0, 100.0, size=(args.entities, 3)).tolist()):
+        face.pointOn = (tuple(point),)
+    points = [face.pointOn for face in rng.choice(np.array(faces, dtype=object), args.points).tolist()]
+    faces.findAt(*points)
+
+    def best(function) -> float:
+        return min(timeit.repeat(function, number=1, repeat=args.repeat))
+
+    timings = {
+        "one call per point": best(lambda: [faces.findAt(point[0]) for point in points]),
+        "batched": best(lambda: faces.findAt(*points)),
+    }
+
+    print(f"findAt of {args.points} points among {args.entities} faces:")
+    for name, timing in timings.items():
+        print(f"  {name:<18} {timing:8.3f} s  {timing / args.points * 1e6:8.2f} us/point")
+
+
+if __name__ == "__main__":
+    main()
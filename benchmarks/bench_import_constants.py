@@ -0,0 +1,65 @@
+"""Benchmark the import time of the `abaqusConstants` module.
+
+Run this script from the root of the repository::
+
+    python benchmarks/bench_import_constants.py --repeat 10
+
+Each sample imports the package in a fresh interpreter with ``python -X importtime`` and reads the cumulative
+import time of the constants modules and of the whole `abaqus` package.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+MODULES = ("abaqus.UtilityAndView.SymbolicConstant", "abaqus.UtilityAndView.abaqusConstants", "abaqus")
+
+
+def import_times(statement: str, env: dict[str, str]) -> dict[str, float]:
+    """Return the cumulative import time in milliseconds of the modules in :data:`MODULES`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], env=env, capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if name.strip() in MODULES and cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative) / 1000
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="number of fresh interpreters to sample")
+    args = parser.parse_args()
+
+    env = dict(os.environ, ABQPY_SKIP_ABAQUS="true", PYTHONPATH=str(SRC), PYTHONDONTWRITEBYTECODE="")
+    with tempfile.TemporaryDirectory() as cache:
+        env["PYTHONPYCACHEPREFIX"] = cache
+        import_times("import abaqus", env)  # warm up the bytecode cache
+        samples = [import_times("import abaqus", env) for _ in range(args.repeat)]
+
+    print(f"Cumulative import time over {args.repeat} runs (median, ms):")
+    for module in MODULES:
+        print(f"  {module:<45} {statistics.median(sample[module] for sample in samples):10.2f}")
+
+    sys.path.insert(0, str(SRC))
+    os.environ["ABQPY_SKIP_ABAQUS"] = "true"
+    from abaqus.UtilityAndView.abaqusConstants import abaqusConstants
+
+    names = abaqusConstants._member_names_
+    elapsed = timeit.timeit(lambda: [getattr(abaqusConstants, name) for name in names], number=1)
+    print(f"Materializing all {len(names)} constants on first access: {elapsed * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Benchmark the throughput of the input file parser.
+
+Run this script from the root of the repository::
+
+    python benchmarks/bench_inp_parser.py --nodes 1000000
+
+A synthetic input file with a block of ``*NODE`` data and a block of ``*ELEMENT`` data is parsed by
+:meth:`abaqus.InputFileParser.InputFile.InputFile.parse`, with and without ``usePyArray``, and by splitting every
+data line into a tuple of numbers, which is the cost of parsing the data one line at a time.
+
+With ``--includes``, the nodes and elements are split into as many included files, which are also parsed with
+``processes`` set to the number of CPUs::
+
+    python benchmarks/bench_inp_parser.py --nodes 1000000 --includes 16
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+def writeDeck(path: str, nodes: int, includes: int = 0):
+    """Write an input file with a number of nodes and as many linear hexahedra, in a number of included files."""
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    with open(path, "w") as file:
+        file.write("*Heading\n** Synthetic deck\n")
+        for part, labels in enumerate(np.array_split(np.arange(1, nodes + 1), max(includes, 1))):
+            if includes:
+                name = f"part-{part}.inp"
+                file.write(f"*Include, input={name}\n")
+                with open(os.path.join(os.path.dirname(path), name), "w") as included:
+                    writePart(included, part, labels, nodes, rng)
+            else:
+                writePart(file, part, labels, nodes, rng)
+
+
+def writePart(file, part: int, labels, nodes: int, rng):
+    """Write a part with the nodes of a number of labels and as many linear hexahedra."""
+    import numpy as np
+
+    coordinates = rng.uniform(-100.0, 100.0, size=(len(labels), 3))
+    connectivity = rng.integers(1, nodes + 1, size=(len(labels), 8))
+    file.write(f"*Part, name=Part-{part}\n*Node\n")
+    np.savetxt(file, np.column_stack((labels, coordinates)), fmt=["%7d"] + ["%13.6g"] * 3, delimiter=",")
+    file.write("*Element, type=C3D8R\n")
+    np.savetxt(file, np.column_stack((labels, connectivity)), fmt="%d", delimiter=", ")
+    file.write("*End Part\n")
+
+
+def parseLines(path: str) -> list:
+    """Parse the data lines one at a time into tuples of numbers."""
+    keywords: list = []
+    with open(path) as file:
+        for line in file:
+            if line.startswith("*"):
+                keywords.append((line, []))
+            elif keywords:
+                keywords[-1][1].append(tuple(float(item) for item in line.split(",")))
+    return keywords
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=1_000_000, help="number of nodes and elements")
+    parser.add_argument("--includes", type=int, default=0, help="number of included files")
+    parser.add_argument("--processes", type=int, default=os.cpu_count(), help="number of processes with includes")
+    parser.add_argument("--repeat", type=int, default=3, help="number of timings, the best one is kept")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(SRC))
+    os.environ["ABQPY_SKIP_ABAQUS"] = "true"
+    from abaqus.InputFileParser.InputFile import InputFile
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "deck.inp")
+        writeDeck(path, args.nodes, args.includes)
+        size = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory)) / 1e6
+
+        def best(function) -> float:
+            return min(timeit.repeat(function, number=1, repeat=args.repeat))
+
+        timings = {
+            "usePyArray=True": best(lambda: InputFile(path).parse(usePyArray=True)),
+            "usePyArray=False": best(lambda: InputFile(path).parse(usePyArray=False)),
+        }
+        if args.includes:
+            timings[f"processes={args.processes}"] = best(
+                lambda: InputFile(path).parse(usePyArray=True, processes=args.processes)
+            )
+        else:
+            timings["per line"] = best(lambda: parseLines(path))
+
+    print(f"Input file of {size:.1f} MB with {args.nodes} nodes and elements in {args.includes} included files:")
+    for name, timing in timings.items():
+        print(f"  {name:<17} {timing:8.3f} s  {size / timing:8.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark the creation and the transforms of thousands of part instances with the instance patterns of the
+assembly, against creating and moving the instances one at a time.
+
+Run this script from the root of the repository::
+
+    python benchmarks/bench_instance_patterns.py --size 100
+
+A lattice of size**2 instances of a meshed part is created with ``LinearInstancePattern``, all its instances are
+translated and rotated with one call each, and the coordinates of the nodes of all the instances are computed
+from the coordinates of the part with a single batched product. The same lattice is then created with
+``Instance`` and ``translate`` for each instance.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=100, help="number of instances along each direction")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(SRC))
+    os.environ["ABQPY_SKIP_ABAQUS"] = "true"
+    import numpy as np
+
+    from abaqus import mdb
+    from abaqus.Assembly.InstanceTransforms import instanceTransforms, rowsOf
+    from abaqus.Part.Part import Part
+    from abaqus.UtilityAndView.abaqusConstants import DEFORMABLE_BODY, THREE_D
+
+    cube = np.indices((2, 2, 2), dtype=np.float64).reshape(3, -1).T.copy()
+    part = Part("cell", THREE_D, DEFORMABLE_BODY).PartFromNodesAndElements(
+        "cell", THREE_D, DEFORMABLE_BODY, (range(1, 9), cube), (("C3D8R", (1,), ((1, 5, 7, 3, 2, 6, 8, 4),)),)
+    )
+    n = args.size
+    assembly = mdb.models["Model-1"].rootAssembly
+
+    start = time.perf_counter()
+    assembly.Instance(name="cell", part=part, dependent=True)
+    copies = assembly.LinearInstancePattern(("cell",), n, 2.0, n, 2.0)
+    created = time.perf_counter() - start
+    names = ["cell"] + [copy.name for copy in copies]
+    start = time.perf_counter()
+    assembly.translate(names, (0.0, 0.0, 1.0))
+    assembly.rotate(names, (0.0, 0.0, 0.0), (0.0, 0.0, 1.0), 30.0)
+    moved = time.perf_counter() - start
+    start = time.perf_counter()
+    transforms = instanceTransforms(assembly)
+    coordinates = transforms.coordinates(rowsOf(transforms, assembly.instances.values()), cube)
+    computed = time.perf_counter() - start
+    print(f"patterns     {len(names)} instances, create {created:.3f}s, move {moved:.3f}s, nodes {computed:.3f}s")
+    print(f"             {coordinates.shape[0] * coordinates.shape[1]} node coordinates")
+
+    for name in names:
+        del assembly.instances[name]
+    start = time.perf_counter()
+    for i in range(n):
+        for j in range(n):
+            instance = assembly.Instance(name=f"cell-{i}-{j}", part=part, dependent=True)
+            instance.translate((2.0 * i, 2.0 * j, 0.0))
+    created = time.perf_counter() - start
+    start = time.perf_counter()
+    for instance in assembly.instances.values():
+        instance.translate((0.0, 0.0, 1.0))
+        instance.rotateAboutAxis((0.0, 0.0, 0.0), (0.0, 0.0, 1.0), 30.0)
+    moved = time.perf_counter() - start
+    print(f"one by one   {len(assembly.instances)} instances, create {created:.3f}s, move {moved:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
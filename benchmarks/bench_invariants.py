@@ -0,0 +1,54 @@
+"""Benchmark the vectorized computation of the invariants of tensor fields.
+
+Run this script from the root of the repository::
+
+    python benchmarks/bench_invariants.py --size 100000
+
+The invariants of a block of random 3D stress tensors are computed at once with
+:func:`abaqus.Odb.FieldInvariants.computeInvariants`, and one value at a time on a sample of the block, which is the
+cost of computing them per FieldValue object.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import timeit
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=100_000, help="number of tensor values")
+    parser.add_argument("--sample", type=int, default=2_000, help="number of values computed one at a time")
+    parser.add_argument("--repeat", type=int, default=3, help="number of timings, the best one is kept")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(SRC))
+    os.environ["ABQPY_SKIP_ABAQUS"] = "true"
+    import numpy as np
+
+    from abaqus.Odb.FieldInvariants import computeInvariants
+    from abaqus.UtilityAndView.abaqusConstants import TENSOR_3D_FULL
+
+    data = np.random.default_rng(0).normal(size=(args.size, 6))
+    sample = data[: args.sample]
+
+    batched = min(timeit.repeat(lambda: computeInvariants(data, TENSOR_3D_FULL), number=1, repeat=args.repeat))
+    per_value = min(
+        timeit.repeat(
+            lambda: [computeInvariants(row[None], TENSOR_3D_FULL) for row in sample], number=1, repeat=args.repeat
+        )
+    )
+    per_value *= args.size / len(sample)
+
+    print(f"All invariants of {args.size} TENSOR_3D_FULL values:")
+    print(f"  batched   {batched * 1000:10.2f} ms  {args.size / batched / 1e6:8.2f} M values/s")
+    print(f"  per value {per_value * 1000:10.2f} ms  {args.size / per_value / 1e6:8.2f} M values/s (extrapolated)")
+    print(f"  speedup   {per_value / batched:10.1f} x")
+
+
+if __name__ == "__main__":
+    main()
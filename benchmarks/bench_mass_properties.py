@@ -0,0 +1,72 @@
+"""Benchmark ``getMassProperties`` of a meshed part, computed once from the mesh and then from the cached integrals
+of the elements.
+
+Run this script from the root of the repository::
+
+    python benchmarks/bench_mass_properties.py --size 60 --calls 20
+
+A structured block of size**3 hexahedra is created with a section and a material. The first call integrates all
+the elements. The following calls, such as the calls of an optimization loop changing the density of the
+material, only weight the cached integrals. A node is then moved, after which the elements are integrated again.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=60, help="number of elements along each axis of the block")
+    parser.add_argument("--calls", type=int, default=20, help="number of calls with the cached integrals")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(SRC))
+    os.environ["ABQPY_SKIP_ABAQUS"] = "true"
+    import numpy as np
+
+    from abaqus import mdb
+    from abaqus.Part.Part import Part
+    from abaqus.UtilityAndView.abaqusConstants import DEFORMABLE_BODY, THREE_D
+
+    n = args.size
+    coordinates = np.indices((n + 1,) * 3, dtype=np.float64).reshape(3, -1).T.copy()
+    ids = np.arange((n + 1) ** 3).reshape(n + 1, n + 1, n + 1)[:-1, :-1, :-1].ravel()
+    dx, dy = (n + 1) ** 2, n + 1
+    bottom = np.stack((ids, ids + dx, ids + dx + dy, ids + dy), axis=1)
+    connectivity = np.concatenate((bottom, bottom + 1), axis=1) + 1
+    model = mdb.models["Model-1"]
+    part = model.parts["block"] = Part("block", THREE_D, DEFORMABLE_BODY).PartFromNodesAndElements(
+        "block",
+        THREE_D,
+        DEFORMABLE_BODY,
+        (np.arange(1, len(coordinates) + 1), coordinates),
+        (("C3D8R", np.arange(1, len(connectivity) + 1), connectivity),),
+    )
+    material = model.Material("steel")
+    model.HomogeneousSolidSection("solid", "steel")
+    part.SectionAssignment(part.Set(name="all", elements=part.elements), "solid")
+
+    material.Density(table=((7.8e-9,),))
+    start = time.perf_counter()
+    mass = part.getMassProperties()["mass"]
+    print(f"{len(part.elements)} elements, first call {time.perf_counter() - start:.3f}s, mass {mass:.4g}")
+    start = time.perf_counter()
+    for call in range(args.calls):
+        material.Density(table=((7.8e-9 * (1 + call / 100),),))
+        mass = part.getMassProperties()["mass"]
+    elapsed = time.perf_counter() - start
+    print(f"cached         {args.calls} calls {elapsed:>8.3f}s {elapsed / args.calls * 1e3:>8.2f}ms/call")
+    part.editNode(nodes=(part.nodes[0],), offset1=-0.1)
+    start = time.perf_counter()
+    part.getMassProperties()
+    print(f"after an edit  {time.perf_counter() - start:>8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
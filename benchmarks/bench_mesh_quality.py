@@ -0,0 +1,72 @@
+"""Benchmark ``verifyMeshQuality`` after node edits, with the metrics updated incrementally or computed again.
+
+Run this script from the root of the repository::
+
+    python benchmarks/bench_mesh_quality.py --size 50 --edits 100
+
+A structured block of size**3 hexahedra is created and its metrics are computed once. Then some interior nodes
+are moved one at a time with ``editNode`` and the mesh quality is checked after each edit, which updates the
+metrics of the elements around the node only. The same loop is timed with the caches invalidated after each
+edit, which computes the metrics of all the elements again.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=50, help="number of elements along each axis of the block")
+    parser.add_argument("--edits", type=int, default=100, help="number of edited nodes")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(SRC))
+    os.environ["ABQPY_SKIP_ABAQUS"] = "true"
+    import numpy as np
+
+    from abaqus.Mesh.MeshArrayCache import invalidateMeshCaches
+    from abaqus.Part.Part import Part
+    from abaqus.UtilityAndView.abaqusConstants import (
+        ASPECT_RATIO,
+        DEFORMABLE_BODY,
+        THREE_D,
+    )
+
+    n = args.size
+    coordinates = np.indices((n + 1,) * 3, dtype=np.float64).reshape(3, -1).T.copy()
+    ids = np.arange((n + 1) ** 3).reshape(n + 1, n + 1, n + 1)[:-1, :-1, :-1].ravel()
+    dx, dy = (n + 1) ** 2, n + 1
+    bottom = np.stack((ids, ids + dx, ids + dx + dy, ids + dy), axis=1)
+    connectivity = np.concatenate((bottom, bottom + 1), axis=1) + 1
+    part = Part("block", THREE_D, DEFORMABLE_BODY).PartFromNodesAndElements(
+        "block",
+        THREE_D,
+        DEFORMABLE_BODY,
+        (np.arange(1, len(coordinates) + 1), coordinates),
+        (("C3D8R", np.arange(1, len(connectivity) + 1), connectivity),),
+    )
+    start = time.perf_counter()
+    part.verifyMeshQuality(ASPECT_RATIO, threshold=1.5)
+    print(f"{len(part.elements)} elements, first check {time.perf_counter() - start:.3f}s")
+
+    rng = np.random.default_rng(0)
+    interior = rng.integers(1, n, size=(args.edits, 3)) @ (dx, dy, 1)
+    for name, invalidate in (("incremental", False), ("from scratch", True)):
+        start = time.perf_counter()
+        for index in interior.tolist():
+            part.editNode(nodes=(part.nodes[index],), offset1=0.01)
+            if invalidate:
+                invalidateMeshCaches()
+            failed = part.verifyMeshQuality(ASPECT_RATIO, threshold=1.5)["failedElements"]
+        elapsed = time.perf_counter() - start
+        print(f"{name:<14} {args.edits} edits {elapsed:>8.3f}s {elapsed / args.edits * 1e3:>8.2f}ms/edit {len(failed)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark the spatial queries of MeshNodeArray against a linear scan of the nodes.
+
+Run this script from the root of the repository::
+
+    python benchmarks/bench_spatial_index.py --sizes 10000 100000 1000000
+
+For each number of nodes, random nodes are queried with small boxes by
+:meth:`abaqus.Mesh.MeshNodeArray.MeshNodeArray.getByBoundingBox`, whose k-d tree is built by the first query, and by
+a vectorized scan of all the coordinates, which is the cost of a query without a spatial index. The cost of a query
+with the index grows with the logarithm of the number of nodes, the cost of a scan grows linearly.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000], help="numbers of nodes")
+    parser.add_argument("--queries", type=int, default=1_000, help="number of queries per size")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(SRC))
+    os.environ["ABQPY_SKIP_ABAQUS"] = "true"
+    import numpy as np
+
+    from abaqus.Mesh.MeshNode import MeshNode
+    from abaqus.Mesh.MeshNodeArray import MeshNodeArray
+
+    rng = np.random.default_rng(0)
+    print(f"{'nodes':>10} {'build':>10} {'indexed query':>15} {'linear scan':>15} {'speedup':>8}")
+    for size in args.sizes:
+        coordinates = rng.uniform(0.0, 100.0, size=(size, 3))
+        nodes = MeshNodeArray([MeshNode(point) for point in map(tuple, coordinates.tolist())])
+        # Boxes holding about 10 nodes each.
+        width = 100.0 * (10 / size) ** (1 / 3)
+        lows = rng.uniform(0.0, 100.0 - width, size=(args.queries, 3))
+        highs = lows + width
+
+        start = time.perf_counter()
+        nodes.getByBoundingBox(*lows[0], *highs[0])
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for low, high in zip(lows.tolist(), highs.tolist()):
+            nodes.getByBoundingBox(*low, *high)
+        indexed = (time.perf_counter() - start) / args.queries
+
+        sample = lows[: max(args.queries // 10, 1)]
+        start = time.perf_counter()
+        for low in sample:
+            selected = np.flatnonzero(np.all((coordinates >= low) & (coordinates <= low + width), axis=1))
+            MeshNodeArray([nodes[index] for index in selected.tolist()])
+        linear = (time.perf_counter() - start) / len(sample)
+
+        print(f"{size:>10} {build:>9.3f}s {indexed * 1e6:>13.1f}us {linear * 1e6:>13.1f}us {linear / indexed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
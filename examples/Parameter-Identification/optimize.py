@@ -37,34 +37,41 @@ The model script of this example can be found :doc:`here <compression>`.
 """
 import os
 
-import numpy as np
 import pandas as pd
 
-
-def fitness(x: float, maxdisp_expected: float = -0.1):
-    # Change the working directory to a new folder
-    wd = os.path.join(os.path.dirname(__file__), f"Job-E={x}")
-    os.makedirs(wd, exist_ok=True)
-    os.chdir(wd)
-
-    # Run the model and read the output, the additional argument can be read by the Abaqus/Python script
-    os.system(f"python ../compression.py {x},0.2")
-
-    # Read the output and calculate the fitness
-    data = pd.read_csv("data.csv")
-    maxdisp = data["U3"].iloc[-1]
-    return abs(maxdisp - maxdisp_expected)
-
-
-def grid_search(search_space: list[float], expected: float):
-    fs = []
-    for x in search_space:
-        print(f"Running model for E={x}")
-        fs.append(fitness(x, expected))
-    argmin = np.argmin(fs)
-    best = search_space[argmin]
-    print("Search results:", pd.DataFrame({"modulus": search_space, "fitness": fs}), sep="\n")
-    print(f"\nBest modulus={best} with fitness={fs[argmin]}")
+from abqpy.sweep import grid, sweep
+
+
+def max_displacement(directory: str):
+    # Read the output written by the model in the directory of its run
+    data = pd.read_csv(os.path.join(directory, "data.csv"))
+    return {"maxdisp": data["U3"].iloc[-1]}
+
+
+def grid_search(search_space: list[float], expected: float, workers: int = 2):
+    # Run the models at the same time, the additional argument can be read by the Abaqus/Python script. The runs
+    # are cached in the sweep directory, so that the models already run with the same script are not run again
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "compression.py")
+    table = sweep(
+        script,
+        grid(modulus=search_space),
+        cache=os.path.join(os.path.dirname(script), "sweep"),
+        arguments=lambda run: [f"{run['modulus']},0.2"],
+        collect=max_displacement,
+        workers=workers,
+        frame=True,
+    )
+    # A failed run has no results, its output is kept in its directory
+    for _, run in table[table["returncode"] != 0].iterrows():
+        print(f"Run with modulus={run['modulus']} failed with exit status {run['returncode']}, see {run['directory']}")
+    table = table[table["returncode"] == 0].copy()
+    if table.empty:
+        raise RuntimeError("All the runs failed, no modulus can be identified")
+    table["fitness"] = (table["maxdisp"] - expected).abs()
+    argmin = table["fitness"].idxmin()
+    best = table["modulus"][argmin]
+    print("Search results:", table[["modulus", "fitness"]], sep="\n")
+    print(f"\nBest modulus={best} with fitness={table['fitness'][argmin]}")
     return best
 
 
@@ -1,15 +1,12 @@
 from __future__ import annotations
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
 from typing_extensions import Literal
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
-from ..Datum.DatumCsys import DatumCsys
 from ..Model.ModelBase import ModelBase
-from ..Odb.Odb import Odb
-from ..Region.Region import Region
 from ..UtilityAndView.abaqusConstants import (
     CURRENT,
     DEFAULT,
@@ -27,11 +24,16 @@ from ..UtilityAndView.abaqusConstants import (
     Boolean,
 )
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
-from .AdaptiveMeshConstraint import AdaptiveMeshConstraint
-from .AdaptiveMeshControl import AdaptiveMeshControl
-from .DisplacementAdaptiveMeshConstraint import DisplacementAdaptiveMeshConstraint
-from .RemeshingRule import RemeshingRule
-from .VelocityAdaptiveMeshConstraint import VelocityAdaptiveMeshConstraint
+
+if TYPE_CHECKING:
+    from ..Datum.DatumCsys import DatumCsys
+    from ..Odb.Odb import Odb
+    from ..Region.Region import Region
+    from .AdaptiveMeshConstraint import AdaptiveMeshConstraint
+    from .AdaptiveMeshControl import AdaptiveMeshControl
+    from .DisplacementAdaptiveMeshConstraint import DisplacementAdaptiveMeshConstraint
+    from .RemeshingRule import RemeshingRule
+    from .VelocityAdaptiveMeshConstraint import VelocityAdaptiveMeshConstraint
 
 
 @abaqus_class_doc
@@ -98,6 +100,8 @@ class AdaptivityModel(ModelBase):
         AdaptiveMeshConstraint
             An AdaptiveMeshConstraint object
         """
+        from .AdaptiveMeshConstraint import AdaptiveMeshConstraint
+
         self.adaptiveMeshConstraints[name] = adaptiveMeshConstraint = AdaptiveMeshConstraint(
             name, category, region, localCsys
         )
@@ -183,6 +187,8 @@ class AdaptivityModel(ModelBase):
         AdaptiveMeshControl
             An AdaptiveMeshControl object
         """
+        from .AdaptiveMeshControl import AdaptiveMeshControl
+
         self.adaptiveMeshControls[name] = adaptiveMeshControl = AdaptiveMeshControl(
             name,
             remapping,
@@ -276,6 +282,10 @@ class AdaptivityModel(ModelBase):
         DisplacementAdaptiveMeshConstraint
             A DisplacementAdaptiveMeshConstraint object
         """
+        from .DisplacementAdaptiveMeshConstraint import (
+            DisplacementAdaptiveMeshConstraint,
+        )
+
         self.adaptiveMeshConstraints[name] = adaptiveMeshConstraint = DisplacementAdaptiveMeshConstraint(
             name,
             createStepName,
@@ -394,6 +404,8 @@ class AdaptivityModel(ModelBase):
         RemeshingRule
             A RemeshingRule object
         """
+        from .RemeshingRule import RemeshingRule
+
         self.remeshingRules[name] = remeshingRule = RemeshingRule(
             name,
             stepName,
@@ -490,6 +502,8 @@ class AdaptivityModel(ModelBase):
         VelocityAdaptiveMeshConstraint
             A VelocityAdaptiveMeshConstraint object
         """
+        from .VelocityAdaptiveMeshConstraint import VelocityAdaptiveMeshConstraint
+
         self.adaptiveMeshConstraints[name] = adaptiveMeshConstraint = VelocityAdaptiveMeshConstraint(
             name,
             createStepName,
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Sequence, Union
+from typing import TYPE_CHECKING, Sequence, Union
 
 from typing_extensions import Literal
 
@@ -18,16 +18,18 @@ from ..UtilityAndView.abaqusConstants import (
     Boolean,
 )
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
-from .ActuatorAmplitude import ActuatorAmplitude
-from .DecayAmplitude import DecayAmplitude
-from .EquallySpacedAmplitude import EquallySpacedAmplitude
-from .ModulatedAmplitude import ModulatedAmplitude
-from .PeriodicAmplitude import PeriodicAmplitude
-from .PsdDefinition import PsdDefinition
-from .SmoothStepAmplitude import SmoothStepAmplitude
-from .SolutionDependentAmplitude import SolutionDependentAmplitude
-from .SpectrumAmplitude import SpectrumAmplitude
-from .TabularAmplitude import TabularAmplitude
+
+if TYPE_CHECKING:
+    from .ActuatorAmplitude import ActuatorAmplitude
+    from .DecayAmplitude import DecayAmplitude
+    from .EquallySpacedAmplitude import EquallySpacedAmplitude
+    from .ModulatedAmplitude import ModulatedAmplitude
+    from .PeriodicAmplitude import PeriodicAmplitude
+    from .PsdDefinition import PsdDefinition
+    from .SmoothStepAmplitude import SmoothStepAmplitude
+    from .SolutionDependentAmplitude import SolutionDependentAmplitude
+    from .SpectrumAmplitude import SpectrumAmplitude
+    from .TabularAmplitude import TabularAmplitude
 
 
 @abaqus_class_doc
@@ -68,6 +70,8 @@ class AmplitudeModel(ModelBase):
         InvalidNameError
         RangeError
         """
+        from .ActuatorAmplitude import ActuatorAmplitude
+
         self.amplitudes[name] = amplitude = ActuatorAmplitude(name, timeSpan)
         return amplitude
 
@@ -115,6 +119,8 @@ class AmplitudeModel(ModelBase):
         InvalidNameError
         RangeError
         """
+        from .DecayAmplitude import DecayAmplitude
+
         self.amplitudes[name] = amplitude = DecayAmplitude(name, initial, maximum, start, decayTime, timeSpan)
         return amplitude
 
@@ -167,6 +173,8 @@ class AmplitudeModel(ModelBase):
         InvalidNameError
         RangeError
         """
+        from .EquallySpacedAmplitude import EquallySpacedAmplitude
+
         self.amplitudes[name] = amplitude = EquallySpacedAmplitude(name, fixedInterval, data, begin, smooth, timeSpan)
         return amplitude
 
@@ -219,6 +227,8 @@ class AmplitudeModel(ModelBase):
         InvalidNameError
         RangeError
         """
+        from .ModulatedAmplitude import ModulatedAmplitude
+
         self.amplitudes[name] = amplitude = ModulatedAmplitude(
             name, initial, magnitude, start, frequency1, frequency2, timeSpan
         )
@@ -268,6 +278,8 @@ class AmplitudeModel(ModelBase):
         InvalidNameError
         RangeError
         """
+        from .PeriodicAmplitude import PeriodicAmplitude
+
         self.amplitudes[name] = amplitude = PeriodicAmplitude(name, frequency, start, a_0, data, timeSpan)
         return amplitude
 
@@ -331,6 +343,8 @@ class AmplitudeModel(ModelBase):
         InvalidNameError
         RangeError
         """
+        from .PsdDefinition import PsdDefinition
+
         self.amplitudes[name] = amplitud = PsdDefinition(
             name,
             data,
@@ -376,6 +390,8 @@ class AmplitudeModel(ModelBase):
         InvalidNameError
         RangeError
         """
+        from .SmoothStepAmplitude import SmoothStepAmplitude
+
         self.amplitudes[name] = amplitude = SmoothStepAmplitude(name, data, timeSpan)
         return amplitude
 
@@ -423,6 +439,8 @@ class AmplitudeModel(ModelBase):
         InvalidNameError
         RangeError
         """
+        from .SolutionDependentAmplitude import SolutionDependentAmplitude
+
         self.amplitudes[name] = amplitude = SolutionDependentAmplitude(name, initial, minimum, maximum, timeSpan)
         return amplitude
 
@@ -502,6 +520,8 @@ class AmplitudeModel(ModelBase):
         InvalidNameError
         RangeError
         """
+        from .SpectrumAmplitude import SpectrumAmplitude
+
         self.amplitudes[name] = amplitud = SpectrumAmplitude(
             name,
             method,
@@ -559,5 +579,7 @@ class AmplitudeModel(ModelBase):
         InvalidNameError
         RangeError
         """
+        from .TabularAmplitude import TabularAmplitude
+
         self.amplitudes[name] = amplitude = TabularAmplitude(name, data, smooth, timeSpan)
         return amplitude
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
 from typing_extensions import Literal
 
@@ -18,16 +18,18 @@ from ..UtilityAndView.abaqusConstants import (
     Boolean,
 )
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
-from .ActuatorAmplitude import ActuatorAmplitude
-from .DecayAmplitude import DecayAmplitude
-from .EquallySpacedAmplitude import EquallySpacedAmplitude
-from .ModulatedAmplitude import ModulatedAmplitude
-from .PeriodicAmplitude import PeriodicAmplitude
-from .PsdDefinition import PsdDefinition
-from .SmoothStepAmplitude import SmoothStepAmplitude
-from .SolutionDependentAmplitude import SolutionDependentAmplitude
-from .SpectrumAmplitude import SpectrumAmplitude
-from .TabularAmplitude import TabularAmplitude
+
+if TYPE_CHECKING:
+    from .ActuatorAmplitude import ActuatorAmplitude
+    from .DecayAmplitude import DecayAmplitude
+    from .EquallySpacedAmplitude import EquallySpacedAmplitude
+    from .ModulatedAmplitude import ModulatedAmplitude
+    from .PeriodicAmplitude import PeriodicAmplitude
+    from .PsdDefinition import PsdDefinition
+    from .SmoothStepAmplitude import SmoothStepAmplitude
+    from .SolutionDependentAmplitude import SolutionDependentAmplitude
+    from .SpectrumAmplitude import SpectrumAmplitude
+    from .TabularAmplitude import TabularAmplitude
 
 
 @abaqus_class_doc
@@ -69,6 +71,8 @@ class AmplitudeOdb(OdbBase):
         InvalidNameError
         RangeError
         """
+        from .ActuatorAmplitude import ActuatorAmplitude
+
         self.amplitudes[name] = amplitude = ActuatorAmplitude(name, timeSpan)
         return amplitude
 
@@ -116,6 +120,8 @@ class AmplitudeOdb(OdbBase):
         InvalidNameError
         RangeError
         """
+        from .DecayAmplitude import DecayAmplitude
+
         self.amplitudes[name] = amplitude = DecayAmplitude(name, initial, maximum, start, decayTime, timeSpan)
         return amplitude
 
@@ -168,6 +174,8 @@ class AmplitudeOdb(OdbBase):
         InvalidNameError
         RangeError
         """
+        from .EquallySpacedAmplitude import EquallySpacedAmplitude
+
         self.amplitudes[name] = amplitude = EquallySpacedAmplitude(name, fixedInterval, data, begin, smooth, timeSpan)
         return amplitude
 
@@ -220,6 +228,8 @@ class AmplitudeOdb(OdbBase):
         InvalidNameError
         RangeError
         """
+        from .ModulatedAmplitude import ModulatedAmplitude
+
         self.amplitudes[name] = amplitude = ModulatedAmplitude(
             name, initial, magnitude, start, frequency1, frequency2, timeSpan
         )
@@ -269,6 +279,8 @@ class AmplitudeOdb(OdbBase):
         InvalidNameError
         RangeError
         """
+        from .PeriodicAmplitude import PeriodicAmplitude
+
         self.amplitudes[name] = amplitude = PeriodicAmplitude(name, frequency, start, a_0, data, timeSpan)
         return amplitude
 
@@ -332,6 +344,8 @@ class AmplitudeOdb(OdbBase):
         InvalidNameError
         RangeError
         """
+        from .PsdDefinition import PsdDefinition
+
         self.amplitudes[name] = amplitud = PsdDefinition(
             name,
             data,
@@ -377,6 +391,8 @@ class AmplitudeOdb(OdbBase):
         InvalidNameError
         RangeError
         """
+        from .SmoothStepAmplitude import SmoothStepAmplitude
+
         self.amplitudes[name] = amplitude = SmoothStepAmplitude(name, data, timeSpan)
         return amplitude
 
@@ -424,6 +440,8 @@ class AmplitudeOdb(OdbBase):
         InvalidNameError
         RangeError
         """
+        from .SolutionDependentAmplitude import SolutionDependentAmplitude
+
         self.amplitudes[name] = amplitude = SolutionDependentAmplitude(name, initial, minimum, maximum, timeSpan)
         return amplitude
 
@@ -503,6 +521,8 @@ class AmplitudeOdb(OdbBase):
         InvalidNameError
         RangeError
         """
+        from .SpectrumAmplitude import SpectrumAmplitude
+
         self.amplitudes[name] = amplitud = SpectrumAmplitude(
             name,
             method,
@@ -560,5 +580,7 @@ class AmplitudeOdb(OdbBase):
         InvalidNameError
         RangeError
         """
+        from .TabularAmplitude import TabularAmplitude
+
         self.amplitudes[name] = amplitude = TabularAmplitude(name, data, smooth, timeSpan)
         return amplitude
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
 from typing_extensions import Literal
 
@@ -9,7 +9,9 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 from ..Session.SessionBase import SessionBase
 from ..UtilityAndView.abaqusConstants import END_FRAME_TIME
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
-from .Movie import Movie
+
+if TYPE_CHECKING:
+    from .Movie import Movie
 
 
 @abaqus_class_doc
@@ -107,6 +109,8 @@ class AnimationSession(SessionBase):
         ValueError
             Unable to decode movie file, If the contents of **fileName** are corrupt or can not be decoded.
         """
+        from .Movie import Movie
+
         self.movies[name] = movie = Movie(
             name,
             fileName,
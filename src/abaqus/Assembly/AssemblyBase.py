@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Sequence, Union, overload
+from typing import TYPE_CHECKING, Optional, Sequence, Tuple, Union, overload
 
 from typing_extensions import Literal
 
@@ -45,6 +45,9 @@ from .ConnectorOrientationArray import ConnectorOrientationArray
 from .ModelInstance import ModelInstance
 from .PartInstance import PartInstance
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 @abaqus_class_doc
 class AssemblyBase(AssemblyFeature):
@@ -236,7 +239,10 @@ class AssemblyBase(AssemblyFeature):
             A PartInstance object.
         """
         if "part" in kwargs.keys() or (len(args) > 0 and isinstance(args[0], Part)):
+            from .InstanceTransforms import instanceTransforms
+
             instance = PartInstance(name, *args, **kwargs)
+            instanceTransforms(self).add([instance])
         else:
             instance = ModelInstance(name, *args, **kwargs)
             self.modelInstances[name] = instance
@@ -385,8 +391,26 @@ class AssemblyBase(AssemblyFeature):
         -------
         Sequence[PartInstance]
             A sequence of PartInstance objects.
+
+        Raises
+        ------
+        ValueError
+            If a direction is zero.
         """
-        return [PartInstance(name, Part("", THREE_D)) for name in instanceList]
+        import numpy as np
+
+        from .InstanceTransforms import translations
+
+        directions = []
+        for direction in (direction1 or (1.0, 0.0, 0.0), direction2 or (0.0, 1.0, 0.0)):
+            vector = np.asarray(direction, dtype=np.float64)
+            if not np.linalg.norm(vector) > 0:
+                raise ValueError("The pattern directions must not be zero")
+            directions.append(vector / np.linalg.norm(vector))
+        first, second = (index.ravel()[1:] for index in np.indices((number1, number2)))
+        offsets = np.outer(first * spacing1, directions[0]) + np.outer(second * spacing2, directions[1])
+        suffixes = [f"lin-{i + 1}-{j + 1}" for i, j in zip(first.tolist(), second.tolist())]
+        return self._pattern(instanceList, suffixes, translations(offsets))
 
     @abaqus_method_doc
     def RadialInstancePattern(
@@ -429,8 +453,42 @@ class AssemblyBase(AssemblyFeature):
         -------
         Sequence[PartInstance]
             A sequence of PartInstance objects.
+
+        Raises
+        ------
+        ValueError
+            If the axis is zero.
         """
-        return [PartInstance(name, Part("", THREE_D)) for name in instanceList]
+        import numpy as np
+
+        from .InstanceTransforms import rotations
+
+        steps = np.arange(1, number)
+        angles = totalAngle * steps / (number if abs(totalAngle) == 360 else max(number - 1, 1))
+        matrices = rotations(point or (0.0, 0.0, 0.0), axis or (0.0, 0.0, 1.0), angles)
+        return self._pattern(instanceList, [f"rad-{step + 1}" for step in steps.tolist()], matrices)
+
+    def _pattern(
+        self, instanceList: Sequence[str], suffixes: Sequence[str], matrices: np.ndarray
+    ) -> list[PartInstance]:
+        """Create the copies of some instances transformed by some transforms, named after the instances and
+        suffixes, and put them into the instances repository."""
+        import numpy as np
+
+        from .InstanceTransforms import instanceTransforms, rowsOf
+
+        transforms = instanceTransforms(self)
+        originals = [self.instances[name] for name in instanceList]
+        placed = np.matmul(matrices[None], transforms.matrices[rowsOf(transforms, originals)][:, None])
+        copies = [
+            PartInstance(f"{original.name}-{suffix}", original.part, dependent=original.dependent)
+            for original in originals
+            for suffix in suffixes
+        ]
+        transforms.add(copies, placed.reshape(-1, 4, 4))
+        for copy in copies:
+            self.instances[copy.name] = self.allInstances[copy.name] = copy
+        return copies
 
     @abaqus_method_doc
     def backup(self):
@@ -495,7 +553,7 @@ class AssemblyBase(AssemblyFeature):
         specifyThickness: Boolean = False,
         thickness: str = "",
         miAboutCenterOfMass: Boolean = True,
-        miAboutPoint: tuple[float, float, float] = ...,
+        miAboutPoint: Optional[Tuple[float, float, float]] = None,
     ):
         """This method returns the mass properties of the assembly, or instances or regions. Only beams,
         trusses, shells, solids, point, nonstructural mass, and rotary inertia elements are supported.
@@ -598,8 +656,41 @@ class AssemblyBase(AssemblyFeature):
             TAPERED_BEAM_MI: Moment of inertia calculations for tapered beams are not accurate.
             SUBSTRUCTURE_INCORRECT_PROPERTIES: The user assigned density and thickness is not
             considered for substructures.
+
+        Notes
+        -----
+        The mass properties are computed from the meshes of the parts of the instances, as the
+        ``getMassProperties`` method of the parts does, and moved by the transforms of the instances. The
+        moments of a part are computed once for all its instances. The elements of the regions are found in the
+        instance named by their **instanceName** member, and the model instances are ignored.
         """
-        ...
+        from ..Mesh.MassProperties import massProperties
+        from ..Mesh.MeshQuality import entityPositions
+
+        items = list(self.instances.values()) if not regions else regions
+        items = [items] if isinstance(items, (PartInstance, ModelInstance)) or hasattr(items, "elements") else items
+        whole: list[PartInstance] = []
+        elements: dict[str, list] = {}
+        for item in items:
+            if isinstance(item, PartInstance):
+                whole.append(item)
+            for element in getattr(item, "elements", None) or ([item] if isinstance(item, MeshElement) else []):
+                elements.setdefault(element.instanceName, []).append(element)
+        selected: list[tuple] = [(instance.part, None, instance._transform()) for instance in whole]
+        for name, members in elements.items():
+            instance = self.instances.get(name)
+            if isinstance(instance, PartInstance) and instance not in whole:
+                positions = entityPositions(instance.part.elements, members, "elements")
+                selected.append((instance.part, positions, instance._transform()))
+        return massProperties(
+            selected,
+            specifyDensity,
+            float(density) if specifyDensity else 0,
+            specifyThickness,
+            float(thickness) if specifyThickness else 0,
+            miAboutCenterOfMass,
+            () if miAboutPoint is None else miAboutPoint,
+        )
 
     @abaqus_method_doc
     def getAngle(self, plane1: str, plane2: str, line1: str, line2: str, commonVertex: str = ""):
@@ -980,7 +1071,11 @@ class AssemblyBase(AssemblyFeature):
             A Float specifying the rotation angle in degrees. Use the right-hand rule to determine
             the direction.
         """
-        ...
+        from .InstanceTransforms import instanceTransforms, rotations, rowsOf
+
+        transforms = instanceTransforms(self)
+        rows = rowsOf(transforms, [self.instances[name] for name in instanceList])
+        transforms.apply(rows, rotations(axisPoint, axisDirection, [angle])[0])
 
     @abaqus_method_doc
     def translate(self, instanceList: tuple, vector: tuple):
@@ -993,7 +1088,11 @@ class AssemblyBase(AssemblyFeature):
         vector
             A sequence of three Floats specifying a translation vector.
         """
-        ...
+        from .InstanceTransforms import instanceTransforms, rowsOf, translations
+
+        transforms = instanceTransforms(self)
+        rows = rowsOf(transforms, [self.instances[name] for name in instanceList])
+        transforms.apply(rows, translations(vector)[0])
 
     @abaqus_method_doc
     def saveGeometryCache(self):
@@ -1,7 +1,13 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ..UtilityAndView.abaqusConstants import Boolean
-from .PartInstance import PartInstance
+
+if TYPE_CHECKING:
+    from .PartInstance import PartInstance
 
 
 # Prevent circular import
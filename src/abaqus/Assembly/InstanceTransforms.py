@@ -0,0 +1,251 @@
+"""Rigid transforms of the part instances of an assembly, stored together and applied to many instances at once.
+
+The transform of each part instance is a 4 x 4 matrix mapping the coordinates of its part to the coordinates of
+the assembly. The matrices of the instances of an assembly are rows of a single (N, 4, 4) array, so that the
+``translate`` and ``rotate`` methods of the assembly and the instance patterns transform thousands of instances
+with a few vectorized operations. The coordinates of the nodes of an instance are not copied: they are computed
+from the coordinates of the nodes of its part and from its transform when they are needed.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Iterable, Sequence, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class InstanceTransforms:
+    """The InstanceTransforms object holds the transforms of some part instances, such as the instances of an
+    assembly, as a single array of 4 x 4 matrices.
+
+    .. note::
+        This object is not part of the Abaqus Scripting Interface. It is used by the methods of the assembly and
+        of the part instances moving the instances, and is returned by :func:`instanceTransforms`, for example::
+
+            from abaqus.Assembly.InstanceTransforms import instanceTransforms
+
+            instanceTransforms(mdb.models[name].rootAssembly).matrices
+    """
+
+    def __init__(self):
+        """This method creates an InstanceTransforms object without any transform."""
+        import numpy as np
+
+        self._matrices = np.empty((0, 4, 4))
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def matrices(self) -> np.ndarray:
+        """The (N, 4, 4) array of the transforms, which is a view of the stored transforms."""
+        return self._matrices[: self._count]
+
+    def add(self, instances: Sequence[Any], matrices: np.ndarray | None = None) -> np.ndarray:
+        """Add the transforms of some part instances, which are then stored by this object.
+
+        Parameters
+        ----------
+        instances
+            A sequence of PartInstance objects.
+        matrices
+            An (N, 4, 4) array of Floats specifying the transforms of the instances. By default, the current
+            transforms of the instances are kept.
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of Ints specifying the rows of the transforms.
+        """
+        import numpy as np
+
+        if matrices is None:
+            matrices = np.array([instance._transform() for instance in instances]).reshape(-1, 4, 4)
+        start, end = self._count, self._count + len(instances)
+        if end > len(self._matrices):
+            capacity = max(end, 2 * len(self._matrices), 16)
+            self._matrices = np.concatenate((self._matrices, np.empty((capacity - len(self._matrices), 4, 4))))
+        self._matrices[start:end] = matrices
+        self._count = end
+        for row, instance in enumerate(instances, start):
+            instance._placement = (self, row)
+        return np.arange(start, end)
+
+    def apply(self, rows: np.ndarray | Sequence[int], matrices: np.ndarray):
+        """Apply some transforms after the transforms of some rows.
+
+        Parameters
+        ----------
+        rows
+            An array of Ints specifying the rows.
+        matrices
+            An (N, 4, 4) array of Floats specifying the transform applied to each row, or a single 4 x 4
+            transform applied to all the rows.
+        """
+        import numpy as np
+
+        rows = np.asarray(rows, dtype=np.int64)
+        self._matrices[rows] = np.matmul(matrices, self._matrices[rows])
+
+    def coordinates(self, rows: np.ndarray | Sequence[int], points: np.ndarray) -> np.ndarray:
+        """Return the coordinates of some points of a part in the assembly, for the transforms of some rows.
+
+        Parameters
+        ----------
+        rows
+            An array of Ints specifying the rows.
+        points
+            An (P, 3) array of Floats specifying the coordinates of the points in the part.
+
+        Returns
+        -------
+        numpy.ndarray
+            An (N, P, 3) array of Floats specifying the coordinates of the points for each row.
+        """
+        import numpy as np
+
+        matrices = self._matrices[np.asarray(rows, dtype=np.int64)]
+        return np.matmul(points, matrices[:, :3, :3].transpose(0, 2, 1)) + matrices[:, None, :3, 3]
+
+
+def instanceTransforms(assembly: Any) -> InstanceTransforms:
+    """Return the transforms of the part instances of an assembly, created on first access.
+
+    Parameters
+    ----------
+    assembly
+        An Assembly object.
+
+    Returns
+    -------
+    InstanceTransforms
+        An InstanceTransforms object.
+    """
+    transforms = assembly.__dict__.get("_instanceTransforms")
+    if transforms is None:
+        transforms = assembly.__dict__["_instanceTransforms"] = InstanceTransforms()
+    return transforms
+
+
+def rowsOf(transforms: InstanceTransforms, instances: Iterable[Any]) -> np.ndarray:
+    """Return the rows of the transforms of some part instances, adding the transforms of the instances that are
+    not stored by an InstanceTransforms object yet.
+
+    Parameters
+    ----------
+    transforms
+        An InstanceTransforms object.
+    instances
+        An iterable of PartInstance objects.
+
+    Returns
+    -------
+    numpy.ndarray
+        An array of Ints specifying the rows of the transforms, in the order of the instances.
+    """
+    import numpy as np
+
+    instances = list(instances)
+    foreign = [instance for instance in instances if instance._located()[0] is not transforms]
+    if foreign:
+        transforms.add(foreign)
+    return np.array([instance._located()[1] for instance in instances], dtype=np.int64)
+
+
+def translations(vectors: Any) -> np.ndarray:
+    """Return the transforms translating by some vectors.
+
+    Parameters
+    ----------
+    vectors
+        An (N, 3) array of Floats specifying the translation vectors.
+
+    Returns
+    -------
+    numpy.ndarray
+        An (N, 4, 4) array of Floats specifying the transforms.
+    """
+    import numpy as np
+
+    vectors = np.asarray(vectors, dtype=np.float64).reshape(-1, 3)
+    matrices = np.tile(np.eye(4), (len(vectors), 1, 1))
+    matrices[:, :3, 3] = vectors
+    return matrices
+
+
+def rotations(point: Sequence[float], axis: Sequence[float], angles: Any) -> np.ndarray:
+    """Return the transforms rotating about an axis by some angles.
+
+    Parameters
+    ----------
+    point
+        A sequence of three Floats specifying the coordinates of a point on the axis.
+    axis
+        A sequence of three Floats specifying the direction of the axis.
+    angles
+        An array of Floats specifying the rotation angles in degrees. Use the right-hand rule to determine the
+        direction.
+
+    Returns
+    -------
+    numpy.ndarray
+        An (N, 4, 4) array of Floats specifying the transforms.
+
+    Raises
+    ------
+    ValueError
+        If the direction of the axis is zero.
+    """
+    import numpy as np
+
+    direction = np.asarray(axis, dtype=np.float64)
+    norm = np.linalg.norm(direction)
+    if not norm > 0:
+        raise ValueError("The direction of the axis must not be zero")
+    x, y, z = direction / norm
+    angles = np.radians(np.asarray(angles, dtype=np.float64).ravel())
+    cosines, sines = np.cos(angles)[:, None, None], np.sin(angles)[:, None, None]
+    cross = np.array(((0, -z, y), (z, 0, -x), (-y, x, 0)))
+    # Rodrigues' rotation formula, for all the angles at once.
+    rotation = cosines * np.eye(3) + sines * cross + (1 - cosines) * np.outer((x, y, z), (x, y, z))
+    center = np.asarray(point, dtype=np.float64)
+    matrices = np.tile(np.eye(4), (len(angles), 1, 1))
+    matrices[:, :3, :3] = rotation
+    matrices[:, :3, 3] = center - rotation @ center
+    return matrices
+
+
+def axisAngle(matrix: np.ndarray) -> Tuple[Tuple[float, ...], Tuple[float, ...], float]:
+    """Return a point of the axis, the direction of the axis and the angle in degrees of the rotation of a
+    transform, which is a rotation about the axis followed by a translation along the axis.
+
+    Parameters
+    ----------
+    matrix
+        A 4 x 4 array of Floats specifying the transform.
+
+    Returns
+    -------
+    tuple
+        The point of the axis closest to the origin, the unit direction of the axis and the angle, which is
+        between 0 and 180 degrees. The axis is (0, 0, 1) and the angle is 0 if there is no rotation.
+    """
+    import numpy as np
+
+    rotation, translation = matrix[:3, :3], matrix[:3, 3]
+    axis = np.array((rotation[2, 1] - rotation[1, 2], rotation[0, 2] - rotation[2, 0], rotation[1, 0] - rotation[0, 1]))
+    angle = np.arctan2(np.linalg.norm(axis) / 2, (np.trace(rotation) - 1) / 2)
+    if np.isclose(angle, 0.0):
+        return (0.0, 0.0, 0.0), (0.0, 0.0, 1.0), 0.0
+    if np.linalg.norm(axis) < 1e-8:
+        # A half turn, whose axis is the eigenvector of the symmetric rotation for the eigenvalue 1.
+        values, vectors = np.linalg.eigh(rotation)
+        axis = vectors[:, np.argmax(values)]
+    axis = axis / np.linalg.norm(axis)
+    # The point solves (I - R) p = t in the plane orthogonal to the axis.
+    normal = translation - (translation @ axis) * axis
+    point = np.linalg.lstsq(np.eye(3) - rotation, normal, rcond=None)[0]
+    point -= (point @ axis) * axis
+    return tuple(point.tolist()), tuple(axis.tolist()), float(np.degrees(angle))
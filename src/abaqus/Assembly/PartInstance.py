@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Sequence
+from typing import TYPE_CHECKING, Sequence, Tuple
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
@@ -25,6 +25,11 @@ from ..Region.Stringer import Stringer
 from ..Region.Surface import Surface
 from ..UtilityAndView.abaqusConstants import OFF, Boolean, SymbolicConstant
 
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .InstanceTransforms import InstanceTransforms
+
 
 @abaqus_class_doc
 class PartInstance:
@@ -163,6 +168,9 @@ class PartInstance:
         PartInstance
             A PartInstance object.
         """
+        self.name = name
+        self.part = part
+        self.dependent = dependent
         self.vertices = part.vertices
         self.ignoredEdges = part.ignoredEdges
         self.faces = part.faces
@@ -249,6 +257,32 @@ class PartInstance:
         """
         ...
 
+    def _located(self) -> Tuple[InstanceTransforms, int]:
+        """Return the InstanceTransforms object storing the transform of the instance and the row of the
+        transform, which is the identity transform of a new instance that is not in an assembly."""
+        placement = self.__dict__.get("_placement")
+        if placement is None:
+            import numpy as np
+
+            from .InstanceTransforms import InstanceTransforms
+
+            InstanceTransforms().add([self], np.eye(4)[None])
+            placement = self.__dict__["_placement"]
+        return placement
+
+    def _transform(self) -> np.ndarray:
+        """Return the 4 x 4 matrix of the transform from the coordinates of the part to the coordinates of the
+        assembly."""
+        transforms, row = self._located()
+        return transforms.matrices[row]
+
+    def _coordinates(self) -> np.ndarray:
+        """Return the (N, 3) array of the coordinates of the nodes of the instance in the assembly, computed from
+        the coordinates of the nodes of the part and the transform of the instance rather than copied."""
+        transforms, row = self._located()
+        points = self.part.nodes._coordinates() if self.part is not None else self.nodes._coordinates()
+        return transforms.coordinates([row], points)[0]
+
     @abaqus_method_doc
     def getPosition(self):
         """This method prints the sum of the translations and rotations applied to the PartInstance object."""
@@ -265,7 +299,9 @@ class PartInstance:
             A tuple including the point of rotation, axis of rotation, and rotation angle (in
             degrees).
         """
-        ...
+        from .InstanceTransforms import axisAngle
+
+        return axisAngle(self._transform())
 
     @abaqus_method_doc
     def getTranslation(self) -> tuple[float, float, float]:
@@ -277,7 +313,8 @@ class PartInstance:
         tuple[float, float, float]
             A tuple of three Floats representing the translation.
         """
-        return (0.0, 0.0, 0.0)
+        x, y, z = self._transform()[:3, 3].tolist()
+        return (x, y, z)
 
     @abaqus_method_doc
     def replace(self, instanceOf: Part, applyConstraints: Boolean = True):
@@ -297,7 +334,7 @@ class PartInstance:
 
     @abaqus_method_doc
     def rotateAboutAxis(self, axisPoint: Sequence[float], axisDirection: Sequence[float], angle: float):
-        """This method translates an instance by the specified amount.
+        """This method rotates an instance about the specified axis.
 
         Parameters
         ----------
@@ -310,7 +347,10 @@ class PartInstance:
             A Float specifying the rotation angle in degrees. Use the right-hand rule to determine
             the direction.
         """
-        ...
+        from .InstanceTransforms import rotations
+
+        transforms, row = self._located()
+        transforms.apply([row], rotations(axisPoint, axisDirection, [angle]))
 
     @abaqus_method_doc
     def translate(self, vector: tuple):
@@ -321,7 +361,10 @@ class PartInstance:
         vector
             A sequence of three Floats specifying a translation vector.
         """
-        ...
+        from .InstanceTransforms import translations
+
+        transforms, row = self._located()
+        transforms.apply([row], translations(vector))
 
     @abaqus_method_doc
     def translateTo(
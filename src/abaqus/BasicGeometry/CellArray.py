@@ -6,12 +6,12 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ..UtilityAndView.abaqusConstants import Boolean
 from .Cell import Cell
-from .Face import Face
 from .FaceArray import FaceArray
+from .GeometryArray import GeometryArray
 
 
 @abaqus_class_doc
-class CellArray(List[Cell]):
+class CellArray(GeometryArray, List[Cell]):
     """The CellArray is a sequence of Cell objects.
 
     .. note::
@@ -33,6 +33,8 @@ class CellArray(List[Cell]):
             mdb.models[name].rootAssembly.sets[name].cells
     """
 
+    _placeholder = Cell
+
     @abaqus_method_doc
     def __init__(self, cells: list[Cell]) -> None:
         """This method creates a CellArray object.
@@ -52,7 +54,7 @@ class CellArray(List[Cell]):
         CellArray
             A CellArray object.
         """
-        ...
+        super().__init__(cells)
 
     @overload
     @abaqus_method_doc
@@ -117,8 +119,7 @@ class CellArray(List[Cell]):
         Cell
             A Cell object.
         """
-        first_arg = kwargs.get("coordinates", args[0] if args else ((),))
-        return Cell() if isinstance(first_arg[0], float) else [Cell()]
+        return self._findAt(*args, **kwargs)
 
     @abaqus_method_doc
     def getExteriorFaces(self) -> FaceArray:
@@ -129,8 +130,15 @@ class CellArray(List[Cell]):
         -------
         FaceArray
             A FaceArray object representing the faces on the exterior of the cells.
+
+        Raises
+        ------
+        ValueError
+            If the CellArray is not held by a part, a part instance or an assembly.
         """
-        return FaceArray([Face()])
+        faces = FaceArray(self._exterior("getFaces", "faces"))
+        faces._shareOwner(self)
+        return faces
 
     @overload
     @abaqus_method_doc
@@ -160,10 +168,11 @@ class CellArray(List[Cell]):
 
         Raises
         ------
-        Error
+        ValueError
             The mask results in an empty sequence, An exception occurs if the resulting sequence is empty.
         """
-        return Cell() if isinstance(mask, str) else [Cell()]
+        entities = self._fromMask(mask)
+        return entities[0] if isinstance(mask, str) and len(entities) == 1 else self._select(entities)
 
     @abaqus_method_doc
     def getMask(self) -> str:
@@ -174,7 +183,7 @@ class CellArray(List[Cell]):
         str
             A String specifying the object or objects.
         """
-        return ""
+        return str(self._mask())
 
     @abaqus_method_doc
     def getByBoundingBox(
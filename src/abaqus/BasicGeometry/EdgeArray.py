@@ -6,10 +6,11 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ..UtilityAndView.abaqusConstants import Boolean
 from .Edge import Edge
+from .GeometryArray import GeometryArray
 
 
 @abaqus_class_doc
-class EdgeArray(List[Edge]):
+class EdgeArray(GeometryArray, List[Edge]):
     """The EdgeArray is a sequence of Edge objects. If the part is modified, then EdgeArray must be updated for
     that part.
 
@@ -43,6 +44,8 @@ class EdgeArray(List[Edge]):
             mdb.models[name].rootAssembly.surfaces[name].edges
     """
 
+    _placeholder = Edge
+
     @abaqus_method_doc
     def __init__(self, edges: list[Edge]) -> None:
         """This method creates an EdgeArray object.
@@ -62,7 +65,7 @@ class EdgeArray(List[Edge]):
         EdgeArray
             A EdgeArray object.
         """
-        ...
+        super().__init__(edges)
 
     @overload
     @abaqus_method_doc
@@ -126,8 +129,7 @@ class EdgeArray(List[Edge]):
         Edge
             An Edge object or a sequence of Edge objects.
         """
-        first_arg = kwargs.get("coordinates", args[0] if args else ((),))
-        return Edge() if isinstance(first_arg[0], float) else [Edge()]
+        return self._findAt(*args, **kwargs)
 
     @abaqus_method_doc
     def getClosest(
@@ -192,10 +194,11 @@ class EdgeArray(List[Edge]):
 
         Raises
         ------
-        Error
+        ValueError
             The mask results in an empty sequence, An exception occurs if the resulting sequence is empty.
         """
-        return Edge() if isinstance(mask, str) else [Edge()]
+        entities = self._fromMask(mask)
+        return entities[0] if isinstance(mask, str) and len(entities) == 1 else self._select(entities)
 
     @abaqus_method_doc
     def getMask(self):
@@ -206,7 +209,7 @@ class EdgeArray(List[Edge]):
         str
             A String specifying the object or objects.
         """
-        return ""
+        return str(self._mask())
 
     @abaqus_method_doc
     def getByBoundingBox(
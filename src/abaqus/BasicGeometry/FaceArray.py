@@ -5,13 +5,13 @@ from typing import List, Sequence, Union, overload
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ..UtilityAndView.abaqusConstants import Boolean
-from .Edge import Edge
 from .EdgeArray import EdgeArray
 from .Face import Face
+from .GeometryArray import GeometryArray
 
 
 @abaqus_class_doc
-class FaceArray(List[Face]):
+class FaceArray(GeometryArray, List[Face]):
     """The FaceArray is a sequence of Face objects. If the part is modified, then FaceArray must be updated for
     that part.
 
@@ -43,6 +43,8 @@ class FaceArray(List[Face]):
             mdb.models[name].rootAssembly.surfaces[name].faces
     """
 
+    _placeholder = Face
+
     @abaqus_method_doc
     def __init__(self, faces: list[Face]) -> None:
         """This method creates a FaceArray object.
@@ -62,7 +64,7 @@ class FaceArray(List[Face]):
         FaceArray
             A FaceArray object.
         """
-        ...
+        super().__init__(faces)
 
     @overload
     @abaqus_method_doc
@@ -131,8 +133,7 @@ class FaceArray(List[Face]):
         Face
             A Face object.
         """
-        first_arg = kwargs.get("coordinates", args[0] if args else ((),))
-        return Face() if isinstance(first_arg[0], float) else [Face()]
+        return self._findAt(*args, **kwargs)
 
     @abaqus_method_doc
     def getExteriorEdges(self) -> EdgeArray:
@@ -143,8 +144,15 @@ class FaceArray(List[Face]):
         -------
         EdgeArray
             An EdgeArray object specifying the exterior edges.
+
+        Raises
+        ------
+        ValueError
+            If the FaceArray is not held by a part, a part instance or an assembly.
         """
-        return EdgeArray([Edge()])
+        edges = EdgeArray(self._exterior("getEdges", "edges"))
+        edges._shareOwner(self)
+        return edges
 
     @overload
     @abaqus_method_doc
@@ -171,8 +179,14 @@ class FaceArray(List[Face]):
         -------
         Face
             A Face object or a sequence of Face objects.
+
+        Raises
+        ------
+        ValueError
+            The mask results in an empty sequence, An exception occurs if the resulting sequence is empty.
         """
-        return Face() if isinstance(mask, str) else [Face()]
+        entities = self._fromMask(mask)
+        return entities[0] if isinstance(mask, str) and len(entities) == 1 else self._select(entities)
 
     @abaqus_method_doc
     def getMask(self) -> str:
@@ -183,7 +197,7 @@ class FaceArray(List[Face]):
         str
             A String specifying the object or objects.
         """
-        return ""
+        return str(self._mask())
 
     @abaqus_method_doc
     def getByBoundingBox(
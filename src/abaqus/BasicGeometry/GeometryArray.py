@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import warnings
+from numbers import Real
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from ..Mesh.MeshArrayCache import MeshArrayCache
+
+if TYPE_CHECKING:
+    from .PointLocator import PointLocator
+
+
+class GeometryArray(MeshArrayCache):
+    """A mixin implementing the ``findAt`` methods of the geometry arrays, such as the FaceArray object, with a
+    PointLocator object cached until the array is modified or :func:`~abaqus.Mesh.MeshArrayCache.invalidateMeshCaches`
+    is called.
+
+    The geometric entities created by the modeling methods of the stubs carry no B-rep data, such as the cells of a
+    part created by BaseSolidExtrude. When no entity of the array has a point on it or bounding vertices, findAt
+    returns a placeholder entity, as the stubs did before the entities were located.
+    """
+
+    #: The class of the placeholder entity returned by findAt when the array has no geometric data.
+    _placeholder: Any = None
+
+    def _pointLocator(self) -> PointLocator:
+        """Return the cached locator of the points on the entities of the array, which are the point given by
+        their **pointOn** member and the vertices bounding them, when the array is held by an object with
+        vertices, such as a Part object."""
+        import numpy as np
+
+        from .PointLocator import PointLocator
+
+        def build() -> PointLocator:
+            vertices = getattr(self._owner(), "vertices", None)
+            corners = np.empty((0, 3))
+            if vertices is not None and vertices is not self:
+                missing = (np.nan,) * 3
+                corners = np.array([_location(vertex) or missing for vertex in vertices], dtype=float).reshape(-1, 3)
+            points, owners = [], []
+            for index, entity in enumerate(self):  # type: ignore
+                location = _location(entity)
+                if location is not None:
+                    points.append(location)
+                    owners.append(index)
+                if len(corners) and hasattr(entity, "getVertices"):
+                    bounding = [vertex for vertex in entity.getVertices() or () if 0 <= vertex < len(corners)]
+                    bounding = [vertex for vertex in bounding if not np.isnan(corners[vertex, 0])]
+                    points.extend(corners[bounding].tolist())
+                    owners.extend([index] * len(bounding))
+            return PointLocator(np.array(points, dtype=float).reshape(-1, 3), np.array(owners, dtype=np.int64))
+
+        return self._cached("pointLocator", build)
+
+    def _findAt(self, *args: Any, **kwargs: Any) -> Any:
+        """Return the entity located at a point, or the entities located at a sequence of points in the order of the
+        points, all the points being located with a single call to the cached PointLocator object."""
+        import numpy as np
+
+        printWarning = kwargs.pop("printWarning", True)
+        coordinates = args if args else (kwargs["coordinates"],)
+        single = len(coordinates) == 1 and isinstance(coordinates[0][0], Real)
+        if single:
+            points = np.asarray(coordinates, dtype=float).reshape(1, 3)
+        else:
+            # Each argument is a sequence of the coordinates of a point and optionally of a normal.
+            items = coordinates if args else coordinates[0]
+            points = np.array([item[0] if not isinstance(item[0], Real) else item for item in items], float)
+        locator = self._pointLocator()
+        if not len(locator):
+            return self._placeholder() if single else self._select([self._placeholder()])
+        found = locator.find(points.reshape(-1, 3))
+        if printWarning:
+            for point in points[found < 0].tolist():
+                warnings.warn(f"findAt could not find a geometric entity at {tuple(point)}", stacklevel=3)
+        if single:
+            return self[int(found[0])] if found[0] >= 0 else None  # type: ignore
+        return self._select([self[index] for index in found[found >= 0].tolist()])  # type: ignore
+
+    def _select(self, entities: List[Any]) -> Any:
+        """Return an array of some entities of the array, held by the object holding the array."""
+        array = type(self)(entities)  # type: ignore
+        array._shareOwner(self)
+        return array
+
+    def _exterior(self, method: str, attribute: str) -> List[Any]:
+        """Return the entities referenced by exactly one of the entities of the array through a method, such as the
+        edges of the faces given by ``getEdges``, taken from the array of the entities under an attribute, such as
+        ``edges``, of the part or the part instance of the entities referencing them.
+
+        Raises
+        ------
+        ValueError
+            If the array is not held by a part, a part instance or an assembly.
+        """
+        import numpy as np
+
+        owner = self._owner()
+        if owner is None:
+            raise ValueError(f"The {attribute} of the entities are unknown, as the array is not held by a part")
+        ids: List[int] = []
+        instances: List[int] = []
+        names: Dict[Any, int] = {}
+        for entity in self:  # type: ignore
+            referenced = getattr(entity, method)() or ()
+            ids.extend(referenced)
+            instances.extend([names.setdefault(getattr(entity, "instanceName", None), len(names))] * len(referenced))
+        # The ids are numbered per part instance, so that the entities are identified by their instance and id.
+        keys = np.array(instances, dtype=np.int64) << 32 | np.array(ids, dtype=np.int64)
+        unique, counts = np.unique(keys, return_counts=True)
+        holders = [
+            owner.instances[name] if name is not None and hasattr(owner, "instances") else owner for name in names
+        ]
+        return [getattr(holders[key >> 32], attribute)[key & 0xFFFFFFFF] for key in unique[counts == 1].tolist()]
+
+
+def _location(entity: Any) -> Optional[Tuple[float, float, float]]:
+    """Return the coordinates of the point on an entity given by its **pointOn** member, leaving out the normal
+    given with the point on a face of a shell, or None if the entity has no such point."""
+    pointOn = getattr(entity, "pointOn", None)
+    if pointOn is None:
+        return None
+    while pointOn and not isinstance(pointOn[0], Real):
+        pointOn = pointOn[0]
+    return tuple(pointOn[:3])  # type: ignore
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Sequence
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class PointLocator:
+    """The PointLocator object finds the geometric entities located at a batch of points, such as the faces of a
+    FaceArray object, used by the ``findAt`` methods of the geometry arrays.
+
+    Each entity is represented by the points on it, such as its **pointOn** member. The points are sorted along the
+    **X** axis, so that the candidates of all the query points are found with a single binary search and tested
+    with a single NumPy operation, instead of looping over the entities for every query point.
+
+    .. note::
+        This object is not part of the Abaqus Scripting Interface. It is built lazily by the geometry arrays, for
+        example::
+
+            faces = mdb.models[name].parts[name].faces
+            faces.findAt(((0.5, 0.5, 0.0),), ((0.5, 0.0, 0.5),))
+    """
+
+    #: A two-dimensional array of Floats specifying the coordinates of the points, sorted along the **X** axis.
+    points: np.ndarray
+
+    #: An array of Ints specifying the index of the entity of each point of **points**.
+    owners: np.ndarray
+
+    def __init__(self, points: np.ndarray | Sequence[Sequence[float]], owners: np.ndarray | Sequence[int]):
+        """This method builds a PointLocator object.
+
+        Parameters
+        ----------
+        points
+            A two-dimensional array of Floats of shape (N, 3) specifying the coordinates of the points on the
+            entities.
+        owners
+            A sequence of Ints specifying the index of the entity of each point.
+        """
+        import numpy as np
+
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        owners = np.asarray(owners, dtype=np.int64)
+        order = np.lexsort((owners, points[:, 0]))
+        self.points, self.owners = points[order], owners[order]
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def find(self, points: np.ndarray | Sequence[Sequence[float]], tolerance: float = 1e-6) -> np.ndarray:
+        """Return the first entity located at each of a batch of points.
+
+        Parameters
+        ----------
+        points
+            A two-dimensional array of Floats of shape (N, 3) specifying the coordinates of the query points.
+        tolerance
+            A Float specifying the maximum distance between a query point and a point on an entity. The default
+            value is the ACIS tolerance of 1E-6.
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of Ints specifying, for each query point, the smallest index of the entities located within
+            **tolerance** of the point, or -1 if there is none.
+        """
+        import numpy as np
+
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        first = np.searchsorted(self.points[:, 0], points[:, 0] - tolerance, side="left")
+        last = np.searchsorted(self.points[:, 0], points[:, 0] + tolerance, side="right")
+        counts = last - first
+        queries = np.repeat(np.arange(len(points)), counts)
+        candidates = np.arange(counts.sum()) + np.repeat(first - (np.cumsum(counts) - counts), counts)
+        offsets = self.points[candidates] - points[queries]
+        inside = np.einsum("ij,ij->i", offsets, offsets) <= tolerance**2
+        found = np.full(len(points), np.iinfo(np.int64).max, dtype=np.int64)
+        np.minimum.at(found, queries[inside], self.owners[candidates[inside]])
+        found[found == np.iinfo(np.int64).max] = -1
+        return found
@@ -8,11 +8,12 @@ from ..Sketcher.ConstrainedSketchVertex.ConstrainedSketchVertex import (
     ConstrainedSketchVertex,
 )
 from ..UtilityAndView.abaqusConstants import Boolean
+from .GeometryArray import GeometryArray
 from .Vertex import Vertex
 
 
 @abaqus_class_doc
-class VertexArray(List[Vertex]):
+class VertexArray(GeometryArray, List[Vertex]):
     """The VertexArray is a sequence of ConstrainedSketchVertex objects. If the part is modified, then
     VertexArray must be updated for that part.
 
@@ -37,6 +38,8 @@ class VertexArray(List[Vertex]):
             mdb.models[name].rootAssembly.vertices
     """
 
+    _placeholder = ConstrainedSketchVertex
+
     @abaqus_method_doc
     def __init__(self, vertices: list[Vertex]):
         """This method creates a VertexArray object.
@@ -56,7 +59,7 @@ class VertexArray(List[Vertex]):
         VertexArray
             A VertexArray object.
         """
-        ...
+        super().__init__(vertices)
 
     @overload
     @abaqus_method_doc
@@ -119,8 +122,7 @@ class VertexArray(List[Vertex]):
         ConstrainedSketchVertex
             A ConstrainedSketchVertex object or a sequence of ConstrainedSketchVertex objects..
         """
-        first_arg = kwargs.get("coordinates", args[0] if args else ((),))
-        return ConstrainedSketchVertex() if isinstance(first_arg[0], float) else [ConstrainedSketchVertex()]
+        return self._findAt(*args, **kwargs)
 
     @overload
     @abaqus_method_doc
@@ -149,8 +151,14 @@ class VertexArray(List[Vertex]):
         -------
         ConstrainedSketchVertex | list[ConstrainedSketchVertex]
             A ConstrainedSketchVertex object or a sequence of ConstrainedSketchVertex objects..
+
+        Raises
+        ------
+        ValueError
+            The mask results in an empty sequence, An exception occurs if the resulting sequence is empty.
         """
-        return ConstrainedSketchVertex() if isinstance(mask, str) else [ConstrainedSketchVertex()]
+        entities = self._fromMask(mask)
+        return entities[0] if isinstance(mask, str) and len(entities) == 1 else self._select(entities)
 
     @abaqus_method_doc
     def getMask(self) -> str:
@@ -161,7 +169,7 @@ class VertexArray(List[Vertex]):
         str
             A String specifying the object or objects.
         """
-        return ""
+        return str(self._mask())
 
     @abaqus_method_doc
     def getByBoundingBox(
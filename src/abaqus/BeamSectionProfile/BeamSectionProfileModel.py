@@ -1,23 +1,24 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ..Model.ModelBase import ModelBase
 from ..UtilityAndView.abaqusConstants import Boolean
-from .ArbitraryProfile import ArbitraryProfile
-from .BoxProfile import BoxProfile
-from .ChannelProfile import ChannelProfile
-from .CircularProfile import CircularProfile
-from .GeneralizedProfile import GeneralizedProfile
-from .HatProfile import HatProfile
-from .HexagonalProfile import HexagonalProfile
-from .IProfile import IProfile
-from .LProfile import LProfile
-from .PipeProfile import PipeProfile
-from .Profile import Profile
-from .RectangularProfile import RectangularProfile
-from .TProfile import TProfile
-from .TrapezoidalProfile import TrapezoidalProfile
+
+if TYPE_CHECKING:
+    from .ArbitraryProfile import ArbitraryProfile
+    from .BoxProfile import BoxProfile
+    from .CircularProfile import CircularProfile
+    from .GeneralizedProfile import GeneralizedProfile
+    from .HexagonalProfile import HexagonalProfile
+    from .IProfile import IProfile
+    from .LProfile import LProfile
+    from .PipeProfile import PipeProfile
+    from .RectangularProfile import RectangularProfile
+    from .TProfile import TProfile
+    from .TrapezoidalProfile import TrapezoidalProfile
 
 
 @abaqus_class_doc
@@ -52,6 +53,8 @@ class BeamSectionProfileModel(ModelBase):
         list[Profile]
             A list of Profile objects.
         """
+        from .Profile import Profile
+
         profiles: dict[str, Profile] = {}
         self.profiles.update(profiles)
         return profiles
@@ -82,6 +85,8 @@ class BeamSectionProfileModel(ModelBase):
         ------
         RangeError
         """
+        from .ArbitraryProfile import ArbitraryProfile
+
         self.profiles[name] = arbitraryProfile = ArbitraryProfile(name, table)
         return arbitraryProfile
 
@@ -139,6 +144,8 @@ class BeamSectionProfileModel(ModelBase):
         ------
         RangeError
         """
+        from .BoxProfile import BoxProfile
+
         self.profiles[name] = boxProfile = BoxProfile(name, a, b, uniformThickness, t1, t2, t3, t4)
         return boxProfile
 
@@ -199,6 +206,8 @@ class BeamSectionProfileModel(ModelBase):
         ------
         RangeError
         """
+        from .ChannelProfile import ChannelProfile
+
         self.profiles[name] = channelProfile = ChannelProfile(name, l, h, b1, b2, t1, t2, t3, o)
         return channelProfile
 
@@ -230,6 +239,8 @@ class BeamSectionProfileModel(ModelBase):
         ------
         RangeError
         """
+        from .CircularProfile import CircularProfile
+
         self.profiles[name] = circularProfile = CircularProfile(name, r)
         return circularProfile
 
@@ -281,6 +292,8 @@ class BeamSectionProfileModel(ModelBase):
         ------
         RangeError
         """
+        from .GeneralizedProfile import GeneralizedProfile
+
         self.profiles[name] = generalizedProfile = GeneralizedProfile(name, area, i11, i12, i22, j, gammaO, gammaW)
         return generalizedProfile
 
@@ -340,6 +353,8 @@ class BeamSectionProfileModel(ModelBase):
         ------
         RangeError
         """
+        from .HatProfile import HatProfile
+
         self.profiles[name] = hatProfile = HatProfile(name, l, h, b, b1, b2, t1, t2, t3)
         return hatProfile
 
@@ -374,6 +389,8 @@ class BeamSectionProfileModel(ModelBase):
         ------
         RangeError
         """
+        from .HexagonalProfile import HexagonalProfile
+
         self.profiles[name] = hexagonalProfile = HexagonalProfile(name, r, t)
         return hexagonalProfile
 
@@ -427,6 +444,8 @@ class BeamSectionProfileModel(ModelBase):
         ------
         RangeError
         """
+        from .IProfile import IProfile
+
         self.profiles[name] = iProfile = IProfile(name, l, h, b1, b2, t1, t2, t3)
         return iProfile
 
@@ -466,6 +485,8 @@ class BeamSectionProfileModel(ModelBase):
         ------
         RangeError
         """
+        from .LProfile import LProfile
+
         self.profiles[name] = lProfile = LProfile(name, a, b, t1, t2)
         return lProfile
 
@@ -499,6 +520,8 @@ class BeamSectionProfileModel(ModelBase):
         ------
         RangeError
         """
+        from .PipeProfile import PipeProfile
+
         self.profiles[name] = pipeProfile = PipeProfile(name, r, t)
         return pipeProfile
 
@@ -532,6 +555,8 @@ class BeamSectionProfileModel(ModelBase):
         ------
         RangeError
         """
+        from .RectangularProfile import RectangularProfile
+
         self.profiles[name] = rectangularProfile = RectangularProfile(name, a, b)
         return rectangularProfile
 
@@ -574,6 +599,8 @@ class BeamSectionProfileModel(ModelBase):
         ------
         RangeError
         """
+        from .TProfile import TProfile
+
         self.profiles[name] = tProfile = TProfile(name, b, h, l, tf, tw)
         return tProfile
 
@@ -611,5 +638,7 @@ class BeamSectionProfileModel(ModelBase):
         ------
         RangeError
         """
+        from .TrapezoidalProfile import TrapezoidalProfile
+
         self.profiles[name] = trapezoidalProfile = TrapezoidalProfile(name, a, b, c, d)
         return trapezoidalProfile
@@ -1,20 +1,24 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ..Odb.OdbBase import OdbBase
 from ..UtilityAndView.abaqusConstants import Boolean
-from .ArbitraryProfile import ArbitraryProfile
-from .BoxProfile import BoxProfile
-from .ChannelProfile import ChannelProfile
-from .CircularProfile import CircularProfile
-from .GeneralizedProfile import GeneralizedProfile
-from .HatProfile import HatProfile
-from .HexagonalProfile import HexagonalProfile
-from .IProfile import IProfile
-from .LProfile import LProfile
-from .PipeProfile import PipeProfile
-from .RectangularProfile import RectangularProfile
-from .TProfile import TProfile
-from .TrapezoidalProfile import TrapezoidalProfile
+
+if TYPE_CHECKING:
+    from .ArbitraryProfile import ArbitraryProfile
+    from .BoxProfile import BoxProfile
+    from .CircularProfile import CircularProfile
+    from .GeneralizedProfile import GeneralizedProfile
+    from .HexagonalProfile import HexagonalProfile
+    from .IProfile import IProfile
+    from .LProfile import LProfile
+    from .PipeProfile import PipeProfile
+    from .RectangularProfile import RectangularProfile
+    from .TProfile import TProfile
+    from .TrapezoidalProfile import TrapezoidalProfile
 
 
 @abaqus_class_doc
@@ -54,6 +58,8 @@ class BeamSectionProfileOdb(OdbBase):
         ------
         RangeError
         """
+        from .ArbitraryProfile import ArbitraryProfile
+
         self.profiles[name] = arbitraryProfile = ArbitraryProfile(name, table)
         return arbitraryProfile
 
@@ -111,6 +117,8 @@ class BeamSectionProfileOdb(OdbBase):
         ------
         RangeError
         """
+        from .BoxProfile import BoxProfile
+
         self.profiles[name] = boxProfile = BoxProfile(name, a, b, uniformThickness, t1, t2, t3, t4)
         return boxProfile
 
@@ -171,6 +179,8 @@ class BeamSectionProfileOdb(OdbBase):
         ------
         RangeError
         """
+        from .ChannelProfile import ChannelProfile
+
         self.profiles[name] = channelProfile = ChannelProfile(name, l, h, b1, b2, t1, t2, t3, o)
         return channelProfile
 
@@ -202,6 +212,8 @@ class BeamSectionProfileOdb(OdbBase):
         ------
         RangeError
         """
+        from .CircularProfile import CircularProfile
+
         self.profiles[name] = circularProfile = CircularProfile(name, r)
         return circularProfile
 
@@ -253,6 +265,8 @@ class BeamSectionProfileOdb(OdbBase):
         ------
         RangeError
         """
+        from .GeneralizedProfile import GeneralizedProfile
+
         self.profiles[name] = generalizedProfile = GeneralizedProfile(name, area, i11, i12, i22, j, gammaO, gammaW)
         return generalizedProfile
 
@@ -312,6 +326,8 @@ class BeamSectionProfileOdb(OdbBase):
         ------
         RangeError
         """
+        from .HatProfile import HatProfile
+
         self.profiles[name] = hatProfile = HatProfile(name, l, h, b, b1, b2, t1, t2, t3)
         return hatProfile
 
@@ -346,6 +362,8 @@ class BeamSectionProfileOdb(OdbBase):
         ------
         RangeError
         """
+        from .HexagonalProfile import HexagonalProfile
+
         self.profiles[name] = hexagonalProfile = HexagonalProfile(name, r, t)
         return hexagonalProfile
 
@@ -399,6 +417,8 @@ class BeamSectionProfileOdb(OdbBase):
         ------
         RangeError
         """
+        from .IProfile import IProfile
+
         self.profiles[name] = iProfile = IProfile(name, l, h, b1, b2, t1, t2, t3)
         return iProfile
 
@@ -438,6 +458,8 @@ class BeamSectionProfileOdb(OdbBase):
         ------
         RangeError
         """
+        from .LProfile import LProfile
+
         self.profiles[name] = lProfile = LProfile(name, a, b, t1, t2)
         return lProfile
 
@@ -471,6 +493,8 @@ class BeamSectionProfileOdb(OdbBase):
         ------
         RangeError
         """
+        from .PipeProfile import PipeProfile
+
         self.profiles[name] = pipeProfile = PipeProfile(name, r, t)
         return pipeProfile
 
@@ -504,6 +528,8 @@ class BeamSectionProfileOdb(OdbBase):
         ------
         RangeError
         """
+        from .RectangularProfile import RectangularProfile
+
         self.profiles[name] = rectangularProfile = RectangularProfile(name, a, b)
         return rectangularProfile
 
@@ -546,6 +572,8 @@ class BeamSectionProfileOdb(OdbBase):
         ------
         RangeError
         """
+        from .TProfile import TProfile
+
         self.profiles[name] = tProfile = TProfile(name, b, h, l, tf, tw)
         return tProfile
 
@@ -583,5 +611,7 @@ class BeamSectionProfileOdb(OdbBase):
         ------
         RangeError
         """
+        from .TrapezoidalProfile import TrapezoidalProfile
+
         self.profiles[name] = trapezoidalProfile = TrapezoidalProfile(name, a, b, c, d)
         return trapezoidalProfile
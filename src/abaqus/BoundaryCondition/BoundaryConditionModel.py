@@ -1,15 +1,12 @@
 from __future__ import annotations
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
 from typing_extensions import Literal
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
-from ..Amplitude.Correlation import Correlation
 from ..Model.ModelBase import ModelBase
-from ..Region.Region import Region
-from ..Region.RegionArray import RegionArray
 from ..UtilityAndView.abaqusConstants import (
     FREE,
     INFLOW,
@@ -22,49 +19,34 @@ from ..UtilityAndView.abaqusConstants import (
     Boolean,
 )
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
-from .AccelerationBaseMotionBC import AccelerationBaseMotionBC
-from .AccelerationBaseMotionBCState import AccelerationBaseMotionBCState
-from .AccelerationBC import AccelerationBC
-from .AccelerationBCState import AccelerationBCState
-from .AcousticPressureBC import AcousticPressureBC
-from .AcousticPressureBCState import AcousticPressureBCState
-from .ConcentrationBC import ConcentrationBC
-from .ConcentrationBCState import ConcentrationBCState
-from .ConnAccelerationBC import ConnAccelerationBC
-from .ConnAccelerationBCState import ConnAccelerationBCState
-from .ConnDisplacementBC import ConnDisplacementBC
-from .ConnDisplacementBCState import ConnDisplacementBCState
-from .ConnVelocityBC import ConnVelocityBC
-from .ConnVelocityBCState import ConnVelocityBCState
-from .DisplacementBaseMotionBC import DisplacementBaseMotionBC
-from .DisplacementBaseMotionBCState import DisplacementBaseMotionBCState
-from .DisplacementBC import DisplacementBC
-from .DisplacementBCState import DisplacementBCState
-from .ElectricPotentialBC import ElectricPotentialBC
-from .ElectricPotentialBCState import ElectricPotentialBCState
-from .EulerianBC import EulerianBC
-from .EulerianBCState import EulerianBCState
-from .EulerianMotionBC import EulerianMotionBC
-from .EulerianMotionBCState import EulerianMotionBCState
-from .FluidCavityPressureBC import FluidCavityPressureBC
-from .FluidCavityPressureBCState import FluidCavityPressureBCState
-from .MagneticVectorPotentialBC import MagneticVectorPotentialBC
-from .MaterialFlowBC import MaterialFlowBC
-from .MaterialFlowBCState import MaterialFlowBCState
-from .PorePressureBC import PorePressureBC
-from .PorePressureBCState import PorePressureBCState
-from .RetainedNodalDofsBC import RetainedNodalDofsBC
-from .SecondaryBaseBC import SecondaryBaseBC
-from .SecondaryBaseBCState import SecondaryBaseBCState
-from .SubmodelBC import SubmodelBC
-from .SubmodelBCState import SubmodelBCState
-from .TemperatureBC import TemperatureBC
-from .TemperatureBCState import TemperatureBCState
-from .TypeBC import TypeBC
-from .VelocityBaseMotionBC import VelocityBaseMotionBC
-from .VelocityBaseMotionBCState import VelocityBaseMotionBCState
-from .VelocityBC import VelocityBC
-from .VelocityBCState import VelocityBCState
+
+if TYPE_CHECKING:
+    from ..Amplitude.Correlation import Correlation
+    from ..Region.Region import Region
+    from ..Region.RegionArray import RegionArray
+    from .AccelerationBaseMotionBC import AccelerationBaseMotionBC
+    from .AccelerationBC import AccelerationBC
+    from .AcousticPressureBC import AcousticPressureBC
+    from .ConcentrationBC import ConcentrationBC
+    from .ConnAccelerationBC import ConnAccelerationBC
+    from .ConnDisplacementBC import ConnDisplacementBC
+    from .ConnVelocityBC import ConnVelocityBC
+    from .DisplacementBaseMotionBC import DisplacementBaseMotionBC
+    from .DisplacementBC import DisplacementBC
+    from .ElectricPotentialBC import ElectricPotentialBC
+    from .EulerianBC import EulerianBC
+    from .EulerianMotionBC import EulerianMotionBC
+    from .FluidCavityPressureBC import FluidCavityPressureBC
+    from .MagneticVectorPotentialBC import MagneticVectorPotentialBC
+    from .MaterialFlowBC import MaterialFlowBC
+    from .PorePressureBC import PorePressureBC
+    from .RetainedNodalDofsBC import RetainedNodalDofsBC
+    from .SecondaryBaseBC import SecondaryBaseBC
+    from .SubmodelBC import SubmodelBC
+    from .TemperatureBC import TemperatureBC
+    from .TypeBC import TypeBC
+    from .VelocityBaseMotionBC import VelocityBaseMotionBC
+    from .VelocityBC import VelocityBC
 
 
 @abaqus_class_doc
@@ -130,6 +112,9 @@ class BoundaryConditionModel(ModelBase):
         bc: AccelerationBaseMotionBC
             An AccelerationBaseMotionBC object.
         """
+        from .AccelerationBaseMotionBC import AccelerationBaseMotionBC
+        from .AccelerationBaseMotionBCState import AccelerationBaseMotionBCState
+
         self.boundaryConditions[name] = boundaryCondition = AccelerationBaseMotionBC(
             name,
             createStepName,
@@ -221,6 +206,9 @@ class BoundaryConditionModel(ModelBase):
         bc: AccelerationBC
             An AccelerationBC object.
         """
+        from .AccelerationBC import AccelerationBC
+        from .AccelerationBCState import AccelerationBCState
+
         self.boundaryConditions[name] = boundaryCondition = AccelerationBC(
             name,
             createStepName,
@@ -290,6 +278,9 @@ class BoundaryConditionModel(ModelBase):
         bc: AcousticPressureBC
             An AcousticPressureBC object.
         """
+        from .AcousticPressureBC import AcousticPressureBC
+        from .AcousticPressureBCState import AcousticPressureBCState
+
         self.boundaryConditions[name] = boundaryCondition = AcousticPressureBC(
             name,
             createStepName,
@@ -354,6 +345,9 @@ class BoundaryConditionModel(ModelBase):
         bc: ConcentrationBC
             A ConcentrationBC object.
         """
+        from .ConcentrationBC import ConcentrationBC
+        from .ConcentrationBCState import ConcentrationBCState
+
         self.boundaryConditions[name] = boundaryCondition = ConcentrationBC(
             name,
             createStepName,
@@ -450,6 +444,9 @@ class BoundaryConditionModel(ModelBase):
         bc: ConnAccelerationBC
             A ConnAccelerationBC object.
         """
+        from .ConnAccelerationBC import ConnAccelerationBC
+        from .ConnAccelerationBCState import ConnAccelerationBCState
+
         self.boundaryConditions[name] = boundaryCondition = ConnAccelerationBC(
             name,
             createStepName,
@@ -562,6 +559,9 @@ class BoundaryConditionModel(ModelBase):
         bc: ConnDisplacementBC
             A ConnDisplacementBC object.
         """
+        from .ConnDisplacementBC import ConnDisplacementBC
+        from .ConnDisplacementBCState import ConnDisplacementBCState
+
         self.boundaryConditions[name] = boundaryCondition = ConnDisplacementBC(
             name,
             createStepName,
@@ -665,6 +665,9 @@ class BoundaryConditionModel(ModelBase):
         bc: ConnVelocityBC
             A ConnVelocityBC object.
         """
+        from .ConnVelocityBC import ConnVelocityBC
+        from .ConnVelocityBCState import ConnVelocityBCState
+
         self.boundaryConditions[name] = boundaryCondition = ConnVelocityBC(
             name,
             createStepName,
@@ -736,6 +739,9 @@ class BoundaryConditionModel(ModelBase):
         bc: DisplacementBaseMotionBC
             A DisplacementBaseMotionBC object.
         """
+        from .DisplacementBaseMotionBC import DisplacementBaseMotionBC
+        from .DisplacementBaseMotionBCState import DisplacementBaseMotionBCState
+
         self.boundaryConditions[name] = boundaryCondition = DisplacementBaseMotionBC(
             name,
             createStepName,
@@ -842,6 +848,9 @@ class BoundaryConditionModel(ModelBase):
         bc: DisplacementBC
             A DisplacementBC object
         """
+        from .DisplacementBC import DisplacementBC
+        from .DisplacementBCState import DisplacementBCState
+
         self.boundaryConditions[name] = boundaryCondition = DisplacementBC(
             name,
             createStepName,
@@ -913,6 +922,9 @@ class BoundaryConditionModel(ModelBase):
         bc: ElectricPotentialBC
             An ElectricPotentialBC object.
         """
+        from .ElectricPotentialBC import ElectricPotentialBC
+        from .ElectricPotentialBCState import ElectricPotentialBCState
+
         self.boundaryConditions[name] = boundaryCondition = ElectricPotentialBC(
             name,
             createStepName,
@@ -967,6 +979,9 @@ class BoundaryConditionModel(ModelBase):
         bc: EulerianBC
             An EulerianBC object.
         """
+        from .EulerianBC import EulerianBC
+        from .EulerianBCState import EulerianBCState
+
         self.boundaryConditions[name] = boundaryCondition = EulerianBC(
             name, createStepName, region, definition, inflowType, outflowType
         )
@@ -1101,6 +1116,9 @@ class BoundaryConditionModel(ModelBase):
         bc: EulerianMotionBC
             An EulerianMotionBC object.
         """
+        from .EulerianMotionBC import EulerianMotionBC
+        from .EulerianMotionBCState import EulerianMotionBCState
+
         self.boundaryConditions[name] = boundaryCondition = EulerianMotionBC(
             name,
             createStepName,
@@ -1173,6 +1191,9 @@ class BoundaryConditionModel(ModelBase):
         bc: FluidCavityPressureBC
             A FluidCavityPressureBC object.
         """
+        from .FluidCavityPressureBC import FluidCavityPressureBC
+        from .FluidCavityPressureBCState import FluidCavityPressureBCState
+
         self.boundaryConditions[name] = boundaryCondition = FluidCavityPressureBC(
             name, createStepName, fluidCavity, magnitude, amplitude, fixed
         )
@@ -1237,6 +1258,8 @@ class BoundaryConditionModel(ModelBase):
         bc: MagneticVectorPotentialBC
             A MagneticVectorPotentialBC object.
         """
+        from .MagneticVectorPotentialBC import MagneticVectorPotentialBC
+
         self.boundaryConditions[name] = boundaryCondition = MagneticVectorPotentialBC(
             name,
             createStepName,
@@ -1301,6 +1324,9 @@ class BoundaryConditionModel(ModelBase):
         bc: MaterialFlowBC
             A MaterialFlowBC object.
         """
+        from .MaterialFlowBC import MaterialFlowBC
+        from .MaterialFlowBCState import MaterialFlowBCState
+
         self.boundaryConditions[name] = boundaryCondition = MaterialFlowBC(
             name,
             createStepName,
@@ -1365,6 +1391,9 @@ class BoundaryConditionModel(ModelBase):
         bc: PorePressureBC
             A PorePressureBC object.
         """
+        from .PorePressureBC import PorePressureBC
+        from .PorePressureBCState import PorePressureBCState
+
         self.boundaryConditions[name] = boundaryCondition = PorePressureBC(
             name,
             createStepName,
@@ -1433,6 +1462,8 @@ class BoundaryConditionModel(ModelBase):
         bc: RetainedNodalDofsBC
             A RetainedNodalDofsBC object.
         """
+        from .RetainedNodalDofsBC import RetainedNodalDofsBC
+
         self.boundaryConditions[name] = boundaryCondition = RetainedNodalDofsBC(
             name, createStepName, region, u1, u2, u3, ur1, ur2, ur3
         )
@@ -1464,6 +1495,9 @@ class BoundaryConditionModel(ModelBase):
         bc: SecondaryBaseBC
             A SecondaryBaseBC object.
         """
+        from .SecondaryBaseBC import SecondaryBaseBC
+        from .SecondaryBaseBCState import SecondaryBaseBCState
+
         self.boundaryConditions[name] = boundaryCondition = SecondaryBaseBC(name, createStepName, regions, dofs)
         self.steps[createStepName].boundaryConditionStates[name] = SecondaryBaseBCState()
         return boundaryCondition
@@ -1552,6 +1586,9 @@ class BoundaryConditionModel(ModelBase):
         bc: SubmodelBC
             A SubmodelBC object.
         """
+        from .SubmodelBC import SubmodelBC
+        from .SubmodelBCState import SubmodelBCState
+
         self.boundaryConditions[name] = boundaryCondition = SubmodelBC(
             name,
             createStepName,
@@ -1625,6 +1662,9 @@ class BoundaryConditionModel(ModelBase):
         bc: TemperatureBC
             A TemperatureBC object.
         """
+        from .TemperatureBC import TemperatureBC
+        from .TemperatureBCState import TemperatureBCState
+
         self.boundaryConditions[name] = boundaryCondition = TemperatureBC(
             name,
             createStepName,
@@ -1692,6 +1732,9 @@ class BoundaryConditionModel(ModelBase):
         bc: VelocityBaseMotionBC
             A VelocityBaseMotionBC object.
         """
+        from .VelocityBaseMotionBC import VelocityBaseMotionBC
+        from .VelocityBaseMotionBCState import VelocityBaseMotionBCState
+
         self.boundaryConditions[name] = boundaryCondition = VelocityBaseMotionBC(
             name,
             createStepName,
@@ -1783,6 +1826,9 @@ class BoundaryConditionModel(ModelBase):
         bc: VelocityBC
             A VelocityBC object.
         """
+        from .VelocityBC import VelocityBC
+        from .VelocityBCState import VelocityBCState
+
         self.boundaryConditions[name] = boundaryCondition = VelocityBC(
             name,
             createStepName,
@@ -1841,6 +1887,8 @@ class BoundaryConditionModel(ModelBase):
         TypeBC
             A TypeBC object.
         """
+        from .TypeBC import TypeBC
+
         self.boundaryConditions[name] = boundaryCondition = TypeBC.EncastreBC(
             name,
             createStepName,
@@ -1890,6 +1938,8 @@ class BoundaryConditionModel(ModelBase):
         TypeBC
             A TypeBC object.
         """
+        from .TypeBC import TypeBC
+
         self.boundaryConditions[name] = boundaryCondition = TypeBC.PinnedBC(
             name,
             createStepName,
@@ -1939,6 +1989,8 @@ class BoundaryConditionModel(ModelBase):
         TypeBC
             A TypeBC object.
         """
+        from .TypeBC import TypeBC
+
         self.boundaryConditions[name] = boundaryCondition = TypeBC.XsymmBC(
             name,
             createStepName,
@@ -1988,6 +2040,8 @@ class BoundaryConditionModel(ModelBase):
         TypeBC
             A TypeBC object.
         """
+        from .TypeBC import TypeBC
+
         self.boundaryConditions[name] = boundaryCondition = TypeBC.YsymmBC(
             name,
             createStepName,
@@ -2037,6 +2091,8 @@ class BoundaryConditionModel(ModelBase):
         TypeBC
             A TypeBC object.
         """
+        from .TypeBC import TypeBC
+
         self.boundaryConditions[name] = boundaryCondition = TypeBC.ZsymmBC(
             name,
             createStepName,
@@ -2086,6 +2142,8 @@ class BoundaryConditionModel(ModelBase):
         TypeBC
             A TypeBC object.
         """
+        from .TypeBC import TypeBC
+
         self.boundaryConditions[name] = boundaryCondition = TypeBC.XasymmBC(
             name,
             createStepName,
@@ -2135,6 +2193,8 @@ class BoundaryConditionModel(ModelBase):
         TypeBC
             A TypeBC object.
         """
+        from .TypeBC import TypeBC
+
         self.boundaryConditions[name] = boundaryCondition = TypeBC.YasymmBC(
             name,
             createStepName,
@@ -2184,6 +2244,8 @@ class BoundaryConditionModel(ModelBase):
         TypeBC
             A TypeBC object.
         """
+        from .TypeBC import TypeBC
+
         self.boundaryConditions[name] = boundaryCondition = TypeBC.ZasymmBC(
             name,
             createStepName,
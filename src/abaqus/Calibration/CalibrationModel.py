@@ -1,8 +1,14 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
-from ..Calibration.Calibration import Calibration
 from ..Model.ModelBase import ModelBase
 
+if TYPE_CHECKING:
+    from ..Calibration.Calibration import Calibration
+
 
 @abaqus_class_doc
 class CalibrationModel(ModelBase):
@@ -33,5 +39,7 @@ class CalibrationModel(ModelBase):
         Calibration
             A Calibration object.
         """
+        from ..Calibration.Calibration import Calibration
+
         self.calibrations[name] = calibration = Calibration(name)
         return calibration
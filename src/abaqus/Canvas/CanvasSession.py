@@ -7,7 +7,6 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 from ..Session.SessionBase import SessionBase
 from ..UtilityAndView.abaqusConstants import ON, SYSTEM, Boolean
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
-from .Viewport import Viewport
 
 
 @abaqus_class_doc
@@ -78,6 +77,8 @@ class CanvasSession(SessionBase):
         RangeError: height must be a Float in the range: 30 <= width <= **maxHeight**
             If **height** is out of range.
         """
+        from .Viewport import Viewport
+
         self.viewports[name] = viewport = Viewport(
             name, origin, width, height, border, titleBar, titleStyle, customTitleString
         )
@@ -1,15 +1,12 @@
 from __future__ import annotations
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
 from typing_extensions import Literal
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
-from ..Assembly.PartInstance import PartInstance
-from ..BasicGeometry.ModelDotArray import ModelDotArray
 from ..Model.ModelBase import ModelBase
-from ..Region.Region import Region
 from ..UtilityAndView.abaqusConstants import (
     BOTH,
     COMPUTED,
@@ -22,15 +19,20 @@ from ..UtilityAndView.abaqusConstants import (
     Boolean,
 )
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
-from .AdjustPoints import AdjustPoints
-from .Coupling import Coupling
-from .DisplayBody import DisplayBody
-from .EmbeddedRegion import EmbeddedRegion
-from .Equation import Equation
-from .MultipointConstraint import MultipointConstraint
-from .RigidBody import RigidBody
-from .ShellSolidCoupling import ShellSolidCoupling
-from .Tie import Tie
+
+if TYPE_CHECKING:
+    from ..Assembly.PartInstance import PartInstance
+    from ..BasicGeometry.ModelDotArray import ModelDotArray
+    from ..Region.Region import Region
+    from .AdjustPoints import AdjustPoints
+    from .Coupling import Coupling
+    from .DisplayBody import DisplayBody
+    from .EmbeddedRegion import EmbeddedRegion
+    from .Equation import Equation
+    from .MultipointConstraint import MultipointConstraint
+    from .RigidBody import RigidBody
+    from .ShellSolidCoupling import ShellSolidCoupling
+    from .Tie import Tie
 
 
 @abaqus_class_doc
@@ -66,6 +68,8 @@ class ConstraintModel(ModelBase):
         AdjustPoints
             An AdjustPoints object.
         """
+        from .AdjustPoints import AdjustPoints
+
         self.constraints[name] = constraint = AdjustPoints(name, surface, controlPoints)
         return constraint
 
@@ -165,6 +169,8 @@ class ConstraintModel(ModelBase):
         Coupling
             A Coupling object.
         """
+        from .Coupling import Coupling
+
         self.constraints[name] = constraint = Coupling(
             name,
             surface,
@@ -211,6 +217,8 @@ class ConstraintModel(ModelBase):
         DisplayBody
             A DisplayBody object.
         """
+        from .DisplayBody import DisplayBody
+
         self.constraints[name] = constraint = DisplayBody(name, instance, controlPoints)
         return constraint
 
@@ -265,6 +273,8 @@ class ConstraintModel(ModelBase):
         EmbeddedRegion
             An EmbeddedRegion object.
         """
+        from .EmbeddedRegion import EmbeddedRegion
+
         self.constraints[name] = constraint = EmbeddedRegion(
             name,
             embeddedRegion,
@@ -303,6 +313,8 @@ class ConstraintModel(ModelBase):
         Exception
             If **terms** does not contain more than one entry, Equation must have two or more terms.
         """
+        from .Equation import Equation
+
         self.constraints[name] = constraint = Equation(name, terms)
         return constraint
 
@@ -355,6 +367,8 @@ class ConstraintModel(ModelBase):
         MultipointConstraint
             A MultipointConstraint object.
         """
+        from .MultipointConstraint import MultipointConstraint
+
         self.constraints[name] = constraint = MultipointConstraint(
             name, surface, controlPoint, mpcType, csys, userType, userMode
         )
@@ -409,6 +423,8 @@ class ConstraintModel(ModelBase):
         RigidBody
             A RigidBody object.
         """
+        from .RigidBody import RigidBody
+
         self.constraints[name] = constraint = RigidBody(
             name,
             refPointRegion,
@@ -467,6 +483,8 @@ class ConstraintModel(ModelBase):
         ShellSolidCoupling
             A ShellSolidCoupling object.
         """
+        from .ShellSolidCoupling import ShellSolidCoupling
+
         self.constraints[name] = constraint = ShellSolidCoupling(
             name,
             shellEdge,
@@ -546,6 +564,8 @@ class ConstraintModel(ModelBase):
         Tie
             A Tie object.
         """
+        from .Tie import Tie
+
         self.constraints[name] = constraint = Tie(
             name,
             main,
@@ -1,8 +1,14 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ..Session.SessionBase import SessionBase
-from .DisplayGroup import DisplayGroup
-from .Leaf import Leaf
+
+if TYPE_CHECKING:
+    from .DisplayGroup import DisplayGroup
+    from .Leaf import Leaf
 
 
 @abaqus_class_doc
@@ -28,5 +34,7 @@ class DisplayGroupSession(SessionBase):
         DisplayGroup
             A DisplayGroup object.
         """
+        from .DisplayGroup import DisplayGroup
+
         self.displayGroups[name] = displayGroup = DisplayGroup(name, leaf)
         return displayGroup
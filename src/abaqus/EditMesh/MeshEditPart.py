@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Sequence, overload
+from typing import Any, Sequence, overload
 
 from typing_extensions import Literal
 
@@ -211,10 +211,36 @@ class MeshEditPart(PartBase):
 
         Raises
         ------
-        Exception
+        ValueError
             A coordinate and an offset may not both be specified for the same coordinate component
         """
-        ...
+        import numpy as np
+
+        from ..Mesh.MeshQuality import entityPositions, moveNodes
+
+        positions = entityPositions(self.nodes, nodes, "nodes")
+        values, offsets = (coordinate1, coordinate2, coordinate3), (offset1, offset2, offset3)
+        if any(value is not None and offset is not None for value, offset in zip(values, offsets)):
+            raise ValueError("A coordinate and an offset may not both be specified for the same coordinate component")
+        if len(coordinates):
+            if any(value is not None for value in values + offsets):
+                raise ValueError("The coordinates may not be specified with a coordinate or an offset")
+            if len(coordinates) != len(positions):
+                raise ValueError("The number of coordinates does not match the number of nodes")
+            positions = np.sort(positions, kind="stable")
+            local: Any = np.array([tuple(point) for point in coordinates], dtype=float)  # type: ignore
+        else:
+            local = self.nodes._coordinates()[positions]
+            if localCsys is not None:
+                local = np.array([localCsys.globalToLocal(tuple(point)) for point in local.tolist()], dtype=float)
+            for axis, (value, offset) in enumerate(zip(values, offsets)):
+                if value is not None:
+                    local[:, axis] = value
+                elif offset is not None:
+                    local[:, axis] += offset
+        if localCsys is not None:
+            local = np.array([localCsys.localToGlobal(tuple(point)) for point in local.tolist()], dtype=float)
+        moveNodes(self, positions, local)
 
     @abaqus_method_doc
     def projectNode(self, nodes: Sequence[MeshNode], projectionReference: str):
@@ -378,7 +404,106 @@ class MeshEditPart(PartBase):
 
     @abaqus_method_doc
     def mergeNodes(self, *args, **kwargs):
-        ...
+        import numpy as np
+
+        from ..Mesh.KDTree import KDTree
+        from ..Mesh.MeshQuality import entityPositions
+
+        def fromNodes(
+            nodes: Sequence[Node],
+            tolerance: float | None = None,
+            removeDuplicateElements: Boolean = True,
+            keepHighLabels: Boolean = False,
+        ):
+            positions = np.unique(entityPositions(self.nodes, nodes, "nodes"))
+            points = self.nodes._coordinates()[positions]
+            tree, roots = KDTree(points), list(range(len(positions)))
+
+            def root(index: int) -> int:
+                while roots[index] != index:
+                    roots[index] = index = roots[roots[index]]
+                return index
+
+            for index, point in enumerate(points.tolist()):
+                for other in tree.inSphere(point, 1e-6 if tolerance is None else tolerance).tolist():
+                    roots[root(other)] = root(index)
+            clusters: dict = {}
+            for index, position in enumerate(positions.tolist()):
+                clusters.setdefault(root(index), []).append(position)
+            return (
+                [cluster for cluster in clusters.values() if len(cluster) > 1],
+                removeDuplicateElements,
+                keepHighLabels,
+            )
+
+        def fromPair(
+            node1: MeshNode, node2: MeshNode, removeDuplicateElements: Boolean = True, keepHighLabels: Boolean = False
+        ):
+            positions = entityPositions(self.nodes, (node1, node2), "nodes").tolist()
+            return [positions] if positions[0] != positions[1] else [], removeDuplicateElements, keepHighLabels
+
+        pair = isinstance(args[0] if args else kwargs.get("node1"), MeshNode)
+        clusters, removeDuplicateElements, keepHighLabels = (fromPair if pair else fromNodes)(*args, **kwargs)
+        if clusters:
+            self._mergeNodes(clusters, removeDuplicateElements, keepHighLabels)
+
+    def _mergeNodes(self, clusters: Sequence[Sequence[int]], removeDuplicateElements: Boolean, keepHighLabels: Boolean):
+        """Merge each cluster of nodes, given by their positions, into the node of the lowest or the highest label
+        placed at their average position, keeping the quality metrics of the elements that are not around the
+        merged nodes."""
+        import numpy as np
+
+        from ..Mesh.LabelIndex import LabelIndex
+        from ..Mesh.MeshQuality import meshQuality
+
+        nodes, elements = self.nodes, self.elements
+        quality = meshQuality(self)
+        coordinates, labels = quality.coordinates, nodes._labelIndex().labels
+        elementLabels = elements._labelIndex().labels
+        target = np.arange(len(nodes))
+        survivors, centers = [], []
+        for cluster in map(np.asarray, clusters):
+            survivor = int(cluster[np.argmax(labels[cluster]) if keepHighLabels else np.argmin(labels[cluster])])
+            target[cluster] = survivor
+            survivors.append(survivor)
+            centers.append(coordinates[cluster].mean(axis=0))
+        removed = target != np.arange(len(nodes))
+        nodeMap = (np.cumsum(~removed) - 1)[target]
+
+        # The connectivity of the elements refers to the node indices, which are shifted by the removed nodes.
+        counts = np.array([len(element.connectivity) for element in elements], dtype=np.int64)
+        bounds = np.concatenate((np.zeros(1, dtype=np.int64), np.cumsum(counts))).tolist()
+        flat = np.fromiter((node for element in elements for node in element.connectivity), np.int64, bounds[-1])
+        owners, mapped = np.repeat(np.arange(len(elements)), counts), nodeMap[flat]
+        for position in np.unique(owners[mapped != flat]).tolist():
+            start, end = bounds[position], bounds[position + 1]
+            elements[position].connectivity = tuple(mapped[start:end].tolist())
+        merged = np.unique(owners[np.isin(flat, np.concatenate(clusters))])
+        kept = np.ones(len(elements), dtype=bool)
+        if removeDuplicateElements:
+            seen: dict = {}
+            for position in merged.tolist():
+                element = elements[position]
+                key = (getattr(element, "type", None), tuple(sorted(element.connectivity)))
+                kept[position] = seen.setdefault(key, position) == position
+
+        newCoordinates = coordinates[~removed]
+        newCoordinates[nodeMap[survivors]] = centers
+        for survivor, center in zip(survivors, centers):
+            nodes[survivor].coordinates = tuple(center.tolist())
+        for position in np.flatnonzero(removed)[::-1].tolist():
+            del nodes[position]
+        for position in np.flatnonzero(~kept)[::-1].tolist():
+            del elements[position]
+        quality.remap(nodeMap, kept, newCoordinates)
+        for name in ("coordinates", "editableCoordinates"):
+            nodes._store(name, newCoordinates)
+        nodes._store("labelIndex", LabelIndex(labels[~removed]))
+        elements._discard("connectivity", "spatialIndex")
+        elements._store("labelIndex", LabelIndex(elementLabels[kept]))
+        elements._store("topology", quality.groups)
+        elements._store("quality", quality)
+        quality.update(nodeMap[survivors])
 
     def orientElements(self, pickedElements: Sequence[MeshElement], referenceRegion: MeshFace):
         """This method orients the stack direction of elements in a continuum shell or gasket mesh.
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from typing_extensions import Literal
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
-from ..DisplayGroup.DisplayGroup import DisplayGroup
-from ..Odb.Odb import Odb
 from ..Session.SessionBase import SessionBase
 from ..UtilityAndView.abaqusConstants import SPECIFY, Boolean
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
 
+if TYPE_CHECKING:
+    from ..DisplayGroup.DisplayGroup import DisplayGroup
+    from ..Odb.Odb import Odb
+
 
 @abaqus_class_doc
 class FieldReportSession(SessionBase):
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from typing_extensions import Literal
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
@@ -7,10 +9,12 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 from ..Odb.OdbBase import OdbBase
 from ..UtilityAndView.abaqusConstants import NONE, OFF, Boolean
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
-from .ButterworthFilter import ButterworthFilter
-from .Chebyshev1Filter import Chebyshev1Filter
-from .Chebyshev2Filter import Chebyshev2Filter
-from .OperatorFilter import OperatorFilter
+
+if TYPE_CHECKING:
+    from .ButterworthFilter import ButterworthFilter
+    from .Chebyshev1Filter import Chebyshev1Filter
+    from .Chebyshev2Filter import Chebyshev2Filter
+    from .OperatorFilter import OperatorFilter
 
 
 @abaqus_class_doc
@@ -79,6 +83,8 @@ class FilterOdb(OdbBase):
         InvalidNameError
         RangeError
         """
+        from .ButterworthFilter import ButterworthFilter
+
         self.filters[name] = butterworthFilter = ButterworthFilter(
             name, cutoffFrequency, order, operation, halt, limit, invariant
         )
@@ -143,6 +149,8 @@ class FilterOdb(OdbBase):
         InvalidNameError
         RangeError
         """
+        from .Chebyshev1Filter import Chebyshev1Filter
+
         self.filters[name] = chebyshev1Filter = Chebyshev1Filter(
             name,
             cutoffFrequency,
@@ -214,6 +222,8 @@ class FilterOdb(OdbBase):
         InvalidNameError
         RangeError
         """
+        from .Chebyshev2Filter import Chebyshev2Filter
+
         self.filters[name] = chebyshev2Filter = Chebyshev2Filter(
             name,
             cutoffFrequency,
@@ -281,6 +291,8 @@ class FilterOdb(OdbBase):
         InvalidNameError
         RangeError
         """
+        from .OperatorFilter import OperatorFilter
+
         self.filters[name] = operatorFilter = OperatorFilter(
             name, cutoffFrequency, order, operation, halt, limit, invariant
         )
@@ -1,8 +1,14 @@
+from __future__ import annotations
+
+from typing import Any, Iterator
+
+import numpy as np
+
 from abqpy.decorators import abaqus_class_doc
 
 
 @abaqus_class_doc
-class AbaqusNDarray:
+class AbaqusNDarray(np.ndarray):
     """The AbaqusNDarray object is a sequence object derived from numpy.ndarray and is used to store numeric
     keyword data from an Abaqus input file. This object is similar to the numpy.ndarray object, but the numeric
     elements are returned as standard Python objects, not numpy numeric types. The numeric elements can be:
@@ -15,4 +21,59 @@ class AbaqusNDarray:
     cases, it will be False.
     """
 
-    ...
+    #: A Boolean specifying whether the first column holds ints while the array holds floats.
+    colZeroIsInt: bool = False
+
+    def __new__(cls, data: Any, colZeroIsInt: bool = False) -> AbaqusNDarray:
+        array = np.asarray(data).view(cls)
+        array.colZeroIsInt = bool(colZeroIsInt) and array.ndim in (1, 2) and array.dtype.kind == "f"
+        return array
+
+    def __array_finalize__(self, array: Any):
+        self.colZeroIsInt = getattr(array, "colZeroIsInt", False)
+
+    def __reduce__(self) -> Any:
+        function, arguments, state = super().__reduce__()  # type: ignore
+        return function, arguments, (state, self.colZeroIsInt)
+
+    def __setstate__(self, state: Any):
+        state, self.colZeroIsInt = state
+        super().__setstate__(state)
+
+    def __getitem__(self, key: Any) -> Any:
+        value = super().__getitem__(key)
+        column = self._columnKey(key)
+        if isinstance(value, np.ndarray):
+            keepsColumnZero = isinstance(column, slice) and column.start in (None, 0) and column.step in (None, 1)
+            value.colZeroIsInt = self.colZeroIsInt and keepsColumnZero  # type: ignore
+            return value
+        if self.colZeroIsInt and isinstance(column, (int, np.integer)) and column == 0:
+            return int(value)
+        return value.item()
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def tolist(self) -> Any:
+        """Return the array as nested lists of Python numbers, with ints in the first column if **colZeroIsInt**
+        is True."""
+        values = super().tolist()
+        if not self.colZeroIsInt or not values:
+            return values
+        if self.ndim == 1:
+            values[0] = int(values[0])
+            return values
+        for row in values:
+            row[0] = int(row[0])
+        return values
+
+    def _columnKey(self, key: Any) -> Any:
+        """Return the part of an index selecting along the last axis, the columns of a two-dimensional array."""
+        if isinstance(key, tuple):
+            return (
+                key[self.ndim - 1]
+                if len(key) == self.ndim and all(item is not Ellipsis for item in key)
+                else slice(None)
+            )
+        return key if self.ndim == 1 else slice(None)
@@ -1,6 +1,25 @@
+from __future__ import annotations
+
+import copy
+import os
+from functools import partial
+from typing import Callable, Dict, Iterable, Iterator, Sequence, Set, Tuple
+
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ..UtilityAndView.abaqusConstants import Boolean
+from .InputFileReader import (
+    BULK_KEYWORDS,
+    includePath,
+    keywordName,
+    organizeKeywords,
+    parameterValue,
+    parseFile,
+    readKeywords,
+    scanIncludes,
+)
+from .Keyword import Keyword
+from .KeywordSequence import KeywordSequence
 
 
 @abaqus_class_doc
@@ -28,6 +47,9 @@ class InputFile:
     #: not be located.
     missingIncludes: tuple = ()
 
+    #: A Boolean specifying whether the input file was parsed.
+    _parsed: bool = False
+
     @abaqus_method_doc
     def __init__(self, file: str, directory: str = ""):
         """This method creates an InputFile object by reading an Abaqus input file.
@@ -49,7 +71,8 @@ class InputFile:
         InputFile
             An InputFile object.
         """
-        ...
+        self.file = file
+        self.directory = directory
 
     @abaqus_method_doc
     def parse(
@@ -58,7 +81,8 @@ class InputFile:
         verbose: Boolean = False,
         bulk: Boolean = True,
         usePyArray: Boolean = False,
-    ):
+        processes: int = 0,
+    ) -> KeywordSequence:
         """This method parses the input file associated with the InputFile object.
 
         Parameters
@@ -78,6 +102,14 @@ class InputFile:
             data value. In cases where large amounts of numerical data (i.e., large node arrays) are
             expected, it is recommended that you use the option usePyArray=True. The default is
             False.
+        processes
+            An Int specifying the number of processes parsing the input file and the files it includes in
+            parallel, the keywords being stitched back together in the order of the input file. The included
+            files are found by scanning the keyword lines, and each file is submitted as soon as it is found. The
+            default value is 0, which parses the files one after the other in the calling process.
+
+            .. note::
+                This argument is not part of the Abaqus Scripting Interface.
 
         Returns
         -------
@@ -88,6 +120,127 @@ class InputFile:
         ------
         ValueError
             If you parse an input file more than once, a ValueError is raised for each subsequent
-            parsing.
+            parsing. A ValueError is also raised if an input file includes itself, directly or through
+            the files it includes.
+        """
+        if self._parsed:
+            raise ValueError(f"The input file {self.file} has already been parsed")
+        self._parsed = True
+        if processes <= 0:
+            keywords = list(self.iterKeywords(bulk=bulk, usePyArray=usePyArray, verbose=verbose))
+        else:
+            keywords = self._parseInParallel(_skippedKeywords(bulk), bool(usePyArray), bool(verbose), processes)
+        return organizeKeywords(keywords) if organize else keywords
+
+    def iterKeywords(
+        self,
+        bulk: Boolean = True,
+        usePyArray: Boolean = False,
+        verbose: Boolean = False,
+        skip: Sequence[str] = (),
+    ) -> Iterator[Keyword]:
+        """This method reads the input file associated with the InputFile object one keyword at a time, as the
+        keywords are consumed, so that the memory used depends on the largest keyword block rather than on the size
+        of the input file. The included files are opened when their ``*INCLUDE`` keyword is reached, and
+        **includes** and **missingIncludes** are updated at that time. Unlike the parse method, this method can be
+        called any number of times.
+
+        .. note::
+            This method is not part of the Abaqus Scripting Interface. For example::
+
+                for keyword in InputFile("job.inp").iterKeywords(usePyArray=True, skip=("ELSET",)):
+                    if keyword.name.upper() == "NODE":
+                        nodes = keyword.data
+
+        Parameters
+        ----------
+        bulk
+            A Boolean specifying whether the data of the ``*NODE``, ``*ELEMENT``, ``*NSET`` and ``*ELSET`` keywords
+            should be parsed. The default is True.
+        usePyArray
+            A Boolean specifying whether numeric keyword data is returned as AbaqusNDarray objects. The default is
+            False.
+        verbose
+            A Boolean specifying whether the included files that cannot be found are printed. The default is False.
+        skip
+            A sequence of Strings specifying the names of the keywords whose data is not parsed, such as "ELSET".
+            The data of these keywords is an empty list. The default is an empty sequence.
+
+        Yields
+        ------
+        Keyword
+            The Keyword objects in the order of the input file, the ``*INCLUDE`` keywords being replaced by the
+            keywords of the included files.
+
+        Raises
+        ------
+        ValueError
+            If an input file includes itself, directly or through the files it includes.
         """
-        ...
+        self.includes, self.missingIncludes = (), ()
+        keywordsOf = partial(readKeywords, skipped=_skippedKeywords(bulk, skip), usePyArray=bool(usePyArray))
+        yield from self._readKeywords(os.path.join(self.directory, self.file), keywordsOf, verbose)
+
+    def _parseInParallel(self, skipped: Set[str], usePyArray: bool, verbose: bool, processes: int) -> KeywordSequence:
+        """Parse the input file and the files it includes in a pool of processes, the included files being
+        submitted as soon as they are found by scanning the keyword lines of the files including them."""
+        from concurrent.futures import Future, ProcessPoolExecutor
+
+        path = os.path.join(self.directory, self.file)
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures: Dict[str, Future] = {}
+            pending = [path]
+            while pending:
+                file = pending.pop(0)
+                if file not in futures and os.path.isfile(file):
+                    futures[file] = executor.submit(parseFile, file, skipped, usePyArray)
+                    pending += [includePath(file, include) for include in scanIncludes(file)]
+
+            spliced: Set[str] = set()
+
+            def keywordsOf(file: str) -> Iterable[Keyword]:
+                if file not in futures:
+                    return readKeywords(file, skipped, usePyArray)
+                keywords = futures[file].result()
+                if file in spliced:
+                    # A file included more than once is spliced in as copies, so that its keywords are distinct
+                    return copy.deepcopy(keywords)
+                spliced.add(file)
+                return keywords
+
+            self.includes, self.missingIncludes = (), ()
+            return list(self._readKeywords(path, keywordsOf, verbose))
+
+    def _readKeywords(
+        self,
+        path: str,
+        keywordsOf: Callable[[str], Iterable[Keyword]],
+        verbose: Boolean,
+        including: Tuple[str, ...] = (),
+    ) -> Iterator[Keyword]:
+        """Yield the keywords of an input file, replacing the ``*INCLUDE`` keywords by the keywords of the included
+        files, the ``*INCLUDE`` keywords of missing files are kept. The comments of a replaced ``*INCLUDE`` keyword
+        belong to the next keyword of the input file. A ValueError is raised if the file is one of the files
+        including it."""
+        if os.path.realpath(path) in including:
+            raise ValueError(f"The input file {path} includes itself")
+        including += (os.path.realpath(path),)
+        comments: Tuple[str, ...] = ()
+        for keyword in keywordsOf(path):
+            keyword.comments, comments = comments + keyword.comments, ()
+            if keywordName(keyword.name) == "INCLUDE":
+                include = includePath(path, parameterValue(keyword.parameter or {}, "input"))
+                if os.path.isfile(include):
+                    self.includes += (include,)
+                    yield from self._readKeywords(include, keywordsOf, verbose, including)
+                    comments = keyword.comments
+                    continue
+                self.missingIncludes += (include,)
+                if verbose:
+                    print(f"Cannot find the file {include} included in the input file {path}")
+            yield keyword
+
+
+def _skippedKeywords(bulk: Boolean, skip: Sequence[str] = ()) -> Set[str]:
+    """Return the normalized names of the keywords whose data is not parsed."""
+    return {keywordName(name) for name in skip} | (set() if bulk else set(BULK_KEYWORDS))
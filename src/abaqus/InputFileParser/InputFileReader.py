@@ -0,0 +1,351 @@
+"""Tokenization of the keyword blocks of an Abaqus input file without the Abaqus kernel.
+
+An input file is read in large chunks and split into keyword blocks, a keyword line followed by its data lines, by
+searching the chunks for the lines starting with a single ``*``. The data of the blocks that only hold numbers, such
+as the data of ``*NODE`` and ``*ELEMENT``, is handed to NumPy as a whole, instead of being split into a tuple per
+line; the other data lines are split into lists of ints, floats and strings.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import re
+from functools import partial
+from typing import TYPE_CHECKING, Any, Collection, Dict, Iterator, List, Tuple
+
+from .Keyword import Keyword
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .KeywordSequence import KeywordSequence
+
+#: The keywords whose data is bulk data, which is skipped when the input file is parsed with bulk=False.
+BULK_KEYWORDS = frozenset({"NODE", "ELEMENT", "NSET", "ELSET"})
+
+#: The keywords whose data lines ending with a comma are continued on the next line.
+CONTINUED_KEYWORDS = frozenset({"ELEMENT"})
+
+#: The number of characters read from the input file at once.
+CHUNK_SIZE = 1 << 24
+
+_PARAMETER_SEPARATOR = re.compile(r',(?=(?:[^"]*"[^"]*")*[^"]*$)')
+_NUMBER_START = re.compile(r"\s*[+-]?\.?\d")
+
+
+def keywordName(name: str) -> str:
+    """Return the normalized form of a keyword name, in uppercase with single spaces, such as "END STEP"."""
+    return " ".join(name.upper().split())
+
+
+def readBlocks(path: str, chunkSize: int = CHUNK_SIZE) -> Iterator[str]:
+    """Yield the keyword blocks of an input file, each block starting with its keyword line.
+
+    Only one block and one chunk are held in memory at a time. The text preceding the first keyword, such as
+    comment lines, is yielded as a block without a keyword line.
+
+    Parameters
+    ----------
+    path
+        A String specifying the path to the input file.
+    chunkSize
+        An Int specifying the number of characters read at once.
+
+    Yields
+    ------
+    str
+        The text of a keyword block, with the line endings normalized to newlines.
+    """
+    pieces: List[str] = []
+    atLineStart = True
+    with open(path, encoding="latin-1") as file:
+        for chunk in iter(partial(file.read, chunkSize), ""):
+            while chunk.endswith("*"):
+                # A keyword line is told from a comment line by the character following the star.
+                following = file.read(1)
+                if not following:
+                    break
+                chunk += following
+            previous = 0
+            for start in _keywordStarts(chunk, atLineStart):
+                pieces.append(chunk[previous:start])
+                # The block is only referenced by the consumer, which can release it before the next block is read.
+                blocks, pieces, previous = ["".join(pieces)], [], start
+                if blocks[0]:
+                    yield blocks.pop()
+            pieces.append(chunk[previous:])
+            atLineStart = chunk.endswith("\n")
+    block = "".join(pieces)
+    if block:
+        yield block
+
+
+def _keywordStarts(chunk: str, atLineStart: bool) -> List[int]:
+    """Return the indices of the keyword lines of a chunk, the lines starting with a single star."""
+    starts = [0] if atLineStart and chunk[:1] == "*" and chunk[1:2] != "*" else []
+    index = chunk.find("\n*")
+    while index != -1:
+        if chunk[index + 2 : index + 3] != "*":
+            starts.append(index + 1)
+        index = chunk.find("\n*", index + 2)
+    return starts
+
+
+def splitBlock(block: str) -> Tuple[str, str]:
+    """Split a keyword block into its keyword line, joined with its continuation lines, and its data text. The
+    text preceding the first keyword of a file, such as comment lines, has no keyword line."""
+    if not block.startswith("*") or block.startswith("**"):
+        return "", block
+    end = block.find("\n")
+    while end != -1 and block[:end].rstrip().endswith(","):
+        end = block.find("\n", end + 1)
+    if end == -1:
+        return block.replace("\n", ""), ""
+    return block[:end].replace("\n", ""), block[end + 1 :]
+
+
+def parseKeywordLine(line: str) -> Tuple[str, Dict[str, str]]:
+    """Parse a keyword line into the keyword name and the dictionary of its parameters.
+
+    Parameters
+    ----------
+    line
+        A String specifying the keyword line, such as ``*Element, type=C3D8R, elset="Set 1"``.
+
+    Returns
+    -------
+    tuple[str, dict[str, str]]
+        The keyword name, such as "Element", and its parameters, whose values are Strings, without the surrounding
+        quotes, or empty Strings for the parameters without a value.
+    """
+    name, *items = _PARAMETER_SEPARATOR.split(line.lstrip("*"))
+    parameter = {}
+    for item in items:
+        key, _, value = item.partition("=")
+        if key.strip():
+            value = value.strip()
+            if len(value) > 1 and value[0] == value[-1] == '"':
+                value = value[1:-1]
+            parameter[key.strip()] = value
+    return name.strip(), parameter
+
+
+def parseData(name: str, text: str, usePyArray: bool = False) -> Tuple[Any, List[str]]:
+    """Parse the data lines of a keyword.
+
+    The data that only holds numbers in rows of the same length is parsed by NumPy at once into an AbaqusNDarray
+    object, in which the numbers are either all ints, all floats, or floats with ints in the first column. The
+    other data lines are split into lists of ints, floats and Strings.
+
+    Parameters
+    ----------
+    name
+        A String specifying the keyword name, the data lines of an ``*ELEMENT`` keyword ending with a comma are
+        continued on the next line.
+    text
+        A String specifying the data lines.
+    usePyArray
+        A Boolean specifying whether numeric data is returned as an AbaqusNDarray object rather than as lists.
+
+    Returns
+    -------
+    tuple[Any, list[str]]
+        The data, an AbaqusNDarray object or a list of lists, and the comment lines found among the data lines.
+    """
+    comments: List[str] = []
+    if "**" in text:
+        lines = text.split("\n")
+        comments = [line for line in lines if line.startswith("**")]
+        text = "\n".join(line for line in lines if not line.startswith("**"))
+    if not text or text.isspace():
+        return [], comments
+
+    if text[-64:].rstrip().endswith(","):
+        text = text.rstrip().rstrip(",")
+    continued = keywordName(name) in CONTINUED_KEYWORDS
+    array = _parseNumbers(text, continued) if _NUMBER_START.match(text) else None
+    if array is None:
+        return _parseLines(text.replace(",\n", "," if continued else "\n")), comments
+    return (array if usePyArray else array.tolist()), comments
+
+
+def _parseNumbers(text: str, continued: bool) -> np.ndarray | None:
+    """Parse rows of numbers of the same length at once, None if the text is not such a table."""
+    import numpy as np
+
+    from .AbaqusNDarray import AbaqusNDarray
+
+    raw = text.encode("latin-1")
+    buffer = np.frombuffer(raw, dtype=np.uint8)
+    commas = np.flatnonzero(buffer == ord(","))
+    if np.any(buffer[commas[commas + 1 < len(buffer)] + 1] == ord("\n")):
+        raw = raw.replace(b",\n", b"," if continued else b"\n")
+        buffer = np.frombuffer(raw, dtype=np.uint8)
+        commas = np.flatnonzero(buffer == ord(","))
+    floating = np.flatnonzero((buffer == ord(".")) | ((buffer | 0x20) == ord("e")))
+    try:
+        array = np.loadtxt(
+            io.BytesIO(raw), delimiter=",", dtype=float if floating.size else np.int64, ndmin=2, encoding="latin-1"
+        )
+    except ValueError:
+        return None
+    return AbaqusNDarray(array, colZeroIsInt=floating.size > 0 and _isColumnZeroInt(buffer, commas, floating))
+
+
+def _isColumnZeroInt(buffer: np.ndarray, commas: np.ndarray, floating: np.ndarray) -> bool:
+    """Whether none of the float characters of the bytes of a table, the positions of the dots and exponents, is
+    in the first column."""
+    import numpy as np
+
+    lineStarts = np.insert(np.flatnonzero(buffer == ord("\n")) + 1, 0, 0)
+    commas = np.append(commas, len(buffer))
+    starts = lineStarts[np.searchsorted(lineStarts, floating, side="right") - 1]
+    firstCommas = commas[np.searchsorted(commas, starts)]
+    return not np.any(floating < firstCommas)
+
+
+def _parseLines(text: str) -> List[List[Any]]:
+    """Split data lines into lists of ints, floats and Strings."""
+    data = []
+    for line in text.split("\n"):
+        if line.strip():
+            items = line.split(",")
+            if len(items) > 1 and not items[-1].strip():
+                items.pop()
+            data.append([_parseItem(item.strip()) for item in items])
+    return data
+
+
+def _parseItem(item: str) -> Any:
+    """Convert a data item to an int or a float if possible."""
+    try:
+        return int(item)
+    except ValueError:
+        pass
+    try:
+        return float(item)
+    except ValueError:
+        return item
+
+
+def readKeywords(path: str, skipped: Collection[str] = frozenset(), usePyArray: bool = False) -> Iterator[Keyword]:
+    """Yield the keywords of a single input file, the ``*INCLUDE`` keywords being yielded as they are.
+
+    Parameters
+    ----------
+    path
+        A String specifying the path to the input file.
+    skipped
+        A collection of Strings specifying the normalized names of the keywords whose data is not parsed.
+    usePyArray
+        A Boolean specifying whether numeric data is returned as AbaqusNDarray objects.
+
+    Yields
+    ------
+    Keyword
+        The Keyword objects in the order of the input file, the comments preceding the first keyword belong to the
+        first keyword.
+    """
+    comments: List[str] = []
+    for block in readBlocks(path):
+        line, text = splitBlock(block)
+        name, parameter = parseKeywordLine(line) if line else ("", {})
+        data: Any = []
+        if keywordName(name) not in skipped:
+            data, blockComments = parseData(name, text, usePyArray)
+            comments += blockComments
+        del block, text
+        if line:
+            yield Keyword(name, parameter, data, comments)
+            comments = []
+
+
+def parseFile(path: str, skipped: Collection[str] = frozenset(), usePyArray: bool = False) -> KeywordSequence:
+    """Return the keywords of a single input file, the ``*INCLUDE`` keywords being kept as they are, see
+    :func:`readKeywords`."""
+    return list(readKeywords(path, skipped, usePyArray))
+
+
+def scanIncludes(path: str, chunkSize: int = CHUNK_SIZE) -> List[str]:
+    """Return the paths of the files included by the ``*INCLUDE`` keywords of an input file, without parsing the
+    keyword data.
+
+    Parameters
+    ----------
+    path
+        A String specifying the path to the input file.
+    chunkSize
+        An Int specifying the number of characters read at once.
+
+    Returns
+    -------
+    list[str]
+        The paths of the included files, relative to the directory of the input file, in the order of the file.
+    """
+    includes = []
+    tail = ""
+    with open(path, encoding="latin-1") as file:
+        for chunk in iter(partial(file.read, chunkSize), ""):
+            chunk = tail + chunk
+            end = chunk.rfind("\n") + 1
+            chunk, tail = chunk[:end], chunk[end:]
+            includes += _includes(chunk)
+    return includes + _includes(tail + "\n")
+
+
+def _includes(lines: str) -> List[str]:
+    """Return the input parameter of the ``*INCLUDE`` keywords of complete lines."""
+    includes = []
+    for start in _keywordStarts(lines, True):
+        if lines[start + 1 : start + 8].upper() == "INCLUDE":
+            name, parameter = parseKeywordLine(lines[start : lines.find("\n", start)])
+            if keywordName(name) == "INCLUDE":
+                includes.append(parameterValue(parameter, "input"))
+    return includes
+
+
+def includePath(path: str, include: str) -> str:
+    """Return the path of a file included by an input file, relative to the directory of the input file."""
+    return os.path.normpath(os.path.join(os.path.dirname(path), include))
+
+
+def parameterValue(parameter: Dict[str, str], key: str) -> str:
+    """Return the value of a keyword parameter, whose name is case insensitive, or an empty String."""
+    return next((value for name, value in parameter.items() if name.lower() == key), "")
+
+
+#: The keywords opening a block of keywords, and the keyword closing the block.
+BLOCK_KEYWORDS = {
+    "PART": "END PART",
+    "ASSEMBLY": "END ASSEMBLY",
+    "INSTANCE": "END INSTANCE",
+    "STEP": "END STEP",
+}
+
+
+def organizeKeywords(keywords: KeywordSequence) -> KeywordSequence:
+    """Nest the keywords of the ``*PART``, ``*ASSEMBLY``, ``*INSTANCE`` and ``*STEP`` blocks into the suboptions of
+    the keyword opening the block, the keyword closing the block being the last suboption.
+
+    Parameters
+    ----------
+    keywords
+        A KeywordSequence object specifying the keywords in the order of the input file.
+
+    Returns
+    -------
+    KeywordSequence
+        A KeywordSequence object specifying the top level keywords.
+    """
+    organized: KeywordSequence = []
+    stack: List[Tuple[KeywordSequence, str]] = [(organized, "")]
+    for keyword in keywords:
+        name = keywordName(keyword.name)
+        stack[-1][0].append(keyword)
+        if name in BLOCK_KEYWORDS:
+            keyword.suboptions = []
+            stack.append((keyword.suboptions, BLOCK_KEYWORDS[name]))
+        elif len(stack) > 1 and name == stack[-1][1]:
+            stack.pop()
+    return organized
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Any, Sequence
+
 from abqpy.decorators import abaqus_class_doc
 
 
@@ -28,7 +30,39 @@ class Keyword:
     data: tuple = ()
 
     #: A KeywordSequence specifying the suboptions of the keyword.
-    suboptions: str = ""
+    suboptions: list = []
 
     #: A sequence of Strings specifying the comments.
     comments: tuple = ()
+
+    def __init__(
+        self,
+        name: str = "",
+        parameter: dict | None = None,
+        data: Any = (),
+        comments: Sequence[str] = (),
+        suboptions: list | None = None,
+    ):
+        """This method creates a Keyword object, Keyword objects are created by the InputFile.parse() method.
+
+        Parameters
+        ----------
+        name
+            A String specifying the name of the keyword.
+        parameter
+            A Dictionary of Strings specifying the keyword parameters.
+        data
+            A sequence of sequences or an AbaqusNDarray object specifying the keyword data.
+        comments
+            A sequence of Strings specifying the comments.
+        suboptions
+            A KeywordSequence specifying the suboptions of the keyword.
+        """
+        self.name = name
+        self.parameter = {} if parameter is None else parameter
+        self.data = data
+        self.comments = tuple(comments)
+        self.suboptions = [] if suboptions is None else suboptions
+
+    def __repr__(self) -> str:
+        return f"Keyword(name={self.name!r}, parameter={self.parameter!r})"
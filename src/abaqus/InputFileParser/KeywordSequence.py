@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from typing import List
+
+from .Keyword import Keyword
+
+KeywordSequence = List[Keyword]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from typing_extensions import Literal
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
@@ -15,8 +17,10 @@ from ..UtilityAndView.abaqusConstants import (
     Boolean,
 )
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
-from .ExpContactControl import ExpContactControl
-from .StdContactControl import StdContactControl
+
+if TYPE_CHECKING:
+    from .ExpContactControl import ExpContactControl
+    from .StdContactControl import StdContactControl
 
 
 @abaqus_class_doc
@@ -74,6 +78,8 @@ class InteractionContactControlModel(ModelBase):
         ------
         RangeError
         """
+        from .ExpContactControl import ExpContactControl
+
         self.contactControls[name] = contactControl = ExpContactControl(
             name,
             globTrkChoice,
@@ -211,6 +217,8 @@ class InteractionContactControlModel(ModelBase):
         ------
         RangeError
         """
+        from .StdContactControl import StdContactControl
+
         self.contactControls[name] = contactControl = StdContactControl(
             name,
             stiffnessScaleFactor,
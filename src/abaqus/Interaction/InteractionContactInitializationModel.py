@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from typing_extensions import Literal
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
@@ -7,8 +9,10 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 from ..Model.ModelBase import ModelBase
 from ..UtilityAndView.abaqusConstants import ADJUST, Boolean
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
-from .ExpInitialization import ExpInitialization
-from .StdInitialization import StdInitialization
+
+if TYPE_CHECKING:
+    from .ExpInitialization import ExpInitialization
+    from .StdInitialization import StdInitialization
 
 
 @abaqus_class_doc
@@ -82,6 +86,8 @@ class InteractionContactInitializationModel(ModelBase):
         ------
         RangeError
         """
+        from .ExpInitialization import ExpInitialization
+
         self.contactInitializations[name] = contactInitialization = ExpInitialization(
             name,
             overclosureType,
@@ -147,6 +153,8 @@ class InteractionContactInitializationModel(ModelBase):
         ------
         RangeError
         """
+        from .StdInitialization import StdInitialization
+
         self.contactInitializations[name] = contactInitialization = StdInitialization(
             name,
             overclosureType,
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ..Model.ModelBase import ModelBase
 from ..UtilityAndView.abaqusConstants import OFF, Boolean
-from .StdStabilization import StdStabilization
+
+if TYPE_CHECKING:
+    from .StdStabilization import StdStabilization
 
 
 @abaqus_class_doc
@@ -60,6 +64,8 @@ class InteractionContactStabilizationModel(ModelBase):
         ------
         RangeError
         """
+        from .StdStabilization import StdStabilization
+
         self.contactStabilizations[name] = interaction = StdStabilization(
             name,
             zeroDistance,
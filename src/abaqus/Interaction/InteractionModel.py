@@ -1,48 +1,11 @@
 from __future__ import annotations
 
-from typing import Sequence, Union
+from typing import TYPE_CHECKING, Sequence, Union
 
 from typing_extensions import Literal
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
-from ..BasicGeometry.ModelDot import ModelDot
-from ..Datum.DatumAxis import DatumAxis
-from ..Interaction.AcousticImpedance import AcousticImpedance
-from ..Interaction.ActuatorSensor import ActuatorSensor
-from ..Interaction.CavityRadiation import CavityRadiation
-from ..Interaction.ConcentratedFilmCondition import ConcentratedFilmCondition
-from ..Interaction.ConcentratedRadiationToAmbient import ConcentratedRadiationToAmbient
-from ..Interaction.ContactExp import ContactExp
-from ..Interaction.ContactPropertyAssignment import ContactPropertyAssignment
-from ..Interaction.ContactStd import ContactStd
-from ..Interaction.CyclicSymmetry import CyclicSymmetry
-from ..Interaction.ElasticFoundation import ElasticFoundation
-from ..Interaction.FilmCondition import FilmCondition
-from ..Interaction.FluidCavity import FluidCavity
-from ..Interaction.FluidExchange import FluidExchange
-from ..Interaction.FluidInflator import FluidInflator
-from ..Interaction.IncidentWave import IncidentWave
-from ..Interaction.InitializationAssignment import InitializationAssignment
-from ..Interaction.MainSecondaryAssignment import MainSecondaryAssignment
-from ..Interaction.ModelChange import ModelChange
-from ..Interaction.PressurePenetration import PressurePenetration
-from ..Interaction.RadiationToAmbient import RadiationToAmbient
-from ..Interaction.RegionPairs import RegionPairs
-from ..Interaction.SelfContactExp import SelfContactExp
-from ..Interaction.SelfContactStd import SelfContactStd
-from ..Interaction.SlidingTransitionAssignment import SlidingTransitionAssignment
-from ..Interaction.SmoothingAssignment import SmoothingAssignment
-from ..Interaction.StabilizationAssignment import StabilizationAssignment
-from ..Interaction.StdXplCosimulation import StdXplCosimulation
-from ..Interaction.SurfaceFeatureAssignment import SurfaceFeatureAssignment
-from ..Interaction.SurfaceOffsetAssignment import SurfaceOffsetAssignment
-from ..Interaction.SurfaceThicknessAssignment import SurfaceThicknessAssignment
-from ..Interaction.SurfaceToSurfaceContactExp import SurfaceToSurfaceContactExp
-from ..Interaction.SurfaceToSurfaceContactStd import SurfaceToSurfaceContactStd
-from ..Interaction.XFEMCrackGrowth import XFEMCrackGrowth
-from ..Region.Region import Region
-from ..Region.RegionArray import RegionArray
 from ..UtilityAndView.abaqusConstants import (
     ALL_NODAL_DIAMETER,
     ALLOW_SUBCYCLING,
@@ -72,18 +35,57 @@ from ..UtilityAndView.abaqusConstants import (
     Boolean,
 )
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
-from .ContactMassScalingExp import ContactMassScalingExp
 from .InteractionContactControlModel import InteractionContactControlModel
 from .InteractionContactInitializationModel import InteractionContactInitializationModel
 from .InteractionContactStabilizationModel import InteractionContactStabilizationModel
 from .InteractionPropertyModel import InteractionPropertyModel
 from .PolarityAssignments import PolarityAssignments
-from .SlidingFormulationAssignment import SlidingFormulationAssignment
 from .SurfaceBeamSmoothingAssignment import SurfaceBeamSmoothingAssignment
 from .SurfaceCrushTriggerAssignment import SurfaceCrushTriggerAssignment
 from .SurfaceFrictionAssignment import SurfaceFrictionAssignment
 from .SurfaceVertexCriteriaAssignment import SurfaceVertexCriteriaAssignment
 
+if TYPE_CHECKING:
+    from ..BasicGeometry.ModelDot import ModelDot
+    from ..Datum.DatumAxis import DatumAxis
+    from ..Interaction.AcousticImpedance import AcousticImpedance
+    from ..Interaction.ActuatorSensor import ActuatorSensor
+    from ..Interaction.CavityRadiation import CavityRadiation
+    from ..Interaction.ConcentratedFilmCondition import ConcentratedFilmCondition
+    from ..Interaction.ConcentratedRadiationToAmbient import (
+        ConcentratedRadiationToAmbient,
+    )
+    from ..Interaction.ContactPropertyAssignment import ContactPropertyAssignment
+    from ..Interaction.ContactStd import ContactStd
+    from ..Interaction.CyclicSymmetry import CyclicSymmetry
+    from ..Interaction.ElasticFoundation import ElasticFoundation
+    from ..Interaction.FilmCondition import FilmCondition
+    from ..Interaction.FluidCavity import FluidCavity
+    from ..Interaction.FluidExchange import FluidExchange
+    from ..Interaction.FluidInflator import FluidInflator
+    from ..Interaction.IncidentWave import IncidentWave
+    from ..Interaction.InitializationAssignment import InitializationAssignment
+    from ..Interaction.MainSecondaryAssignment import MainSecondaryAssignment
+    from ..Interaction.ModelChange import ModelChange
+    from ..Interaction.PressurePenetration import PressurePenetration
+    from ..Interaction.RadiationToAmbient import RadiationToAmbient
+    from ..Interaction.RegionPairs import RegionPairs
+    from ..Interaction.SelfContactExp import SelfContactExp
+    from ..Interaction.SelfContactStd import SelfContactStd
+    from ..Interaction.SlidingTransitionAssignment import SlidingTransitionAssignment
+    from ..Interaction.SmoothingAssignment import SmoothingAssignment
+    from ..Interaction.StabilizationAssignment import StabilizationAssignment
+    from ..Interaction.StdXplCosimulation import StdXplCosimulation
+    from ..Interaction.SurfaceFeatureAssignment import SurfaceFeatureAssignment
+    from ..Interaction.SurfaceOffsetAssignment import SurfaceOffsetAssignment
+    from ..Interaction.SurfaceThicknessAssignment import SurfaceThicknessAssignment
+    from ..Interaction.SurfaceToSurfaceContactExp import SurfaceToSurfaceContactExp
+    from ..Interaction.SurfaceToSurfaceContactStd import SurfaceToSurfaceContactStd
+    from ..Interaction.XFEMCrackGrowth import XFEMCrackGrowth
+    from ..Region.Region import Region
+    from ..Region.RegionArray import RegionArray
+    from .SlidingFormulationAssignment import SlidingFormulationAssignment
+
 
 @abaqus_class_doc
 class InteractionModel(
@@ -312,6 +314,8 @@ class InteractionModel(
         AcousticImpedance
             An AcousticImpedance object.
         """
+        from ..Interaction.AcousticImpedance import AcousticImpedance
+
         self.interactions[name] = interaction = AcousticImpedance(
             name,
             createStepName,
@@ -379,6 +383,8 @@ class InteractionModel(
         ActuatorSensor
             An ActuatorSensor object.
         """
+        from ..Interaction.ActuatorSensor import ActuatorSensor
+
         self.interactions[name] = interaction = ActuatorSensor(
             name,
             createStepName,
@@ -602,6 +608,8 @@ class InteractionModel(
         CavityRadiation
             A CavityRadiation object.
         """
+        from ..Interaction.CavityRadiation import CavityRadiation
+
         self.interactions[name] = interaction = CavityRadiation(
             name,
             createStepName,
@@ -733,6 +741,8 @@ class InteractionModel(
         ConcentratedFilmCondition
             A ConcentratedFilmCondition object.
         """
+        from ..Interaction.ConcentratedFilmCondition import ConcentratedFilmCondition
+
         self.interactions[name] = interaction = ConcentratedFilmCondition(
             name,
             createStepName,
@@ -813,6 +823,10 @@ class InteractionModel(
         ConcentratedRadiationToAmbient
             A ConcentratedRadiationToAmbient object.
         """
+        from ..Interaction.ConcentratedRadiationToAmbient import (
+            ConcentratedRadiationToAmbient,
+        )
+
         self.interactions[name] = interaction = ConcentratedRadiationToAmbient(
             name,
             createStepName,
@@ -914,6 +928,8 @@ class InteractionModel(
         ContactExp
             A ContactExp object.
         """
+        from ..Interaction.ContactExp import ContactExp
+
         self.interactions[name] = interaction = ContactExp(
             name,
             createStepName,
@@ -971,6 +987,8 @@ class InteractionModel(
         ContactMassScalingExp
             An ContactMassScalingExp object.
         """
+        from .ContactMassScalingExp import ContactMassScalingExp
+
         self.interactions[name] = interaction = ContactMassScalingExp(name, createStepName, location, surfaces)
         return interaction
 
@@ -1078,6 +1096,8 @@ class InteractionModel(
         ContactStd
             A ContactStd object.
         """
+        from ..Interaction.ContactStd import ContactStd
+
         self.interactions[name] = interaction = ContactStd(
             name,
             createStepName,
@@ -1187,6 +1207,8 @@ class InteractionModel(
         CyclicSymmetry
             A CyclicSymmetry object.
         """
+        from ..Interaction.CyclicSymmetry import CyclicSymmetry
+
         self.interactions[name] = interaction = CyclicSymmetry(
             name,
             createStepName,
@@ -1231,6 +1253,8 @@ class InteractionModel(
         ElasticFoundation
             An ElasticFoundation object.
         """
+        from ..Interaction.ElasticFoundation import ElasticFoundation
+
         self.interactions[name] = interaction = ElasticFoundation(name, createStepName, surface, stiffness)
         return interaction
 
@@ -1311,6 +1335,8 @@ class InteractionModel(
         FilmCondition
             A FilmCondition object.
         """
+        from ..Interaction.FilmCondition import FilmCondition
+
         self.interactions[name] = interaction = FilmCondition(
             name,
             createStepName,
@@ -1377,6 +1403,8 @@ class InteractionModel(
         FluidCavity
             A FluidCavity object.
         """
+        from ..Interaction.FluidCavity import FluidCavity
+
         self.interactions[name] = interaction = FluidCavity(
             name,
             createStepName,
@@ -1433,6 +1461,8 @@ class InteractionModel(
         FluidExchange
             A FluidExchange object.
         """
+        from ..Interaction.FluidExchange import FluidExchange
+
         self.interactions[name] = interaction = FluidExchange(
             name,
             createStepName,
@@ -1485,6 +1515,8 @@ class InteractionModel(
         -------
             A FluidInflator object.
         """
+        from ..Interaction.FluidInflator import FluidInflator
+
         self.interactions[name] = interaction = FluidInflator(
             name,
             createStepName,
@@ -1575,6 +1607,8 @@ class InteractionModel(
         IncidentWave
             An IncidentWave object.
         """
+        from ..Interaction.IncidentWave import IncidentWave
+
         self.interactions[name] = interaction = IncidentWave(
             name,
             createStepName,
@@ -1641,6 +1675,8 @@ class InteractionModel(
         ModelChange
             A ModelChange object.
         """
+        from ..Interaction.ModelChange import ModelChange
+
         self.interactions[name] = interaction = ModelChange(
             name,
             createStepName,
@@ -1713,6 +1749,8 @@ class InteractionModel(
         PressurePenetration
             A PressurePenetration object.
         """
+        from ..Interaction.PressurePenetration import PressurePenetration
+
         self.interactions[name] = interaction = PressurePenetration(
             name,
             createStepName,
@@ -1785,6 +1823,8 @@ class InteractionModel(
         RadiationToAmbient
             A RadiationToAmbient object.
         """
+        from ..Interaction.RadiationToAmbient import RadiationToAmbient
+
         self.interactions[name] = interaction = RadiationToAmbient(
             name,
             createStepName,
@@ -1839,6 +1879,8 @@ class InteractionModel(
         SelfContactExp
             A SelfContactExp object.
         """
+        from ..Interaction.SelfContactExp import SelfContactExp
+
         self.interactions[name] = interaction = SelfContactExp(
             name,
             createStepName,
@@ -1902,6 +1944,8 @@ class InteractionModel(
         SelfContactStd
             A SelfContactStd object.
         """
+        from ..Interaction.SelfContactStd import SelfContactStd
+
         self.interactions[name] = interaction = SelfContactStd(
             name,
             createStepName,
@@ -1959,6 +2003,8 @@ class InteractionModel(
         StdXplCosimulation
             A StdXplCosimulation object.
         """
+        from ..Interaction.StdXplCosimulation import StdXplCosimulation
+
         self.interactions[name] = interaction = StdXplCosimulation(
             name, createStepName, region, incrementation, stepSize, stepSizeDefinition
         )
@@ -2058,6 +2104,8 @@ class InteractionModel(
         SurfaceToSurfaceContactExp
             A SurfaceToSurfaceContactExp object.
         """
+        from ..Interaction.SurfaceToSurfaceContactExp import SurfaceToSurfaceContactExp
+
         self.interactions[name] = interaction = SurfaceToSurfaceContactExp(
             name,
             createStepName,
@@ -2251,6 +2299,8 @@ class InteractionModel(
         SurfaceToSurfaceContactStd
             A SurfaceToSurfaceContactStd object.
         """
+        from ..Interaction.SurfaceToSurfaceContactStd import SurfaceToSurfaceContactStd
+
         self.interactions[name] = interaction = SurfaceToSurfaceContactStd(
             name,
             createStepName,
@@ -2316,5 +2366,7 @@ class InteractionModel(
         XFEMCrackGrowth
             A XFEMCrackGrowth object.
         """
+        from ..Interaction.XFEMCrackGrowth import XFEMCrackGrowth
+
         self.interactions[name] = interaction = XFEMCrackGrowth(name, createStepName, crackName, allowGrowth)
         return interaction
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from typing_extensions import Literal
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
@@ -16,15 +18,17 @@ from ..UtilityAndView.abaqusConstants import (
     Boolean,
 )
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
-from .AcousticImpedanceProp import AcousticImpedanceProp
-from .ActuatorSensorProp import ActuatorSensorProp
-from .CavityRadiationProp import CavityRadiationProp
-from .ContactProperty import ContactProperty
-from .FilmConditionProp import FilmConditionProp
-from .FluidCavityProperty import FluidCavityProperty
-from .FluidExchangeProperty import FluidExchangeProperty
-from .FluidInflatorProperty import FluidInflatorProperty
-from .IncidentWaveProperty import IncidentWaveProperty
+
+if TYPE_CHECKING:
+    from .AcousticImpedanceProp import AcousticImpedanceProp
+    from .ActuatorSensorProp import ActuatorSensorProp
+    from .CavityRadiationProp import CavityRadiationProp
+    from .ContactProperty import ContactProperty
+    from .FilmConditionProp import FilmConditionProp
+    from .FluidCavityProperty import FluidCavityProperty
+    from .FluidExchangeProperty import FluidExchangeProperty
+    from .FluidInflatorProperty import FluidInflatorProperty
+    from .IncidentWaveProperty import IncidentWaveProperty
 
 
 @abaqus_class_doc
@@ -67,6 +71,8 @@ class InteractionPropertyModel(ModelBase):
         AcousticImpedanceProp
             An AcousticImpedanceProp object.
         """
+        from .AcousticImpedanceProp import AcousticImpedanceProp
+
         self.interactionProperties[name] = interactionProperty = AcousticImpedanceProp(
             name, tableType, table, frequencyDependency
         )
@@ -99,6 +105,8 @@ class InteractionPropertyModel(ModelBase):
         ActuatorSensorProp
             An ActuatorSensorProp object.
         """
+        from .ActuatorSensorProp import ActuatorSensorProp
+
         self.interactionProperties[name] = interactionProperty = ActuatorSensorProp(
             name, realProperties, integerProperties
         )
@@ -137,6 +145,8 @@ class InteractionPropertyModel(ModelBase):
         CavityRadiationProp
             A CavityRadiationProp object.
         """
+        from .CavityRadiationProp import CavityRadiationProp
+
         self.interactionProperties[name] = interactionProperty = CavityRadiationProp(
             name, temperatureDependency, dependencies, property
         )
@@ -161,6 +171,8 @@ class InteractionPropertyModel(ModelBase):
         ContactProperty
             A ContactProperty object.
         """
+        from .ContactProperty import ContactProperty
+
         self.interactionProperties[name] = interactionProperty = ContactProperty(name)
         return interactionProperty
 
@@ -201,6 +213,8 @@ class InteractionPropertyModel(ModelBase):
         FilmConditionProp
             A FilmConditionProp object.
         """
+        from .FilmConditionProp import FilmConditionProp
+
         self.interactionProperties[name] = interactionProperty = FilmConditionProp(
             name, temperatureDependency, dependencies, property
         )
@@ -338,6 +352,8 @@ class InteractionPropertyModel(ModelBase):
         FluidCavityProperty
             A FluidCavityProperty object.
         """
+        from .FluidCavityProperty import FluidCavityProperty
+
         self.interactionProperties[name] = interactionProperty = FluidCavityProperty(
             name,
             definition,
@@ -456,6 +472,8 @@ class InteractionPropertyModel(ModelBase):
         FluidExchangeProperty
             A FluidExchangeProperty object.
         """
+        from .FluidExchangeProperty import FluidExchangeProperty
+
         self.interactionProperties[name] = interactionProperty = FluidExchangeProperty(
             name,
             dataTable,
@@ -529,6 +547,8 @@ class InteractionPropertyModel(ModelBase):
         -------
             A FluidInflatorProperty object.
         """
+        from .FluidInflatorProperty import FluidInflatorProperty
+
         self.interactionProperties[name] = interactionProperty = FluidInflatorProperty(
             name,
             definition,
@@ -712,6 +732,8 @@ class InteractionPropertyModel(ModelBase):
         IncidentWaveProperty
             An IncidentWaveProperty object.
         """
+        from .IncidentWaveProperty import IncidentWaveProperty
+
         self.interactionProperties[name] = interactionProperty = IncidentWaveProperty(
             name,
             definition,
@@ -1,19 +1,29 @@
 from __future__ import annotations
 
+import os
+from typing import TYPE_CHECKING, AsyncIterator, List
+
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ..UtilityAndView.abaqusConstants import (
     ANALYSIS,
     DEFAULT,
+    NONE,
     OFF,
     ON,
     PERCENTAGE,
+    RECOVER,
     SINGLE,
+    SYNTAXCHECK,
     Boolean,
     SymbolicConstant,
 )
+from .Message import Message
 from .MessageArray import MessageArray
 
+if TYPE_CHECKING:
+    from .Queue import Queue
+
 
 @abaqus_class_doc
 class Job:
@@ -153,8 +163,16 @@ class Job:
 
     @abaqus_method_doc
     def kill(self):
-        """This method kills the analysis of a job."""
-        ...
+        """This method kills the analysis of a job.
+
+        The analysis is killed with the child processes of the ``abaqus`` driver, such as the solver, so that their
+        license tokens are released, and this method waits at most 10 seconds for it to exit.
+        """
+        monitor = self.__dict__.get("_monitor")
+        if monitor is not None and not monitor.done:
+            monitor.kill()
+            monitor.wait(monitor.killTimeout)
+            monitor.poll()
 
     @abaqus_method_doc
     def submit(
@@ -165,6 +183,18 @@ class Job:
     ):
         """This method submits a job for analysis.
 
+        Outside Abaqus/CAE, this method does nothing unless the ``ABQPY_RUN_JOBS`` environment variable is set, as
+        a script importing :mod:`abaqus` is run by Abaqus/CAE, whose own jobs run the analyses. If it is set, the
+        analysis of the input file of the job is run in the foreground by the ``abaqus`` command (or the command in
+        the ``ABAQUS_BAT_PATH`` environment variable, a batch file such as ``abaqus.bat`` being found on Windows)
+        in a subprocess, in the current working directory, and this method returns once the subprocess is started. The input file must exist in the current working directory:
+        the input file of a ModelJob object, named after the job, is not written by this method, but by
+        :meth:`~abaqus.Job.ModelJob.ModelJob.writeInput` in Abaqus/CAE. If the **queue** member is the name of a
+        queue of the session, the analysis is dispatched to the queue by :mod:`abqpy.dispatch` instead, which
+        copies the result files back to the current working directory. The **messages** and **status** members of
+        the job are updated from the log, message and status files of the analysis by :meth:`waitForCompletion`,
+        :meth:`waitForCompletionAsync` and :meth:`watch`.
+
         Parameters
         ----------
         consistencyChecking
@@ -177,8 +207,34 @@ class Job:
         continueJob
             A Boolean specifying whether to run the job as a continuation analysis. The default
             value is False. The datacheckJob and continueJob arguments cannot both be True.
+
+        Raises
+        ------
+        ValueError
+            If the datacheckJob and continueJob arguments are both True.
+        FileNotFoundError
+            If the analysis is run and the input file of the job does not exist.
         """
-        ...
+        from abqpy.config import config
+
+        from .JobMonitor import JobMonitor
+
+        if datacheckJob and continueJob:
+            raise ValueError("The datacheckJob and continueJob arguments cannot both be True")
+        if not config.run_jobs:
+            return
+        inputFileName = self._inputFileName()
+        if not os.path.isfile(inputFileName):
+            raise FileNotFoundError(f"The input file {inputFileName} of the job {self.name} does not exist")
+        command = [os.environ.get("ABAQUS_BAT_PATH", "abaqus"), f"job={self.name}", f"input={inputFileName}"]
+        command += self._commandOptions()
+        command += ["datacheck"] if datacheckJob else ["continue"] if continueJob else []
+        command += ["interactive", "ask_delete=OFF"]
+        queue = self._queue()
+        if queue is not None:
+            command = queue._dispatchCommand(self.name, command, self.numCpus)
+        self.messages = []
+        self.__dict__["_monitor"] = JobMonitor(self, command, os.getcwd(), bool(datacheckJob), bool(continueJob))
 
     @abaqus_method_doc
     def waitForCompletion(self):
@@ -187,9 +243,142 @@ class Job:
         If you call the waitForCompletion method and the **status** member is neither SUBMITTED nor RUNNING,
         Abaqus assumes the analysis has either completed or aborted and returns immediately.
         """
-        ...
+        from .JobMonitor import monitorJobs
+
+        for _ in monitorJobs([self]):
+            pass
 
     @abaqus_method_doc
     def clearMessage(self):
         """This method clears **messages** and sets the **status** to NONE."""
-        ...
+        self.messages = []
+        self.status = NONE
+
+    async def submitAsync(
+        self,
+        consistencyChecking: Boolean = ON,
+        datacheckJob: Boolean = False,
+        continueJob: Boolean = False,
+    ):
+        """This method submits a job for analysis from a coroutine, see :meth:`submit`.
+
+        .. note::
+            This method is not part of the Abaqus Scripting Interface.
+
+        Parameters
+        ----------
+        consistencyChecking
+            A Boolean specifying whether to perform consistency checking for the job. The default
+            value is ON.
+        datacheckJob
+            A Boolean specifying whether to run the job as a datacheck analysis. The default value
+            is False.
+        continueJob
+            A Boolean specifying whether to run the job as a continuation analysis. The default
+            value is False.
+        """
+        import asyncio
+
+        self.submit(consistencyChecking, datacheckJob, continueJob)
+        await asyncio.sleep(0)
+
+    async def waitForCompletionAsync(self, interval: float = 0.5) -> SymbolicConstant:
+        """This method waits for the end of the analysis from a coroutine, without blocking the event loop. The
+        analysis is killed if the coroutine is cancelled.
+
+        .. note::
+            This method is not part of the Abaqus Scripting Interface.
+
+        Parameters
+        ----------
+        interval
+            A Float specifying the time in seconds between two polls of the files of the analysis. The default
+            value is 0.5.
+
+        Returns
+        -------
+        SymbolicConstant
+            A SymbolicConstant specifying the status of the job, such as COMPLETED, ABORTED or TERMINATED.
+        """
+        async for _ in self.watch(interval):
+            pass
+        return self.status
+
+    async def watch(self, interval: float = 0.5) -> AsyncIterator[Message]:
+        """This method iterates over the messages of the analysis from a coroutine, from the first message of
+        the job until the end of the analysis. The analysis is killed if the coroutine is cancelled.
+
+        .. note::
+            This method is not part of the Abaqus Scripting Interface. The messages are read from the files of
+            the analysis by polling them, so that many jobs can be watched by the same event loop::
+
+                async def run(job):
+                    await job.submitAsync()
+                    async for message in job.watch():
+                        print(job.name, message.type, message.data)
+
+                asyncio.run(asyncio.wait_for(asyncio.gather(*map(run, jobs)), timeout=3600))
+
+            Outside an event loop, the messages of many jobs are iterated over by
+            :func:`~abaqus.Job.JobMonitor.monitorJobs`.
+
+        Parameters
+        ----------
+        interval
+            A Float specifying the time in seconds between two polls of the files of the analysis. The default
+            value is 0.5.
+
+        Yields
+        ------
+        Message
+            A Message object.
+        """
+        import asyncio
+
+        monitor = self.__dict__.get("_monitor")
+        if monitor is None:
+            return
+        position = 0
+        try:
+            while True:
+                monitor.poll()
+                messages: List[Message] = self.messages[position:]
+                position += len(messages)
+                for message in messages:
+                    yield message
+                if monitor.done and position == len(self.messages):
+                    return
+                await asyncio.sleep(interval)
+        except asyncio.CancelledError:
+            # The killed analysis is waited for in a thread, so that the event loop is not blocked
+            monitor.kill()
+            await asyncio.get_running_loop().run_in_executor(None, monitor.wait, monitor.killTimeout)
+            monitor.poll()
+            raise
+
+    def _queue(self) -> Queue | None:
+        """Return the queue of the job in the session, or None if the job is not run on a queue."""
+        import abaqus
+        from abqpy.lazy import created
+
+        session = created(abaqus.__dict__.get("session"))
+        return session.queues.get(self.queue) if self.queue and session is not None else None
+
+    def _inputFileName(self) -> str:
+        """Return the name of the input file analyzed by the job."""
+        return f"{self.name}.inp"
+
+    def _commandOptions(self) -> List[str]:
+        """Return the options of the analysis command given by the members of the job."""
+        options = [f"cpus={self.numCpus}"]
+        if self.numDomains > 1:
+            options.append(f"domains={self.numDomains}")
+        if self.scratch:
+            options.append(f"scratch={self.scratch}")
+        if self.userSubroutine:
+            options.append(f"user={self.userSubroutine}")
+        if self.type == SYNTAXCHECK:
+            options.append("syntaxcheck")
+        elif self.type == RECOVER:
+            options.append("recover")
+        return options
@@ -7,6 +7,7 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 from ..UtilityAndView.abaqusConstants import (
     ANALYSIS,
     DEFAULT,
+    NONE,
     ODB,
     OFF,
     ON,
@@ -289,6 +290,20 @@ class JobFromInputFile(Job):
             RESTART of input file job is not currently supported
         """
         super().__init__()
+        self.name = name
+        self.inputFileName = inputFileName
+        self.type = type
+        self.queue = queue or ""
+        self.scratch = scratch
+        self.userSubroutine = userSubroutine
+        self.numCpus = numCpus
+        self.numDomains = numDomains
+        self.messages = []
+        self.status = NONE
+
+    def _inputFileName(self) -> str:
+        """Return the name of the input file analyzed by the job."""
+        return self.inputFileName
 
     @abaqus_method_doc
     def setValues(
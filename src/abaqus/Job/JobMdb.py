@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from typing_extensions import Literal
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
@@ -17,9 +19,11 @@ from ..UtilityAndView.abaqusConstants import (
     Boolean,
 )
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
-from .JobFromInputFile import JobFromInputFile
-from .ModelJob import ModelJob
-from .OptimizationProcess import OptimizationProcess
+
+if TYPE_CHECKING:
+    from .JobFromInputFile import JobFromInputFile
+    from .ModelJob import ModelJob
+    from .OptimizationProcess import OptimizationProcess
 
 
 @abaqus_class_doc
@@ -174,6 +178,8 @@ class JobMdb(MdbBase):
         ------
         AbaqusException
         """
+        from .ModelJob import ModelJob
+
         self.jobs[name] = job = ModelJob(
             name,
             model,
@@ -324,6 +330,7 @@ class JobMdb(MdbBase):
         resultsFormat
             This option specifies the results output format: ODB, SIM, or BOTH. The default value is ODB.
         """
+        from .JobFromInputFile import JobFromInputFile
 
         self.jobs[name] = jobFromInputFile = JobFromInputFile(
             name,
@@ -426,6 +433,8 @@ class JobMdb(MdbBase):
         ------
         AbaqusException
         """
+        from .OptimizationProcess import OptimizationProcess
+
         self.optimizationProcesses[name] = optimizationProcess = OptimizationProcess(
             name,
             model,
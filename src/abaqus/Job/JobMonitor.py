@@ -0,0 +1,409 @@
+"""Monitoring of the analyses of jobs run outside Abaqus/CAE, from the files written by the analyses.
+
+The log (.log), message (.msg) and status (.sta) files of a job are read incrementally: each poll reads the bytes
+appended to the files since the previous poll only, and turns the new complete lines into Message objects, such as
+the STATUS messages of the increments of Abaqus/Standard and Abaqus/Explicit analyses. The files are polled rather
+than watched, which works on every platform and on network file systems, and a poll that finds no new bytes costs
+three ``stat`` calls, so that a single thread, see :func:`monitorJobs`, or event loop can monitor many jobs.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import time
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from abqpy.jobs import kill_tree, resolve_command
+
+from ..UtilityAndView.abaqusConstants import abaqusConstants as C
+from .Message import Message
+
+if TYPE_CHECKING:
+    from .Job import Job
+
+#: The data lines of the status file of Abaqus/Standard: step, increment, attempts (with a ``U`` suffix if the
+#: attempt did not converge), severe discontinuity, equilibrium and total iterations, total time, step time and
+#: time increment.
+_STANDARD_STATUS = re.compile(r"^\s*(\d+)\s+(\d+)\s+(\d+)(U?)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\S+)\s+(\S+)\s+(\S+)")
+
+#: The data lines of the status file of Abaqus/Explicit: increment, step time, total time, CPU time (hh:mm:ss),
+#: stable time increment, critical element, kinetic energy and total energy.
+_EXPLICIT_STATUS = re.compile(r"^\s*(\d+)\s+(\S+)\s+(\S+)\s+(\d+):(\d\d):(\d\d)\s+(\S+)\s+(\d+)\s+(\S+)\s+(\S+)\s*$")
+
+#: The lines of the status file of Abaqus/Explicit starting a step: step and total time at the start of the step.
+_EXPLICIT_STEP = re.compile(r"^\s*STEP\s+(\d+)\s+ORIGIN\s+(\S+)")
+
+
+class FileTail:
+    """The FileTail object reads the lines appended to a text file since it was last read.
+
+    .. note::
+        This object is not part of the Abaqus Scripting Interface.
+    """
+
+    def __init__(self, path: str):
+        """This method creates a FileTail object, which reads the file from its beginning.
+
+        Parameters
+        ----------
+        path
+            A String specifying the path of the file, which may not exist yet.
+        """
+        self.path = path
+        self.offset = 0
+        self._partial = b""
+
+    def read(self, final: bool = False) -> List[str]:
+        """Return the lines appended to the file since it was last read.
+
+        Parameters
+        ----------
+        final
+            A Boolean specifying whether the file is complete, so that its last line is returned even if it does
+            not end with a newline. The default value is False.
+
+        Returns
+        -------
+        List[str]
+            A list of Strings specifying the new complete lines, without their newlines. The file is read again
+            from its beginning if it was truncated.
+        """
+        try:
+            size = os.stat(self.path).st_size
+        except OSError:
+            return []
+        if size == self.offset and not (final and self._partial):
+            return []
+        if size < self.offset:
+            self.offset, self._partial = 0, b""
+        data = b""
+        if size > self.offset:
+            with open(self.path, "rb") as file:
+                file.seek(self.offset)
+                data = file.read(size - self.offset)
+            self.offset += len(data)
+        lines = (self._partial + data).split(b"\n")
+        self._partial = lines.pop()
+        if final and self._partial:
+            lines.append(self._partial)
+            self._partial = b""
+        return [line.decode(errors="replace").rstrip("\r") for line in lines]
+
+
+def parseLine(extension: str, line: str, step: int = 0) -> Optional[Message]:
+    """Return the message of a line of the log, message or status file of a job.
+
+    Parameters
+    ----------
+    extension
+        A String specifying the extension of the file: ``"log"``, ``"msg"`` or ``"sta"``.
+    line
+        A String specifying the line.
+    step
+        An Int specifying the current step of an Abaqus/Explicit analysis, whose status lines do not hold their
+        step, see :class:`MessageTail`. The default value is 0.
+
+    Returns
+    -------
+    Optional[Message]
+        A Message object, or None if the line does not hold a message. The data of the STATUS messages of
+        Abaqus/Explicit holds the stable time increment in **timeIncrement**, and also holds the **cpuTime** in
+        seconds, the **criticalElement**, the **kineticEnergy** and the **totalEnergy**.
+    """
+    text = line.strip()
+    if extension == "log":
+        if text.startswith("Begin Abaqus/"):
+            return Message(C.STARTED, {"clientName": text.split("/", 1)[1].split()[0], "message": text})
+        if "exited with error" in text:
+            return Message(C.ERROR, {"message": text})
+    elif extension == "msg":
+        if text.startswith("***ERROR"):
+            return Message(C.ERROR, {"message": text})
+        if text.startswith("***WARNING"):
+            return Message(C.WARNING, {"message": text})
+    elif extension == "sta":
+        match = _STANDARD_STATUS.match(line)
+        if match is not None:
+            step, increment, attempts, severe, equilibrium, iterations = (
+                int(match.group(i)) for i in (1, 2, 3, 5, 6, 7)
+            )
+            try:
+                totalTime, stepTime, timeIncrement = (float(value) for value in match.groups()[7:])
+            except ValueError:
+                return None
+            data: Dict[str, Any] = {
+                "step": step,
+                "increment": increment,
+                "attempts": attempts,
+                "converged": not match.group(4),
+                "severe": severe,
+                "equilibrium": equilibrium,
+                "iterations": iterations,
+                "totalTime": totalTime,
+                "stepTime": stepTime,
+                "timeIncrement": timeIncrement,
+                "phase": C.STANDARD_PHASE,
+            }
+            return Message(C.STATUS, data)
+        match = _EXPLICIT_STATUS.match(line)
+        if match is not None:
+            increment, hours, minutes, seconds, criticalElement = (int(match.group(i)) for i in (1, 4, 5, 6, 8))
+            try:
+                stepTime, totalTime, stableTimeIncrement, kineticEnergy, totalEnergy = (
+                    float(match.group(i)) for i in (2, 3, 7, 9, 10)
+                )
+            except ValueError:
+                return None
+            data = {
+                "step": step,
+                "increment": increment,
+                "stepTime": stepTime,
+                "totalTime": totalTime,
+                "cpuTime": float(3600 * hours + 60 * minutes + seconds),
+                "timeIncrement": stableTimeIncrement,
+                "criticalElement": criticalElement,
+                "kineticEnergy": kineticEnergy,
+                "totalEnergy": totalEnergy,
+                "phase": C.EXPLICIT_PHASE,
+            }
+            return Message(C.STATUS, data)
+        match = _EXPLICIT_STEP.match(line)
+        if match is not None:
+            try:
+                return Message(C.STEP, {"step": int(match.group(1)), "totalTime": float(match.group(2))})
+            except ValueError:
+                return None
+        if "HAS COMPLETED SUCCESSFULLY" in text:
+            return Message(C.COMPLETED, {"message": text})
+        if "HAS NOT BEEN COMPLETED" in text:
+            return Message(C.ABORTED, {"message": text})
+    return None
+
+
+class MessageTail(FileTail):
+    """The MessageTail object reads the messages of the lines appended to the log, message or status file of a
+    job since it was last read, such as the progress of an analysis run outside this process.
+
+    .. note::
+        This object is not part of the Abaqus Scripting Interface.
+    """
+
+    def __init__(self, path: str, extension: Optional[str] = None):
+        """This method creates a MessageTail object, which reads the file from its beginning.
+
+        Parameters
+        ----------
+        path
+            A String specifying the path of the file, which may not exist yet.
+        extension
+            A String specifying the type of the file: ``"log"``, ``"msg"`` or ``"sta"``. The default value is
+            the extension of the path.
+        """
+        super().__init__(path)
+        self.extension = extension or os.path.splitext(path)[1].lstrip(".")
+        self.step = 0
+
+    def messages(self, final: bool = False) -> List[Message]:
+        """Return the messages of the lines appended to the file since it was last read.
+
+        Parameters
+        ----------
+        final
+            A Boolean specifying whether the file is complete, see :meth:`FileTail.read`. The default value is
+            False.
+
+        Returns
+        -------
+        List[Message]
+            A list of Message objects.
+        """
+        messages = []
+        for line in self.read(final):
+            message = parseLine(self.extension, line, self.step)
+            if message is not None:
+                if message.type == C.STEP:
+                    self.step = (message.data or {}).get("step", self.step)
+                messages.append(message)
+        return messages
+
+
+class JobMonitor:
+    """The JobMonitor object monitors the analysis of a job run in a subprocess, from the exit status of the
+    subprocess and from the files written by the analysis.
+
+    .. note::
+        This object is not part of the Abaqus Scripting Interface. It is created by :meth:`Job.submit` when a
+        job is submitted outside Abaqus/CAE.
+    """
+
+    #: A Float specifying the time in seconds to wait for a killed analysis to exit.
+    killTimeout: float = 10.0
+
+    def __init__(self, job: Job, command: List[str], directory: str, datacheck: bool = False, continued: bool = False):
+        """This method starts the analysis of a job in a subprocess.
+
+        Parameters
+        ----------
+        job
+            A Job object.
+        command
+            A list of Strings specifying the command of the analysis, which must run in the foreground.
+        directory
+            A String specifying the working directory of the analysis, where its files are written.
+        datacheck
+            A Boolean specifying whether the analysis is a datacheck analysis. The default value is False.
+        continued
+            A Boolean specifying whether the analysis continues a datacheck analysis, whose files are kept. The
+            files of a previous analysis of the job are deleted otherwise. The default value is False.
+        """
+        self.job = job
+        self.directory = directory
+        self.datacheck = datacheck
+        self.done = False
+        self.killed = False
+        self.startTime = time.time()
+        self.tails = {
+            extension: MessageTail(os.path.join(directory, f"{job.name}.{extension}"))
+            for extension in ("log", "msg", "sta")
+        }
+        for tail in self.tails.values():
+            if not continued and os.path.exists(tail.path):
+                os.remove(tail.path)
+            # The lines written by the datacheck analysis are skipped
+            tail.offset = os.stat(tail.path).st_size if os.path.exists(tail.path) else 0
+        # The analysis writes its log to the standard output when it runs in the foreground
+        self._log: IO[bytes] = open(self.tails["log"].path, "ab")
+        self.process = subprocess.Popen(resolve_command(command), cwd=directory, stdout=self._log,
+                                        stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL,
+                                        start_new_session=os.name == "posix")  # fmt: skip
+        self._update([Message(C.JOB_SUBMITTED, {"processId": self.process.pid})])
+
+    def poll(self) -> List[Message]:
+        """Return the messages of the analysis since the previous poll, without waiting. The messages are also
+        added to the **messages** member of the job and update its **status** member.
+
+        Returns
+        -------
+        List[Message]
+            A list of Message objects.
+        """
+        if self.done:
+            return []
+        # The exit status is read first, so that the files are complete when the analysis has ended
+        returncode = self.process.poll()
+        messages = []
+        for tail in self.tails.values():
+            messages += tail.messages(final=returncode is not None)
+        if returncode is not None:
+            self.done = True
+            self._log.close()
+            data = {"processId": self.process.pid, "returncode": returncode}
+            messages.append(Message(C.JOB_COMPLETED if returncode == 0 else C.JOB_ABORTED, data))
+        return self._update(messages)
+
+    def kill(self):
+        """Kill the analysis with its child processes, such as the solver started by the ``abaqus`` driver, so
+        that their license tokens are released. This method does not wait for the analysis to exit."""
+        if self.done or self.process.poll() is not None:
+            return
+        self.killed = True
+        kill_tree(self.process)
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[int]:
+        """Wait for the subprocess of the analysis to exit, without polling the files of the analysis.
+
+        Parameters
+        ----------
+        timeout
+            A Float specifying the maximum time to wait in seconds. The default value is None, which waits until
+            the subprocess exits.
+
+        Returns
+        -------
+        Optional[int]
+            The exit status of the subprocess, or None if it is still running after **timeout** seconds.
+        """
+        try:
+            return self.process.wait(timeout)
+        except subprocess.TimeoutExpired:
+            return None
+
+    def _update(self, messages: List[Message]) -> List[Message]:
+        """Add some messages to the job and update its status. The data of the messages is stamped with the time
+        they are read (**timeStamp**), and the data of the STATUS messages with the time since the job was
+        submitted (**wallclockTime**), in seconds."""
+        now = time.time()
+        if self.datacheck:
+            submitted, running, completed = C.CHECK_SUBMITTED, C.CHECK_RUNNING, C.CHECK_COMPLETED
+        else:
+            submitted, running, completed = C.SUBMITTED, C.RUNNING, C.COMPLETED
+        for message in messages:
+            message.data = {**(message.data or {}), "timeStamp": int(now)}
+            if message.type == C.STATUS:
+                message.data["wallclockTime"] = now - self.startTime
+            if message.type == C.JOB_SUBMITTED:
+                self.job.status = submitted
+            elif message.type == C.STARTED:
+                self.job.status = running
+            elif message.type == C.JOB_COMPLETED:
+                self.job.status = completed
+            elif message.type == C.JOB_ABORTED:
+                self.job.status = C.TERMINATED if self.killed else C.ABORTED
+        self.job.messages.extend(messages)
+        return messages
+
+
+def monitorJobs(jobs: Iterable[Job], interval: float = 0.5) -> Iterator[Tuple[Job, Message]]:
+    """Iterate over the messages of the analyses of some jobs from a single thread, from the first message of
+    each job until the end of all the analyses.
+
+    All the analyses are polled in turn, once per interval, so that monitoring hundreds of jobs costs a few
+    ``stat`` calls per job and interval.
+
+    .. note::
+        This function is not part of the Abaqus Scripting Interface::
+
+            for job, message in monitorJobs(jobs, interval=5.0):
+                if message.type == STATUS:
+                    print(job.name, message.data["totalTime"], message.data["wallclockTime"])
+
+    Parameters
+    ----------
+    jobs
+        A sequence of Job objects, the jobs which are not submitted are skipped.
+    interval
+        A Float specifying the time in seconds between two polls of the files of the analyses. The default value
+        is 0.5.
+
+    Yields
+    ------
+    Tuple[Job, Message]
+        A tuple of a Job object and of one of its Message objects.
+    """
+    monitors = (job.__dict__.get("_monitor") for job in jobs)
+    pending: List[Tuple[JobMonitor, int]] = [(monitor, 0) for monitor in monitors if monitor is not None]
+    while pending:
+        start = time.monotonic()
+        running = []
+        for monitor, position in pending:
+            monitor.poll()
+            messages = monitor.job.messages[position:]
+            for message in messages:
+                yield monitor.job, message
+            if not monitor.done:
+                running.append((monitor, position + len(messages)))
+        pending = running
+        if pending:
+            time.sleep(max(0.0, interval - (time.monotonic() - start)))
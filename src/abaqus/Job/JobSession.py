@@ -1,3 +1,7 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from typing_extensions import Literal
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
@@ -5,7 +9,9 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 from ..Session.SessionBase import SessionBase
 from ..UtilityAndView.abaqusConstants import ALL, LINUX, OFF, ON, Boolean
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
-from .Queue import Queue
+
+if TYPE_CHECKING:
+    from .Queue import Queue
 
 
 @abaqus_class_doc
@@ -72,6 +78,8 @@ class JobSession(SessionBase):
             Remote queue host name is not set, If **fileCopy** = ON and **hostName** is empty.
             Directory in which to run the job on the remote computer is not set, If **fileCopy** = ON and **directory** is empty.
         """
+        from .Queue import Queue
+
         self.queues[name] = queue = Queue(
             name,
             queueName,
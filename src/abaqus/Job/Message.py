@@ -49,3 +49,20 @@ class Message:
     #: depends on the message returned. For a list of the possible entries, see the members of
     #: DataObject.
     data: dict | None = None
+
+    def __init__(self, type: SymbolicConstant | None = None, data: dict | None = None):
+        """This method creates a Message object, such as the messages of a job monitored outside Abaqus/CAE.
+
+        Parameters
+        ----------
+        type
+            A SymbolicConstant specifying the type of message.
+        data
+            A Dictionary object specifying the data of the message.
+        """
+        if type is not None:
+            self.type = type
+        self.data = data
+
+    def __repr__(self) -> str:
+        return f"Message({getattr(self, 'type', None)!r}, {self.data!r})"
@@ -7,6 +7,7 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 from ..UtilityAndView.abaqusConstants import (
     ANALYSIS,
     DEFAULT,
+    NONE,
     OFF,
     ON,
     PERCENTAGE,
@@ -289,7 +290,17 @@ class ModelJob(Job):
         ModelJob
             A ModelJob object.
         """
-        ...
+        self.name = name
+        self.model = model
+        self.description = description
+        self.type = type
+        self.queue = queue or ""
+        self.scratch = scratch
+        self.userSubroutine = userSubroutine
+        self.numCpus = numCpus
+        self.numDomains = numDomains
+        self.messages = []
+        self.status = NONE
 
     @abaqus_method_doc
     def writeInput(self, consistencyChecking: Boolean = ON):
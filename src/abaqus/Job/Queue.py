@@ -1,3 +1,7 @@
+import os
+import sys
+from typing import List
+
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ..UtilityAndView.abaqusConstants import (
@@ -124,4 +128,42 @@ class Queue:
             Directory in which to run the job on the remote computer is not set,
             If **fileCopy** = ON and **directory** is empty.
         """
-        ...
+        if fileCopy and not hostName:
+            raise Exception("Remote queue host name is not set")
+        if fileCopy and not directory:
+            raise Exception("Directory in which to run the job on the remote computer is not set")
+        self.name = name
+        self.queueName = queueName
+        self.hostName = hostName
+        self.fileCopy = fileCopy
+        self.directory = directory
+        self.driver = driver
+        self.remotePlatform = remotePlatform
+        self.filesToCopy = filesToCopy
+        self.deleteAfterCopy = deleteAfterCopy
+        self.description = description
+
+    def _dispatchCommand(self, job: str, command: List[str], cpus: int = 1) -> List[str]:
+        """Return the command dispatching the analysis of a job to the queue with :mod:`abqpy.dispatch`, from the
+        command of the analysis on this machine. The input files of the analysis are uploaded to the directory of
+        the queue, and the analysis is run there by the driver of the queue."""
+        from abqpy.dispatch import QUEUE_COMMANDS
+
+        inputs, remote = [], [self.driver or "abaqus"]
+        for argument in command[1:]:
+            option, _, value = argument.partition("=")
+            if option in ("input", "user"):
+                inputs.append(value)
+                argument = f"{option}={os.path.basename(value)}"
+            remote.append(argument)
+        dispatch = [sys.executable, "-m", "abqpy.dispatch", f"--host={self.hostName}", f"--directory={self.directory}"]
+        dispatch += [f"--submit={QUEUE_COMMANDS.get(self.queueName, '{command}')}", f"--cpus={cpus}"]
+        dispatch += [f"--input={path}" for path in inputs]
+        if self.filesToCopy != ALL:
+            extensions = (self.filesToCopy,) if isinstance(self.filesToCopy, str) else self.filesToCopy
+            dispatch.append(f"--files={','.join(extensions)}")
+        if self.deleteAfterCopy:
+            dispatch.append("--delete")
+        if not self.fileCopy:
+            dispatch.append("--no-copy")
+        return [*dispatch, "--", job, *remote]
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from typing_extensions import Literal
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
-from ..Datum.DatumAxis import DatumAxis
 from ..Model.ModelBase import ModelBase
-from ..Region.Region import Region
 from ..UtilityAndView.abaqusConstants import (
     APPLY_FORCE,
     AXIS_1,
@@ -22,41 +22,45 @@ from ..UtilityAndView.abaqusConstants import (
     Boolean,
 )
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
-from .BodyCharge import BodyCharge
-from .BodyConcentrationFlux import BodyConcentrationFlux
-from .BodyCurrent import BodyCurrent
-from .BodyCurrentDensity import BodyCurrentDensity
-from .BodyForce import BodyForce
-from .BodyHeatFlux import BodyHeatFlux
-from .BoltLoad import BoltLoad
-from .ConcCharge import ConcCharge
-from .ConcConcFlux import ConcConcFlux
-from .ConcCurrent import ConcCurrent
-from .ConcentratedForce import ConcentratedForce
-from .ConcentratedHeatFlux import ConcentratedHeatFlux
-from .ConcPoreFluid import ConcPoreFluid
-from .ConnectorForce import ConnectorForce
-from .ConnectorMoment import ConnectorMoment
-from .CoriolisForce import CoriolisForce
-from .Gravity import Gravity
-from .InertiaRelief import InertiaRelief
-from .InwardVolAccel import InwardVolAccel
-from .LineLoad import LineLoad
-from .Moment import Moment
-from .PEGLoad import PEGLoad
-from .PipePressure import PipePressure
-from .Pressure import Pressure
-from .RotationalBodyForce import RotationalBodyForce
-from .ShellEdgeLoad import ShellEdgeLoad
-from .SubmodelSB import SubmodelSB
-from .SubstructureLoad import SubstructureLoad
-from .SurfaceCharge import SurfaceCharge
-from .SurfaceConcentrationFlux import SurfaceConcentrationFlux
-from .SurfaceCurrent import SurfaceCurrent
-from .SurfaceCurrentDensity import SurfaceCurrentDensity
-from .SurfaceHeatFlux import SurfaceHeatFlux
-from .SurfacePoreFluid import SurfacePoreFluid
-from .SurfaceTraction import SurfaceTraction
+
+if TYPE_CHECKING:
+    from ..Datum.DatumAxis import DatumAxis
+    from ..Region.Region import Region
+    from .BodyCharge import BodyCharge
+    from .BodyConcentrationFlux import BodyConcentrationFlux
+    from .BodyCurrent import BodyCurrent
+    from .BodyCurrentDensity import BodyCurrentDensity
+    from .BodyForce import BodyForce
+    from .BodyHeatFlux import BodyHeatFlux
+    from .BoltLoad import BoltLoad
+    from .ConcCharge import ConcCharge
+    from .ConcConcFlux import ConcConcFlux
+    from .ConcCurrent import ConcCurrent
+    from .ConcentratedForce import ConcentratedForce
+    from .ConcentratedHeatFlux import ConcentratedHeatFlux
+    from .ConcPoreFluid import ConcPoreFluid
+    from .ConnectorForce import ConnectorForce
+    from .ConnectorMoment import ConnectorMoment
+    from .CoriolisForce import CoriolisForce
+    from .Gravity import Gravity
+    from .InertiaRelief import InertiaRelief
+    from .InwardVolAccel import InwardVolAccel
+    from .LineLoad import LineLoad
+    from .Moment import Moment
+    from .PEGLoad import PEGLoad
+    from .PipePressure import PipePressure
+    from .Pressure import Pressure
+    from .RotationalBodyForce import RotationalBodyForce
+    from .ShellEdgeLoad import ShellEdgeLoad
+    from .SubmodelSB import SubmodelSB
+    from .SubstructureLoad import SubstructureLoad
+    from .SurfaceCharge import SurfaceCharge
+    from .SurfaceConcentrationFlux import SurfaceConcentrationFlux
+    from .SurfaceCurrent import SurfaceCurrent
+    from .SurfaceCurrentDensity import SurfaceCurrentDensity
+    from .SurfaceHeatFlux import SurfaceHeatFlux
+    from .SurfacePoreFluid import SurfacePoreFluid
+    from .SurfaceTraction import SurfaceTraction
 
 
 @abaqus_class_doc
@@ -115,6 +119,8 @@ class LoadModel(ModelBase):
         BodyCharge
             A BodyCharge object.
         """
+        from .BodyCharge import BodyCharge
+
         self.loads[name] = load = BodyCharge(
             name, createStepName, region, magnitude, amplitude, distributionType, field
         )
@@ -166,6 +172,8 @@ class LoadModel(ModelBase):
         BodyConcentrationFlux
             A BodyConcentrationFlux object.
         """
+        from .BodyConcentrationFlux import BodyConcentrationFlux
+
         self.loads[name] = load = BodyConcentrationFlux(
             name, createStepName, region, magnitude, field, distributionType, amplitude
         )
@@ -217,6 +225,8 @@ class LoadModel(ModelBase):
         BodyCurrent
             A BodyCurrent object.
         """
+        from .BodyCurrent import BodyCurrent
+
         self.loads[name] = load = BodyCurrent(
             name, createStepName, region, magnitude, amplitude, distributionType, field
         )
@@ -269,6 +279,8 @@ class LoadModel(ModelBase):
         BodyCurrentDensity
             A BodyCurrentDensity object.
         """
+        from .BodyCurrentDensity import BodyCurrentDensity
+
         self.loads[name] = load = BodyCurrentDensity(
             name,
             createStepName,
@@ -334,6 +346,8 @@ class LoadModel(ModelBase):
         BodyForce
             A BodyForce object.
         """
+        from .BodyForce import BodyForce
+
         self.loads[name] = load = BodyForce(
             name,
             createStepName,
@@ -393,6 +407,8 @@ class LoadModel(ModelBase):
         BodyHeatFlux
             A BodyHeatFlux object.
         """
+        from .BodyHeatFlux import BodyHeatFlux
+
         self.loads[name] = load = BodyHeatFlux(
             name, createStepName, region, magnitude, field, distributionType, amplitude
         )
@@ -457,6 +473,8 @@ class LoadModel(ModelBase):
         ------
         TextError
         """
+        from .BoltLoad import BoltLoad
+
         self.loads[name] = load = BoltLoad(
             name, createStepName, region, magnitude, datumAxis, boltMethod, amplitude, preTenSecPartLevel
         )
@@ -508,6 +526,8 @@ class LoadModel(ModelBase):
         ConcCharge
             A ConcCharge object.
         """
+        from .ConcCharge import ConcCharge
+
         self.loads[name] = load = ConcCharge(
             name, createStepName, region, magnitude, distributionType, field, amplitude
         )
@@ -559,6 +579,8 @@ class LoadModel(ModelBase):
         ConcConcFlux
             A ConcConcFlux object.
         """
+        from .ConcConcFlux import ConcConcFlux
+
         self.loads[name] = load = ConcConcFlux(
             name, createStepName, region, magnitude, distributionType, field, amplitude
         )
@@ -610,6 +632,8 @@ class LoadModel(ModelBase):
         ConcCurrent
             A ConcCurrent object.
         """
+        from .ConcCurrent import ConcCurrent
+
         self.loads[name] = load = ConcCurrent(
             name, createStepName, region, magnitude, distributionType, field, amplitude
         )
@@ -679,6 +703,8 @@ class LoadModel(ModelBase):
         ConcentratedForce
             A ConcentratedForce object.
         """
+        from .ConcentratedForce import ConcentratedForce
+
         self.loads[name] = load = ConcentratedForce(
             name,
             createStepName,
@@ -744,6 +770,8 @@ class LoadModel(ModelBase):
         ConcentratedHeatFlux
             A ConcentratedHeatFlux object.
         """
+        from .ConcentratedHeatFlux import ConcentratedHeatFlux
+
         self.loads[name] = load = ConcentratedHeatFlux(
             name,
             createStepName,
@@ -802,6 +830,8 @@ class LoadModel(ModelBase):
         ConcPoreFluid
             A ConcPoreFluid object.
         """
+        from .ConcPoreFluid import ConcPoreFluid
+
         self.loads[name] = load = ConcPoreFluid(
             name, createStepName, region, magnitude, distributionType, field, amplitude
         )
@@ -866,6 +896,8 @@ class LoadModel(ModelBase):
         ConnectorForce
             A ConnectorForce object.
         """
+        from .ConnectorForce import ConnectorForce
+
         self.loads[name] = load = ConnectorForce(
             name,
             createStepName,
@@ -937,6 +969,8 @@ class LoadModel(ModelBase):
         ConnectorMoment
             A ConnectorMoment object.
         """
+        from .ConnectorMoment import ConnectorMoment
+
         self.loads[name] = load = ConnectorMoment(
             name,
             createStepName,
@@ -1002,6 +1036,8 @@ class LoadModel(ModelBase):
         CoriolisForce
             A CoriolisForce object.
         """
+        from .CoriolisForce import CoriolisForce
+
         self.loads[name] = load = CoriolisForce(
             name,
             createStepName,
@@ -1068,6 +1104,8 @@ class LoadModel(ModelBase):
         Gravity
             A Gravity object.
         """
+        from .Gravity import Gravity
+
         self.loads[name] = load = Gravity(
             name,
             createStepName,
@@ -1139,6 +1177,8 @@ class LoadModel(ModelBase):
         InertiaRelief
             An InertiaRelief object.
         """
+        from .InertiaRelief import InertiaRelief
+
         self.loads[name] = load = InertiaRelief(
             name,
             createStepName,
@@ -1199,6 +1239,8 @@ class LoadModel(ModelBase):
         InwardVolAccel
             An InwardVolAccel object.
         """
+        from .InwardVolAccel import InwardVolAccel
+
         self.loads[name] = load = InwardVolAccel(
             name, createStepName, region, magnitude, distributionType, field, amplitude
         )
@@ -1262,6 +1304,8 @@ class LoadModel(ModelBase):
         LineLoad
             A LineLoad object.
         """
+        from .LineLoad import LineLoad
+
         self.loads[name] = load = LineLoad(
             name,
             createStepName,
@@ -1340,6 +1384,8 @@ class LoadModel(ModelBase):
         Moment
             A Moment object.
         """
+        from .Moment import Moment
+
         self.loads[name] = load = Moment(
             name,
             createStepName,
@@ -1408,6 +1454,8 @@ class LoadModel(ModelBase):
         PEGLoad
             A PEGLoad object.
         """
+        from .PEGLoad import PEGLoad
+
         self.loads[name] = load = PEGLoad(
             name,
             createStepName,
@@ -1482,6 +1530,8 @@ class LoadModel(ModelBase):
         PipePressure
             A PipePressure object.
         """
+        from .PipePressure import PipePressure
+
         self.loads[name] = load = PipePressure(
             name,
             createStepName,
@@ -1558,6 +1608,8 @@ class LoadModel(ModelBase):
         Pressure
             A Pressure object.
         """
+        from .Pressure import Pressure
+
         self.loads[name] = load = Pressure(
             name,
             createStepName,
@@ -1634,6 +1686,8 @@ class LoadModel(ModelBase):
         RotationalBodyForce
             A RotationalBodyForce object.
         """
+        from .RotationalBodyForce import RotationalBodyForce
+
         self.loads[name] = load = RotationalBodyForce(
             name,
             createStepName,
@@ -1738,6 +1792,8 @@ class LoadModel(ModelBase):
         ShellEdgeLoad
             A ShellEdgeLoad object.
         """
+        from .ShellEdgeLoad import ShellEdgeLoad
+
         self.loads[name] = load = ShellEdgeLoad(
             name,
             createStepName,
@@ -1811,6 +1867,8 @@ class LoadModel(ModelBase):
         SubmodelSB
             A SubmodelSB object.
         """
+        from .SubmodelSB import SubmodelSB
+
         self.loads[name] = load = SubmodelSB(
             name,
             createStepName,
@@ -1862,6 +1920,8 @@ class LoadModel(ModelBase):
         SubstructureLoad
             A SubstructureLoad object.
         """
+        from .SubstructureLoad import SubstructureLoad
+
         self.loads[name] = load = SubstructureLoad(name, createStepName, region, loadCaseNames, magnitude, amplitude)
         return load
 
@@ -1911,6 +1971,8 @@ class LoadModel(ModelBase):
         SurfaceCharge
             A SurfaceCharge object.
         """
+        from .SurfaceCharge import SurfaceCharge
+
         self.loads[name] = load = SurfaceCharge(
             name, createStepName, region, magnitude, distributionType, field, amplitude
         )
@@ -1963,6 +2025,8 @@ class LoadModel(ModelBase):
         SurfaceConcentrationFlux
             A SurfaceConcentrationFlux object.
         """
+        from .SurfaceConcentrationFlux import SurfaceConcentrationFlux
+
         self.loads[name] = load = SurfaceConcentrationFlux(
             name, createStepName, region, magnitude, field, distributionType, amplitude
         )
@@ -2014,6 +2078,8 @@ class LoadModel(ModelBase):
         SurfaceCurrent
             A SurfaceCurrent object.
         """
+        from .SurfaceCurrent import SurfaceCurrent
+
         self.loads[name] = load = SurfaceCurrent(
             name, createStepName, region, magnitude, distributionType, field, amplitude
         )
@@ -2066,6 +2132,8 @@ class LoadModel(ModelBase):
         SurfaceCurrentDensity
             A SurfaceCurrentDensity object.
         """
+        from .SurfaceCurrentDensity import SurfaceCurrentDensity
+
         self.loads[name] = load = SurfaceCurrentDensity(
             name,
             createStepName,
@@ -2124,6 +2192,8 @@ class LoadModel(ModelBase):
         SurfaceHeatFlux
             A SurfaceHeatFlux object.
         """
+        from .SurfaceHeatFlux import SurfaceHeatFlux
+
         self.loads[name] = load = SurfaceHeatFlux(
             name, createStepName, region, magnitude, field, distributionType, amplitude
         )
@@ -2175,6 +2245,8 @@ class LoadModel(ModelBase):
         SurfacePoreFluid
             A SurfacePoreFluid object.
         """
+        from .SurfacePoreFluid import SurfacePoreFluid
+
         self.loads[name] = load = SurfacePoreFluid(
             name, createStepName, region, magnitude, field, distributionType, amplitude
         )
@@ -2267,6 +2339,8 @@ class LoadModel(ModelBase):
         SurfaceTraction
             A SurfaceTraction object.
         """
+        from .SurfaceTraction import SurfaceTraction
+
         self.loads[name] = load = SurfaceTraction(
             name,
             createStepName,
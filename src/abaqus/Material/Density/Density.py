@@ -74,7 +74,11 @@ class Density:
         ------
         RangeError
         """
-        ...
+        self.table = table
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
+        self.distributionType = distributionType
+        self.fieldName = fieldName
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -1,6 +1,7 @@
+from __future__ import annotations
+
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
-from ..Material.Material import Material
 from ..Model.ModelBase import ModelBase
 
 
@@ -39,5 +40,7 @@ class MaterialModel(ModelBase):
         Material
             A Material object.
         """
+        from ..Material.Material import Material
+
         self.materials[name] = material = Material(name, description, materialIdentifier)
         return material
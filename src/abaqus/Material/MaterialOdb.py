@@ -1,7 +1,8 @@
+from __future__ import annotations
+
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ..Odb.OdbBase import OdbBase
-from .Material import Material
 
 
 @abaqus_class_doc
@@ -40,5 +41,7 @@ class MaterialOdb(OdbBase):
         Material
             A Material object.
         """
+        from .Material import Material
+
         self.materials[name] = material = Material(name, description, materialIdentifier)
         return material
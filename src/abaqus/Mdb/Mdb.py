@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from typing_extensions import Literal
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ..Job.JobMdb import JobMdb
-from ..Model.Model import Model
 from ..Part.AcisMdb import AcisMdb
 from ..UtilityAndView.abaqusConstants import NOT_SET, ON, STANDARD_EXPLICIT, Boolean
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
 
+if TYPE_CHECKING:
+    from ..Model.Model import Model
+
 
 @abaqus_class_doc
 class Mdb(AcisMdb, JobMdb):
@@ -78,6 +82,8 @@ class Mdb(AcisMdb, JobMdb):
         model: Model
             A Model object
         """
+        from ..Model.Model import Model
+
         self.models[name] = model = Model(
             name,
             description,
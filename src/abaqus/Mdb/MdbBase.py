@@ -3,17 +3,19 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Union
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
-
-from ..Adaptivity.AdaptivityProcess import AdaptivityProcess
-from ..Annotation.Annotation import Annotation
-from ..CustomKernel.RepositorySupport import RepositorySupport
-from ..EditMesh.MeshEditOptions import MeshEditOptions
-from ..Job.Coexecution import Coexecution
-from ..Job.Job import Job
-from ..Job.JobFromInputFile import JobFromInputFile
-from ..Job.ModelJob import ModelJob
-from ..Job.OptimizationProcess import OptimizationProcess
-from ..Model.Model import Model
+from abqpy.lazy import lazy_attribute
+
+if TYPE_CHECKING:
+    from ..Adaptivity.AdaptivityProcess import AdaptivityProcess
+    from ..Annotation.Annotation import Annotation
+    from ..CustomKernel.RepositorySupport import RepositorySupport
+    from ..EditMesh.MeshEditOptions import MeshEditOptions
+    from ..Job.Coexecution import Coexecution
+    from ..Job.Job import Job
+    from ..Job.JobFromInputFile import JobFromInputFile
+    from ..Job.ModelJob import ModelJob
+    from ..Job.OptimizationProcess import OptimizationProcess
+    from ..Model.Model import Model
 
 if TYPE_CHECKING:  # to avoid circular imports
     from .Mdb import Mdb
@@ -51,13 +53,13 @@ class MdbBase:
 
     #: A MeshEditOptions object specifying the undo/redo behavior when editing meshes on parts
     #: or part instances.
-    meshEditOptions: MeshEditOptions = MeshEditOptions()
+    meshEditOptions: MeshEditOptions = lazy_attribute("..EditMesh.MeshEditOptions", "MeshEditOptions")
 
     #: A repository of Model objects.
     models: dict[str, Model] = {}
 
     #: A RepositorySupport object.
-    customData: RepositorySupport = RepositorySupport()
+    customData: RepositorySupport = lazy_attribute("..CustomKernel.RepositorySupport", "RepositorySupport")
 
     #: A repository of Annotation objects.
     annotations: dict[str, Annotation] = {}
@@ -83,6 +85,8 @@ class MdbBase:
         Mdb
             A Mdb object
         """
+        from ..Model.Model import Model
+
         self.pathName = pathName
         self.models["Model-1"] = Model("Model-1")
         self.models["Model-1"].FieldOutputRequest("F-Output-1", "Initial")
@@ -0,0 +1,334 @@
+"""Bulk construction of nodes and elements from NumPy arrays, shared by the orphan mesh constructors of the parts
+and by the ``addNodes`` and ``addElements`` methods of the output database.
+
+The labels, coordinates and connectivity are validated with a few vectorized checks, and the Python objects of the
+nodes and elements are created in a single loop, without intermediate tuples of tuples. The objects do not hold
+their own tuple of coordinates or connectivity: the **coordinates** of a node and the **connectivity** of an element
+are :func:`bulkMember` members, which read the row of the object in the array until the member is assigned.
+
+Memory behavior: an array that already has the required type (int64 labels and connectivity, float64
+coordinates) and is C-contiguous is not copied. It is shared with the mesh, as the cached coordinates, labels or
+connectivity of the node or element array, so that the vectorized queries of the array do not read the objects
+again, and it is the array read by the objects. Such an array must not be modified afterwards, unless
+:func:`~abaqus.Mesh.MeshArrayCache.invalidateMeshCaches` is called. The other arrays and the sequences of
+sequences are converted once, and the converted array is the only copy of the coordinates or connectivity.
+"""
+
+from __future__ import annotations
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from .LabelIndex import LabelIndex
+from .MeshArrayCache import MeshArrayCache, labelIndexOf, storeLabelIndex
+
+if TYPE_CHECKING:
+    import numpy as np
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+class _BulkMember:
+    """A member of the nodes or elements created from arrays, read from the row of the object in the array."""
+
+    def __init__(self, default: Any):
+        self.default = default
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, entity: Any, owner: Optional[type] = None) -> Any:
+        # The member is only looked up here when the object does not hold its own value.
+        rows = None if entity is None else entity.__dict__.get("_bulkRows")
+        if rows is not None:
+            return tuple(rows[entity._bulkRow].tolist())
+        if self.default is _MISSING:
+            raise AttributeError(self.name)
+        return self.default
+
+
+def bulkMember(default: Any = _MISSING) -> Any:
+    """Return a member of a node or element class, such as the coordinates of the MeshNode objects, which the
+    objects created from arrays read from the array.
+
+    The objects created by :func:`addNodes` and :func:`addElements` hold the array of their coordinates or
+    connectivity and their row in it. The member returns the row as a tuple, unless a value is assigned to the
+    member of the object, as the constructor of the class and the methods editing the mesh do.
+
+    Parameters
+    ----------
+    default
+        The value of the member of the class and of the objects not created from arrays. By default, the member
+        is not set.
+
+    Returns
+    -------
+    Any
+        A descriptor.
+    """
+    return _BulkMember(default)
+
+
+def nodeArrays(
+    labels: Sequence[int] | np.ndarray, coordinates: Any, kind: str = "node"
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the labels and the (N, 3) coordinates of some nodes as arrays, after checking them.
+
+    Parameters
+    ----------
+    labels
+        A sequence or an array of Ints specifying the node labels.
+    coordinates
+        A sequence of sequences or a two-dimensional array of Floats specifying the coordinates of the nodes, with
+        one to three coordinates per node. The missing coordinates are zero.
+    kind
+        A String specifying the kind of label in the error messages.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, numpy.ndarray]
+        The labels and the coordinates.
+
+    Raises
+    ------
+    ValueError
+        If the number of labels and coordinates does not match, if a node has more than three coordinates or
+        coordinates that are not finite, or if a label is repeated.
+    """
+    import numpy as np
+
+    labels = _labels(labels, kind)
+    coordinates = np.asarray(coordinates, dtype=np.float64)
+    if coordinates.ndim == 1 and len(labels) <= 1:
+        coordinates = coordinates.reshape(len(labels), -1)
+    if coordinates.ndim != 2 or len(coordinates) != len(labels):
+        raise ValueError(f"Number of {kind} labels and coordinates does not match")
+    if coordinates.shape[1] > 3:
+        raise ValueError("Node location specification does not correspond to part dimensions")
+    if coordinates.shape[1] < 3:
+        coordinates = np.pad(coordinates, ((0, 0), (0, 3 - coordinates.shape[1])))
+    if not np.isfinite(coordinates).all():
+        raise ValueError("Node coordinates must be finite")
+    return labels, np.ascontiguousarray(coordinates)
+
+
+def elementArrays(labels: Sequence[int] | np.ndarray, connectivity: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the labels and the (N, K) connectivity of some elements of the same type as arrays, after checking
+    them.
+
+    Parameters
+    ----------
+    labels
+        A sequence or an array of Ints specifying the element labels.
+    connectivity
+        A sequence of sequences or a two-dimensional array of Ints specifying the connectivity of the elements.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, numpy.ndarray]
+        The labels and the connectivity.
+
+    Raises
+    ------
+    ValueError
+        If the number of labels and connectivity rows does not match, if the elements do not have the same number
+        of nodes, or if a label is repeated.
+    """
+    import numpy as np
+
+    labels = _labels(labels, "element")
+    try:
+        connectivity = np.asarray(connectivity, dtype=np.int64)
+    except ValueError:
+        raise ValueError("The elements of a type must have the same number of nodes") from None
+    if connectivity.ndim == 1 and len(labels) <= 1:
+        connectivity = connectivity.reshape(len(labels), -1)
+    if connectivity.ndim != 2 or len(connectivity) != len(labels):
+        raise ValueError("Connectivity array must be provided for all elements")
+    return labels, np.ascontiguousarray(connectivity)
+
+
+def createEntities(entityType: Type[T], members: Dict[str, Sequence[Any]], **shared: Any) -> List[T]:
+    """Return new objects of a type without calling their constructor, with their members set from some
+    sequences, such as the labels and the coordinates of nodes.
+
+    Parameters
+    ----------
+    entityType
+        The type of the objects, such as MeshNode.
+    members
+        A dictionary of sequences of the values of the members of the objects, by member name.
+    **shared
+        The values of the members shared by all the objects, such as the element type.
+
+    Returns
+    -------
+    list
+        A list of objects.
+    """
+    new = entityType.__new__
+    names = list(members) + list(shared)
+    entities = []
+    for values in zip(*members.values()):
+        entity = new(entityType)
+        for name, value in zip(names, values + tuple(shared.values())):
+            setattr(entity, name, value)
+        entities.append(entity)
+    return entities
+
+
+def addNodes(owner: object, nodeType: Type[T], labels: Any, coordinates: Any) -> List[T]:
+    """Create nodes from arrays of labels and coordinates and append them to the nodes of an object.
+
+    Parameters
+    ----------
+    owner
+        The object holding the nodes, such as a Part object.
+    nodeType
+        The type of the nodes, such as MeshNode.
+    labels
+        A sequence or an array of Ints specifying the node labels.
+    coordinates
+        A sequence of sequences or a two-dimensional array of Floats specifying the coordinates of the nodes.
+
+    Returns
+    -------
+    list
+        A list of the new nodes.
+
+    Raises
+    ------
+    ValueError
+        If the labels or the coordinates are not valid.
+    """
+    labels, coordinates = nodeArrays(labels, coordinates)
+    nodes = createEntities(nodeType, {"label": labels.tolist(), "_bulkRow": range(len(labels))}, _bulkRows=coordinates)
+    extendEntities(owner, "nodes", nodes, labels, {"coordinates": coordinates})
+    return nodes
+
+
+def addElements(
+    owner: object,
+    elementType: Type[T],
+    labels: Any,
+    connectivity: Any,
+    nodeIndex: Optional[LabelIndex] = None,
+    **shared: Any,
+) -> List[T]:
+    """Create elements of the same type from arrays of labels and connectivity and append them to the elements of
+    an object.
+
+    Parameters
+    ----------
+    owner
+        The object holding the elements, such as a Part object.
+    elementType
+        The type of the elements, such as MeshElement.
+    labels
+        A sequence or an array of Ints specifying the element labels.
+    connectivity
+        A sequence of sequences or a two-dimensional array of Ints specifying the node labels of the elements.
+    nodeIndex
+        A LabelIndex object of the node labels, to store the connectivity as node indices, as the MeshElement
+        objects do. By default, the connectivity is stored as node labels.
+    **shared
+        The values of the members shared by the elements, such as their type.
+
+    Returns
+    -------
+    list
+        A list of the new elements.
+
+    Raises
+    ------
+    KeyError
+        If a node label of the connectivity is not in **nodeIndex**.
+    ValueError
+        If the labels or the connectivity are not valid.
+    """
+    labels, connectivity = elementArrays(labels, connectivity)
+    if nodeIndex is not None:
+        connectivity = nodeIndex.require(connectivity, "node label").reshape(connectivity.shape)
+    members = {"label": labels.tolist(), "_bulkRow": range(len(labels))}
+    elements = createEntities(elementType, members, _bulkRows=connectivity, **shared)
+    extendEntities(owner, "elements", elements, labels)
+    return elements
+
+
+def extendEntities(
+    owner: object,
+    attribute: str,
+    entities: List[Any],
+    labels: np.ndarray,
+    cached: Optional[Dict[str, np.ndarray]] = None,
+) -> None:
+    """Append new nodes or elements to the array of an object, such as the nodes of a part, keeping the label
+    index and the cached arrays of the array up to date without reading the objects.
+
+    Parameters
+    ----------
+    owner
+        The object holding the array, such as a Part object.
+    attribute
+        A String specifying the name of the array, "nodes" or "elements".
+    entities
+        A list of the new nodes or elements.
+    labels
+        An array of Ints specifying the labels of the new nodes or elements.
+    cached
+        A dictionary of the arrays of the new nodes or elements cached by a mesh array under their keys, such as
+        their coordinates under "coordinates". The arrays are appended to the cached arrays of the existing nodes
+        or elements, if they are cached.
+
+    Raises
+    ------
+    ValueError
+        If a label of a new node or element is a label of an existing one.
+    """
+    import numpy as np
+
+    array: Any = owner.__dict__.get(attribute)
+    if array is None:
+        # The default array of the class is shared by all its objects, so that the object gets its own copy.
+        shared = getattr(type(owner), attribute, [])
+        array = type(shared)(shared) if isinstance(shared, list) else []
+        setattr(owner, attribute, array)
+    if isinstance(array, MeshArrayCache):
+        array._setOwner(owner)
+    count = len(array)
+    previous = labelIndexOf(owner, attribute, array) if count else LabelIndex(())
+    if count and np.any(previous.indices(labels) >= 0):
+        raise ValueError(f"Duplicate {attribute[:-1]} labels")
+    arrays = {}
+    for key, values in (cached or {}).items() if isinstance(array, MeshArrayCache) else ():
+        existing = array._peek(key) if count else values[:0]
+        if existing is not None:
+            arrays[key] = np.concatenate((existing, values)) if len(existing) else values
+    array.extend(entities)
+    storeLabelIndex(owner, attribute, array, LabelIndex(np.concatenate((previous.labels, labels))))
+    for key, values in arrays.items():
+        array._store(key, values)
+
+
+def _labels(labels: Sequence[int] | np.ndarray, kind: str) -> np.ndarray:
+    """Return some labels as a one-dimensional array of Ints, checking that they are unique."""
+    import numpy as np
+
+    labels = np.asarray(labels, dtype=np.int64).ravel()
+    if len(labels) > 1:
+        ordered = np.sort(labels)
+        repeated = ordered[1:][ordered[1:] == ordered[:-1]]
+        if len(repeated):
+            raise ValueError(f"Duplicate {kind} labels: {', '.join(map(str, np.unique(repeated)[:10].tolist()))}")
+    return labels
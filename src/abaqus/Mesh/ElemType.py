@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
 from typing_extensions import Literal
 
@@ -8,7 +8,6 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ..UtilityAndView.abaqusConstants import (
     AVERAGE_STRAIN,
-    CODE,
     CUBIC,
     DEFAULT,
     ENHANCED,
@@ -20,6 +19,9 @@ from ..UtilityAndView.abaqusConstants import (
 )
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
 
+if TYPE_CHECKING:
+    from ..UtilityAndView.abaqusConstants import CODE
+
 
 @abaqus_class_doc
 class ElemType:
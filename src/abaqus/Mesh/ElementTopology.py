@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+#: The element types whose faces are the faces of a solid, such as C3D8R, DC3D4 or SC8R.
+_SOLID = re.compile(r"^(?:[A-Z]*C3D|SC\d|COH3D|GK3D)")
+
+#: The element types whose faces are the edges of a planar or axisymmetric solid, such as CPS4R or CAX8.
+_PLANAR = re.compile(r"^(?:[A-Z]*(?:CPE|CPS|CAX|CGAX)|COH2D|COHAX|GK(?:PE|PS|AX))")
+
+#: The element types whose faces are the sides of a surface, such as S4R, M3D4 or R3D3.
+_SHELL = re.compile(r"^(?:S\d|STRI|DS\d|M3D|R3D|SFM3D)")
+
+
+class ElementTopology:
+    """The ElementTopology object describes the faces and the edges of the elements of a shape, such as the
+    linear and quadratic hexahedra, in terms of the positions of their corner nodes in the element connectivity.
+
+    The faces and the edges are numbered as in Abaqus, so that the face of index i of a solid element is its face
+    FACEi+1. The faces of a planar element are its edges, and the faces of a shell element are its sides SPOS and
+    SNEG.
+
+    .. note::
+        This object is not part of the Abaqus Scripting Interface. It is used by the ``getExteriorFaces`` and
+        ``getExteriorEdges`` methods of the MeshElementArray object, for example::
+
+            elements = mdb.models[name].parts[name].elements
+            elements.getExteriorFaces()
+    """
+
+    #: A String specifying the kind of the elements, "SOLID", "PLANAR" or "SHELL".
+    kind: str
+
+    #: A String specifying the shape of the elements, such as "HEX8".
+    shape: str
+
+    #: An Int specifying the number of corner nodes, which are the first nodes of the element connectivity.
+    corners: int
+
+    #: A tuple of tuples of Ints specifying the positions of the corner nodes of each face, ordered around the
+    #: face.
+    faces: Tuple[Tuple[int, ...], ...]
+
+    #: A tuple of Strings specifying the name of each face, such as "FACE1" or "SPOS".
+    faceNames: Tuple[str, ...]
+
+    #: A tuple of pairs of Ints specifying the positions of the corner nodes of each edge.
+    edges: Tuple[Tuple[int, int], ...]
+
+    #: A tuple of tuples of Ints specifying the indices in **edges** of the edges of each face.
+    faceEdges: Tuple[Tuple[int, ...], ...]
+
+    def __init__(self, kind: str, shape: str, faces: Sequence[Sequence[int]], edges: Sequence[Sequence[int]]):
+        """This method creates an ElementTopology object.
+
+        Parameters
+        ----------
+        kind
+            A String specifying the kind of the elements, "SOLID", "PLANAR" or "SHELL".
+        shape
+            A String specifying the shape of the elements, such as "HEX8".
+        faces
+            A sequence of sequences of Ints specifying the positions of the corner nodes of each solid face, or of
+            the corner nodes of the element for the other kinds.
+        edges
+            A sequence of pairs of Ints specifying the positions of the corner nodes of each edge.
+        """
+        self.kind, self.shape = kind, shape
+        self.edges = tuple((int(first), int(second)) for first, second in edges)
+        self.corners = 1 + max(max(edge) for edge in self.edges)
+        if kind == "SOLID":
+            self.faces = tuple(tuple(face) for face in faces)
+            self.faceNames = tuple(f"FACE{index}" for index in range(1, len(self.faces) + 1))
+        elif kind == "PLANAR":
+            self.faces = self.edges
+            self.faceNames = tuple(f"FACE{index}" for index in range(1, len(self.faces) + 1))
+        else:
+            cycle = tuple(faces[0])
+            self.faces = (cycle, cycle[:1] + cycle[:0:-1])
+            self.faceNames = ("SPOS", "SNEG")
+        pairs = {frozenset(edge): index for index, edge in enumerate(self.edges)}
+        self.faceEdges = tuple(
+            tuple(pairs[frozenset((face[index - 1], face[index]))] for index in range(len(face))) if len(face) > 2
+            # A face of a planar element is an edge.
+            else (pairs[frozenset(face)],)
+            for face in self.faces
+        )
+
+    def __repr__(self) -> str:
+        return f"ElementTopology({self.kind!r}, {self.shape!r})"
+
+
+_TRI = ((0, 1), (1, 2), (2, 0))
+_QUAD = ((0, 1), (1, 2), (2, 3), (3, 0))
+
+#: The topologies of the elements, by kind and number of corner nodes.
+TOPOLOGIES: Dict[Tuple[str, int], ElementTopology] = {
+    ("SOLID", 4): ElementTopology(
+        "SOLID", "TET4", ((0, 1, 2), (0, 3, 1), (1, 3, 2), (2, 3, 0)), _TRI + ((0, 3), (1, 3), (2, 3))
+    ),
+    ("SOLID", 6): ElementTopology(
+        "SOLID",
+        "WEDGE6",
+        ((0, 1, 2), (3, 5, 4), (0, 3, 4, 1), (1, 4, 5, 2), (2, 5, 3, 0)),
+        _TRI + ((3, 4), (4, 5), (5, 3), (0, 3), (1, 4), (2, 5)),
+    ),
+    ("SOLID", 8): ElementTopology(
+        "SOLID",
+        "HEX8",
+        ((0, 1, 2, 3), (4, 7, 6, 5), (0, 4, 5, 1), (1, 5, 6, 2), (2, 6, 7, 3), (3, 7, 4, 0)),
+        _QUAD + ((4, 5), (5, 6), (6, 7), (7, 4), (0, 4), (1, 5), (2, 6), (3, 7)),
+    ),
+    ("PLANAR", 3): ElementTopology("PLANAR", "TRI3", ((0, 1, 2),), _TRI),
+    ("PLANAR", 4): ElementTopology("PLANAR", "QUAD4", ((0, 1, 2, 3),), _QUAD),
+    ("SHELL", 3): ElementTopology("SHELL", "TRI3", ((0, 1, 2),), _TRI),
+    ("SHELL", 4): ElementTopology("SHELL", "QUAD4", ((0, 1, 2, 3),), _QUAD),
+}
+
+#: The number of corner nodes of the elements, by kind and number of nodes.
+_CORNERS = {
+    "SOLID": {4: 4, 10: 4, 6: 6, 15: 6, 8: 8, 20: 8, 27: 8},
+    "PLANAR": {3: 3, 6: 3, 4: 4, 8: 4, 9: 4},
+    "SHELL": {3: 3, 6: 3, 7: 3, 4: 4, 8: 4, 9: 4},
+}
+
+
+@lru_cache(maxsize=None)
+def elementTopology(elementType: Optional[str], nodeCount: int) -> Optional[ElementTopology]:
+    """Return the topology of the elements of a type and a number of nodes, or None for the elements without
+    faces, such as the beams and the trusses.
+
+    Parameters
+    ----------
+    elementType
+        A String specifying the Abaqus element code, such as "C3D8R", or None if it is unknown, in which case the
+        elements of 4, 6, 8, 10, 15, 20 or 27 nodes are solids and the elements of 3 nodes are shells.
+    nodeCount
+        An Int specifying the number of nodes of the elements.
+
+    Returns
+    -------
+    ElementTopology
+        An ElementTopology object, or None.
+    """
+    if elementType is None:
+        kind = "SOLID" if nodeCount in _CORNERS["SOLID"] else "SHELL"
+    elif _SOLID.match(elementType):
+        kind = "SOLID"
+    elif _PLANAR.match(elementType):
+        kind = "PLANAR"
+    elif _SHELL.match(elementType):
+        kind = "SHELL"
+    else:
+        return None
+    corners = _CORNERS[kind].get(nodeCount)
+    return None if corners is None else TOPOLOGIES[kind, corners]
+
+
+#: A group of elements of the same topology, given by the topology, the positions of the elements in their array
+#: and their connectivity as a two-dimensional array of node indices.
+Group = Tuple[ElementTopology, "np.ndarray", "np.ndarray"]
+
+
+def exteriorFaces(groups: Sequence[Group]) -> List[Group]:
+    """Return the faces referenced by exactly one of the elements of some groups of elements.
+
+    The faces of all the groups are identified by their sorted corner nodes and counted with a single sort, so
+    that the faces shared by elements of different shapes, such as a hexahedron and a wedge, are matched.
+
+    Parameters
+    ----------
+    groups
+        A sequence of groups of elements, given by their topology, their positions and their connectivity.
+
+    Returns
+    -------
+    list[tuple[ElementTopology, numpy.ndarray, numpy.ndarray]]
+        For each group, its topology, the positions of the elements of the exterior faces and the indices of the
+        faces in **faces** of the topology.
+    """
+    return _split(groups, _exteriorFaces(groups))
+
+
+def exteriorEdges(groups: Sequence[Group]) -> List[Group]:
+    """Return the edges referenced by exactly one of the exterior faces of the solid elements, and by exactly one
+    of the planar and shell elements, of some groups of elements.
+
+    Parameters
+    ----------
+    groups
+        A sequence of groups of elements, given by their topology, their positions and their connectivity.
+
+    Returns
+    -------
+    list[tuple[ElementTopology, numpy.ndarray, numpy.ndarray]]
+        For each group, its topology, the positions of the elements of the exterior edges and the indices of the
+        edges in **edges** of the topology.
+    """
+    import numpy as np
+
+    faces = _exteriorFaces(groups)
+    columns, blocks = [], []
+    for number, (topology, positions, connectivity) in enumerate(groups):
+        # The edges of a solid are counted on its exterior faces, and the edges of the other elements on the
+        # elements.
+        if topology.kind == "SOLID":
+            rows, indices = faces[1:, faces[0] == number]
+            pairs = [(rows[indices == face], edge) for face, edges in enumerate(topology.faceEdges) for edge in edges]
+        else:
+            pairs = [(np.arange(len(positions)), edge) for edge in range(len(topology.edges))]
+        for rows, edge in pairs:
+            first, second = _sorted([connectivity[rows, corner] for corner in topology.edges[edge]])
+            columns.append(first << 32 | second)
+            blocks.append((number, rows, edge))
+    return _split(groups, _located(blocks, _single([np.concatenate(columns)]) if columns else np.empty(0, int)))
+
+
+def _exteriorFaces(groups: Sequence[Group]) -> np.ndarray:
+    """Return the exterior faces of some groups of elements as the columns (group, row, face index) of an array
+    of Ints, the row being the row of the element in the connectivity of its group."""
+    import numpy as np
+
+    # The faces are identified by their sorted corner nodes, padded on the left with 0 for the faces of less than
+    # 4 nodes, and by a tag distinguishing the sides of the shells from the faces of the solids. When the node
+    # indices fit in 30 bits, which is the case but for huge meshes, the keys are packed in two Ints.
+    packed = all(connectivity.max(initial=0) < 2**30 - 1 for _, _, connectivity in groups)
+    keys: List[List[np.ndarray]] = [[] for _ in range(2 if packed else 5)]
+    blocks = []
+    for number, (topology, positions, connectivity) in enumerate(groups):
+        for index, face in enumerate(topology.faces):
+            nodes = _sorted([connectivity[:, corner] + 1 for corner in face])
+            nodes = [np.zeros(len(positions), dtype=np.int64)] * (4 - len(nodes)) + nodes
+            tag = np.full(len(positions), index + 1 if topology.kind == "SHELL" else 0, dtype=np.int64)
+            if packed:
+                nodes = [tag << 61 | nodes[0] << 31 | nodes[1], nodes[2] << 31 | nodes[3]]
+            else:
+                nodes.append(tag)
+            for column, values in zip(keys, nodes):
+                column.append(values)
+            blocks.append((number, np.arange(len(positions)), index))
+    if not blocks:
+        return np.empty((3, 0), dtype=np.int64)
+    return _located(blocks, _single([np.concatenate(column) for column in keys]))
+
+
+#: The compare-exchange networks sorting 2, 3 and 4 values.
+_NETWORKS = {2: ((0, 1),), 3: ((0, 1), (1, 2), (0, 1)), 4: ((0, 1), (2, 3), (0, 2), (1, 3), (1, 2))}
+
+
+def _sorted(columns: List[np.ndarray]) -> List[np.ndarray]:
+    """Return some columns of Ints sorted row by row, with a sorting network of 2, 3 or 4 columns."""
+    import numpy as np
+
+    for first, second in _NETWORKS[len(columns)]:
+        columns[first], columns[second] = (
+            np.minimum(columns[first], columns[second]),
+            np.maximum(columns[first], columns[second]),
+        )
+    return columns
+
+
+def _single(columns: Sequence[np.ndarray]) -> np.ndarray:
+    """Return the sorted indices of the rows of some columns of Ints that appear exactly once.
+
+    The rows are sorted by a 64-bit hash of their columns, so that a single sort of one column is needed. If two
+    different rows have the same hash, which is unlikely, the rows are sorted by all their columns instead.
+    """
+    import numpy as np
+
+    hashes = columns[0].astype(np.uint64)
+    for column in columns[1:]:
+        hashes = (hashes * np.uint64(0x100000001B3)) ^ column.astype(np.uint64)
+    order = np.argsort(hashes)
+
+    def changes(order: np.ndarray) -> np.ndarray:
+        changed = np.zeros(max(len(order) - 1, 0), dtype=bool)
+        for column in columns:
+            ordered = column[order]
+            changed |= ordered[1:] != ordered[:-1]
+        return changed
+
+    changed = changes(order)
+    if len(columns) > 1 and np.any(changed & (np.diff(hashes[order]) == 0)):
+        order = np.lexsort(columns[::-1])
+        changed = changes(order)
+    first = np.flatnonzero(np.r_[True, changed])
+    counts = np.diff(np.r_[first, len(order)])
+    return np.sort(order[first[counts == 1]])
+
+
+def _located(blocks: Sequence[Tuple[int, np.ndarray, int]], found: np.ndarray) -> np.ndarray:
+    """Return the columns (group, row, index) of an array of Ints of the rows at some indices of the concatenation
+    of some blocks of rows, each block being given by its group number, its rows and its face or edge index."""
+    import numpy as np
+
+    starts = np.cumsum([0] + [len(rows) for _, rows, _ in blocks])
+    block = np.searchsorted(starts, found, side="right") - 1
+    numbers = np.array([number for number, _, _ in blocks], dtype=np.int64)
+    indices = np.array([index for _, _, index in blocks], dtype=np.int64)
+    rows = np.concatenate([rows for _, rows, _ in blocks]) if blocks else np.empty(0, dtype=np.int64)
+    return np.stack((numbers[block], rows[found], indices[block]))
+
+
+def _split(groups: Sequence[Group], found: np.ndarray) -> List[Group]:
+    """Return the positions of the elements and the face or edge indices of the columns (group, row, index) of an
+    array of Ints, for each group."""
+    return [
+        (topology, positions[found[1, found[0] == number]], found[2, found[0] == number])
+        for number, (topology, positions, _) in enumerate(groups)
+    ]
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import heapq
+from typing import TYPE_CHECKING, Callable, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class KDTree:
+    """The KDTree object is a spatial index over the coordinates of a set of points, such as the nodes of a
+    MeshNodeArray object, used by the spatial queries of the mesh arrays.
+
+    The points are split recursively at the median of the widest axis of their bounding box, down to leaves of at
+    most **leafSize** points. The coordinates are stored contiguously in the order of the leaves, so that a leaf is
+    tested with a single NumPy operation, and the queries only visit the tree nodes whose bounding box intersects
+    the query region, which makes their cost grow with the logarithm of the number of points rather than linearly.
+
+    .. note::
+        This object is not part of the Abaqus Scripting Interface. It is built lazily by the mesh arrays, for
+        example::
+
+            nodes = mdb.models[name].parts[name].nodes
+            nodes.getByBoundingBox(xMin=0, yMin=0, zMin=0, xMax=1, yMax=1, zMax=1)
+    """
+
+    #: A two-dimensional array of Floats specifying the coordinates of the points, in the order of the leaves.
+    points: np.ndarray
+
+    #: An array of Ints specifying the index of each point of **points** in the original sequence of points.
+    order: np.ndarray
+
+    #: An Int specifying the maximum number of points of a leaf.
+    leafSize: int = 32
+
+    def __init__(self, points: np.ndarray | Sequence[Sequence[float]], leafSize: int = 32):
+        """This method builds a KDTree object.
+
+        Parameters
+        ----------
+        points
+            A two-dimensional array of Floats of shape (N, dimensions) specifying the coordinates of the points.
+        leafSize
+            An Int specifying the maximum number of points of a leaf. The default value is 32.
+        """
+        import numpy as np
+
+        points = np.asarray(points, dtype=float)
+        points = points.reshape(len(points), -1)
+        self.leafSize = max(int(leafSize), 1)
+        self.order = np.arange(len(points))
+        self._ranges: List[Tuple[int, int]] = []
+        self._children: List[List[int]] = []
+        lows, highs = [], []
+        stack = [(0, len(points), -1, 0)]
+        while stack:
+            start, end, parent, side = stack.pop()
+            node = len(self._ranges)
+            if parent >= 0:
+                self._children[parent][side] = node
+            coordinates = points[self.order[start:end]]
+            low = coordinates.min(axis=0) if end > start else np.zeros(points.shape[1])
+            high = coordinates.max(axis=0) if end > start else np.zeros(points.shape[1])
+            lows.append(low)
+            highs.append(high)
+            self._ranges.append((start, end))
+            self._children.append([-1, -1])
+            if end - start > self.leafSize:
+                axis = int(np.argmax(high - low))
+                middle = (start + end) // 2
+                indices = self.order[start:end]
+                self.order[start:end] = indices[np.argpartition(coordinates[:, axis], middle - start)]
+                stack.append((middle, end, node, 1))
+                stack.append((start, middle, node, 0))
+        self.points = np.ascontiguousarray(points[self.order])
+        self._lows: List[Tuple[float, ...]] = [tuple(low.tolist()) for low in lows]
+        self._highs: List[Tuple[float, ...]] = [tuple(high.tolist()) for high in highs]
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def inBox(self, low: Sequence[float], high: Sequence[float]) -> np.ndarray:
+        """Return the sorted indices of the points inside a box, boundaries included.
+
+        Parameters
+        ----------
+        low
+            A sequence of Floats specifying the minimum coordinates of the box.
+        high
+            A sequence of Floats specifying the maximum coordinates of the box.
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of Ints specifying the indices of the points in the original sequence of points.
+        """
+        import numpy as np
+
+        low, high = tuple(map(float, low)), tuple(map(float, high))
+        lowArray, highArray = np.array(low), np.array(high)
+        return self._query(
+            low,
+            high,
+            lambda points: np.all((points >= lowArray) & (points <= highArray), axis=1),
+            lambda nodeLow, nodeHigh: all(a >= b for a, b in zip(nodeLow, low))
+            and all(a <= b for a, b in zip(nodeHigh, high)),
+        )
+
+    def inSphere(self, center: Sequence[float], radius: float) -> np.ndarray:
+        """Return the sorted indices of the points inside a sphere, boundary included.
+
+        Parameters
+        ----------
+        center
+            A sequence of Floats specifying the coordinates of the center of the sphere.
+        radius
+            A Float specifying the radius of the sphere.
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of Ints specifying the indices of the points in the original sequence of points.
+        """
+        import numpy as np
+
+        center = tuple(map(float, center))
+        centerArray, squared = np.array(center), float(radius) ** 2
+        return self._query(
+            tuple(c - radius for c in center),
+            tuple(c + radius for c in center),
+            lambda points: np.einsum("ij,ij->i", points - centerArray, points - centerArray) <= squared,
+            lambda nodeLow, nodeHigh: sum(max(c - a, b - c) ** 2 for c, a, b in zip(center, nodeLow, nodeHigh))
+            <= squared,
+        )
+
+    def inCylinder(self, center1: Sequence[float], center2: Sequence[float], radius: float) -> np.ndarray:
+        """Return the sorted indices of the points inside a cylinder, boundary included.
+
+        Parameters
+        ----------
+        center1
+            A sequence of Floats specifying the coordinates of the center of the first end of the cylinder.
+        center2
+            A sequence of Floats specifying the coordinates of the center of the second end of the cylinder.
+        radius
+            A Float specifying the radius of the cylinder.
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of Ints specifying the indices of the points in the original sequence of points.
+        """
+        import numpy as np
+
+        start, end = np.asarray(center1, dtype=float), np.asarray(center2, dtype=float)
+        axis = end - start
+        length = float(np.dot(axis, axis))
+        # The extent of a cylinder along a coordinate axis is its axis extent plus the radius of its end disks.
+        extent = radius * np.sqrt(np.clip(1.0 - axis**2 / length, 0.0, 1.0)) if length else np.full(len(axis), radius)
+
+        def inside(points: np.ndarray) -> np.ndarray:
+            relative = points - start
+            along = relative @ axis / length if length else np.zeros(len(points))
+            distance = relative - along[:, None] * axis
+            return (along >= 0) & (along <= 1) & (np.einsum("ij,ij->i", distance, distance) <= radius**2)
+
+        return self._query(
+            tuple((np.minimum(start, end) - extent).tolist()), tuple((np.maximum(start, end) + extent).tolist()), inside
+        )
+
+    def closest(
+        self, point: Sequence[float], numToFind: int = 1, searchTolerance: float = 0.0
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the points closest to a point, in order of proximity.
+
+        Parameters
+        ----------
+        point
+            A sequence of Floats specifying the coordinates of the point.
+        numToFind
+            An Int specifying the number of points to find. The default value is 1.
+        searchTolerance
+            A Float specifying the maximum distance of the points found. The default value is 0.0, which searches
+            all the points.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray]
+            The distances of the points found and their indices in the original sequence of points, fewer than
+            **numToFind** if there are not enough points within **searchTolerance**.
+        """
+        import numpy as np
+
+        point = tuple(map(float, point))
+        pointArray = np.array(point)
+        limit = float(searchTolerance) ** 2 if searchTolerance > 0 else np.inf
+        distances, indices = np.empty(0), np.empty(0, dtype=np.int64)
+        heap = [(0.0, 0)] if len(self.points) else []
+        while heap:
+            distance, node = heapq.heappop(heap)
+            worst = distances[-1] if len(distances) == numToFind else limit
+            if distance > min(worst, limit):
+                break
+            left, right = self._children[node]
+            if left >= 0:
+                for child in (left, right):
+                    heapq.heappush(heap, (self._boxDistance(point, child), child))
+                continue
+            start, end = self._ranges[node]
+            leaf = self.points[start:end] - pointArray
+            distances = np.concatenate((distances, np.einsum("ij,ij->i", leaf, leaf)))
+            indices = np.concatenate((indices, np.arange(start, end)))
+            kept = np.argsort(distances, kind="stable")[:numToFind]
+            kept = kept[distances[kept] <= limit]
+            distances, indices = distances[kept], indices[kept]
+        return np.sqrt(distances), self.order[indices]
+
+    def _boxDistance(self, point: Tuple[float, ...], node: int) -> float:
+        """Return the squared distance from a point to the bounding box of a tree node."""
+        return sum(
+            (low - value) ** 2 if value < low else (value - high) ** 2 if value > high else 0.0
+            for value, low, high in zip(point, self._lows[node], self._highs[node])
+        )
+
+    def _query(
+        self,
+        low: Tuple[float, ...],
+        high: Tuple[float, ...],
+        inside: Callable[[np.ndarray], np.ndarray],
+        contains: Optional[Callable[[Tuple[float, ...], Tuple[float, ...]], bool]] = None,
+    ) -> np.ndarray:
+        """Return the sorted indices of the points of the tree nodes intersecting a box that satisfy a test, the
+        points of a tree node contained in the query region are taken without testing them."""
+        import numpy as np
+
+        selected = []
+        stack = [0] if len(self.points) else []
+        while stack:
+            node = stack.pop()
+            nodeLow, nodeHigh = self._lows[node], self._highs[node]
+            if any(a > b for a, b in zip(nodeLow, high)) or any(a < b for a, b in zip(nodeHigh, low)):
+                continue
+            start, end = self._ranges[node]
+            if contains is not None and contains(nodeLow, nodeHigh):
+                selected.append(self.order[start:end])
+                continue
+            left, right = self._children[node]
+            if left >= 0:
+                stack += (right, left)
+            else:
+                selected.append(self.order[start:end][inside(self.points[start:end])])
+        return np.sort(np.concatenate(selected)) if selected else np.empty(0, dtype=np.int64)
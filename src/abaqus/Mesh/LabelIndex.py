@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Sequence
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class LabelIndex:
+    """The LabelIndex object maps the labels of a sequence of nodes or elements to their positions in the
+    sequence, and is shared by the label-based methods of the mesh arrays, the ODB instances and the sets.
+
+    When the labels are compact, the positions are stored in a dense table indexed by the label minus the smallest
+    label. Otherwise the scalar lookups use a dictionary and the batch lookups a binary search in the sorted
+    labels. In both cases a batch of labels is looked up with a single vectorized call. When a label appears more
+    than once, its first position is used.
+
+    .. note::
+        This object is not part of the Abaqus Scripting Interface. It is built lazily by the mesh arrays, for
+        example::
+
+            nodes = mdb.models[name].parts[name].nodes
+            nodes.sequenceFromLabels(labels=(1, 2, 3))
+    """
+
+    #: The maximum ratio of the label range to the number of labels for which a dense table is used.
+    DENSITY = 4
+
+    #: An array of Ints specifying the labels in the order of the sequence.
+    labels: np.ndarray
+
+    #: A Boolean specifying whether the positions are stored in a dense table.
+    dense: bool = False
+
+    def __init__(self, labels: Iterable[int]):
+        """This method builds a LabelIndex object.
+
+        Parameters
+        ----------
+        labels
+            A sequence of Ints specifying the labels in the order of the sequence.
+        """
+        import numpy as np
+
+        if isinstance(labels, np.ndarray):
+            self.labels = labels.astype(np.int64, copy=False).ravel()
+        else:
+            self.labels = np.fromiter(labels, dtype=np.int64)
+        positions = np.arange(len(self.labels))
+        self._offset = int(self.labels.min()) if len(self.labels) else 0
+        span = int(self.labels.max()) - self._offset + 1 if len(self.labels) else 0
+        self.dense = span <= self.DENSITY * len(self.labels) + 1024
+        if self.dense:
+            self._table = np.full(span, -1, dtype=np.int64)
+            # Reversed so that the first position of a repeated label is written last.
+            self._table[self.labels[::-1] - self._offset] = positions[::-1]
+        else:
+            self._order = np.argsort(self.labels, kind="stable")
+            self._sorted = self.labels[self._order]
+        self._positions: Optional[Dict[int, int]] = None
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def index(self, label: int) -> int:
+        """Return the position of a label, or -1 if there is no such label.
+
+        Parameters
+        ----------
+        label
+            An Int specifying the label.
+
+        Returns
+        -------
+        int
+            The position of the first node or element with the label.
+        """
+        if self.dense:
+            position = int(label) - self._offset
+            return int(self._table[position]) if 0 <= position < len(self._table) else -1
+        if self._positions is None:
+            self._positions = {}
+            for position, value in enumerate(self.labels.tolist()):
+                self._positions.setdefault(value, position)
+        return self._positions.get(int(label), -1)
+
+    def indices(self, labels: Sequence[int] | np.ndarray) -> np.ndarray:
+        """Return the positions of a batch of labels, -1 for the labels that do not exist.
+
+        Parameters
+        ----------
+        labels
+            A sequence or an array of Ints specifying the labels.
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of Ints specifying the position of the first node or element with each label.
+        """
+        import numpy as np
+
+        labels = np.asarray(labels, dtype=np.int64).ravel()
+        if not len(self.labels):
+            return np.full(len(labels), -1, dtype=np.int64)
+        if self.dense:
+            positions = labels - self._offset
+            valid = (positions >= 0) & (positions < len(self._table))
+            return np.where(valid, self._table[np.where(valid, positions, 0)], -1)
+        found = np.minimum(np.searchsorted(self._sorted, labels), len(self._sorted) - 1)
+        return np.where(self._sorted[found] == labels, self._order[found], -1)
+
+    def require(self, labels: Sequence[int] | np.ndarray, kind: str = "label") -> np.ndarray:
+        """Return the positions of a batch of labels, which must all exist.
+
+        Parameters
+        ----------
+        labels
+            A sequence or an array of Ints specifying the labels.
+        kind
+            A String specifying the kind of label in the error message, such as "node label".
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of Ints specifying the position of the first node or element with each label.
+
+        Raises
+        ------
+        KeyError
+            If a label does not exist.
+        """
+        import numpy as np
+
+        positions = self.indices(labels)
+        missing = np.flatnonzero(positions < 0)
+        if len(missing):
+            invalid = np.asarray(labels).ravel()[missing[:10]].tolist()
+            raise KeyError(f"Invalid {kind}s: {', '.join(map(str, invalid))}{', ...' if len(missing) > 10 else ''}")
+        return positions
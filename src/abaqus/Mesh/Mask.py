@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, Sequence, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class Mask:
+    """The Mask object is a set of entity indices stored as a bitset, encoded to and decoded from the mask strings
+    of the ``getMask`` and ``getSequenceFromMask`` methods, such as ``'[#ff #0:2 #4000 ]'``.
+
+    A mask string is a sequence of 32-bit words in hexadecimal, the first word holding the indices 0 to 31. A word
+    followed by ``:count`` is repeated **count** times. The bits are stored in 64-bit words, so that the set
+    operations, which are available as the ``|``, ``&`` and ``-`` operators, cost one NumPy operation over n/64
+    words, and the mask strings are decoded without a Python loop over the words.
+
+    .. note::
+        This object is not part of the Abaqus Scripting Interface. It is used by the ``getMask`` and
+        ``getSequenceFromMask`` methods of the arrays, for example::
+
+            faces = mdb.models[name].parts[name].faces
+            faces.getSequenceFromMask(mask=("[#ff ]",))
+    """
+
+    #: An array of unsigned 64-bit Ints specifying the bits of the mask, the first word holding the indices 0 to
+    #: 63.
+    words: np.ndarray
+
+    def __init__(self, words: np.ndarray | Sequence[int] = ()):
+        """This method creates a Mask object.
+
+        Parameters
+        ----------
+        words
+            A sequence of unsigned 64-bit Ints specifying the bits of the mask. The default value is an empty
+            sequence, which creates an empty mask.
+        """
+        import numpy as np
+
+        self.words = np.asarray(words, dtype=np.uint64).ravel()
+
+    @classmethod
+    def fromIndices(cls, indices: np.ndarray | Iterable[int]) -> Mask:
+        """Return the mask of a sequence of entity indices.
+
+        Parameters
+        ----------
+        indices
+            A sequence of non-negative Ints specifying the indices.
+
+        Returns
+        -------
+        Mask
+            A Mask object.
+        """
+        import numpy as np
+
+        indices = np.fromiter(indices, dtype=np.int64) if not isinstance(indices, np.ndarray) else indices
+        if not len(indices):
+            return cls()
+        if indices.min() < 0:
+            raise ValueError("Mask indices must be non-negative")
+        bits = np.zeros((int(indices.max()) // 64 + 1) * 64, dtype=bool)
+        bits[indices] = True
+        return cls(np.packbits(bits, bitorder="little").view("<u8"))
+
+    @classmethod
+    def fromString(cls, mask: Union[str, Sequence[str]]) -> Mask:
+        """Return the mask encoded by a mask string, or the union of the masks encoded by a sequence of mask
+        strings.
+
+        Parameters
+        ----------
+        mask
+            A String or a sequence of Strings specifying the mask, such as ``'[#ff #0:2 #4000 ]'``.
+
+        Returns
+        -------
+        Mask
+            A Mask object.
+
+        Raises
+        ------
+        ValueError
+            If a mask string is not valid.
+        """
+        import numpy as np
+
+        if not isinstance(mask, str):
+            result = cls()
+            for item in mask:
+                result = result | cls.fromString(item)
+            return result
+        body = mask.strip()
+        if body.startswith("[") and body.endswith("]"):
+            body = body[1:-1]
+        raw = np.frombuffer(body.strip().encode("ascii", "replace") + b" ", dtype=np.uint8)
+        if len(raw) == 1:
+            return cls()
+        # Runs of whitespace characters are replaced by single spaces.
+        spaces = np.isin(raw, list(b" \t\r\n"))
+        raw = np.where(spaces, ord(" "), raw).astype(np.uint8)[~(spaces & np.r_[False, spaces[:-1]])]
+        starts = np.flatnonzero(raw == ord("#"))
+        # Each word is a '#' character followed by a value of at most 8 digits, a count after an optional ':'
+        # character, and a space.
+        ends = np.flatnonzero(raw == ord(" "))
+        colons = np.flatnonzero(raw == ord(":"))
+        if len(ends) != len(starts) or np.any(starts != np.r_[0, ends[:-1] + 1]):
+            raise ValueError(f"Invalid mask: {mask!r}")
+        withCount = np.searchsorted(starts, colons, side="right") - 1
+        valueEnds = ends.copy()
+        valueEnds[withCount] = colons
+        values = _digits(raw, starts + 1, valueEnds, 8)
+        counts = _digits(raw, colons + 1, ends[withCount], 18)
+        if values is None or counts is None or values.max(initial=0) >= 16 or counts.max(initial=0) >= 10:
+            raise ValueError(f"Invalid mask: {mask!r}")
+        if np.any(np.diff(withCount) == 0):
+            raise ValueError(f"Invalid mask: {mask!r}")
+        # The hexadecimal digits are packed two by two into the bytes of big-endian 32-bit words.
+        packed = ((values[:, 0::2] << 4) | values[:, 1::2]).view(">u4").ravel()
+        repeats = np.ones(len(starts), dtype=np.int64)
+        repeats[withCount] = counts.astype(np.int64) @ 10 ** np.arange(17, -1, -1, dtype=np.int64)
+        words = np.repeat(packed.astype("<u4"), repeats)
+        return cls(np.concatenate((words, np.zeros(len(words) % 2, dtype="<u4"))).view("<u8"))
+
+    def toString(self) -> str:
+        """Return the mask string encoding the mask, such as ``'[#ff #0:2 #4000 ]'``.
+
+        Returns
+        -------
+        str
+            A String specifying the mask.
+        """
+        import numpy as np
+
+        words = self.words.astype("<u8").view("<u4")
+        nonzero = np.flatnonzero(words)
+        words = words[: nonzero[-1] + 1] if len(nonzero) else words[:1] if len(words) else np.zeros(1, "<u4")
+        starts = np.flatnonzero(np.r_[True, words[1:] != words[:-1]])
+        counts = np.diff(np.r_[starts, len(words)])
+        items = [
+            f"#{word:x}:{count}" if count > 1 else f"#{word:x}"
+            for word, count in zip(words[starts].tolist(), counts.tolist())
+        ]
+        return f"[{' '.join(items)} ]"
+
+    def indices(self) -> np.ndarray:
+        """Return the sorted indices of the mask.
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of Ints specifying the indices.
+        """
+        import numpy as np
+
+        return np.flatnonzero(np.unpackbits(self.words.astype("<u8").view(np.uint8), bitorder="little"))
+
+    def contains(self, indices: np.ndarray | Sequence[int]) -> np.ndarray:
+        """Return whether each of a sequence of entity indices is in the mask.
+
+        Parameters
+        ----------
+        indices
+            A sequence of non-negative Ints specifying the indices.
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of Booleans.
+        """
+        import numpy as np
+
+        indices = np.asarray(indices, dtype=np.int64)
+        word = indices >> 6
+        valid = (indices >= 0) & (word < len(self.words))
+        if not len(self.words):
+            return valid
+        bits = self.words[np.where(valid, word, 0)] >> (indices & 63).astype(np.uint64)
+        return valid & (bits & np.uint64(1) == 1)
+
+    def __len__(self) -> int:
+        import numpy as np
+
+        return int(np.unpackbits(self.words.view(np.uint8)).sum())
+
+    def __bool__(self) -> bool:
+        return bool(self.words.any())
+
+    def __or__(self, other: Mask) -> Mask:
+        words, others = self._aligned(other)
+        return Mask(words | others)
+
+    def __and__(self, other: Mask) -> Mask:
+        words, others = self._aligned(other)
+        return Mask(words & others)
+
+    def __sub__(self, other: Mask) -> Mask:
+        words, others = self._aligned(other)
+        return Mask(words & ~others)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Mask):
+            return NotImplemented
+        words, others = self._aligned(other)
+        return bool((words == others).all())
+
+    __hash__ = None  # type: ignore
+
+    def __str__(self) -> str:
+        return self.toString()
+
+    def __repr__(self) -> str:
+        return f"Mask({self.toString()!r})"
+
+    def _aligned(self, other: Mask) -> tuple[np.ndarray, np.ndarray]:
+        """Return the words of the mask and of another mask, padded with zeros to the same length."""
+        import numpy as np
+
+        size = max(len(self.words), len(other.words))
+        return (
+            np.pad(self.words, (0, size - len(self.words))),
+            np.pad(other.words, (0, size - len(other.words))),
+        )
+
+
+def _digits(raw: np.ndarray, starts: np.ndarray, ends: np.ndarray, size: int) -> np.ndarray | None:
+    """Return the digits of the numbers between some start and end positions of a buffer of characters, as rows of
+    **size** digits aligned to the right, or None if a number is longer than **size** or not made of digits."""
+    import numpy as np
+
+    if len(starts) and (ends - starts).max() > size:
+        return None
+    positions = ends[:, None] - size + np.arange(size)
+    inside = positions >= starts[:, None]
+    digits = np.where(inside, _digitTable()[raw[np.where(inside, positions, 0)]], 0)
+    return None if np.any(digits < 0) else digits.astype(np.uint8)
+
+
+def _digitTable() -> np.ndarray:
+    """Return the table of the values of the hexadecimal digits indexed by their character codes, -1 for the other
+    characters."""
+    import numpy as np
+
+    table = np.full(256, -1, dtype=np.int8)
+    for value, character in enumerate(b"0123456789abcdef"):
+        table[character] = table[bytes([character]).upper()[0]] = value
+    return table
@@ -0,0 +1,472 @@
+"""Mass properties of the meshes of the parts and of the assembly, used by the ``getMassProperties`` methods.
+
+The volume or the area, the first moments and the second moments of each element are integrated with Gauss
+rules that are exact for the linear solids, triangles and quadrilaterals. The elements of a shape are integrated
+together, by blocks of elements to bound the memory used, and the integrals are cached by the element array of
+the part. The mass properties of a region are then sums of these integrals weighted by the density of the
+material of each element, and by the thickness of its section for the planar and shell elements, so that
+evaluating them again after a change of a material or a section only costs a few vectorized sums.
+
+The cached integrals are discarded when nodes are moved with :func:`~abaqus.Mesh.MeshQuality.moveNodes`. Other
+in-place edits of the nodes or the elements must be followed by a call to
+:func:`~abaqus.Mesh.MeshArrayCache.invalidateMeshCaches`.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+from ..UtilityAndView.abaqusConstants import (
+    MIDDLE_SURFACE,
+    SINGLE_VALUE,
+    UNIFORM,
+    Boolean,
+)
+from ..UtilityAndView.SymbolicConstant import SymbolicConstant
+from .ElementTopology import ElementTopology
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .MeshElementArray import MeshElementArray
+
+#: The warnings of ``getMassProperties`` that are found per element, in the order of their bits in the flags
+#: returned by :func:`sectionProperties`.
+WARNINGS = (
+    "UNSUPPORTED_ENTITIES",
+    "MISSING_SECTION_DEFINITION",
+    "UNSUPPORTED_SECTION_DEFINITION",
+    "MISSING_MATERIAL_DEFINITION",
+    "MISSING_DENSITY",
+    "ZERO_DENSITY",
+    "UNSUPPORTED_DENSITY",
+    "MISSING_THICKNESS",
+    "ZERO_THICKNESS",
+    "VARIABLE_THICKNESS",
+    "SHELL_OFFSETS",
+)
+
+#: The kinds of the elements, 0 for the unsupported elements.
+SOLID, PLANAR, SHELL = 1, 2, 3
+
+#: The warnings of the elements whose density is replaced by the density specified by the user.
+_DENSITY_WARNINGS = (
+    "MISSING_SECTION_DEFINITION",
+    "UNSUPPORTED_SECTION_DEFINITION",
+    "MISSING_MATERIAL_DEFINITION",
+    "MISSING_DENSITY",
+    "ZERO_DENSITY",
+    "UNSUPPORTED_DENSITY",
+)
+
+#: The warnings of the elements whose thickness is replaced by the thickness specified by the user.
+_THICKNESS_WARNINGS = ("MISSING_THICKNESS", "ZERO_THICKNESS")
+
+#: The maximum number of elements integrated at once.
+_BLOCK = 1 << 14
+
+#: The components of the second moments, in the order of the moments of inertia.
+_PAIRS = ((0, 0), (1, 1), (2, 2), (0, 1), (0, 2), (1, 2))
+
+
+class MassIntegrals:
+    """The MassIntegrals object holds the volume or the area, the first moments and the second moments of the
+    elements of a mesh, per unit density and per unit thickness.
+
+    The solids are integrated over their volume, and the planar and shell elements over their area. The moments
+    are taken about **origin**, a point close to the mesh, so that the moments about the center of mass do not
+    lose precision for the meshes far from the origin. The quadratic elements are integrated over the linear
+    element of their corner nodes.
+
+    .. note::
+        This object is not part of the Abaqus Scripting Interface. It is used by the ``getMassProperties``
+        methods of the parts and of the assembly, and is returned by :func:`massIntegrals`.
+    """
+
+    #: The (N, 3) array of the coordinates of the nodes the integrals are computed from.
+    coordinates: np.ndarray
+
+    #: An array of three Floats specifying the point about which the moments are taken.
+    origin: np.ndarray
+
+    #: An array of Ints specifying the kind of each element, SOLID, PLANAR, SHELL, or 0 if it is not supported.
+    kinds: np.ndarray
+
+    #: An array of Floats specifying the volume of each solid and the area of each other element.
+    measure: np.ndarray
+
+    #: An (M, 3) array of Floats specifying the first moments of each element.
+    first: np.ndarray
+
+    #: An (M, 6) array of Floats specifying the second moments xx, yy, zz, xy, xz and yz of each element.
+    second: np.ndarray
+
+    def __init__(self, elements: MeshElementArray, coordinates: np.ndarray):
+        """This method creates a MassIntegrals object and integrates all the elements.
+
+        Parameters
+        ----------
+        elements
+            A MeshElementArray object specifying the elements of the mesh.
+        coordinates
+            An (N, 3) array of Floats specifying the coordinates of the nodes of the mesh.
+        """
+        import numpy as np
+
+        self.coordinates = coordinates
+        self.origin = coordinates.mean(axis=0) if len(coordinates) else np.zeros(3)
+        self.kinds = np.zeros(len(elements), dtype=np.int8)
+        self.measure = np.zeros(len(elements))
+        self.first = np.zeros((len(elements), 3))
+        self.second = np.zeros((len(elements), 6))
+        for topology, positions, connectivity in elements._topology():
+            self.kinds[positions] = {"SOLID": SOLID, "PLANAR": PLANAR, "SHELL": SHELL}[topology.kind]
+            for start in range(0, len(positions), _BLOCK):
+                end = start + _BLOCK
+                block, corners = positions[start:end], coordinates[connectivity[start:end]] - self.origin
+                self.measure[block], self.first[block], self.second[block] = _integrate(topology, corners)
+        for position in np.flatnonzero(self.kinds).tolist():
+            if _unsupported(str(getattr(elements[position], "type", ""))):
+                self.kinds[position] = 0
+
+
+def massIntegrals(part: Any) -> MassIntegrals:
+    """Return the integrals of the elements of a part, cached by its element array.
+
+    Parameters
+    ----------
+    part
+        A Part object.
+
+    Returns
+    -------
+    MassIntegrals
+        A MassIntegrals object.
+    """
+    coordinates = part.nodes._coordinates()
+    integrals = part.elements._peek("massIntegrals")
+    if integrals is None or integrals.coordinates is not coordinates:
+        integrals = MassIntegrals(part.elements, coordinates)
+        part.elements._store("massIntegrals", integrals)
+    return integrals
+
+
+def sectionProperties(part: Any, kinds: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the density and the thickness of each element of a part, from the sections assigned to the part
+    and the materials of the model holding the part, and the warnings found for each element.
+
+    Parameters
+    ----------
+    part
+        A Part object.
+    kinds
+        An array of Ints specifying the kind of each element, as the **kinds** member of the MassIntegrals
+        object.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+        The density of each element, NaN if it is not known, the thickness of each element, which is 1 for the
+        solids and NaN if it is not known, and the flags of the warnings of each element, whose bit i is set for
+        the warning of index i in :data:`WARNINGS`.
+    """
+    import numpy as np
+
+    from .MeshQuality import entityPositions
+
+    density = np.full(len(kinds), np.nan)
+    thickness = np.where(kinds == SHELL, np.nan, 1.0)
+    flags = np.zeros(len(kinds), dtype=np.int64)
+    flags[kinds == 0] |= _bit("UNSUPPORTED_ENTITIES")
+    assigned = np.zeros(len(kinds), dtype=bool)
+    model = _model(part)
+    for assignment in part.sectionAssignments:
+        positions = entityPositions(part.elements, assignment.region, "elements")
+        if getattr(assignment, "suppressed", False) or not len(positions):
+            continue
+        assigned[positions] = True
+        section = model.sections.get(assignment.sectionName) if model is not None else None
+        if section is None or getattr(section, "material", None) is None:
+            name = "MISSING_SECTION_DEFINITION" if section is None else "UNSUPPORTED_SECTION_DEFINITION"
+            flags[positions] |= _bit(name)
+            continue
+        density[positions], warning = _density(model.materials.get(section.material))
+        if warning:
+            flags[positions] |= _bit(warning)
+        value = getattr(section, "thickness", None)
+        planar, shells = positions[kinds[positions] == PLANAR], positions[kinds[positions] == SHELL]
+        thickness[planar] = value or 1.0
+        thickness[shells] = np.nan if value is None else value
+        if len(shells):
+            if value is None or value == 0:
+                flags[shells] |= _bit("MISSING_THICKNESS" if value is None else "ZERO_THICKNESS")
+            if getattr(section, "thicknessType", UNIFORM) != UNIFORM:
+                flags[shells] |= _bit("VARIABLE_THICKNESS")
+            offsetType = getattr(assignment, "offsetType", SINGLE_VALUE)
+            if getattr(assignment, "offset", 0) or offsetType not in (SINGLE_VALUE, MIDDLE_SURFACE):
+                flags[shells] |= _bit("SHELL_OFFSETS")
+    flags[~assigned & (kinds > 0)] |= _bit("MISSING_SECTION_DEFINITION")
+    return density, thickness, flags
+
+
+def massProperties(
+    regions: Sequence[Tuple[Any, Optional[np.ndarray], Optional[np.ndarray]]],
+    specifyDensity: Boolean = False,
+    density: float = 0,
+    specifyThickness: Boolean = False,
+    thickness: float = 0,
+    miAboutCenterOfMass: Boolean = True,
+    miAboutPoint: Sequence[float] = (),
+) -> Dict[str, Any]:
+    """Return the mass properties of some elements of some parts, as the ``getMassProperties`` methods do.
+
+    Parameters
+    ----------
+    regions
+        A sequence of tuples of a Part object, of an array of Ints specifying the positions of some elements in
+        the element array of the part, or None for all its elements, and of the 4 x 4 transform of the
+        elements, such as the transform of a part instance, or None for the identity.
+    specifyDensity
+        A Boolean specifying whether **density** is used for the elements with a density warning.
+    density
+        A Float specifying the density used for the elements with a density warning.
+    specifyThickness
+        A Boolean specifying whether **thickness** is used for the shell elements with a thickness warning.
+    thickness
+        A Float specifying the thickness used for the shell elements with a thickness warning.
+    miAboutCenterOfMass
+        A Boolean specifying whether the moments of inertia are about the center of mass.
+    miAboutPoint
+        A sequence of three Floats specifying the point about which the moments of inertia are taken when they
+        are not about the center of mass, the origin by default.
+
+    Returns
+    -------
+    dict
+        A dictionary with the items of the dictionary returned by ``getMassProperties``.
+    """
+    import numpy as np
+
+    moments: Dict[str, List[Tuple[float, np.ndarray, np.ndarray, np.ndarray]]] = {"area": [], "volume": [], "mass": []}
+    computed: Dict[int, Tuple[Dict[str, Tuple[float, np.ndarray, np.ndarray]], int]] = {}
+    found = 0
+    for part, positions, matrix in regions:
+        # The moments of a whole part are computed once for all its instances.
+        result = computed.get(id(part)) if positions is None else None
+        if result is None:
+            result = _moments(part, positions, specifyDensity, density, specifyThickness, thickness)
+            if positions is None:
+                computed[id(part)] = result
+        partMoments, flags = result
+        found |= flags
+        for name, (total, center, tensor) in partMoments.items():
+            moments[name].append((total, center, tensor, np.eye(4) if matrix is None else matrix))
+    properties: Dict[str, Any] = {
+        "area": None,
+        "areaCentroid": None,
+        "volume": None,
+        "volumeCentroid": None,
+        "massFromMassPerUnitSurfaceArea": None,
+        "mass": None,
+        "centerOfMass": None,
+        "momentOfInertia": None,
+        "warnings": tuple(SymbolicConstant(name) for index, name in enumerate(WARNINGS) if found >> index & 1),
+    }
+    for name, centroid in (("area", "areaCentroid"), ("volume", "volumeCentroid"), ("mass", "centerOfMass")):
+        if moments[name]:
+            total, center, tensor = _combine(moments[name])
+            properties[name], properties[centroid] = total, tuple(center.tolist())
+            if name == "mass":
+                point = center if miAboutCenterOfMass else np.array(tuple(miAboutPoint) or (0.0, 0.0, 0.0), float)
+                tensor = tensor + total * np.outer(center - point, center - point)
+                inertia = np.trace(tensor) * np.eye(3) - tensor
+                properties["momentOfInertia"] = tuple(float(inertia[i, j]) for i, j in _PAIRS)
+                properties["massFromMassPerUnitSurfaceArea"] = 0.0
+    return properties
+
+
+def _moments(
+    part: Any,
+    positions: Optional[np.ndarray],
+    specifyDensity: Boolean,
+    density: float,
+    specifyThickness: Boolean,
+    thickness: float,
+) -> Tuple[Dict[str, Tuple[float, np.ndarray, np.ndarray]], int]:
+    """Return the total, the center and the second moments about the center of the area, the volume and the mass
+    of some elements of a part, for the names whose total is positive, and the flags of their warnings."""
+    import numpy as np
+
+    integrals = massIntegrals(part)
+    densities, thicknesses, flags = sectionProperties(part, integrals.kinds)
+    selected = np.arange(len(integrals.kinds)) if positions is None else np.unique(positions)
+    kinds, flags = integrals.kinds[selected], flags[selected]
+    densities, thicknesses = densities[selected], thicknesses[selected]
+    if specifyDensity:
+        replaced = (flags & _bit(*_DENSITY_WARNINGS)) != 0
+        densities[replaced] = float(density)
+        flags[replaced] &= ~_bit(*_DENSITY_WARNINGS)
+    if specifyThickness:
+        replaced = (flags & _bit(*_THICKNESS_WARNINGS)) != 0
+        thicknesses[replaced] = float(thickness)
+        flags[replaced] &= ~_bit(*_THICKNESS_WARNINGS)
+    volumes = np.where(kinds > 0, np.nan_to_num(thicknesses), 0.0)
+    weights = {"area": (kinds >= PLANAR).astype(float), "volume": volumes, "mass": volumes * np.nan_to_num(densities)}
+    measure, first, second = integrals.measure[selected], integrals.first[selected], integrals.second[selected]
+    moments = {}
+    for name, weight in weights.items():
+        total = float(weight @ measure)
+        if total > 0:
+            center = weight @ first / total
+            moments[name] = (
+                total,
+                integrals.origin + center,
+                _tensor(weight @ second) - total * np.outer(center, center),
+            )
+    return moments, int(np.bitwise_or.reduce(flags)) if len(flags) else 0
+
+
+def _integrate(topology: ElementTopology, corners: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the volume or the area, the first moments and the second moments of some elements of a topology,
+    given the (M, corners, 3) coordinates of their corners."""
+    import numpy as np
+
+    shapes, derivatives, weights = _rule(topology.shape)
+    points = shapes @ corners
+    columns = [derivatives[:, :, axis] @ corners for axis in range(derivatives.shape[2])]
+    if len(columns) == 3:
+        scales = np.abs(np.einsum("mqd,mqd->mq", columns[0], np.cross(columns[1], columns[2])))
+    else:
+        scales = np.linalg.norm(np.cross(columns[0], columns[1]), axis=-1)
+    weighted = scales * weights
+    moments = weighted[..., None] * points
+    first = moments.sum(axis=1)
+    second = np.stack([np.einsum("mq,mq->m", moments[..., i], points[..., j]) for i, j in _PAIRS], axis=1)
+    return weighted.sum(axis=1), first, second
+
+
+@lru_cache(maxsize=None)
+def _rule(shape: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the values and the derivatives of the shape functions of the corners of the elements of a shape at
+    the points of a Gauss rule exact for their second moments, and the weights of the points."""
+    import numpy as np
+
+    line, lineWeights = np.polynomial.legendre.leggauss(3)
+    if shape in ("HEX8", "QUAD4"):
+        # The corners are numbered counterclockwise on the bottom face, then on the top face of the hexahedron.
+        dimension = 3 if shape == "HEX8" else 2
+        square = np.array(((-1, -1), (1, -1), (1, 1), (-1, 1)))
+        signs = np.array([(*corner, side) for side in (-1, 1) for corner in square]) if dimension == 3 else square
+        points = np.stack(np.meshgrid(*[line] * dimension, indexing="ij"), -1).reshape(-1, dimension)
+        weights = np.prod(np.stack(np.meshgrid(*[lineWeights] * dimension, indexing="ij"), -1), -1).ravel()
+        factors = 1 + points[:, None, :] * signs[None, :, :]
+        shapes = np.prod(factors, axis=2) / 2**dimension
+        derivatives = (
+            np.stack([signs[None, :, axis] * np.prod(np.delete(factors, axis, 2), 2) for axis in range(dimension)], 2)
+            / 2**dimension
+        )
+        return shapes, derivatives, weights
+    if shape in ("TRI3", "TET4"):
+        # The triangles and the tetrahedra are integrated with rules exact for the polynomials of degree 2.
+        a, b = 0.5854101966249685, 0.1381966011250105
+        points = np.array(((1, 1), (4, 1), (1, 4))) / 6 if shape == "TRI3" else np.array(_permutations(b, a, 3))
+        shapes, derivatives = _simplex(points)
+        return shapes, derivatives, np.full(len(points), 1 / 2 if shape == "TRI3" else 1 / 6) / len(points)
+    # The wedges are integrated with a rule exact for the polynomials of degree 4 over their triangles, and their
+    # corners are numbered on the bottom triangle, then on the top triangle.
+    first, second = 0.445948490915965, 0.091576213509771
+    triangle = np.array(_permutations(first, 1 - 2 * first, 2) + _permutations(second, 1 - 2 * second, 2))
+    triangleWeights = np.repeat((0.223381589678011 / 2, 0.109951743655322 / 2), 3)
+    linear, linearDerivatives = _simplex(triangle)
+    heights, heightDerivatives = np.stack(((1 - line) / 2, (1 + line) / 2), 1), np.array((-0.5, 0.5))
+    count = len(triangle) * len(line)
+    shapes = np.einsum("ai,bj->abji", linear, heights).reshape(count, 6)
+    inPlane = np.einsum("air,bj->abjir", linearDerivatives, heights).reshape(count, 6, 2)
+    normal = np.broadcast_to(np.einsum("ai,j->aji", linear, heightDerivatives)[:, None], (len(triangle), 3, 2, 3))
+    derivatives = np.concatenate((inPlane, normal.reshape(count, 6, 1)), axis=2)
+    return shapes, derivatives, np.outer(triangleWeights, lineWeights).ravel()
+
+
+def _simplex(points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the values and the derivatives of the linear shape functions of the corners of a triangle or a
+    tetrahedron at some points."""
+    import numpy as np
+
+    dimension = points.shape[1]
+    derivatives = np.vstack((-np.ones(dimension), np.eye(dimension)))
+    return np.column_stack((1 - points.sum(1), points)), np.broadcast_to(
+        derivatives, (len(points),) + derivatives.shape
+    )
+
+
+def _permutations(value: float, other: float, dimension: int) -> List[Tuple[float, ...]]:
+    """Return the point of a simplex whose coordinates are all **value**, then the points with one coordinate
+    equal to **other** and the others equal to **value**."""
+    points = [(value,) * dimension]
+    for axis in range(dimension):
+        points.append(tuple(other if index == axis else value for index in range(dimension)))
+    return points
+
+
+@lru_cache(maxsize=None)
+def _unsupported(elementType: str) -> bool:
+    """Return whether the mass properties of the elements of a type are not computed, which are the axisymmetric
+    elements and the gaskets."""
+    return "AX" in elementType or elementType.startswith("GK")
+
+
+def _density(material: Any) -> Tuple[float, Optional[str]]:
+    """Return the density of a material, NaN if it is not supported, and the warning of the density if any."""
+    if material is None:
+        return float("nan"), "MISSING_MATERIAL_DEFINITION"
+    density = getattr(material, "density", None)
+    rows = [row for row in getattr(density, "table", ()) if len(row)]
+    if not rows:
+        return float("nan"), "MISSING_DENSITY"
+    value = float(rows[0][0])
+    if len(rows) > 1 or value < 0 or getattr(density, "distributionType", UNIFORM) != UNIFORM:
+        return float("nan"), "UNSUPPORTED_DENSITY"
+    return value, "ZERO_DENSITY" if value == 0 else None
+
+
+def _model(part: Any) -> Any:
+    """Return the model of the model database holding a part, or None if the part is not in a model."""
+    import abaqus
+    from abqpy.lazy import created
+
+    mdb = created(abaqus.__dict__.get("mdb"))
+    for model in getattr(mdb, "models", {}).values():
+        if any(candidate is part for candidate in model.parts.values()):
+            return model
+    return None
+
+
+def _bit(*names: str) -> int:
+    """Return the flags of some warnings."""
+    return sum(1 << WARNINGS.index(name) for name in names)
+
+
+def _tensor(moments: np.ndarray) -> np.ndarray:
+    """Return the symmetric 3 x 3 tensor of the second moments xx, yy, zz, xy, xz and yz."""
+    import numpy as np
+
+    xx, yy, zz, xy, xz, yz = moments.tolist()
+    return np.array(((xx, xy, xz), (xy, yy, yz), (xz, yz, zz)))
+
+
+def _combine(
+    moments: Sequence[Tuple[float, np.ndarray, np.ndarray, np.ndarray]]
+) -> Tuple[float, np.ndarray, np.ndarray]:
+    """Return the total, the center and the second moments about the center of some regions, given the total,
+    the center and the second moments about the center of each region, and the transform moving the region."""
+    import numpy as np
+
+    totals, centers, tensors, matrices = (np.array(values) for values in zip(*moments))
+    rotations = matrices[:, :3, :3]
+    centers = np.einsum("nij,nj->ni", rotations, centers) + matrices[:, :3, 3]
+    tensors = rotations @ tensors @ rotations.transpose(0, 2, 1)
+    total = totals.sum()
+    center = totals @ centers / total
+    offsets = centers - center
+    return float(total), center, tensors.sum(axis=0) + np.einsum("n,ni,nj->ij", totals, offsets, offsets)
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, Dict, Sequence, Tuple, TypeVar, Union
+
+from .LabelIndex import LabelIndex
+from .Mask import Mask
+
+if TYPE_CHECKING:
+    import numpy as np
+
+T = TypeVar("T")
+
+#: The revision of the mesh data, increased by :func:`invalidateMeshCaches` when entities of a mesh are edited in
+#: place, such as when nodes are moved or relabeled with their ``setValues`` method.
+_revision = [0]
+
+
+def invalidateMeshCaches():
+    """Invalidate the data cached by all the mesh arrays, to be called when entities of a mesh are edited in place,
+    such as when nodes are moved or relabeled."""
+    _revision[0] += 1
+
+
+def labelIndexOf(owner: object, key: str, entities: Sequence[Any]) -> LabelIndex:
+    """Return the index of the labels of a plain sequence of nodes or elements held by an object, such as the nodes
+    of an OdbInstance object, cached in the object until the sequence is replaced or resized or
+    :func:`invalidateMeshCaches` is called, which the ``setValues`` method of the nodes and the elements does when
+    it changes their label."""
+    if isinstance(entities, MeshArrayCache):
+        return entities._labelIndex()
+    cache: Dict[str, Tuple[Tuple[int, int, int], LabelIndex]] = owner.__dict__.setdefault("_labelIndexes", {})
+    version = (id(entities), len(entities), _revision[0])
+    entry = cache.get(key)
+    if entry is None or entry[0] != version:
+        entry = cache[key] = (version, LabelIndex(entity.label for entity in entities))
+    return entry[1]
+
+
+def storeLabelIndex(owner: object, key: str, entities: Sequence[Any], index: LabelIndex):
+    """Store the index of the labels of a sequence of nodes or elements held by an object, such as an index built
+    from an array of labels when the nodes are created, to be returned by :func:`labelIndexOf`."""
+    if isinstance(entities, MeshArrayCache):
+        entities._store("labelIndex", index)
+    else:
+        owner.__dict__.setdefault("_labelIndexes", {})[key] = ((id(entities), len(entities), _revision[0]), index)
+
+
+class MeshArrayCache:
+    """A mixin caching data derived from the entities of a mesh array, such as a coordinates array or a spatial
+    index, until the array is modified or :func:`invalidateMeshCaches` is called.
+
+    The mixin is placed before the list base of the mesh arrays, so that the list methods modifying the array
+    invalidate its cache.
+    """
+
+    def _cached(self, key: str, build: Callable[[], T]) -> T:
+        """Return the data cached under a key, built again if the array or the mesh changed since it was cached."""
+        cache: Dict[str, Tuple[int, Any]] = self.__dict__.setdefault("_cache", {})
+        entry = cache.get(key)
+        if entry is None or entry[0] != _revision[0]:
+            entry = cache[key] = (_revision[0], build())
+        return entry[1]
+
+    def _peek(self, key: str) -> Any:
+        """Return the data cached under a key, or None if it is not cached or out of date."""
+        entry = self.__dict__.get("_cache", {}).get(key)
+        return entry[1] if entry is not None and entry[0] == _revision[0] else None
+
+    def _store(self, key: str, value: Any):
+        """Cache some data under a key, such as data known when the array is created."""
+        self.__dict__.setdefault("_cache", {})[key] = (_revision[0], value)
+
+    def _discard(self, *keys: str):
+        """Discard the data cached under some keys, such as data that a mesh edit made out of date."""
+        cache = self.__dict__.get("_cache", {})
+        for key in keys:
+            cache.pop(key, None)
+
+    def _setOwner(self, owner: object):
+        """Record the object holding the array, such as the Part object whose nodes the connectivity of its
+        elements refers to, by a weak reference."""
+        self.__dict__["_ownerRef"] = weakref.ref(owner)
+
+    def _shareOwner(self, source: Any):
+        """Record the object holding another array as the object holding the array, for the arrays of entities
+        selected from it."""
+        if isinstance(source, MeshArrayCache) and "_ownerRef" in source.__dict__:
+            self.__dict__["_ownerRef"] = source.__dict__["_ownerRef"]
+
+    def _owner(self) -> Any:
+        """Return the object holding the array or the array it was selected from, or None if it is unknown."""
+        ref = self.__dict__.get("_ownerRef")
+        return None if ref is None else ref()
+
+    def _labelIndex(self) -> LabelIndex:
+        """Return the index of the labels of the entities of the array, shared by the label-based methods."""
+        return self._cached("labelIndex", lambda: LabelIndex(entity.label for entity in self))  # type: ignore
+
+    def _entityIndices(self) -> np.ndarray:
+        """Return the indices of the entities of the array used by the masks, which are their **index** members, or
+        their positions in the array for the entities without an index."""
+        import numpy as np
+
+        def build() -> np.ndarray:
+            indices = [getattr(entity, "index", None) for entity in self]  # type: ignore
+            return np.array(
+                [position if index is None else index for position, index in enumerate(indices)], dtype=np.int64
+            )
+
+        return self._cached("entityIndices", build)
+
+    def _mask(self) -> Mask:
+        """Return the mask of the entities of the array."""
+        return Mask.fromIndices(self._entityIndices())
+
+    def _fromMask(self, mask: Union[str, Sequence[str], Mask]) -> list:
+        """Return the entities of the array in a mask, in the order of the array, raising a ValueError if there is
+        none."""
+        import numpy as np
+
+        mask = mask if isinstance(mask, Mask) else Mask.fromString(mask)
+        positions = np.flatnonzero(mask.contains(self._entityIndices()))
+        if not len(positions):
+            raise ValueError("The mask results in an empty sequence")
+        return [self[index] for index in positions.tolist()]  # type: ignore
+
+    def _invalidate(self):
+        """Discard the data cached by the array."""
+        self.__dict__.pop("_cache", None)
+
+    def append(self, *args: Any, **kwargs: Any):
+        self._invalidate()
+        return super().append(*args, **kwargs)  # type: ignore
+
+    def extend(self, *args: Any, **kwargs: Any):
+        self._invalidate()
+        return super().extend(*args, **kwargs)  # type: ignore
+
+    def insert(self, *args: Any, **kwargs: Any):
+        self._invalidate()
+        return super().insert(*args, **kwargs)  # type: ignore
+
+    def remove(self, *args: Any, **kwargs: Any):
+        self._invalidate()
+        return super().remove(*args, **kwargs)  # type: ignore
+
+    def pop(self, *args: Any, **kwargs: Any):
+        self._invalidate()
+        return super().pop(*args, **kwargs)  # type: ignore
+
+    def clear(self, *args: Any, **kwargs: Any):
+        self._invalidate()
+        return super().clear(*args, **kwargs)  # type: ignore
+
+    def sort(self, *args: Any, **kwargs: Any):
+        self._invalidate()
+        return super().sort(*args, **kwargs)  # type: ignore
+
+    def reverse(self, *args: Any, **kwargs: Any):
+        self._invalidate()
+        return super().reverse(*args, **kwargs)  # type: ignore
+
+    def __setitem__(self, *args: Any, **kwargs: Any):
+        self._invalidate()
+        return super().__setitem__(*args, **kwargs)  # type: ignore
+
+    def __delitem__(self, *args: Any, **kwargs: Any):
+        self._invalidate()
+        return super().__delitem__(*args, **kwargs)  # type: ignore
+
+    def __iadd__(self, *args: Any, **kwargs: Any):
+        self._invalidate()
+        return super().__iadd__(*args, **kwargs)  # type: ignore
+
+    def __imul__(self, *args: Any, **kwargs: Any):
+        self._invalidate()
+        return super().__imul__(*args, **kwargs)  # type: ignore
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from .MeshElementArray import MeshElementArray
@@ -21,6 +23,12 @@ class MeshEdge:
             mdb.models[name].rootAssembly.instances[name].elementEdges[i]
     """
 
+    #: An Int specifying the label of the element of the edge.
+    label: int | None = None
+
+    #: An Int specifying the number of the edge on the element, starting at 1.
+    edge: int | None = None
+
     @abaqus_method_doc
     def getElements(self):
         """This method returns a tuple of elements that share the element edge.
@@ -43,7 +43,7 @@ class MeshEdgeArray(List[MeshEdge]):
         MeshEdgeArray
             A MeshEdgeArray object.
         """
-        super().__init__()
+        super().__init__(elemEdges)
 
     @abaqus_method_doc
     def getSequenceFromMask(self, mask: Union[str, Sequence[str]]) -> MeshEdgeArray:
@@ -8,6 +8,8 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ..UtilityAndView.abaqusConstants import SymbolicConstant
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
+from .BulkMesh import bulkMember
+from .MeshArrayCache import invalidateMeshCaches
 
 if TYPE_CHECKING:  # to avoid circular imports
     from .MeshEdge import MeshEdge
@@ -64,7 +66,7 @@ class MeshElement:
     #: A tuple of Ints specifying the internal node indices that define the nodal connectivity.
     #: It is important to note the difference with OdbMeshElement object of ODB where the
     #: connectivity is node labels instead of node indices.
-    connectivity: tuple[int, ...] = ()
+    connectivity: tuple[int, ...] = bulkMember(())
 
     @abaqus_method_doc
     def Element(
@@ -190,4 +192,7 @@ class MeshElement:
             belongs to an orphan mesh part. The specified label must be non-negative and must not be
             in use by any other element of the same part.
         """
-        ...
+        if label is not None:
+            self.label = label
+            # The label indexes of the mesh arrays and of the objects holding the elements are out of date.
+            invalidateMeshCaches()
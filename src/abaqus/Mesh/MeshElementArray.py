@@ -1,20 +1,24 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Sequence, Union
+from typing import TYPE_CHECKING, Callable, List, Sequence, Tuple, Union
 
-from abaqus.BasicGeometry.Edge import Edge
-from abaqus.BasicGeometry.Face import Face
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
+from ..UtilityAndView.abaqusConstants import SymbolicConstant
+from .MeshArrayCache import MeshArrayCache
 from .MeshElement import MeshElement
 
 if TYPE_CHECKING:  # to avoid circular imports
-    from ..BasicGeometry.EdgeArray import EdgeArray
-    from ..BasicGeometry.FaceArray import FaceArray
+    import numpy as np
+
+    from .ElementTopology import ElementTopology, Group
+    from .KDTree import KDTree
+    from .MeshEdgeArray import MeshEdgeArray
+    from .MeshFaceArray import MeshFaceArray
 
 
 @abaqus_class_doc
-class MeshElementArray(List[MeshElement]):
+class MeshElementArray(MeshArrayCache, List[MeshElement]):
     """The MeshElementArray is a sequence of MeshElement objects.
 
     .. note::
@@ -66,7 +70,7 @@ class MeshElementArray(List[MeshElement]):
         MeshElementArray
             A MeshElementArray object.
         """
-        super().__init__()
+        super().__init__(elements)
 
     @abaqus_method_doc
     def getFromLabel(self, label: int) -> MeshElement:
@@ -81,8 +85,16 @@ class MeshElementArray(List[MeshElement]):
         -------
         MeshElement
             A MeshElement object.
+
+        Raises
+        ------
+        KeyError
+            If there is no object with the given label.
         """
-        return MeshElement()
+        index = self._labelIndex().index(label)
+        if index < 0:
+            raise KeyError(f"Invalid element label: {label}")
+        return self[index]
 
     @abaqus_method_doc
     def getSequenceFromMask(self, mask: Union[str, Sequence[str]]) -> MeshElementArray:
@@ -99,8 +111,13 @@ class MeshElementArray(List[MeshElement]):
         -------
         MeshElementArray
             A MeshElementArray object.
+
+        Raises
+        ------
+        ValueError
+            The mask results in an empty sequence, An exception occurs if the resulting sequence is empty.
         """
-        return MeshElementArray([MeshElement()])
+        return self._select(self._fromMask(mask))
 
     @abaqus_method_doc
     def getMask(self) -> str:
@@ -111,7 +128,7 @@ class MeshElementArray(List[MeshElement]):
         str
             A String specifying the object or objects.
         """
-        return ""
+        return str(self._mask())
 
     @abaqus_method_doc
     def getByBoundingBox(
@@ -145,10 +162,16 @@ class MeshElementArray(List[MeshElement]):
         MeshElementArray
             A MeshElementArray object, which is a sequence of MeshElement objects.
         """
-        return MeshElementArray([MeshElement()])
+        low, high = (xMin, yMin, zMin), (xMax, yMax, zMax)
+        return self._within(lambda index: index.inBox(low, high))
 
     @abaqus_method_doc
-    def getByBoundingCylinder(self, center1: tuple, center2: tuple, radius: str) -> MeshElementArray:
+    def getByBoundingCylinder(
+        self,
+        center1: tuple[float, float, float],
+        center2: tuple[float, float, float],
+        radius: float,
+    ) -> MeshElementArray:
         """This method returns an array of element objects that lie within the specified bounding cylinder.
 
         Parameters
@@ -166,7 +189,7 @@ class MeshElementArray(List[MeshElement]):
         MeshElementArray
             A MeshElementArray object, which is a sequence of MeshElement objects.
         """
-        return MeshElementArray([MeshElement()])
+        return self._within(lambda index: index.inCylinder(center1, center2, radius))
 
     @abaqus_method_doc
     def getByBoundingSphere(self, center: tuple[float, float, float], radius: float) -> MeshElementArray:
@@ -184,7 +207,7 @@ class MeshElementArray(List[MeshElement]):
         MeshElementArray
             A MeshElementArray object, which is a sequence of MeshElement objects.
         """
-        return MeshElementArray([MeshElement()])
+        return self._within(lambda index: index.inSphere(center, radius))
 
     @abaqus_method_doc
     def getBoundingBox(self) -> dict[str, tuple[float, float, float]]:
@@ -201,7 +224,47 @@ class MeshElementArray(List[MeshElement]):
             - **high**: a tuple of three floats representing the maximum x, y, and z boundary values of
               the bounding box.
         """
-        return {"low": (0.0, 0.0, 0.0), "high": (0.0, 0.0, 0.0)}
+        flat = self._connectivity()[2]
+        if not len(flat):
+            return {"low": (0.0, 0.0, 0.0), "high": (0.0, 0.0, 0.0)}
+        points = self._nodeCoordinates()[flat]
+        return {"low": tuple(points.min(axis=0).tolist()), "high": tuple(points.max(axis=0).tolist())}
+
+    @abaqus_method_doc
+    def getClosest(
+        self, coordinates: tuple, numToFind: int = 1, searchTolerance: float = 0.0
+    ) -> Union[MeshElement, list[MeshElement]]:
+        """This method returns the element or elements closest to the given point or set of points, which are
+        the elements whose centroids are closest to the points.
+
+        Parameters
+        ----------
+        coordinates
+            A point defined by x, y, and z values or a list of such points.
+        numToFind
+            The number of elements to find for each given point. For example, if **numToFind** is 2, then
+            the 2 closest elements, if available and within **searchTolerance**, will be returned in
+            order of proximity for each input point. The default is 1.
+        searchTolerance
+            A float specifying a search radius for each point. By default, no search radius is
+            defined, and all elements in the sequence will be searched.
+
+        Returns
+        -------
+        MeshElement | list[MeshElement]
+            A MeshElement, or a list of MeshElement objects, or a list of lists of MeshElement objects,
+            depending on the number of points given and the number of elements requested.
+        """
+        import numpy as np
+
+        points = np.asarray(coordinates, dtype=float)
+        index, positions = self._spatialIndex(), self._connectivity()[0]
+        found = [
+            [self[i] for i in positions[index.closest(point.tolist(), numToFind, searchTolerance)[1]].tolist()]
+            for point in points.reshape(-1, points.shape[-1])
+        ]
+        elements = [(elements[0] if elements else None) for elements in found] if numToFind == 1 else found
+        return elements[0] if points.ndim == 1 else elements  # type: ignore
 
     @abaqus_method_doc
     def sequenceFromLabels(self, labels: Sequence[int]) -> MeshElementArray:
@@ -219,37 +282,176 @@ class MeshElementArray(List[MeshElement]):
 
         Raises
         ------
-        Error
+        KeyError
+            If there is no object with one of the labels.
+        ValueError
             The mask results in an empty sequence, An exception occurs if the resulting sequence is empty.
         """
-        return MeshElementArray([MeshElement()])
+        indices = self._labelIndex().require(labels, "element label")
+        if not len(indices):
+            raise ValueError("The mask results in an empty sequence")
+        return self._fromIndices(indices)
 
     @abaqus_method_doc
-    def getExteriorEdges(self) -> EdgeArray:
-        """This method returns the edges on the exterior of the faces in the FaceArray. That is, it returns the
-        edges that are referenced by exactly one of the faces in the sequence.
+    def getExteriorEdges(self) -> MeshEdgeArray:
+        """This method returns the element edges on the exterior of the elements in the MeshElementArray. That is,
+        it returns the edges that are referenced by exactly one of the exterior faces of the solid elements, and by
+        exactly one of the planar and shell elements in the sequence.
+
+        The exterior faces of a mesh of solid elements form a closed surface, on which every edge is shared by two
+        faces, so that a mesh of solid elements, such as a block of hexahedra, has no exterior edges. The exterior
+        edges are the free edges of the planar and shell elements.
 
         .. versionadded:: 2018
             The ``getExteriorEdges`` method was added.
 
         Returns
         -------
-        EdgeArray
-            An EdgeArray object specifying the exterior edges.
+        MeshEdgeArray
+            A MeshEdgeArray object specifying the exterior edges.
         """
-        return EdgeArray([Edge()])
+        from .ElementTopology import exteriorEdges
+        from .MeshEdge import MeshEdge
+        from .MeshEdgeArray import MeshEdgeArray
+
+        edges = []
+        for element, topology, index in self._exterior(exteriorEdges(self._topology())):
+            edge = MeshEdge()
+            edge.label, edge.edge = element.label, index + 1
+            edges.append(edge)
+        return MeshEdgeArray(edges)
 
     @abaqus_method_doc
-    def getExteriorFaces(self) -> FaceArray:
-        """This method returns the cell faces on the exterior of the CellArray. That is, it returns the faces
-        that are referenced by exactly one of the cells in the sequence.
+    def getExteriorFaces(self) -> MeshFaceArray:
+        """This method returns the element faces on the exterior of the MeshElementArray. That is, it returns the
+        faces that are referenced by exactly one of the elements in the sequence.
 
         .. versionadded:: 2018
             The ``getExteriorFaces`` method was added.
 
         Returns
         -------
-        FaceArray
-            A FaceArray object representing the faces on the exterior of the cells.
+        MeshFaceArray
+            A MeshFaceArray object representing the faces on the exterior of the elements.
+        """
+        from .ElementTopology import exteriorFaces
+        from .MeshFace import MeshFace
+        from .MeshFaceArray import MeshFaceArray
+
+        faces = []
+        for element, topology, index in self._exterior(exteriorFaces(self._topology())):
+            face = MeshFace()
+            face.label, face.face = element.label, SymbolicConstant(topology.faceNames[index])
+            faces.append(face)
+        return MeshFaceArray(faces)
+
+    def _select(self, elements: list[MeshElement]) -> MeshElementArray:
+        """Return an array of some elements of the array, held by the object holding the array."""
+        array = MeshElementArray(elements)
+        array._shareOwner(self)
+        return array
+
+    def _fromIndices(self, indices: np.ndarray) -> MeshElementArray:
+        """Return the elements at some indices of the array."""
+        return self._select([self[index] for index in indices.tolist()])
+
+    def _nodeCoordinates(self) -> np.ndarray:
+        """Return the (N, 3) array of the coordinates of the nodes the connectivity of the elements refers to,
+        which are the nodes of the object holding the array, such as a Part object.
+
+        Raises
+        ------
+        ValueError
+            If the array is not held by an object with nodes, such as an array created from a list of elements.
         """
-        return FaceArray([Face()])
+        owner = self._owner()
+        nodes = getattr(owner, "nodes", None)
+        if not isinstance(nodes, MeshArrayCache):
+            raise ValueError("The nodes of the elements are unknown, as the array is not held by a part")
+        return nodes._coordinates()  # type: ignore
+
+    def _connectivity(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the positions of the elements with nodes, the offsets of their nodes and the flat array of the
+        node indices of their connectivity, cached by the array."""
+        import numpy as np
+
+        def build() -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+            counts = np.fromiter((len(element.connectivity) for element in self), np.int64, len(self))
+            flat = np.fromiter((node for element in self for node in element.connectivity), np.int64, int(counts.sum()))
+            offsets = np.concatenate((np.zeros(1, dtype=np.int64), np.cumsum(counts[counts > 0])))
+            return np.flatnonzero(counts), offsets, flat
+
+        return self._cached("connectivity", build)
+
+    def _spatialIndex(self) -> KDTree:
+        """Return the cached spatial index of the centroids of the elements with nodes, built the first time it is
+        used, whose point indices are positions in the elements with nodes."""
+        import numpy as np
+
+        from .KDTree import KDTree
+
+        def build() -> KDTree:
+            _, offsets, flat = self._connectivity()
+            if not len(flat):
+                return KDTree(np.empty((0, 3)))
+            sums = np.add.reduceat(self._nodeCoordinates()[flat], offsets[:-1], axis=0)
+            return KDTree(sums / np.diff(offsets)[:, None])
+
+        return self._cached("spatialIndex", build)
+
+    def _within(self, query: Callable[[KDTree], np.ndarray]) -> MeshElementArray:
+        """Return the elements whose nodes all lie within a convex region, given the query of the points inside the
+        region of a spatial index. The centroid of such an element lies within the region too, so that only the
+        elements found by the spatial index of the centroids are checked against the nodes inside the region."""
+        import numpy as np
+
+        positions, offsets, flat = self._connectivity()
+        candidates = query(self._spatialIndex())
+        if not len(candidates):
+            return self._select([])
+        inside = np.zeros(len(self._nodeCoordinates()), dtype=bool)
+        inside[query(self._owner().nodes._spatialIndex())] = True
+        starts, counts = offsets[candidates], np.diff(offsets)[candidates]
+        firsts = np.cumsum(counts) - counts
+        slots = np.repeat(starts - firsts, counts) + np.arange(int(counts.sum()))
+        return self._fromIndices(positions[candidates[np.logical_and.reduceat(inside[flat[slots]], firsts)]])
+
+    def _topology(self) -> list[Group]:
+        """Return the elements of the array grouped by topology, with the connectivity of their corner nodes,
+        leaving out the elements without faces such as the beams."""
+        import numpy as np
+
+        from .ElementTopology import elementTopology
+
+        def build() -> list[Group]:
+            groups: dict[ElementTopology, tuple[list[int], list[Sequence[int]]]] = {}
+            for position, element in enumerate(self):
+                topology = elementTopology(getattr(element, "type", None), len(element.connectivity))
+                if topology is not None:
+                    positions, connectivity = groups.setdefault(topology, ([], []))
+                    positions.append(position)
+                    connectivity.append(element.connectivity[: topology.corners])
+            return [
+                (topology, np.array(positions, dtype=np.int64), np.array(connectivity, dtype=np.int64))
+                for topology, (positions, connectivity) in groups.items()
+            ]
+
+        return self._cached("topology", build)
+
+    def _exterior(self, found: list[Group]) -> list[tuple[MeshElement, ElementTopology, int]]:
+        """Return the elements, their topology and the face or edge indices of some exterior faces or edges, in
+        the order of the elements and of the indices."""
+        import numpy as np
+
+        if not found:
+            return []
+        groups = np.concatenate([np.full(len(positions), number) for number, (_, positions, _) in enumerate(found)])
+        positions = np.concatenate([positions for _, positions, _ in found])
+        indices = np.concatenate([indices for _, _, indices in found])
+        order = np.lexsort((indices, positions))
+        return [
+            (self[position], found[group][0], index)
+            for group, position, index in zip(
+                groups[order].tolist(), positions[order].tolist(), indices[order].tolist()
+            )
+        ]
@@ -43,7 +43,7 @@ class MeshFaceArray(List[MeshFace]):
         MeshFaceArray
             A MeshFaceArray object.
         """
-        super().__init__()
+        super().__init__(elemFaces)
 
     @abaqus_method_doc
     def getSequenceFromMask(self, mask: Union[str, Sequence[str]]) -> MeshFaceArray:
@@ -5,6 +5,8 @@ from typing import TYPE_CHECKING
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ..Datum.DatumCsys import DatumCsys
+from .BulkMesh import bulkMember
+from .MeshArrayCache import invalidateMeshCaches
 from .MeshFace import MeshFace
 
 if TYPE_CHECKING:  # to avoid circular imports
@@ -57,7 +59,7 @@ class MeshNode:
     instanceName: str = ""
 
     #: A tuple of three Floats specifying the coordinates of the new node.
-    coordinates: tuple[float, float, float]
+    coordinates: tuple[float, float, float] = bulkMember()
 
     @abaqus_method_doc
     def __init__(
@@ -88,7 +90,9 @@ class MeshNode:
         node: MeshNode
             A MeshNode object
         """
-        ...
+        self.coordinates = tuple(coordinates)  # type: ignore
+        if label is not None:
+            self.label = label
 
     @abaqus_method_doc
     def getElemEdges(self) -> tuple[MeshEdge, ...]:
@@ -155,4 +159,7 @@ class MeshNode:
         -------
             None
         """
-        ...
+        if label is not None:
+            self.label = label
+            # The label indexes of the mesh arrays and of the objects holding the nodes are out of date.
+            invalidateMeshCaches()
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
-from typing import List, Sequence, Union
+from typing import TYPE_CHECKING, List, Sequence, Union
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
+from .MeshArrayCache import MeshArrayCache
 from .MeshNode import MeshNode
 
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .KDTree import KDTree
+
 
 @abaqus_class_doc
-class MeshNodeArray(List[MeshNode]):
+class MeshNodeArray(MeshArrayCache, List[MeshNode]):
     """The MeshNodeArray is a sequence of MeshNode objects.
 
     .. note::
@@ -61,7 +67,7 @@ class MeshNodeArray(List[MeshNode]):
         MeshNodeArray
             A MeshNodeArray object.
         """
-        super().__init__()
+        super().__init__(nodes)
 
     @abaqus_method_doc
     def getFromLabel(self, label: int) -> MeshNode:
@@ -76,8 +82,16 @@ class MeshNodeArray(List[MeshNode]):
         -------
         MeshNode
             A MeshNode object.
+
+        Raises
+        ------
+        KeyError
+            If there is no object with the given label.
         """
-        return MeshNode((0.0, 0.0, 0.0))
+        index = self._labelIndex().index(label)
+        if index < 0:
+            raise KeyError(f"Invalid node label: {label}")
+        return self[index]
 
     @abaqus_method_doc
     def getSequenceFromMask(self, mask: Union[str, Sequence[str]]) -> MeshNodeArray:
@@ -94,8 +108,13 @@ class MeshNodeArray(List[MeshNode]):
         -------
         MeshNodeArray
             A MeshNodeArray object.
+
+        Raises
+        ------
+        ValueError
+            The mask results in an empty sequence, An exception occurs if the resulting sequence is empty.
         """
-        return MeshNodeArray([MeshNode((0.0, 0.0, 0.0))])
+        return MeshNodeArray(self._fromMask(mask))
 
     @abaqus_method_doc
     def getMask(self) -> str:
@@ -106,7 +125,7 @@ class MeshNodeArray(List[MeshNode]):
         str
             A String specifying the object or objects.
         """
-        return ""
+        return str(self._mask())
 
     @abaqus_method_doc
     def getByBoundingBox(
@@ -140,7 +159,7 @@ class MeshNodeArray(List[MeshNode]):
         MeshNodeArray
             A MeshNodeArray object, which is a sequence of MeshNode objects.
         """
-        return MeshNodeArray([MeshNode((0.0, 0.0, 0.0))])
+        return self._fromIndices(self._spatialIndex().inBox((xMin, yMin, zMin), (xMax, yMax, zMax)))
 
     @abaqus_method_doc
     def getByBoundingCylinder(
@@ -166,10 +185,10 @@ class MeshNodeArray(List[MeshNode]):
         MeshNodeArray
             A MeshNodeArray object, which is a sequence of MeshNode objects.
         """
-        return MeshNodeArray([MeshNode((0.0, 0.0, 0.0))])
+        return self._fromIndices(self._spatialIndex().inCylinder(center1, center2, radius))
 
     @abaqus_method_doc
-    def getByBoundingSphere(self, center: tuple, radius: str) -> MeshNodeArray:
+    def getByBoundingSphere(self, center: tuple, radius: float) -> MeshNodeArray:
         """This method returns an array of node objects that lie within the specified bounding sphere.
 
         Parameters
@@ -184,7 +203,7 @@ class MeshNodeArray(List[MeshNode]):
         MeshNodeArray
             A MeshNodeArray object, which is a sequence of MeshNode objects.
         """
-        return MeshNodeArray([MeshNode((0.0, 0.0, 0.0))])
+        return self._fromIndices(self._spatialIndex().inSphere(center, radius))
 
     @abaqus_method_doc
     def getBoundingBox(self) -> dict[str, tuple[float, float, float]]:
@@ -204,7 +223,10 @@ class MeshNodeArray(List[MeshNode]):
         Raises
         ------
         """
-        return {"low": (0.0, 0.0, 0.0), "high": (0.0, 0.0, 0.0)}
+        coordinates = self._coordinates()
+        if not len(coordinates):
+            return {"low": (0.0, 0.0, 0.0), "high": (0.0, 0.0, 0.0)}
+        return {"low": tuple(coordinates.min(axis=0).tolist()), "high": tuple(coordinates.max(axis=0).tolist())}
 
     @abaqus_method_doc
     def getClosest(
@@ -230,7 +252,16 @@ class MeshNodeArray(List[MeshNode]):
             A MeshNode, or a list of MeshNode objects, or a list of lists of MeshNode objects,
             depending on the number of points given and the number of nodes requested.
         """
-        return MeshNode((0.0, 0.0, 0.0))
+        import numpy as np
+
+        points = np.asarray(coordinates, dtype=float)
+        index = self._spatialIndex()
+        found = [
+            [self[i] for i in index.closest(point.tolist(), numToFind, searchTolerance)[1].tolist()]
+            for point in points.reshape(-1, points.shape[-1])
+        ]
+        nodes = [(nodes[0] if nodes else None) for nodes in found] if numToFind == 1 else found
+        return nodes[0] if points.ndim == 1 else nodes  # type: ignore
 
     @abaqus_method_doc
     def sequenceFromLabels(self, labels: Sequence[int]) -> MeshNodeArray:
@@ -248,7 +279,30 @@ class MeshNodeArray(List[MeshNode]):
 
         Raises
         ------
-        Error
+        KeyError
+            If there is no object with one of the labels.
+        ValueError
             The mask results in an empty sequence, An exception occurs if the resulting sequence is empty.
         """
-        return MeshNodeArray([MeshNode((0.0, 0.0, 0.0))])
+        indices = self._labelIndex().require(labels, "node label")
+        if not len(indices):
+            raise ValueError("The mask results in an empty sequence")
+        return MeshNodeArray([self[index] for index in indices.tolist()])
+
+    def _coordinates(self) -> np.ndarray:
+        """Return the cached (N, 3) array of the coordinates of the nodes."""
+        import numpy as np
+
+        return self._cached(
+            "coordinates", lambda: np.array([node.coordinates for node in self], dtype=float).reshape(len(self), 3)
+        )
+
+    def _spatialIndex(self) -> KDTree:
+        """Return the cached spatial index of the coordinates of the nodes, built the first time it is used."""
+        from .KDTree import KDTree
+
+        return self._cached("spatialIndex", lambda: KDTree(self._coordinates()))
+
+    def _fromIndices(self, indices: np.ndarray) -> MeshNodeArray:
+        """Return the nodes at some indices of the array."""
+        return MeshNodeArray([self[index] for index in indices.tolist()])
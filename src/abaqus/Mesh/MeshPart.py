@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Sequence, Union
+from numbers import Real
+from typing import Any, Sequence, Union
 
 from typing_extensions import Literal
 
@@ -671,7 +672,25 @@ class MeshPart(PartBase):
         MeshStats
             A MeshStats object.
         """
-        return MeshStats()
+        import numpy as np
+
+        from .MeshQuality import SHAPES, entityPositions, meshQuality
+
+        shapes = meshQuality(self).shapes
+        stats = MeshStats()
+        if regions:
+            positions = entityPositions(self.elements, regions, "elements")
+            shapes = shapes[positions]
+            stats.numNodes = len(
+                {node for position in positions.tolist() for node in self.elements[position].connectivity}
+            )
+            stats.numMeshedRegions = sum(bool(len(getattr(region, "elements", ()) or ())) for region in regions)
+        else:
+            stats.numNodes, stats.numMeshedRegions = len(self.nodes), int(len(self.elements) > 0)
+        counts = np.bincount(shapes[shapes >= 0], minlength=len(SHAPES)).tolist()
+        for shape, count in zip(SHAPES, counts):
+            setattr(stats, f"num{shape.capitalize()}Elems", count)
+        return stats
 
     @abaqus_method_doc
     def getPartSeeds(
@@ -1141,6 +1160,11 @@ class MeshPart(PartBase):
     ):
         """This method tests the mesh quality of a part and returns poor-quality elements.
 
+        The quality metrics are computed from the corner nodes of the elements and cached by the part. The mesh
+        editing methods, such as ``editNode``, update them for the elements around the edited nodes only (see
+        :mod:`~abaqus.Mesh.MeshQuality`). The elements are not applicable for the criteria depending on the
+        geometry, the sections or the materials, such as MAX_FREQUENCY.
+
         Parameters
         ----------
         criterion
@@ -1210,7 +1234,10 @@ class MeshPart(PartBase):
             numElements (Int); average, worst (Float); worstElement
             (MeshElement object) .
         """
-        ...
+        from .MeshQuality import entityPositions, meshQuality
+
+        positions = entityPositions(self.elements, regions, "elements") if regions else None
+        return meshQuality(self).verify(self.elements, criterion, threshold, elemShape, positions)
 
     @abaqus_method_doc
     def Node(
@@ -1230,17 +1257,40 @@ class MeshPart(PartBase):
         ----------
         coordinates
             A sequence of three Floats specifying the coordinates of the new node.
+
+            Several nodes are created at once if **coordinates** is a sequence of sequences of Floats or a
+            two-dimensional NumPy array, which is shared with the part if it is a C-contiguous array of
+            float64 (see :mod:`~abaqus.Mesh.BulkMesh`).
         localCsys
             A DatumCsys object specifying the local coordinate system. If unspecified, the global
             coordinate system will be used.
         label
             An Int specifying the node label.
 
+            When several nodes are created, a sequence or an array of Ints specifying the node labels. If
+            unspecified, the nodes are labeled from the largest label of the part plus one.
+
         Returns
         -------
         MeshNode
-            A MeshNode object.
+            A MeshNode object, or a MeshNodeArray object of the new nodes when several nodes are created.
+
+        Raises
+        ------
+        ValueError
+            If several nodes are created with labels or coordinates that are not valid.
         """
+        if len(coordinates) and not isinstance(coordinates[0], Real):
+            from .BulkMesh import addNodes
+            from .MeshArrayCache import labelIndexOf
+            from .MeshNodeArray import MeshNodeArray
+
+            labels: Any = label
+            if labels is None:
+                existing = labelIndexOf(self, "nodes", self.nodes).labels
+                start = int(existing.max()) + 1 if len(existing) else 1
+                labels = range(start, start + len(coordinates))
+            return MeshNodeArray(addNodes(self, MeshNode, labels, coordinates))
         node = MeshNode(coordinates, localCsys, label)
         self.nodes.append(node)
         return node
@@ -0,0 +1,600 @@
+"""Quality metrics of the elements of a mesh, used by the ``verifyMeshQuality`` and ``getMeshStats`` methods of
+the parts and kept up to date by the mesh editing methods.
+
+The metrics of all the elements of a shape are computed at once with NumPy, from the coordinates of their corner
+nodes, and cached by the element array of the part. The ``editNode``, ``smoothNodes`` and ``mergeNodes`` methods
+move nodes with :func:`moveNodes`, which updates the cached coordinates of the nodes in place and computes the
+metrics again for the elements around the moved nodes only. Other in-place edits of the nodes or the elements
+must be followed by a call to :func:`~abaqus.Mesh.MeshArrayCache.invalidateMeshCaches`, after which the metrics
+of all the elements are computed again when they are next needed.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from .ElementTopology import ElementTopology, Group, exteriorEdges, exteriorFaces
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .MeshElementArray import MeshElementArray
+
+#: The shapes of the elements counted by the MeshStats object.
+SHAPES = ("POINT", "LINE", "TRI", "QUAD", "TET", "WEDGE", "PYRAMID", "HEX")
+
+#: The quality metrics of the elements, which are not defined for the elements without faces, such as the beams.
+#: The shape factor is only defined for the triangles and the tetrahedra.
+METRICS = (
+    "shortestEdge",
+    "longestEdge",
+    "aspectRatio",
+    "smallAngle",
+    "largeAngle",
+    "angularDeviation",
+    "shapeFactor",
+    "jacobian",
+    "skew",
+)
+
+#: The metric of each criterion of ``verifyMeshQuality``, and whether the elements with a larger value than the
+#: threshold fail the test, rather than those with a smaller value. The elements that fail the analysis checks
+#: are the elements whose scaled Jacobian is not positive.
+CRITERIA = {
+    "ANALYSIS_CHECKS": ("jacobian", False),
+    "ANGULAR_DEVIATION": ("angularDeviation", True),
+    "ASPECT_RATIO": ("aspectRatio", True),
+    "LARGE_ANGLE": ("largeAngle", True),
+    "LONGEST_EDGE": ("longestEdge", True),
+    "SHAPE_FACTOR": ("shapeFactor", False),
+    "SHORTEST_EDGE": ("shortestEdge", False),
+    "SMALL_ANGLE": ("smallAngle", False),
+}
+
+#: The corners of the regular elements of the solid shapes, which orient the edges meeting at each corner.
+_REFERENCE = {
+    "TET4": ((0, 0, 0), (1, 0, 0), (0, 1, 0), (0, 0, 1)),
+    "WEDGE6": ((0, 0, 0), (1, 0, 0), (0, 1, 0), (0, 0, 1), (1, 0, 1), (0, 1, 1)),
+    "HEX8": ((0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0), (0, 0, 1), (1, 0, 1), (1, 1, 1), (0, 1, 1)),
+}
+
+#: The factors scaling the Jacobian of the corners of the regular elements to 1.
+_JACOBIAN_SCALE = {"TET4": 2**0.5, "WEDGE6": 2 / 3**0.5, "TRI3": 2 / 3**0.5}
+
+Vector = Tuple["np.ndarray", "np.ndarray", "np.ndarray"]
+
+
+class MeshQuality:
+    """The MeshQuality object holds the quality metrics of the elements of a mesh, computed for the elements of
+    each shape with vectorized operations, and updated for the elements around the nodes moved by mesh edits.
+
+    .. note::
+        This object is not part of the Abaqus Scripting Interface. It is used by the ``verifyMeshQuality`` and
+        ``getMeshStats`` methods of the parts, and is returned by :func:`meshQuality`, for example::
+
+            from abaqus.Mesh.MeshQuality import meshQuality
+
+            meshQuality(mdb.models[name].parts[name]).metrics["jacobian"]
+    """
+
+    #: A dictionary of arrays of Floats specifying the value of each metric of :data:`METRICS` for each element,
+    #: NaN when it is not defined for the element. The angles are in degrees, and the scaled Jacobian is the
+    #: smallest over the corners of the element.
+    metrics: Dict[str, np.ndarray]
+
+    #: An array of Ints specifying the index in :data:`SHAPES` of the shape of each element, -1 if it is unknown.
+    shapes: np.ndarray
+
+    #: The (N, 3) array of the coordinates of the nodes the metrics are computed from.
+    coordinates: np.ndarray
+
+    #: The elements of the mesh grouped by topology, with the node indices of their corners.
+    groups: List[Group]
+
+    def __init__(self, elements: MeshElementArray, coordinates: np.ndarray):
+        """This method creates a MeshQuality object and computes the metrics of all the elements.
+
+        Parameters
+        ----------
+        elements
+            A MeshElementArray object specifying the elements of the mesh.
+        coordinates
+            An (N, 3) array of Floats specifying the coordinates of the nodes of the mesh.
+        """
+        import numpy as np
+
+        self.coordinates, self.groups = coordinates, elements._topology()
+        self.shapes = np.full(len(elements), -1, dtype=np.int8)
+        self.metrics = {name: np.full(len(elements), np.nan) for name in METRICS}
+        grouped = np.zeros(len(elements), dtype=bool)
+        for topology, positions, _ in self.groups:
+            self.shapes[positions] = SHAPES.index(topology.shape.rstrip("0123456789"))
+            grouped[positions] = True
+        for position in np.flatnonzero(~grouped).tolist():
+            self.shapes[position] = _shape(len(elements[position].connectivity))
+        self._index()
+        self._compute(np.arange(len(elements)))
+
+    def incidence(self, nodes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the pairs of a node and an element with a corner at the node, for some nodes.
+
+        Parameters
+        ----------
+        nodes
+            An array of Ints specifying the node indices.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray]
+            The positions of the nodes in **nodes** and the positions of the elements, for each pair.
+        """
+        import numpy as np
+
+        nodes = np.asarray(nodes, dtype=np.int64)
+        valid = (nodes >= 0) & (nodes < len(self._offsets) - 1)
+        starts = self._offsets[np.where(valid, nodes, 0)]
+        counts = np.where(valid, self._offsets[np.where(valid, nodes + 1, 0)] - starts, 0)
+        slots = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+        return np.repeat(np.arange(len(nodes)), counts), self._incident[slots]
+
+    def elementsAround(self, nodes: np.ndarray) -> np.ndarray:
+        """Return the sorted positions of the elements with a corner at some nodes.
+
+        Parameters
+        ----------
+        nodes
+            An array of Ints specifying the node indices.
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of Ints specifying the positions of the elements.
+        """
+        import numpy as np
+
+        return np.unique(self.incidence(nodes)[1])
+
+    def centroids(self, positions: np.ndarray) -> np.ndarray:
+        """Return the centroids of the corner nodes of some elements, NaN for the elements without faces.
+
+        Parameters
+        ----------
+        positions
+            An array of Ints specifying the positions of the elements.
+
+        Returns
+        -------
+        numpy.ndarray
+            An (N, 3) array of Floats.
+        """
+        import numpy as np
+
+        positions = np.asarray(positions, dtype=np.int64)
+        centroids = np.full((len(positions), 3), np.nan)
+        for number, (_, _, connectivity) in enumerate(self.groups):
+            selected = np.flatnonzero(self._group[positions] == number)
+            corners = connectivity[self._row[positions[selected]]]
+            for axis in range(3):
+                centroids[selected, axis] = self.coordinates[:, axis][corners].mean(axis=1)
+        return centroids
+
+    def update(self, nodes: np.ndarray) -> np.ndarray:
+        """Compute the metrics again for the elements around some nodes, after the nodes were moved.
+
+        Parameters
+        ----------
+        nodes
+            An array of Ints specifying the indices of the moved nodes.
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of Ints specifying the positions of the updated elements.
+        """
+        positions = self.elementsAround(nodes)
+        self._compute(positions)
+        return positions
+
+    def remap(self, nodeMap: np.ndarray, kept: np.ndarray, coordinates: np.ndarray):
+        """Renumber the nodes and remove some elements, keeping the metrics of the other elements, after nodes are
+        merged. The metrics of the elements around the merged nodes must then be updated.
+
+        Parameters
+        ----------
+        nodeMap
+            An array of Ints specifying the new index of each node.
+        kept
+            An array of Booleans specifying whether each element is kept.
+        coordinates
+            An (N, 3) array of Floats specifying the coordinates of the renumbered nodes.
+        """
+        import numpy as np
+
+        newPositions = np.cumsum(kept) - 1
+        self.groups = [
+            (topology, newPositions[positions[kept[positions]]], nodeMap[connectivity[kept[positions]]])
+            for topology, positions, connectivity in self.groups
+        ]
+        self.coordinates, self.shapes = coordinates, self.shapes[kept]
+        self.metrics = {name: values[kept] for name, values in self.metrics.items()}
+        self._index()
+
+    def verify(
+        self,
+        elements: MeshElementArray,
+        criterion: str,
+        threshold: Optional[float] = None,
+        elemShape: Optional[str] = None,
+        positions: Optional[np.ndarray] = None,
+    ) -> Dict[str, Any]:
+        """Return the result of a quality check of some elements, as returned by ``verifyMeshQuality``.
+
+        Parameters
+        ----------
+        elements
+            A MeshElementArray object specifying the elements of the mesh.
+        criterion
+            A String specifying a criterion of :data:`CRITERIA` or a metric of :data:`METRICS`. The elements are
+            not applicable for the other criteria, which depend on the geometry, the sections or the materials.
+        threshold
+            A Float specifying the threshold of the elements that fail the check, if any. It is ignored by the
+            analysis checks, which the elements fail if their scaled Jacobian is not positive.
+        elemShape
+            A String specifying the shape of :data:`SHAPES` of the checked elements, if any.
+        positions
+            An array of Ints specifying the positions of the checked elements. By default, all the elements are
+            checked.
+
+        Returns
+        -------
+        dict[str, int | float, MeshElement]
+            A dictionary with the keys numElements, average, worst, worstElement, failedElements and naElements.
+        """
+        import numpy as np
+
+        checked = np.arange(len(self.shapes)) if positions is None else np.asarray(positions, dtype=np.int64)
+        if elemShape is not None:
+            checked = checked[self.shapes[checked] == SHAPES.index(str(elemShape))]
+        name, larger = CRITERIA.get(str(criterion), (str(criterion), True))
+        values = self.metrics[name][checked] if name in self.metrics else np.full(len(checked), np.nan)
+        applicable = ~np.isnan(values)
+        result: Dict[str, Any] = {"numElements": len(checked)}
+        if applicable.any():
+            worst = np.nanargmax(values) if larger else np.nanargmin(values)
+            result["average"] = float(values[applicable].mean())
+            result["worst"], result["worstElement"] = float(values[worst]), elements[int(checked[worst])]
+        failed = None
+        if str(criterion) == "ANALYSIS_CHECKS":
+            failed = applicable & (values <= 0.0)
+        elif threshold is not None:
+            failed = applicable & ((values > threshold) if larger else (values < threshold))
+        if failed is not None:
+            result["failedElements"] = [elements[position] for position in checked[failed].tolist()]
+        if not applicable.all():
+            result["naElements"] = [elements[position] for position in checked[~applicable].tolist()]
+        return result
+
+    def _index(self):
+        """Index the groups by element position, and the elements by corner node in compressed rows."""
+        import numpy as np
+
+        self._group = np.full(len(self.shapes), -1, dtype=np.int64)
+        self._row = np.full(len(self.shapes), -1, dtype=np.int64)
+        nodes, elements = [np.empty(0, dtype=np.int64)], [np.empty(0, dtype=np.int64)]
+        for number, (_, positions, connectivity) in enumerate(self.groups):
+            self._group[positions], self._row[positions] = number, np.arange(len(positions))
+            nodes.append(connectivity.ravel())
+            elements.append(np.repeat(positions, connectivity.shape[1]))
+        corners = np.concatenate(nodes)
+        order = np.argsort(corners, kind="stable")
+        self._incident = np.concatenate(elements)[order]
+        self._offsets = np.concatenate(([0], np.cumsum(np.bincount(corners, minlength=len(self.coordinates)))))
+
+    def _compute(self, positions: np.ndarray):
+        """Compute the metrics of the elements at some positions."""
+        x, y, z = (self.coordinates[:, axis] for axis in range(3))
+        for number, (topology, groupPositions, connectivity) in enumerate(self.groups):
+            rows = self._row[positions[self._group[positions] == number]]
+            if len(rows):
+                corners = connectivity[rows]
+                for name, values in _metrics(topology, (x[corners], y[corners], z[corners])).items():
+                    self.metrics[name][groupPositions[rows]] = values
+
+
+def meshQuality(part: Any) -> MeshQuality:
+    """Return the quality metrics of the elements of a part, cached by its element array.
+
+    Parameters
+    ----------
+    part
+        A Part object.
+
+    Returns
+    -------
+    MeshQuality
+        A MeshQuality object.
+    """
+    coordinates = part.nodes._coordinates()
+    quality = part.elements._peek("quality")
+    if quality is None or quality.coordinates is not coordinates:
+        quality = MeshQuality(part.elements, coordinates)
+        part.elements._store("quality", quality)
+    return quality
+
+
+def moveNodes(part: Any, positions: np.ndarray, coordinates: np.ndarray) -> np.ndarray:
+    """Move some nodes of a part, updating the coordinates cached by its node array and the quality metrics of
+    the elements around the nodes, if they are cached, and discarding the cached integrals and spatial index of
+    the elements.
+
+    Parameters
+    ----------
+    part
+        A Part object.
+    positions
+        An array of Ints specifying the positions of the nodes in the node array of the part.
+    coordinates
+        An (N, 3) array of Floats specifying the new coordinates of the nodes.
+
+    Returns
+    -------
+    numpy.ndarray
+        An array of Ints specifying the positions of the elements whose metrics were updated.
+    """
+    import numpy as np
+
+    nodes = part.nodes
+    current = nodes._coordinates()
+    quality = part.elements._peek("quality")
+    if nodes._peek("editableCoordinates") is not current:
+        # The cached coordinates may be an array of the caller shared by BulkMesh, so that they are copied once
+        # before they are edited in place.
+        previous, current = current, current.copy()
+        nodes._store("coordinates", current)
+        nodes._store("editableCoordinates", current)
+        if quality is not None and quality.coordinates is previous:
+            quality.coordinates = current
+    positions = np.asarray(positions, dtype=np.int64)
+    current[positions] = coordinates
+    for position, point in zip(positions.tolist(), current[positions].tolist()):
+        nodes[position].coordinates = tuple(point)
+    nodes._discard("spatialIndex")
+    part.elements._discard("massIntegrals", "spatialIndex")
+    if quality is None or quality.coordinates is not current:
+        return np.empty(0, dtype=np.int64)
+    return quality.update(positions)
+
+
+def boundaryNodes(part: Any) -> np.ndarray:
+    """Return the sorted indices of the corner nodes on the boundary of the mesh of a part, which are the nodes of
+    the exterior faces of the solid and planar elements and of the exterior edges of the shell elements, cached
+    by its element array.
+
+    Parameters
+    ----------
+    part
+        A Part object.
+
+    Returns
+    -------
+    numpy.ndarray
+        An array of Ints specifying the node indices.
+    """
+    import numpy as np
+
+    def build() -> np.ndarray:
+        quality = meshQuality(part)
+        groups = quality.groups
+        connectivities = {id(topology): connectivity for topology, _, connectivity in groups}
+        found = exteriorFaces([group for group in groups if group[0].kind != "SHELL"]) + exteriorEdges(
+            [group for group in groups if group[0].kind == "SHELL"]
+        )
+        nodes = [np.empty(0, dtype=np.int64)]
+        for topology, positions, indices in found:
+            connectivity = connectivities[id(topology)]
+            elementRows = quality._row[positions]
+            sides = topology.faces if topology.kind != "SHELL" else topology.edges
+            for index, side in enumerate(sides):
+                nodes.append(connectivity[elementRows[indices == index]][:, list(side)].ravel())
+        return np.unique(np.concatenate(nodes))
+
+    return part.elements._cached("boundaryNodes", build)
+
+
+def entityPositions(array: Any, items: Any, attribute: str) -> np.ndarray:
+    """Return the positions in a node or element array of some nodes or elements, given as a sequence of nodes or
+    elements, of regions holding some, such as Set objects, or of both. The regions without nodes or elements,
+    such as the geometric regions, are ignored.
+
+    Parameters
+    ----------
+    array
+        A MeshNodeArray or MeshElementArray object.
+    items
+        A sequence of MeshNode, MeshElement or Region objects, or a Region object.
+    attribute
+        A String specifying the attribute of the regions holding the entities, "nodes" or "elements".
+
+    Returns
+    -------
+    numpy.ndarray
+        An array of Ints specifying the positions of the entities.
+
+    Raises
+    ------
+    KeyError
+        If the label of an entity is not a label of the array.
+    """
+    labels: List[int] = []
+    for item in [items] if hasattr(items, attribute) else items:
+        members = getattr(item, attribute, None)
+        if members is not None:
+            labels.extend(entity.label for entity in members)
+        elif hasattr(item, "label"):
+            labels.append(item.label)
+    return array._labelIndex().require(labels, f"{attribute[:-1]} label")
+
+
+@lru_cache(maxsize=None)
+def _cornerEdges(topology: ElementTopology) -> Tuple[Tuple[int, ...], ...]:
+    """Return the three corners joined by an edge to each corner of a solid, ordered so that their edge vectors
+    form a direct frame in the regular element."""
+    import numpy as np
+
+    reference = np.array(_REFERENCE[topology.shape], dtype=float)
+    frames = []
+    for corner in range(topology.corners):
+        others = [second if first == corner else first for first, second in topology.edges if corner in (first, second)]
+        if np.linalg.det(reference[others] - reference[corner]) < 0:
+            others[1], others[2] = others[2], others[1]
+        frames.append(tuple(others))
+    return tuple(frames)
+
+
+def _shape(nodeCount: int) -> int:
+    """Return the index in SHAPES of the shape of the elements without faces of a number of nodes."""
+    return {1: 0, 2: 1, 3: 1, 5: 6, 13: 6}.get(nodeCount, -1)
+
+
+def _metrics(topology: ElementTopology, corners: Vector) -> Dict[str, np.ndarray]:
+    """Return the metrics of some elements of a topology, given the (M, corners) coordinates of their corners."""
+    import numpy as np
+
+    x, y, z = corners
+    count = len(x)
+    first, second = (list(nodes) for nodes in zip(*topology.edges))
+    lengths = _norm((x[:, second] - x[:, first], y[:, second] - y[:, first], z[:, second] - z[:, first]))
+    shortest, longest = lengths.min(axis=1), lengths.max(axis=1)
+    metrics = {"shortestEdge": shortest, "longestEdge": longest}
+    with np.errstate(divide="ignore", invalid="ignore"):
+        metrics["aspectRatio"] = np.where(shortest > 0, longest / shortest, np.inf)
+
+    small, large = np.full(count, np.inf), np.zeros(count)
+    deviation, skew = np.zeros(count), np.zeros(count)
+    polygons = topology.faces if topology.kind == "SOLID" else (tuple(range(topology.corners)),)
+    for size in sorted({len(polygon) for polygon in polygons}):
+        polygon = np.array([polygon for polygon in polygons if len(polygon) == size])
+        after, before = np.roll(polygon, -1, axis=1), np.roll(polygon, 1, axis=1)
+        angles = _angle(
+            tuple(values[:, after] - values[:, polygon] for values in corners),  # type: ignore
+            tuple(values[:, before] - values[:, polygon] for values in corners),  # type: ignore
+        )
+        ideal = 60.0 if size == 3 else 90.0
+        small, large = np.minimum(small, angles.min(axis=(1, 2))), np.maximum(large, angles.max(axis=(1, 2)))
+        deviation = np.maximum(deviation, np.abs(angles - ideal).max(axis=(1, 2)))
+        if size == 3:
+            # The equiangle skew of the triangles.
+            faceSkew = np.maximum((angles.max(axis=2) - 60.0) / 120.0, (60.0 - angles.min(axis=2)) / 60.0)
+        else:
+            # The cosine of the angle between the principal axes of the quadrilaterals.
+            p0, p1, p2, p3 = polygon.T
+            faceSkew = np.abs(
+                _cosine(
+                    tuple(v[:, p1] - v[:, p0] + v[:, p2] - v[:, p3] for v in corners),  # type: ignore
+                    tuple(v[:, p2] - v[:, p1] + v[:, p3] - v[:, p0] for v in corners),  # type: ignore
+                )
+            )
+        skew = np.maximum(skew, faceSkew.max(axis=1))
+    metrics.update(smallAngle=small, largeAngle=large, angularDeviation=deviation, skew=skew)
+    metrics["jacobian"] = np.minimum(_jacobian(topology, corners) * _JACOBIAN_SCALE.get(topology.shape, 1.0), 1.0)
+    metrics["shapeFactor"] = _shapeFactor(topology, corners)
+    return metrics
+
+
+def _jacobian(topology: ElementTopology, corners: Vector) -> np.ndarray:
+    """Return the smallest scaled Jacobian over the corners of some elements, which is the determinant of the
+    unit edge vectors at the corner for the solids, and the sine of the corner angle signed by the normal of the
+    element for the other elements."""
+    import numpy as np
+
+    if topology.kind == "SOLID":
+        frames = np.array(_cornerEdges(topology))
+        base = np.arange(topology.corners)
+        edges = [_unit(tuple(v[:, frames[:, axis]] - v[:, base] for v in corners)) for axis in range(3)]  # type: ignore
+        return _dot(edges[0], _cross(edges[1], edges[2])).min(axis=1)
+    base = np.arange(topology.corners)
+    after, before = np.roll(base, -1), np.roll(base, 1)
+    sines = _cross(
+        _unit(tuple(v[:, after] - v[:, base] for v in corners)),  # type: ignore
+        _unit(tuple(v[:, before] - v[:, base] for v in corners)),  # type: ignore
+    )
+    if topology.kind == "PLANAR":
+        return sines[2].min(axis=1)
+    # The normal of a shell element is the sum of the cross products of its consecutive corners.
+    x, y, z = corners
+    products = _cross((x, y, z), (x[:, after], y[:, after], z[:, after]))
+    normal = _unit(tuple(values.sum(axis=1, keepdims=True) for values in products))  # type: ignore
+    return _dot(sines, normal).min(axis=1)
+
+
+def _shapeFactor(topology: ElementTopology, corners: Vector) -> np.ndarray:
+    """Return the ratio of the area or the volume of some triangles or tetrahedra to the area or the volume of the
+    regular element of the same circumradius, NaN for the other elements."""
+    import numpy as np
+
+    x, y, z = corners
+    if topology.shape not in ("TRI3", "TET4"):
+        return np.full(len(x), np.nan)
+    a, b = ((x[:, i] - x[:, 0], y[:, i] - y[:, 0], z[:, i] - z[:, 0]) for i in (1, 2))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if topology.shape == "TRI3":
+            area = _norm(_cross(a, b)) / 2
+            product = _norm(a) * _norm(b) * _norm((a[0] - b[0], a[1] - b[1], a[2] - b[2]))
+            radius = product / (4 * area)
+            factor = area / (3 * 3**0.5 / 4 * radius**2)
+        else:
+            c = (x[:, 3] - x[:, 0], y[:, 3] - y[:, 0], z[:, 3] - z[:, 0])
+            volume = np.abs(_dot(a, _cross(b, c))) / 6
+            ab, bc, ca = _cross(a, b), _cross(b, c), _cross(c, a)
+            squares = _dot(a, a), _dot(b, b), _dot(c, c)
+            center = (
+                squares[0] * bc[0] + squares[1] * ca[0] + squares[2] * ab[0],
+                squares[0] * bc[1] + squares[1] * ca[1] + squares[2] * ab[1],
+                squares[0] * bc[2] + squares[1] * ca[2] + squares[2] * ab[2],
+            )
+            # The circumcenter is center / (2 a.(b x c)) from the first corner.
+            radius = _norm(center) / (12 * volume)
+            edge = 4 * radius / 6**0.5
+            factor = volume / (edge**3 / (6 * 2**0.5))
+    return np.where(np.isfinite(factor), factor, 0.0)
+
+
+def _dot(first: Vector, second: Vector) -> np.ndarray:
+    return first[0] * second[0] + first[1] * second[1] + first[2] * second[2]
+
+
+def _cross(first: Vector, second: Vector) -> Vector:
+    return (
+        first[1] * second[2] - first[2] * second[1],
+        first[2] * second[0] - first[0] * second[2],
+        first[0] * second[1] - first[1] * second[0],
+    )
+
+
+def _norm(vector: Vector) -> np.ndarray:
+    import numpy as np
+
+    return np.sqrt(_dot(vector, vector))
+
+
+def _unit(vector: Vector) -> Vector:
+    """Return the unit vectors of some vectors, zero for the zero vectors."""
+    import numpy as np
+
+    norm = _norm(vector)
+    scale = np.divide(1.0, norm, out=np.zeros_like(norm), where=norm > 0)
+    return (vector[0] * scale, vector[1] * scale, vector[2] * scale)
+
+
+def _cosine(first: Vector, second: Vector) -> np.ndarray:
+    return _dot(_unit(first), _unit(second))
+
+
+def _angle(first: Vector, second: Vector) -> np.ndarray:
+    """Return the angles in degrees between some vectors, zero when one of them is zero."""
+    import numpy as np
+
+    first, second = _unit(first), _unit(second)
+    angles = np.degrees(np.arccos(np.clip(_dot(first, second), -1.0, 1.0)))
+    return np.where((_norm(first) > 0) & (_norm(second) > 0), angles, 0.0)
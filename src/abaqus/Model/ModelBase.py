@@ -1,43 +1,12 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from typing_extensions import Literal
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
+from abqpy.lazy import lazy_attribute
 
-from ..Adaptivity.AdaptiveMeshConstraint import AdaptiveMeshConstraint
-from ..Adaptivity.AdaptiveMeshControl import AdaptiveMeshControl
-from ..Adaptivity.RemeshingRule import RemeshingRule
-from ..Amplitude.Amplitude import Amplitude
-from ..Assembly.Assembly import Assembly
-from ..BeamSectionProfile.Profile import Profile
-from ..BoundaryCondition.BoundaryCondition import BoundaryCondition
-from ..Calibration.Calibration import Calibration
-from ..Constraint.Constraint import Constraint
-from ..Feature.FeatureOptions import FeatureOptions
-from ..Field.AnalyticalField import AnalyticalField
-from ..Field.DiscreteField import DiscreteField
-from ..Filter.Filter import Filter
-from ..Interaction.ContactControl import ContactControl
-from ..Interaction.ContactInitialization import ContactInitialization
-from ..Interaction.ContactProperty import ContactProperty
-from ..Interaction.ContactStabilization import ContactStabilization
-from ..Interaction.Interaction import Interaction
-from ..Load.Load import Load
-from ..Material.Material import Material
-from ..Optimization.OptimizationTask import OptimizationTask
-from ..Part.Part import Part
-from ..PredefinedField.PredefinedField import PredefinedField
-from ..Section.Section import Section
-from ..Sketcher.ConstrainedSketch import ConstrainedSketch
-from ..Step.InitialStep import InitialStep
-from ..Step.Step import Step
-from ..StepOutput.FieldOutputRequest import FieldOutputRequest
-from ..StepOutput.HistoryOutputRequest import HistoryOutputRequest
-from ..StepOutput.IntegratedOutputSection import IntegratedOutputSection
-from ..StepOutput.TimePoint import TimePoint
-from ..TableCollection.EventSeriesData import EventSeriesData
-from ..TableCollection.EventSeriesType import EventSeriesType
-from ..TableCollection.TableCollection import TableCollection
 from ..UtilityAndView.abaqusConstants import (
     B31,
     C3D8I,
@@ -52,7 +21,42 @@ from ..UtilityAndView.abaqusConstants import (
     SymbolicConstant,
 )
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
-from .KeywordBlock import KeywordBlock
+
+if TYPE_CHECKING:
+    from ..Adaptivity.AdaptiveMeshConstraint import AdaptiveMeshConstraint
+    from ..Adaptivity.AdaptiveMeshControl import AdaptiveMeshControl
+    from ..Adaptivity.RemeshingRule import RemeshingRule
+    from ..Amplitude.Amplitude import Amplitude
+    from ..Assembly.Assembly import Assembly
+    from ..BeamSectionProfile.Profile import Profile
+    from ..BoundaryCondition.BoundaryCondition import BoundaryCondition
+    from ..Calibration.Calibration import Calibration
+    from ..Constraint.Constraint import Constraint
+    from ..Feature.FeatureOptions import FeatureOptions
+    from ..Field.AnalyticalField import AnalyticalField
+    from ..Field.DiscreteField import DiscreteField
+    from ..Filter.Filter import Filter
+    from ..Interaction.ContactControl import ContactControl
+    from ..Interaction.ContactInitialization import ContactInitialization
+    from ..Interaction.ContactProperty import ContactProperty
+    from ..Interaction.ContactStabilization import ContactStabilization
+    from ..Interaction.Interaction import Interaction
+    from ..Load.Load import Load
+    from ..Material.Material import Material
+    from ..Optimization.OptimizationTask import OptimizationTask
+    from ..Part.Part import Part
+    from ..PredefinedField.PredefinedField import PredefinedField
+    from ..Section.Section import Section
+    from ..Sketcher.ConstrainedSketch import ConstrainedSketch
+    from ..Step.Step import Step
+    from ..StepOutput.FieldOutputRequest import FieldOutputRequest
+    from ..StepOutput.HistoryOutputRequest import HistoryOutputRequest
+    from ..StepOutput.IntegratedOutputSection import IntegratedOutputSection
+    from ..StepOutput.TimePoint import TimePoint
+    from ..TableCollection.EventSeriesData import EventSeriesData
+    from ..TableCollection.EventSeriesType import EventSeriesType
+    from ..TableCollection.TableCollection import TableCollection
+    from .KeywordBlock import KeywordBlock
 
 
 @abaqus_class_doc
@@ -130,10 +134,10 @@ class ModelBase:
     copyInteractions: Boolean = OFF
 
     #: A KeywordBlock object.
-    keywordBlock: KeywordBlock = KeywordBlock()
+    keywordBlock: KeywordBlock = lazy_attribute(".KeywordBlock", "KeywordBlock")
 
     #: An Assembly object.
-    rootAssembly: Assembly = Assembly()
+    rootAssembly: Assembly = lazy_attribute("..Assembly.Assembly", "Assembly")
 
     #: A repository of Amplitude objects.
     amplitudes: dict[str, Amplitude] = {}
@@ -204,7 +208,7 @@ class ModelBase:
     steps: dict[str, Step] = {}
 
     #: A FeatureOptions object.
-    featureOptions: FeatureOptions = FeatureOptions()
+    featureOptions: FeatureOptions = lazy_attribute("..Feature.FeatureOptions", "FeatureOptions")
 
     #: A repository of AdaptiveMeshConstraint objects.
     adaptiveMeshConstraints: dict[str, AdaptiveMeshConstraint] = {}
@@ -304,6 +308,8 @@ class ModelBase:
         Model
             A Model object.
         """
+        from ..Step.InitialStep import InitialStep
+
         self.steps["Initial"] = InitialStep()
 
     @abaqus_method_doc
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from ..UtilityAndView.abaqusConstants import SymbolicConstant
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .FieldBulkData import FieldBulkData
+
+
+class FieldArrays:
+    """The FieldArrays object holds the values of a FieldOutput object as contiguous NumPy arrays, one row per
+    output location, without creating a FieldValue object per location.
+
+    The instances and positions of the rows are stored as integer codes into the :attr:`instances` and
+    :attr:`positions` tuples. Integer columns that are not available for a row, such as the integration point of
+    nodal data, are set to -1.
+
+    .. note::
+        This object can be accessed by::
+
+            import odbAccess
+            session.odbs[name].steps[name].frames[i].fieldOutputs[name].asArrays()
+    """
+
+    #: A tuple of Strings specifying the component labels of the columns of **data**.
+    componentLabels: tuple = ()
+
+    #: A tuple of OdbInstance objects indexed by **instance**.
+    instances: tuple = ()
+
+    #: A tuple of SymbolicConstants indexed by **position**.
+    positions: tuple = ()
+
+    #: An array of Ints specifying the index in **instances** of the instance of each row.
+    instance: np.ndarray
+
+    #: An array of Ints specifying the index in **positions** of the position of each row.
+    position: np.ndarray
+
+    #: An array of Ints specifying the element label of each row.
+    elementLabels: np.ndarray
+
+    #: An array of Ints specifying the node label of each row.
+    nodeLabels: np.ndarray
+
+    #: An array of Ints specifying the integration point of each row.
+    integrationPoints: np.ndarray
+
+    #: An array of Ints specifying the section point number of each row.
+    sectionPoints: np.ndarray
+
+    #: A two-dimensional array of Floats specifying the components of each row.
+    data: np.ndarray
+
+    #: A two-dimensional array of Floats specifying the imaginary part of the components of each row, or None if
+    #: the field is not complex.
+    conjugateData: np.ndarray | None = None
+
+    #: A dictionary of arrays of Floats specifying the invariants available in all the blocks, keyed by the name of
+    #: the FieldBulkData attribute, such as "mises".
+    invariants: dict[str, np.ndarray]
+
+    def __init__(self, blocks: list[FieldBulkData], componentLabels: tuple = ()):
+        """This method concatenates the bulk data blocks of a FieldOutput object.
+
+        Parameters
+        ----------
+        blocks
+            A sequence of FieldBulkData objects.
+        componentLabels
+            A sequence of Strings specifying the component labels.
+        """
+        import numpy as np
+
+        self.componentLabels = tuple(componentLabels)
+        instances: dict[int, int] = {}
+        positions: dict[SymbolicConstant, int] = {}
+        instanceCodes = [instances.setdefault(id(block.instance), len(instances)) for block in blocks]
+        positionCodes = [positions.setdefault(block.position, len(positions)) for block in blocks]
+        self.instances = tuple({id(block.instance): block.instance for block in blocks}.values())
+        self.positions = tuple(positions)
+
+        sizes = [len(block.data) for block in blocks]
+        self.instance = np.repeat(np.array(instanceCodes, dtype=np.int32), sizes)
+        self.position = np.repeat(np.array(positionCodes, dtype=np.int8), sizes)
+        self.elementLabels = self._concatenate(blocks, "elementLabels", -1)
+        self.nodeLabels = self._concatenate(blocks, "nodeLabels", -1)
+        self.integrationPoints = self._concatenate(blocks, "integrationPoints", -1)
+        sectionPoints = [-1 if block.sectionPoint is None else block.sectionPoint.number for block in blocks]
+        self.sectionPoints = np.repeat(np.array(sectionPoints, dtype=np.int32), sizes)
+        width = len(self.componentLabels) or 1
+        self.data = self._concatenate(blocks, "data", np.nan, width)
+        self.conjugateData = (
+            self._concatenate(blocks, "conjugateData", np.nan, width)
+            if any(len(block.conjugateData) for block in blocks)
+            else None
+        )
+        self.invariants = {
+            name: self._concatenate(blocks, name, np.nan)
+            for name in ("mises",)
+            if blocks and all(len(getattr(block, name)) for block in blocks)
+        }
+
+    @staticmethod
+    def _concatenate(blocks: list[FieldBulkData], name: str, fill: Any, width: int = 0) -> np.ndarray:
+        """Concatenate an attribute of the blocks, the rows of the blocks without the attribute are filled."""
+        import numpy as np
+
+        arrays = []
+        for block in blocks:
+            value = np.asarray(getattr(block, name))
+            if width:
+                value = value.reshape(len(block.data), width) if value.size else np.full((len(block.data), width), fill)
+            elif not value.size:
+                value = np.full(len(block.data), fill)
+            arrays.append(value)
+        if len(arrays) == 1:
+            return arrays[0]
+        if not arrays:
+            return np.empty((0, width) if width else 0, dtype=type(fill))
+        return np.concatenate(arrays)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, componentLabel: str) -> np.ndarray:
+        """Return the column of a component, such as "S11", or an invariant, such as "mises"."""
+        if componentLabel in self.invariants:
+            return self.invariants[componentLabel]
+        return self.data[:, self.componentLabels.index(componentLabel)]
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import copy
+from typing import TYPE_CHECKING, Any
+
 from abqpy.decorators import abaqus_class_doc
 
 from ..UtilityAndView.abaqusConstants import DEFORMABLE_BODY, THREE_D, SymbolicConstant
@@ -7,6 +10,9 @@ from .OdbInstance import OdbInstance
 from .OdbPart import OdbPart
 from .SectionPoint import SectionPoint
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 @abaqus_class_doc
 class FieldBulkData:
@@ -37,6 +43,9 @@ class FieldBulkData:
     #: TENSOR_2D_SURFACE.
     type: SymbolicConstant
 
+    #: A String specifying the base element type of the elements in the block.
+    baseElementType: str = ""
+
     #: An OdbInstance object specifying the part to which the labels belong.
     instance: OdbInstance = OdbInstance("instance", OdbPart("part", THREE_D, DEFORMABLE_BODY))
 
@@ -87,3 +96,30 @@ class FieldBulkData:
     #: local to global. If the underlying data are in double precision, an exception will be
     #: thrown.
     localCoordSystem: float | None = None
+
+    def _subset(self, mask: np.ndarray) -> FieldBulkData | None:
+        """Return the block restricted to the rows selected by a boolean mask.
+
+        The block itself is returned if all the rows are selected, and None if none is. Otherwise, the arrays of
+        the returned block are views of the arrays of this block if the selected rows are contiguous, and copies
+        only if they are not.
+        """
+        import numpy as np
+
+        rows = np.flatnonzero(mask)
+        if len(rows) == len(self.data):
+            return self
+        if not len(rows):
+            return None
+        index = slice(rows[0], rows[-1] + 1) if rows[-1] - rows[0] + 1 == len(rows) else rows
+        names = ("elementLabels", "nodeLabels", "integrationPoints", "data", "conjugateData", "mises")
+        arrays = {name: getattr(self, name) for name in names + ("localCoordSystem",)}
+        return self._replace(
+            **{name: array[index] for name, array in arrays.items() if array is not None and len(array)}
+        )
+
+    def _replace(self, **attributes: Any) -> FieldBulkData:
+        """Return a shallow copy of the block with some attributes replaced."""
+        block = copy.copy(self)
+        block.__dict__.update(attributes)
+        return block
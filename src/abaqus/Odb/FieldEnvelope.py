@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+from itertools import islice
+from typing import TYPE_CHECKING, Iterable, Iterator, Tuple
+
+from ..UtilityAndView.abaqusConstants import SymbolicConstant
+from ..UtilityAndView.abaqusConstants import abaqusConstants as C
+from .FieldOutput import FieldOutput
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    #: The data, type, engineering tensor flag and component labels of a field, as sent to the reducing processes.
+    _RawField = Tuple[np.ndarray, SymbolicConstant, bool, Tuple[str, ...]]
+
+
+class FieldEnvelope:
+    """The FieldEnvelope object accumulates the maximum or minimum value of an output variable over a number of
+    fields, and the index of the field reaching it, as computed by the maxEnvelope and minEnvelope commands.
+
+    The fields are reduced in chunks of a fixed number of fields, so that the memory used only depends on the
+    number of output locations and on the chunk size. The invariant or component of the fields of a chunk is
+    extracted with its reduction, so that both run in the pool of processes when the chunks are reduced in parallel.
+    Envelopes are also partial results: an envelope over new fields, such as a new load case, can be merged into
+    an existing envelope without reducing the previous fields again.
+
+    .. note::
+        This object is not part of the Abaqus Scripting Interface. For example::
+
+            envelope = FieldEnvelope(maximum=True, invariantOrComponentLabel=MISES)
+            envelope.add([frame.fieldOutputs["S"] for frame in step.frames], chunkSize=16, processes=4)
+            envelope.merge(FieldEnvelope(True, MISES).add([newLoadCaseField]))
+            maxValues, fieldIndices = envelope.getFields()
+    """
+
+    #: A Boolean specifying whether the envelope is the maximum or the minimum value.
+    maximum: bool = True
+
+    #: A SymbolicConstant specifying the invariant or a String specifying the component label to compare, or None if
+    #: the fields are scalar fields.
+    invariantOrComponentLabel: SymbolicConstant | str | None = None
+
+    #: An Int specifying the number of fields reduced in the envelope.
+    count: int = 0
+
+    #: An array of Floats specifying the envelope value at each output location, or None if no field was reduced.
+    values: np.ndarray | None = None
+
+    #: An array of Ints specifying the index of the field reaching the envelope value at each output location, or
+    #: None if no field was reduced.
+    indices: np.ndarray | None = None
+
+    #: A scalar FieldOutput object specifying the output locations of the envelope, or None if no field was reduced.
+    template: FieldOutput | None = None
+
+    def __init__(self, maximum: bool = True, invariantOrComponentLabel: SymbolicConstant | str | None = None):
+        """This method creates an empty FieldEnvelope object.
+
+        Parameters
+        ----------
+        maximum
+            A Boolean specifying whether the envelope is the maximum or the minimum value. The default value is
+            True.
+        invariantOrComponentLabel
+            A SymbolicConstant specifying the invariant or a String specifying the component label to compare, such
+            as MISES or "S11". It is required if the fields are not scalar fields.
+        """
+        self.maximum = maximum
+        self.invariantOrComponentLabel = invariantOrComponentLabel
+
+    def add(self, fieldList: Iterable[FieldOutput], chunkSize: int = 16, processes: int = 0) -> FieldEnvelope:
+        """This method reduces fields into the envelope, their indices follow the fields already reduced.
+
+        Parameters
+        ----------
+        fieldList
+            A sequence or an iterator of FieldOutput objects with values at the same locations as the envelope,
+            the fields of a chunk are read when the chunk is reduced.
+        chunkSize
+            An Int specifying the number of fields reduced at once. The default value is 16.
+        processes
+            An Int specifying the number of processes extracting the invariants or components of the chunks and
+            reducing them in parallel. The default value is 0, which reduces them in the calling process.
+
+        Returns
+        -------
+        FieldEnvelope
+            The FieldEnvelope object itself.
+        """
+        chunks = self._chunks(fieldList, max(chunkSize, 1), self.count)
+        selection = self.invariantOrComponentLabel
+        if processes <= 0:
+            for offset, chunk in chunks:
+                self._combine(*_reduceChunk(chunk, selection, self.maximum), offset, len(chunk))
+            return self
+
+        from collections import deque
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            pending: deque = deque()
+            for offset, chunk in chunks:
+                if len(pending) == processes:
+                    self._combine(*pending[0][2].result(), *pending.popleft()[:2])
+                pending.append((offset, len(chunk), executor.submit(_reduceChunk, chunk, selection, self.maximum)))
+            while pending:
+                self._combine(*pending[0][2].result(), *pending.popleft()[:2])
+        return self
+
+    def merge(self, other: FieldEnvelope) -> FieldEnvelope:
+        """This method merges the envelope of fields that follow the fields of this envelope.
+
+        Parameters
+        ----------
+        other
+            A FieldEnvelope object of the same kind, whose field indices are offset by the number of fields of this
+            envelope.
+
+        Returns
+        -------
+        FieldEnvelope
+            The FieldEnvelope object itself.
+
+        Raises
+        ------
+        ValueError
+            If the envelopes are not of the same kind.
+        """
+        if (other.maximum, other.invariantOrComponentLabel) != (self.maximum, self.invariantOrComponentLabel):
+            raise ValueError("Only envelopes of the same kind can be merged")
+        if other.values is not None and other.indices is not None:
+            self.template = self.template or other.template
+            self._combine(other.values, other.indices, self.count, other.count)
+        return self
+
+    def getFields(self) -> tuple[FieldOutput, FieldOutput]:
+        """This method returns the envelope as FieldOutput objects.
+
+        Returns
+        -------
+        tuple[FieldOutput, FieldOutput]
+            A sequence of two FieldOutput objects. The first FieldOutput object contains the envelope value. The
+            second FieldOutput object contains the index of the field reaching the envelope value.
+
+        Raises
+        ------
+        ValueError
+            If no field was reduced.
+        """
+        if self.template is None or self.values is None or self.indices is None:
+            raise ValueError("The envelope requires at least one field")
+        return self._scalarField(self.values), self._scalarField(self.indices)
+
+    def _chunks(
+        self, fieldList: Iterable[FieldOutput], chunkSize: int, offset: int
+    ) -> Iterator[tuple[int, list[_RawField]]]:
+        """Yield the index of the first field and the raw values of the fields of each chunk of fields."""
+        size = None if self.values is None else len(self.values)
+        fields = iter(fieldList)
+        while True:
+            chunk = []
+            for field in islice(fields, chunkSize):
+                self.template = self.template or field
+                data = field.asArrays().data
+                size = len(data) if size is None else size
+                if len(data) != size:
+                    raise ValueError("The fields of an envelope must have values at the same locations")
+                chunk.append((data, field.type, bool(field.isEngineeringTensor), tuple(field.componentLabels)))
+            if not chunk:
+                return
+            yield offset, chunk
+            offset += len(chunk)
+
+    def _combine(self, values: np.ndarray, indices: np.ndarray, offset: int, count: int) -> None:
+        """Combine the envelope of a number of fields starting at an offset, ties keep the first field."""
+        import numpy as np
+
+        if self.values is None or self.indices is None:
+            self.values, self.indices = values.astype(float), indices + offset
+        else:
+            replaced = values > self.values if self.maximum else values < self.values
+            self.values[replaced] = values[replaced]
+            self.indices[replaced] = indices[replaced] + offset
+        self.count = max(self.count, offset + count)
+        self.indices = self.indices.astype(np.int64, copy=False)
+
+    def _scalarField(self, column: np.ndarray) -> FieldOutput:
+        """Create a scalar field with the locations of the template field and the values of a column."""
+        assert self.template is not None
+        field = FieldOutput(self.template)
+        field.type, field.componentLabels, field.bulkDataBlocks = C.SCALAR, (), []
+        start = 0
+        for block in self.template.bulkDataBlocks:
+            data, start = column[start : start + len(block.data), None], start + len(block.data)
+            field.bulkDataBlocks.append(
+                block._replace(data=data, type=C.SCALAR, componentLabels=(), conjugateData=(), mises=())
+            )
+        return field
+
+
+def _reduceChunk(
+    chunk: list[_RawField], selection: SymbolicConstant | str | None, maximum: bool
+) -> tuple[np.ndarray, np.ndarray]:
+    """Extract the invariant or component of the raw values of the fields of a chunk and reduce them to the
+    envelope and the index of the field reaching it."""
+    import numpy as np
+
+    from .FieldInvariants import computeInvariants
+
+    columns = []
+    for data, type, isEngineeringTensor, componentLabels in chunk:
+        if selection is None:
+            columns.append(data[:, 0])
+        elif isinstance(selection, SymbolicConstant):
+            columns.append(computeInvariants(data, type, isEngineeringTensor, (selection,))[selection])
+        else:
+            columns.append(data[:, componentLabels.index(selection)])
+    values = np.stack(columns)
+    indices = np.argmax(values, axis=0) if maximum else np.argmin(values, axis=0)
+    return np.take_along_axis(values, indices[None], axis=0)[0], indices
@@ -0,0 +1,156 @@
+"""Vectorized computation of the invariants of the values of a FieldOutput object.
+
+The invariants of a whole block of vector or tensor values are computed at once with NumPy, instead of one
+FieldValue object at a time. The definitions follow the Abaqus documentation: the pressure is minus one third of
+the trace, the third invariant is the cube root of 27/2 times the determinant of the deviatoric tensor, and the
+in-plane principal values of the planar and surface tensors are the eigenvalues of their (11, 22, 12) part.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Optional, Sequence, Tuple
+
+from ..UtilityAndView.abaqusConstants import SymbolicConstant
+from ..UtilityAndView.abaqusConstants import abaqusConstants as C
+
+if TYPE_CHECKING:
+    import numpy as np
+
+#: The columns of the (11, 22, 33, 12, 13, 23) components in the data of each tensor type, None if the component is
+#: not stored.
+TENSOR_COLUMNS: Dict[SymbolicConstant, Tuple[Optional[int], ...]] = {
+    C.TENSOR_3D_FULL: (0, 1, 2, 3, 4, 5),
+    C.TENSOR_3D_PLANAR: (0, 1, 2, 3, None, None),
+    C.TENSOR_2D_PLANAR: (0, 1, 2, 3, None, None),
+    C.TENSOR_3D_SURFACE: (0, 1, None, 2, None, None),
+    C.TENSOR_2D_SURFACE: (0, 1, None, 2, None, None),
+}
+
+TENSOR_INVARIANTS = (C.MISES, C.TRESCA, C.PRESS, C.INV3, C.MAX_PRINCIPAL, C.MID_PRINCIPAL, C.MIN_PRINCIPAL)
+INPLANE_INVARIANTS = (C.MAX_INPLANE_PRINCIPAL, C.MIN_INPLANE_PRINCIPAL, C.OUTOFPLANE_PRINCIPAL)
+
+
+def validInvariants(type: SymbolicConstant) -> Tuple[SymbolicConstant, ...]:
+    """Return the invariants that can be calculated for a type of output.
+
+    Parameters
+    ----------
+    type
+        A SymbolicConstant specifying the output type. Possible values are SCALAR, VECTOR, TENSOR_3D_FULL,
+        TENSOR_3D_PLANAR, TENSOR_3D_SURFACE, TENSOR_2D_PLANAR, and TENSOR_2D_SURFACE.
+
+    Returns
+    -------
+    tuple[SymbolicConstant, ...]
+        A tuple of SymbolicConstants specifying the invariants.
+    """
+    if type == C.VECTOR:
+        return (C.MAGNITUDE,)
+    if type == C.TENSOR_3D_FULL:
+        return TENSOR_INVARIANTS
+    if type in TENSOR_COLUMNS:
+        return TENSOR_INVARIANTS + INPLANE_INVARIANTS
+    return ()
+
+
+def tensorComponents(
+    data: np.ndarray, type: SymbolicConstant, isEngineeringTensor: bool = False
+) -> Tuple[np.ndarray, ...]:
+    """Return the (11, 22, 33, 12, 13, 23) components of an (N, components) block of tensor values.
+
+    Parameters
+    ----------
+    data
+        A two-dimensional array of Floats specifying the components of the tensors, in the order of the component
+        labels of the output type.
+    type
+        A SymbolicConstant specifying the tensor type.
+    isEngineeringTensor
+        A Boolean specifying whether the off-diagonal components are engineering shear strains, which are halved.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, ...]
+        Six arrays of Floats of shape (N,), the components that are not stored are zeros.
+    """
+    import numpy as np
+
+    zeros = np.zeros(len(data))
+    return tuple(
+        zeros if column is None else data[:, column] * 0.5 if isEngineeringTensor and index >= 3 else data[:, column]
+        for index, column in enumerate(TENSOR_COLUMNS[type])
+    )
+
+
+def computeInvariants(
+    data: np.ndarray,
+    type: SymbolicConstant,
+    isEngineeringTensor: bool = False,
+    invariants: Sequence[SymbolicConstant] = (),
+) -> Dict[SymbolicConstant, np.ndarray]:
+    """Compute the invariants of a block of vector or tensor values in one pass.
+
+    The principal values are computed in closed form from the invariants of the deviatoric tensor and the Lode
+    angle, without an eigenvalue decomposition per value.
+
+    Parameters
+    ----------
+    data
+        A two-dimensional array of Floats of shape (N, components) specifying the values, such as the data of a
+        FieldBulkData object.
+    type
+        A SymbolicConstant specifying the output type. Possible values are VECTOR, TENSOR_3D_FULL,
+        TENSOR_3D_PLANAR, TENSOR_3D_SURFACE, TENSOR_2D_PLANAR, and TENSOR_2D_SURFACE.
+    isEngineeringTensor
+        A Boolean specifying whether the tensors are engineering tensors, whose off-diagonal components are halved
+        for the invariants computation. The default value is False.
+    invariants
+        A sequence of SymbolicConstants specifying the invariants to compute. The default value is an empty
+        sequence, which computes all the invariants valid for **type**.
+
+    Returns
+    -------
+    dict[SymbolicConstant, numpy.ndarray]
+        A dictionary of arrays of Floats of shape (N,), keyed by the invariant.
+
+    Raises
+    ------
+    ValueError
+        If an invariant is not valid for **type**.
+    """
+    import numpy as np
+
+    valid = validInvariants(type)
+    invariants = tuple(invariants) or valid
+    invalid = [str(invariant) for invariant in invariants if invariant not in valid]
+    if invalid:
+        raise ValueError(f"Invariants {', '.join(invalid)} are not valid for {type} output")
+    data = np.asarray(data, dtype=float).reshape(len(data), -1)
+    if type == C.VECTOR:
+        return {C.MAGNITUDE: np.sqrt(np.einsum("ij,ij->i", data, data))}
+
+    s11, s22, s33, s12, s13, s23 = tensorComponents(data, type, isEngineeringTensor)
+    mean = (s11 + s22 + s33) / 3
+    d11, d22, d33 = s11 - mean, s22 - mean, s33 - mean
+    j2 = (d11**2 + d22**2 + d33**2) / 2 + s12**2 + s13**2 + s23**2
+    j3 = d11 * d22 * d33 + 2 * s12 * s13 * s23 - d11 * s23**2 - d22 * s13**2 - d33 * s12**2
+    results: Dict[SymbolicConstant, np.ndarray] = {
+        C.PRESS: -mean,
+        C.MISES: np.sqrt(3 * j2),
+        C.INV3: np.cbrt(13.5 * j3),
+    }
+    if {C.TRESCA, C.MAX_PRINCIPAL, C.MID_PRINCIPAL, C.MIN_PRINCIPAL} & set(invariants):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cosine = np.where(j2 > 0, 1.5 * np.sqrt(3) * j3 / j2**1.5, 1.0)
+        angle = np.arccos(np.clip(cosine, -1.0, 1.0)) / 3
+        radius = 2 * np.sqrt(j2 / 3)
+        results[C.MAX_PRINCIPAL] = mean + radius * np.cos(angle)
+        results[C.MID_PRINCIPAL] = mean + radius * np.cos(angle - 2 * np.pi / 3)
+        results[C.MIN_PRINCIPAL] = mean + radius * np.cos(angle + 2 * np.pi / 3)
+        results[C.TRESCA] = results[C.MAX_PRINCIPAL] - results[C.MIN_PRINCIPAL]
+    if set(INPLANE_INVARIANTS) & set(invariants):
+        center, radius = (s11 + s22) / 2, np.hypot((s11 - s22) / 2, s12)
+        results[C.MAX_INPLANE_PRINCIPAL] = center + radius
+        results[C.MIN_INPLANE_PRINCIPAL] = center - radius
+        results[C.OUTOFPLANE_PRINCIPAL] = s33
+    return {invariant: results[invariant] for invariant in invariants}
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Sequence, Union, overload
+from typing import TYPE_CHECKING, Sequence, Union, overload
 
 from typing_extensions import Literal
 
@@ -8,6 +8,8 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ..UtilityAndView.abaqusConstants import OFF, Boolean, SymbolicConstant
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
+from .FieldBulkData import FieldBulkData
+from .FieldBulkDataArray import FieldBulkDataArray
 from .FieldLocation import FieldLocation
 from .FieldLocationArray import FieldLocationArray
 from .FieldValueArray import FieldValueArray
@@ -17,6 +19,11 @@ from .OdbMeshNode import OdbMeshNode
 from .OdbSet import OdbSet
 from .SectionPoint import SectionPoint
 
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .FieldArrays import FieldArrays
+
 
 @abaqus_class_doc
 class FieldOutput:
@@ -47,6 +54,9 @@ class FieldOutput:
     #: description of the order.
     values: FieldValueArray | None = None
 
+    #: A FieldBulkDataArray object specifying the data of the field as one block per class of elements or nodes.
+    bulkDataBlocks: FieldBulkDataArray = []
+
     #: A String specifying the output variable name.
     name: str
 
@@ -163,7 +173,17 @@ class FieldOutput:
 
     @abaqus_method_doc
     def __init__(self, *args, **kwargs):
-        ...
+        if args and isinstance(args[0], FieldOutput) or "field" in kwargs:
+            field = kwargs.pop("field") if "field" in kwargs else args[0]
+            self.__dict__.update(field.__dict__)
+            self.bulkDataBlocks = list(field.bulkDataBlocks)
+            args = args[1:]
+            keys: tuple = ("name", "description")
+        else:
+            self.bulkDataBlocks = []
+            keys = ("name", "description", "type", "componentLabels", "validInvariants", "isEngineeringTensor")
+        self.__dict__.update({key: value for key, value in zip(keys, args) if value != ""})
+        self.__dict__.update({key: value for key, value in kwargs.items() if value != ""})
 
     @overload
     def addData(
@@ -314,10 +334,64 @@ class FieldOutput:
 
     @abaqus_method_doc
     def addData(self, *args, **kwargs):
-        ...
+        import numpy as np
+
+        if args and isinstance(args[0], FieldOutput) or "field" in kwargs:
+            field = kwargs["field"] if "field" in kwargs else args[0]
+            self.bulkDataBlocks = self.bulkDataBlocks + field.bulkDataBlocks
+            return
+        if len(args) > 1 and isinstance(args[1], OdbSet) or "set" in kwargs:
+            keys: tuple = ("position", "set", "data", "sectionPoint", "conjugateData")
+        else:
+            keys = ("position", "instance", "labels", "data", "sectionPoint", "localCoordSystem")
+        kwargs.update(zip(keys, args))
+        position, data = kwargs["position"], np.asarray(kwargs["data"])
+        if "set" in kwargs:
+            odbSet = kwargs["set"]
+            members = odbSet.nodes if position == C.NODAL else odbSet.elements
+            labels = np.array([member.label for member in members], dtype=int)
+            instances = list(odbSet.instances.values()) if isinstance(odbSet.instances, dict) else []
+            if "instance" in kwargs:
+                instance = kwargs["instance"]
+            elif len(instances) == 1:
+                instance = instances[0]
+            else:
+                raise ValueError(f"The set {odbSet.name} of addData is not the set of a single instance")
+        else:
+            labels, instance = np.asarray(kwargs["labels"], dtype=int), kwargs["instance"]
+
+        block = FieldBulkData()
+        block.position, block.type, block.instance = position, getattr(self, "type", C.SCALAR), instance
+        block.sectionPoint = kwargs.get("sectionPoint")
+        block.componentLabels = tuple(self.componentLabels)
+        block.data = data.reshape(len(data), -1).astype(float, copy=False) if data.size else data.reshape(0, 1)
+        if kwargs.get("conjugateData") is not None:
+            block.conjugateData = np.asarray(kwargs["conjugateData"], dtype=float).reshape(block.data.shape)
+        if len(labels) and len(block.data) % len(labels) or not len(labels) and len(block.data):
+            raise ValueError(f"The {len(block.data)} rows of data do not match the {len(labels)} labels")
+        if position == C.NODAL and len(block.data) != len(labels):
+            raise ValueError(f"The {len(block.data)} rows of nodal data do not match the {len(labels)} labels")
+        system = kwargs.get("localCoordSystem")
+        if system is not None and len(system):
+            if block.type == C.SCALAR:
+                raise ValueError("Transformation not allowed for scalar data")
+            matrices = np.asarray(system, dtype=float)
+            matrices = np.broadcast_to(matrices, (len(block.data), 3, 3)) if matrices.shape == (3, 3) else matrices
+            if matrices.shape != (len(block.data), 3, 3):
+                raise ValueError("The local coordinate systems must be a 3 x 3 matrix or one matrix per row of data")
+            # The direction cosines are transposed before they are stored, as quaternions
+            block.localCoordSystem = _quaternions(np.swapaxes(matrices, 1, 2))
+        repeats = len(block.data) // len(labels) if len(labels) else 0
+        if position == C.NODAL:
+            block.nodeLabels = labels
+        else:
+            block.elementLabels = np.repeat(labels, repeats)
+            if position == C.INTEGRATION_POINT:
+                block.integrationPoints = np.tile(np.arange(1, repeats + 1), len(labels))
+        self.bulkDataBlocks = self.bulkDataBlocks + [block]
 
     @overload
-    def getScalarField(self, invariant: SymbolicConstant):
+    def getScalarField(self, invariant: SymbolicConstant) -> "FieldOutput":
         """This method generates a scalar field containing the extracted component or calculated invariant
         values. The new field will hold values for the same nodes or elements as the parent field. Abaqus will
         perform this operation on only the real part of the FieldOutput object. The operation is not performed
@@ -339,7 +413,7 @@ class FieldOutput:
 
     @overload
     @abaqus_method_doc
-    def getScalarField(self, componentLabel: str):
+    def getScalarField(self, componentLabel: str) -> "FieldOutput":
         """This method generates a scalar field containing the extracted component or calculated invariant
         values. The new field will hold values for the same nodes or elements as the parent field. Abaqus will
         perform this operation on only the real part of the FieldOutput object. The operation is not performed
@@ -359,7 +433,23 @@ class FieldOutput:
 
     @abaqus_method_doc
     def getScalarField(self, *args, **kwargs):
-        ...
+        from .FieldInvariants import computeInvariants
+
+        selection = args[0] if args else next(iter(kwargs.values()))
+        scalar = FieldOutput(self)
+        scalar.type, scalar.componentLabels, scalar.validInvariants = C.SCALAR, (), ()
+        scalar.bulkDataBlocks = []
+        for block in self.bulkDataBlocks:
+            if isinstance(selection, SymbolicConstant):
+                invariants = computeInvariants(block.data, self.type, self.isEngineeringTensor, (selection,))
+                data = invariants[selection].reshape(-1, 1)
+            else:
+                column = list(self.componentLabels).index(selection)
+                data = block.data[:, column : column + 1]
+            scalar.bulkDataBlocks.append(
+                block._replace(data=data, type=C.SCALAR, componentLabels=(), conjugateData=(), mises=())
+            )
+        return scalar
 
     @overload
     @abaqus_method_doc
@@ -537,7 +627,93 @@ class FieldOutput:
 
     @abaqus_method_doc
     def getSubset(self, *args, **kwargs) -> "FieldOutput":
-        return FieldOutput("", "", C.SCALAR)
+        subset = FieldOutput(self)
+        argument = args[0] if args else next(iter(kwargs.values()), None)
+        if isinstance(argument, FieldLocation):
+            numbers = {sectionPoint.number for sectionPoint in argument.sectionPoints}
+            subset.bulkDataBlocks = [
+                block
+                for block in self.bulkDataBlocks
+                if block.position == argument.position
+                and (not numbers or block.sectionPoint is not None and block.sectionPoint.number in numbers)
+            ]
+            return subset
+        if isinstance(argument, (str, SymbolicConstant, SectionPoint)):
+            subset.bulkDataBlocks = [block for block in self.bulkDataBlocks if self._matches(block, argument)]
+        elif isinstance(argument, (OdbSet, OdbMeshNode, OdbMeshElement, FieldOutput)):
+            blocks = [block._subset(self._regionMask(block, argument)) for block in self.bulkDataBlocks]
+            subset.bulkDataBlocks = [block for block in blocks if block is not None]
+        elif "localCoordSystem" in kwargs or isinstance(argument, (tuple, list)) and isinstance(argument[0], Sequence):
+            import numpy as np
+
+            target = _quaternions(np.asarray(argument, dtype=float).T[None])[0]
+            blocks = [
+                block._subset(np.isclose(np.abs(np.asarray(block.localCoordSystem) @ target), 1.0))
+                for block in self.bulkDataBlocks
+                if block.localCoordSystem is not None
+            ]
+            subset.bulkDataBlocks = [block for block in blocks if block is not None]
+        else:
+            raise TypeError(f"Invalid subset argument: {argument!r}")
+        return subset
+
+    @staticmethod
+    def _matches(block: FieldBulkData, selection: str | SymbolicConstant | SectionPoint) -> bool:
+        """Whether a block matches a position, a section point or an element type."""
+        if isinstance(selection, SectionPoint):
+            return block.sectionPoint is not None and block.sectionPoint.number == selection.number
+        if isinstance(selection, SymbolicConstant):
+            return block.position == selection
+        return block.baseElementType == selection
+
+    @staticmethod
+    def _regionMask(block: FieldBulkData, region: OdbSet | OdbMeshNode | OdbMeshElement | FieldOutput) -> np.ndarray:
+        """The mask of the rows of a block located in a region."""
+        import numpy as np
+
+        nodal = block.position == C.NODAL
+        labels = block.nodeLabels if nodal else block.elementLabels
+        if isinstance(region, FieldOutput):
+            selected = [
+                other.nodeLabels if nodal else other.elementLabels
+                for other in region.bulkDataBlocks
+                if other.instance is block.instance
+            ]
+            return np.isin(labels, np.concatenate(selected) if selected else [])
+        attribute = "nodes" if nodal else "elements"
+        if isinstance(region, OdbSet):
+            members = getattr(region, attribute)
+            if region.instanceNames and members and not isinstance(members[0], (OdbMeshNode, OdbMeshElement)):
+                # An assembly-level set holds a sequence of members for each of its instances
+                if block.instance.name not in region.instanceNames:
+                    return np.zeros(len(labels), dtype=bool)
+                members = members[region.instanceNames.index(block.instance.name)]
+            elif region.instanceNames and block.instance.name not in region.instanceNames:
+                return np.zeros(len(labels), dtype=bool)
+            owned = [member.label for member in members if FieldOutput._owns(block.instance, attribute, member)]
+            return np.isin(labels, owned)
+        if isinstance(region, (OdbMeshNode, OdbMeshElement)) and isinstance(region, OdbMeshNode) == nodal:
+            if FieldOutput._owns(block.instance, attribute, region):
+                return np.asarray(labels) == region.label
+        return np.zeros(len(labels), dtype=bool)
+
+    @staticmethod
+    def _owns(instance: OdbInstance, attribute: str, member: OdbMeshNode | OdbMeshElement) -> bool:
+        """Whether a node or an element belongs to an instance, from the instance name of an element, or else from
+        the nodes or elements of the instance. A member is assumed to belong to an instance without nodes or
+        elements, whose mesh is not loaded."""
+        from ..Mesh.MeshArrayCache import labelIndexOf
+
+        instanceName = getattr(member, "instanceName", "")
+        if instanceName:
+            return instanceName == instance.name
+        entities = getattr(instance, attribute)
+        if not len(entities):
+            return True
+        if member.label is None:
+            return False
+        index = labelIndexOf(instance, attribute, entities).index(member.label)
+        return index >= 0 and entities[index] is member
 
     @overload
     def getTransformedField(self, datumCsys: str, projected22Axis: int | None = None, projectionTol: str = ""):
@@ -701,6 +877,23 @@ class FieldOutput:
         """
         ...
 
+    def asArrays(self) -> FieldArrays:
+        """This method returns the data of the field as contiguous NumPy arrays, without creating a FieldValue object
+        per output location.
+
+        .. note::
+            This method requires NumPy. The arrays of a field with a single bulk data block, or of a subset of it
+            selecting contiguous rows, are views of the data of the block.
+
+        Returns
+        -------
+        FieldArrays
+            A FieldArrays object.
+        """
+        from .FieldArrays import FieldArrays
+
+        return FieldArrays(self.bulkDataBlocks, self.componentLabels)
+
     @abaqus_method_doc
     def setComponentLabels(self, componentLabels: tuple):
         """This method sets the component labels for the FieldOutput object.
@@ -714,7 +907,7 @@ class FieldOutput:
             is **name** with the suffixes ('1', '2', '3'). If **type** = SCALAR, the default value is an
             empty sequence.
         """
-        ...
+        self.componentLabels = tuple(componentLabels)
 
     @abaqus_method_doc
     def setDataType(
@@ -738,7 +931,7 @@ class FieldOutput:
             TENSOR_3D_FULL, TENSOR_3D_PLANAR, TENSOR_3D_SURFACE, TENSOR_2D_PLANAR, and
             TENSOR_2D_SURFACE.
         """
-        ...
+        self.type = type
 
     @abaqus_method_doc
     def setValidInvariants(
@@ -780,4 +973,32 @@ class FieldOutput:
 
             The default value is an empty sequence.
         """
-        ...
+        self.validInvariants = validInvariants
+
+
+def _quaternions(matrices: np.ndarray) -> np.ndarray:
+    """Convert an (N, 3, 3) array of rotation matrices to an (N, 4) array of quaternions in the form (q, q0)."""
+    import numpy as np
+
+    m = matrices
+    trace = np.trace(m, axis1=1, axis2=2)
+    case = np.argmax(np.stack([trace, m[:, 0, 0], m[:, 1, 1], m[:, 2, 2]], axis=1), axis=1)
+    sign = np.array([[1, 1, 1], [1, -1, -1], [-1, 1, -1], [-1, -1, 1]])[case]
+    scale = 2 * np.sqrt(np.maximum(1 + (sign * np.stack([m[:, 0, 0], m[:, 1, 1], m[:, 2, 2]], axis=1)).sum(1), 0))
+    # Each quaternion is computed from its largest component, selected by case: the component is a quarter of the
+    # scale, and the other components are sums or differences of off-diagonal terms divided by the scale
+    terms = np.stack(
+        [
+            m[:, 2, 1] - m[:, 1, 2],
+            m[:, 0, 2] - m[:, 2, 0],
+            m[:, 1, 0] - m[:, 0, 1],
+            m[:, 0, 1] + m[:, 1, 0],
+            m[:, 0, 2] + m[:, 2, 0],
+            m[:, 1, 2] + m[:, 2, 1],
+        ],
+        axis=1,
+    )
+    layout = np.array([[0, 1, 2, -1], [-1, 3, 4, 0], [3, -1, 5, 1], [4, 5, -1, 2]])[case]
+    rows = np.arange(len(m))[:, None]
+    quaternions = np.where(layout >= 0, terms[rows, np.maximum(layout, 0)] / scale[:, None], scale[:, None] / 4)
+    return quaternions / np.linalg.norm(quaternions, axis=1, keepdims=True)
@@ -1,3 +1,7 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from typing_extensions import Literal
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
@@ -8,9 +12,11 @@ from ..Canvas.Displayable import Displayable
 from ..Filter.FilterOdb import FilterOdb
 from ..Material.MaterialOdb import MaterialOdb
 from ..UtilityAndView.SymbolicConstant import abaqusConstants as C
-from .OdbPart import OdbPart
-from .OdbStep import OdbStep
-from .SectionCategory import SectionCategory
+
+if TYPE_CHECKING:
+    from .OdbPart import OdbPart
+    from .OdbStep import OdbStep
+    from .SectionCategory import SectionCategory
 
 
 @abaqus_class_doc
@@ -54,6 +60,8 @@ class Odb(AmplitudeOdb, FilterOdb, MaterialOdb, BeamSectionProfileOdb, Displayab
         OdbPart
             An OdbPart object.
         """
+        from .OdbPart import OdbPart
+
         self.parts[name] = odbPart = OdbPart(name, embeddedSpace, type)
         return odbPart
 
@@ -158,6 +166,8 @@ class Odb(AmplitudeOdb, FilterOdb, MaterialOdb, BeamSectionProfileOdb, Displayab
         ValueError
             previousStepName is invalid, If **previousStepName** is invalid.
         """
+        from .OdbStep import OdbStep
+
         self.steps[name] = odbStep = OdbStep(
             name,
             description,
@@ -190,5 +200,7 @@ class Odb(AmplitudeOdb, FilterOdb, MaterialOdb, BeamSectionProfileOdb, Displayab
         SectionCategory
             A SectionCategory object.
         """
+        from .SectionCategory import SectionCategory
+
         self.sectionCategories[name] = sectionCategory = SectionCategory(name, description)
         return sectionCategory
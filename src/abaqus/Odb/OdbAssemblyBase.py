@@ -172,7 +172,21 @@ class OdbAssemblyBase:
         OdbError
             Connectivity array must be provided for all element, If length of label array does not match connectivity data length.
         """
-        ...
+        from ..Mesh.BulkMesh import addElements
+        from .OdbMeshElement import OdbMeshElement
+
+        elements = addElements(
+            self,
+            OdbMeshElement,
+            labels,
+            connectivity,
+            type=type,
+            instanceNames=tuple(instanceNames),
+            sectionCategory=sectionCategory,
+        )
+        if elementSetName:
+            self.elementSets[elementSetName] = elementSet = OdbSet(elementSetName, [])
+            elementSet.elements = elements
 
     @abaqus_method_doc
     def addNodes(self, labels: tuple, coordinates: tuple, nodeSetName: str | None = None):
@@ -195,7 +209,12 @@ class OdbAssemblyBase:
         OdbError
             Node location specification does not correspond to part dimensions, If width of coordinate array does not match assembly dimension.
         """
-        ...
+        from ..Mesh.BulkMesh import addNodes
+        from .OdbMeshNode import OdbMeshNode
+
+        nodes = addNodes(self, OdbMeshNode, labels, coordinates)
+        if nodeSetName:
+            self.nodeSets[nodeSetName] = OdbSet(nodeSetName, nodes)
 
     @abaqus_method_doc
     def RigidBody(
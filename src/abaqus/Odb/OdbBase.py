@@ -1,24 +1,29 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from typing_extensions import Literal
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
+from abqpy.lazy import lazy_attribute
 
-from ..Amplitude.Amplitude import Amplitude
-from ..BeamSectionProfile.Profile import Profile
-from ..CustomKernel.RepositorySupport import RepositorySupport
-from ..Filter.Filter import Filter
-from ..Material.Material import Material
-from ..Section.Section import Section
 from ..UtilityAndView.abaqusConstants import CLOSEST, OFF, Boolean
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
-from .JobData import JobData
-from .OdbAssembly import OdbAssembly
-from .OdbPart import OdbPart
-from .OdbStep import OdbStep
-from .SectionCategory import SectionCategory
-from .SectorDefinition import SectorDefinition
-from .UserData import UserData
+
+if TYPE_CHECKING:
+    from ..Amplitude.Amplitude import Amplitude
+    from ..BeamSectionProfile.Profile import Profile
+    from ..CustomKernel.RepositorySupport import RepositorySupport
+    from ..Filter.Filter import Filter
+    from ..Material.Material import Material
+    from ..Section.Section import Section
+    from .JobData import JobData
+    from .OdbAssembly import OdbAssembly
+    from .OdbPart import OdbPart
+    from .OdbStep import OdbStep
+    from .SectionCategory import SectionCategory
+    from .SectorDefinition import SectorDefinition
+    from .UserData import UserData
 
 
 @abaqus_class_doc
@@ -42,10 +47,10 @@ class OdbBase:
     filters: dict[str, Filter] = {}
 
     #: An OdbAssembly object.
-    rootAssembly: OdbAssembly = OdbAssembly()
+    rootAssembly: OdbAssembly = lazy_attribute(".OdbAssembly", "OdbAssembly")
 
     #: A JobData object.
-    jobData: JobData = JobData()
+    jobData: JobData = lazy_attribute(".JobData", "JobData")
 
     #: A repository of OdbPart objects.
     parts: dict[str, OdbPart] = {}
@@ -63,13 +68,13 @@ class OdbBase:
     sectionCategories: dict[str, SectionCategory] = {}
 
     #: A SectorDefinition object.
-    sectorDefinition: SectorDefinition = SectorDefinition()
+    sectorDefinition: SectorDefinition = lazy_attribute(".SectorDefinition", "SectorDefinition")
 
     #: A UserData object.
-    userData: UserData = UserData()
+    userData: UserData = lazy_attribute(".UserData", "UserData")
 
     #: A RepositorySupport object.
-    customData: RepositorySupport = RepositorySupport()
+    customData: RepositorySupport = lazy_attribute("..CustomKernel.RepositorySupport", "RepositorySupport")
 
     #: A repository of Profile objects.
     profiles: dict[str, Profile] = {}
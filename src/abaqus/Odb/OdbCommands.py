@@ -4,8 +4,9 @@ from typing import Sequence
 
 from abqpy.decorators import abaqus_function_doc
 
-from ..UtilityAndView.abaqusConstants import OFF, Boolean
+from ..UtilityAndView.abaqusConstants import OFF, Boolean, SymbolicConstant
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
+from .FieldEnvelope import FieldEnvelope
 from .FieldOutput import FieldOutput
 from .Odb import Odb
 from .OdbSequenceAnalyticSurfaceSegment import OdbSequenceAnalyticSurfaceSegment
@@ -54,12 +55,23 @@ def isUpgradeRequiredForOdb(upgradeRequiredOdbPath: str):
 
 
 @abaqus_function_doc
-def maxEnvelope() -> Sequence[tuple[FieldOutput, FieldOutput]]:
+def maxEnvelope(
+    fieldList: Sequence[FieldOutput], invariantOrComponentLabel: SymbolicConstant | str | None = None
+) -> tuple[FieldOutput, FieldOutput]:
     """Retrieve the maximum value of an output variable over a number of fields.
 
+    Parameters
+    ----------
+    fieldList
+        A sequence of FieldOutput objects with values at the same locations, such as the fields of an output
+        variable in a number of frames or load cases.
+    invariantOrComponentLabel
+        A SymbolicConstant specifying the invariant or a String specifying the component label to compare, such as
+        MISES or "S11". It is required if the fields are not scalar fields.
+
     Returns
     -------
-    Sequence[FieldOutput]
+    tuple[FieldOutput, FieldOutput]
         A sequence of two fieldOutput objects. The first fieldOutput object contains the maximum
         value. The second fieldOutput object contains the index of the field containing the
         maximum value. The index follows the order in which fields are positioned in the list of
@@ -71,16 +83,27 @@ def maxEnvelope() -> Sequence[tuple[FieldOutput, FieldOutput]]:
     TypeError
         This function takes no keyword arguments.
     """
-    return ((FieldOutput("", "", C.SCALAR), FieldOutput("", "", C.SCALAR)),)
+    return FieldEnvelope(True, invariantOrComponentLabel).add(fieldList).getFields()
 
 
 @abaqus_function_doc
-def minEnvelope() -> Sequence[tuple[FieldOutput, FieldOutput]]:
+def minEnvelope(
+    fieldList: Sequence[FieldOutput], invariantOrComponentLabel: SymbolicConstant | str | None = None
+) -> tuple[FieldOutput, FieldOutput]:
     """Retrieve the minimum value of an output variable over a number of fields.
 
+    Parameters
+    ----------
+    fieldList
+        A sequence of FieldOutput objects with values at the same locations, such as the fields of an output
+        variable in a number of frames or load cases.
+    invariantOrComponentLabel
+        A SymbolicConstant specifying the invariant or a String specifying the component label to compare, such as
+        MISES or "S11". It is required if the fields are not scalar fields.
+
     Returns
     -------
-    Sequence[tuple[FieldOutput, FieldOutput]]
+    tuple[FieldOutput, FieldOutput]
         A sequence of two fieldOutput objects. The first fieldOutput object contains the minimum
         value. The second fieldOutput object contains the index of the field containing the
         minimum value. The index follows the order in which fields are positioned in the list of
@@ -92,7 +115,7 @@ def minEnvelope() -> Sequence[tuple[FieldOutput, FieldOutput]]:
     TypeError
         This function takes no keyword arguments.
     """
-    return ((FieldOutput("", "", C.SCALAR), FieldOutput("", "", C.SCALAR)),)
+    return FieldEnvelope(False, invariantOrComponentLabel).add(fieldList).getFields()
 
 
 @abaqus_function_doc
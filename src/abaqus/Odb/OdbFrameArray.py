@@ -1,7 +1,53 @@
 from __future__ import annotations
 
-from typing import List
+from typing import Callable, List, Sequence, Union, overload
 
 from .OdbFrame import OdbFrame
 
 OdbFrameArray = List[OdbFrame]
+
+
+class OdbFrameSequence(Sequence[OdbFrame]):
+    """The OdbFrameSequence object is a sequence of OdbFrame objects which are read on demand.
+
+    Each frame is read when it is accessed and is not kept by the sequence, so that a step whose **frames** member
+    is an OdbFrameSequence object only keeps in memory the frames referenced by the caller, see
+    :meth:`~abaqus.Odb.OdbStepBase.OdbStepBase.iterFrames`.
+
+    .. note::
+        This object is not part of the Abaqus Scripting Interface. It can be assigned to the frames of a step, for
+        example::
+
+            step.frames = OdbFrameSequence(len(increments), lambda index: readFrame(increments[index]))
+    """
+
+    def __init__(self, length: int, read: Callable[[int], OdbFrame]):
+        """This method creates an OdbFrameSequence object.
+
+        Parameters
+        ----------
+        length
+            An Int specifying the number of frames.
+        read
+            A callable reading the frame at a non-negative index of the sequence.
+        """
+        self._length = length
+        self._read = read
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> OdbFrame:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[OdbFrame]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[OdbFrame, List[OdbFrame]]:
+        if isinstance(index, slice):
+            return [self._read(position) for position in range(*index.indices(self._length))]
+        if not -self._length <= index < self._length:
+            raise IndexError("frame index out of range")
+        return self._read(index % self._length)
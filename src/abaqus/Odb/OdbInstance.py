@@ -4,6 +4,7 @@ from typing import Sequence
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
+from ..Mesh.MeshArrayCache import labelIndexOf
 from .OdbInstanceBase import OdbInstanceBase
 from .OdbMeshNode import OdbMeshNode
 from .OdbSet import OdbSet
@@ -37,4 +38,68 @@ class OdbInstance(OdbInstanceBase):
             An OdbSet object.
         """
         self.nodeSets[name] = odbSet = OdbSet(name, nodes)
+        odbSet.instances = {self.name: self}
+        return odbSet
+
+    @abaqus_method_doc
+    def NodeSetFromNodeLabels(self, name: str, nodeLabels: Sequence[int]) -> OdbSet:
+        """This method creates a node set from a sequence of node labels.
+
+        .. note::
+            This function can be accessed by::
+
+                session.odbs[name].rootAssembly.instances[name].NodeSetFromNodeLabels
+
+        Parameters
+        ----------
+        name
+            A String specifying the name of the set and the repository key.
+        nodeLabels
+            A sequence of Ints specifying the node labels.
+
+        Returns
+        -------
+        OdbSet
+            An OdbSet object.
+
+        Raises
+        ------
+        KeyError
+            Invalid node label, If no node with one of the specified labels exists.
+        """
+        positions = labelIndexOf(self, "nodes", self.nodes).require(nodeLabels, "node label")
+        self.nodeSets[name] = odbSet = OdbSet(name, [self.nodes[index] for index in positions.tolist()])
+        odbSet.instances = {self.name: self}
+        return odbSet
+
+    @abaqus_method_doc
+    def ElementSetFromElementLabels(self, name: str, elementLabels: Sequence[int]) -> OdbSet:
+        """This method creates an element set from a sequence of element labels.
+
+        .. note::
+            This function can be accessed by::
+
+                session.odbs[name].rootAssembly.instances[name].ElementSetFromElementLabels
+
+        Parameters
+        ----------
+        name
+            A String specifying the name of the set and the repository key.
+        elementLabels
+            A sequence of Ints specifying the element labels.
+
+        Returns
+        -------
+        OdbSet
+            An OdbSet object.
+
+        Raises
+        ------
+        KeyError
+            Invalid element label, If no element with one of the specified labels exists.
+        """
+        positions = labelIndexOf(self, "elements", self.elements).require(elementLabels, "element label")
+        self.elementSets[name] = odbSet = OdbSet(name, [])
+        odbSet.elements = [self.elements[index] for index in positions.tolist()]
+        odbSet.instances = {self.name: self}
         return odbSet
@@ -6,6 +6,7 @@ from typing_extensions import Literal
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
+from ..Mesh.MeshArrayCache import labelIndexOf
 from ..Property.MaterialOrientationArray import MaterialOrientationArray
 from ..Property.SectionAssignmentArray import SectionAssignmentArray
 from ..Section.Section import Section
@@ -127,7 +128,7 @@ class OdbInstanceBase:
         OdbInstance
             An OdbInstance object.
         """
-        ...
+        self.name = name
 
     @abaqus_method_doc
     def assignBeamOrientation(self, region: str, method: Literal[C.N1_COSINES], vector: tuple):
@@ -221,10 +222,13 @@ class OdbInstanceBase:
 
         Raises
         ------
-        OdbError
+        KeyError
             Invalid element label, If no element with the specified label exists.
         """
-        ...
+        index = labelIndexOf(self, "elements", self.elements).index(label)
+        if index < 0:
+            raise KeyError(f"Invalid element label: {label}")
+        return self.elements[index]
 
     @abaqus_method_doc
     def getNodeFromLabel(self, label: int):
@@ -242,10 +246,13 @@ class OdbInstanceBase:
 
         Raises
         ------
-        OdbError
+        KeyError
             Invalid node label, If no node with the specified label exists.
         """
-        ...
+        index = labelIndexOf(self, "nodes", self.nodes).index(label)
+        if index < 0:
+            raise KeyError(f"Invalid node label: {label}")
+        return self.nodes[index]
 
     @abaqus_method_doc
     def assignSection(self, region: str, section: Section):
@@ -4,6 +4,7 @@ from typing_extensions import Literal
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
+from ..Mesh.BulkMesh import bulkMember
 from ..UtilityAndView.abaqusConstants import CLOSEST
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
 from .SectionCategory import SectionCategory
@@ -49,7 +50,7 @@ class OdbMeshElement:
     #: node cannot be ascertained. This is a limitation. It is important to note the difference
     #: with MeshElement object of MDB where the connectivity is node indices instead of node
     #: labels.
-    connectivity: int | None = None
+    connectivity: int | None = bulkMember(None)
 
     #: A tuple of Strings specifying the instance names for nodes in the element connectivity.
     instanceNames: tuple = ()
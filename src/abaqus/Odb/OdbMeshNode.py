@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from abqpy.decorators import abaqus_class_doc
 
+from ..Mesh.BulkMesh import bulkMember
+
 
 @abaqus_class_doc
 class OdbMeshNode:
@@ -30,4 +32,4 @@ class OdbMeshNode:
 
     #: A tuple of Floats specifying the nodal coordinates in the global Cartesian coordinate
     #: system.
-    coordinates: float | None = None
+    coordinates: float | None = bulkMember(None)
@@ -157,7 +157,32 @@ class OdbPartBase:
 
     @abaqus_method_doc
     def addElements(self, *args, **kwargs):
-        ...
+        import numpy as np
+
+        from ..Mesh.BulkMesh import addElements
+        from .OdbMeshElement import OdbMeshElement
+
+        def fromLabels(
+            labels, connectivity, type: str, elementSetName: str = "", sectionCategory: SectionCategory | None = None
+        ):
+            return labels, connectivity, type, elementSetName, sectionCategory
+
+        def fromData(
+            elementData, type: str, elementSetName: str | None = None, sectionCategory: SectionCategory | None = None
+        ):
+            elementData = np.asarray(elementData, dtype=np.int64)
+            if elementData.ndim != 2 or elementData.shape[1] < 2:
+                raise ValueError("Connectivity array must be provided for all elements")
+            return elementData[:, 0], elementData[:, 1:], type, elementSetName, sectionCategory
+
+        data = "elementData" in kwargs or (isinstance(args[1], str) if len(args) > 1 else "connectivity" not in kwargs)
+        labels, connectivity, type, elementSetName, sectionCategory = (fromData if data else fromLabels)(
+            *args, **kwargs
+        )
+        elements = addElements(self, OdbMeshElement, labels, connectivity, type=type, sectionCategory=sectionCategory)
+        if elementSetName:
+            self.elementSets[elementSetName] = elementSet = OdbSet(elementSetName, [])
+            elementSet.elements = elements
 
     @overload
     def addNodes(self, labels: tuple, coordinates: tuple, nodeSetName: str | None = None):
@@ -194,7 +219,30 @@ class OdbPartBase:
 
     @abaqus_method_doc
     def addNodes(self, *args, **kwargs):
-        ...
+        import numpy as np
+
+        from ..Mesh.BulkMesh import addNodes
+        from .OdbMeshNode import OdbMeshNode
+
+        def fromLabels(labels, coordinates, nodeSetName: str | None = None):
+            return labels, coordinates, nodeSetName
+
+        def fromData(nodeData, nodeSetName: str | None = None):
+            nodeData = np.asarray(nodeData, dtype=np.float64)
+            if nodeData.ndim != 2 or nodeData.shape[1] < 2:
+                raise ValueError("Number of node labels and coordinates does not match")
+            labels = nodeData[:, 0].astype(np.int64)
+            if np.any(labels != nodeData[:, 0]):
+                raise ValueError("Node labels must be Ints")
+            return labels, nodeData[:, 1:], nodeSetName
+
+        data = "nodeData" in kwargs or (
+            isinstance(args[1], (str, type(None))) if len(args) > 1 else "coordinates" not in kwargs
+        )
+        labels, coordinates, nodeSetName = (fromData if data else fromLabels)(*args, **kwargs)
+        nodes = addNodes(self, OdbMeshNode, labels, coordinates)
+        if nodeSetName:
+            self.nodeSets[nodeSetName] = OdbSet(nodeSetName, nodes)
 
     def assignBeamOrientation(self, region: str, method: Literal[C.N1_COSINES], vector: tuple):
         """This method assigns a beam section orientation to a region of a part instance.
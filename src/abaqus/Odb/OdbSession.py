@@ -1,9 +1,15 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ..Session.SessionBase import SessionBase
 from ..UtilityAndView.abaqusConstants import OFF, Boolean
-from .Odb import Odb
-from .ScratchOdb import ScratchOdb
+
+if TYPE_CHECKING:
+    from .Odb import Odb
+    from .ScratchOdb import ScratchOdb
 
 
 @abaqus_class_doc
@@ -27,6 +33,8 @@ class OdbSession(SessionBase):
         ScratchOdb
             A ScratchOdb object.
         """
+        from .ScratchOdb import ScratchOdb
+
         self.scratchOdbs["odb"] = scratchOdb = ScratchOdb(odb)
         return scratchOdb
 
@@ -72,6 +80,8 @@ class OdbSession(SessionBase):
         AbaqusError: Cannot open file <filename>
             If the file is not a valid database.
         """
+        from .Odb import Odb
+
         self.odbs[name] = odb = Odb(name)
         return odb
 
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
-from typing import Sequence
+from typing import TYPE_CHECKING, Sequence
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
+from ..Mesh.MeshArrayCache import labelIndexOf
 from ..UtilityAndView.abaqusConstants import OFF, Boolean, SymbolicConstant
 from .OdbMeshElement import OdbMeshElement
 from .OdbMeshElementArray import OdbMeshElementArray
 from .OdbMeshNode import OdbMeshNode
 from .OdbMeshNodeArray import OdbMeshNodeArray
 
+if TYPE_CHECKING:
+    from .OdbInstance import OdbInstance
+
 
 @abaqus_class_doc
 class OdbSet:
@@ -56,7 +60,7 @@ class OdbSet:
     #:
     #: .. versionadded:: 2020
     #:     The ``instances`` attribute was added.
-    instances: str = ""
+    instances: dict[str, OdbInstance] = {}
 
     #: A Boolean specifying whether the set is internal.
     #:
@@ -89,10 +93,11 @@ class OdbSet:
         OdbSet
             An OdbSet object.
         """
-        ...
+        self.name = name
+        self.nodes = list(nodes)
 
     @abaqus_method_doc
-    def NodeSetFromNodeLabels(self, name: str, nodeLabels: tuple):
+    def NodeSetFromNodeLabels(self, name: str, nodeLabels: tuple) -> OdbSet:
         """This method creates a node set from a sequence of node labels.
 
         .. note::
@@ -115,8 +120,13 @@ class OdbSet:
         -------
         OdbSet
             An OdbSet object.
+
+        Raises
+        ------
+        KeyError
+            If a label is not the label of one of the nodes of the set.
         """
-        ...
+        return self._fromLabels(name, "nodes", nodeLabels, "node label")
 
     @abaqus_method_doc
     def ElementSet(self, name: str, elements: Sequence[OdbMeshElement]):
@@ -147,7 +157,7 @@ class OdbSet:
         ...
 
     @abaqus_method_doc
-    def ElementSetFromElementLabels(self, name: str, elementLabels: tuple):
+    def ElementSetFromElementLabels(self, name: str, elementLabels: tuple) -> OdbSet:
         """This method creates an element set from a sequence of element labels.
 
         .. note::
@@ -170,8 +180,13 @@ class OdbSet:
         -------
         OdbSet
             An OdbSet object.
+
+        Raises
+        ------
+        KeyError
+            If a label is not the label of one of the elements of the set.
         """
-        ...
+        return self._fromLabels(name, "elements", elementLabels, "element label")
 
     @abaqus_method_doc
     def MeshSurface(self, name: str, meshSurfaces: tuple):
@@ -274,3 +289,23 @@ class OdbSet:
             An OdbSet object.
         """
         ...
+
+    def _fromLabels(self, name: str, attribute: str, labels: Sequence, kind: str) -> OdbSet:
+        """Return a set of the nodes or elements of the set with some labels, given for each part instance as pairs
+        of an instance name and a sequence of labels if the set spans more than one part instance."""
+        members = getattr(self, attribute)
+        odbSet = OdbSet(name, [])
+        if not isinstance(next(iter(labels), None), (tuple, list)):
+            positions = labelIndexOf(self, attribute, members).require(labels, kind)
+            setattr(odbSet, attribute, [members[index] for index in positions.tolist()])
+            return odbSet
+        selected = []
+        for instanceName, instanceLabels in labels:
+            if instanceName not in self.instanceNames:
+                raise KeyError(f"Invalid instance name: {instanceName}")
+            instance = self.instanceNames.index(instanceName)
+            positions = labelIndexOf(self, f"{attribute}[{instance}]", members[instance]).require(instanceLabels, kind)
+            selected.append([members[instance][index] for index in positions.tolist()])
+        odbSet.instanceNames = tuple(instanceName for instanceName, _ in labels)
+        setattr(odbSet, attribute, selected)
+        return odbSet
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import overload
+from typing import Iterator, Sequence, overload
 
 from typing_extensions import Literal
 
@@ -286,6 +286,73 @@ class OdbStepBase:
         """
         return HistoryRegion("", "", point)
 
+    def iterFrames(
+        self, variables: Sequence[str] = (), prefetch: int = 0, release: Boolean = OFF
+    ) -> Iterator[tuple[OdbFrame, dict[str, FieldOutput]]]:
+        """This method iterates over the frames of the step and yields the requested field outputs of one frame at
+        a time.
+
+        The iterator only references the frame being processed and the frames read ahead. When **frames** is an
+        :class:`~abaqus.Odb.OdbFrameArray.OdbFrameSequence` object, the frames are read on demand and are not kept
+        by the step, so that the memory used does not grow with the number of frames as long as the caller does not
+        keep the yielded objects. When **frames** is a list, the frames are already in memory and **release** removes
+        the field outputs of each frame from the frame once the iterator moves to the next frame.
+
+        .. note::
+            This method is not part of the Abaqus Scripting Interface.
+
+        Parameters
+        ----------
+        variables
+            A sequence of Strings specifying the output variables to read, such as ("S", "U"). Variables that are
+            not output in a frame are skipped. The default value is an empty sequence, which reads all the field
+            outputs of the frames.
+        prefetch
+            An Int specifying the number of frames to read ahead in a background thread while the current frame is
+            processed. The default value is 0, which reads the frames in the calling thread.
+        release
+            A Boolean specifying whether to remove the field outputs of each frame from the frame once the iterator
+            moves to the next frame. The released field outputs cannot be read again from the frame. The default
+            value is OFF.
+
+        Yields
+        ------
+        OdbFrame
+            An OdbFrame object.
+        dict[str, FieldOutput]
+            A dictionary of the requested FieldOutput objects of the frame, keyed by the output variable.
+        """
+
+        def read(index: int) -> tuple[OdbFrame, dict[str, FieldOutput]]:
+            frame = self.frames[index]
+            names = variables or list(frame.fieldOutputs)
+            return frame, {name: frame.fieldOutputs[name] for name in names if name in frame.fieldOutputs}
+
+        def frames() -> Iterator[tuple[OdbFrame, dict[str, FieldOutput]]]:
+            count = len(self.frames)
+            if prefetch <= 0:
+                for index in range(count):
+                    yield read(index)
+                return
+
+            from collections import deque
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                pending = deque(executor.submit(read, index) for index in range(min(prefetch, count)))
+                for index in range(prefetch, count + prefetch):
+                    future = pending.popleft()
+                    if index < count:
+                        pending.append(executor.submit(read, index))
+                    yield future.result()
+                    del future
+
+        for frame, fields in frames():
+            yield frame, fields
+            if release:
+                frame.fieldOutputs = {}
+            del frame, fields
+
     @abaqus_method_doc
     def setDefaultDeformedField(self, field: FieldOutput) -> None:
         """This method sets the default deformed field variable in a step.
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
 from typing_extensions import Literal
 
@@ -29,10 +29,12 @@ from ..UtilityAndView.abaqusConstants import (
     Boolean,
 )
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
-from .BeadTask import BeadTask
-from .ShapeTask import ShapeTask
-from .SizingTask import SizingTask
-from .TopologyTask import TopologyTask
+
+if TYPE_CHECKING:
+    from .BeadTask import BeadTask
+    from .ShapeTask import ShapeTask
+    from .SizingTask import SizingTask
+    from .TopologyTask import TopologyTask
 
 
 @abaqus_class_doc
@@ -159,6 +161,8 @@ class OptimizationTaskModel(ModelBase):
         BeadTask
             A BeadTask object.
         """
+        from .BeadTask import BeadTask
+
         self.optimizationTasks[name] = optimizationTask = BeadTask(
             name,
             abaqusSensitivities,
@@ -402,6 +406,8 @@ class OptimizationTaskModel(ModelBase):
         ShapeTask
             A ShapeTask object.
         """
+        from .ShapeTask import ShapeTask
+
         self.optimizationTasks[name] = optimizationTask = ShapeTask(
             name,
             abaqusSensitivities,
@@ -527,6 +533,8 @@ class OptimizationTaskModel(ModelBase):
         SizingTask
             A SizingTask object.
         """
+        from .SizingTask import SizingTask
+
         self.optimizationTasks[name] = optimizationTask = SizingTask(
             name,
             abaqusSensitivities,
@@ -722,6 +730,8 @@ class OptimizationTaskModel(ModelBase):
         TopologyTask
             A TopologyTask object.
         """
+        from .TopologyTask import TopologyTask
+
         self.optimizationTasks[name] = optimizationTask = TopologyTask(
             name,
             abaqusSensitivities,
@@ -13,7 +13,6 @@ from ..UtilityAndView.abaqusConstants import (
     Boolean,
     SymbolicConstant,
 )
-from .AcisFile import AcisFile
 
 
 @abaqus_class_doc
@@ -58,6 +57,8 @@ class AcisMdb(MdbBase):
         Texterror
             Failed to read ACIS file, The data in the ACIS file are corrupted.
         """
+        from .AcisFile import AcisFile
+
         return AcisFile()
 
     @staticmethod
@@ -99,6 +100,8 @@ class AcisMdb(MdbBase):
         AcisFile
             An AcisFile object.
         """
+        from .AcisFile import AcisFile
+
         return AcisFile()
 
     @staticmethod
@@ -142,6 +145,8 @@ class AcisMdb(MdbBase):
         AcisFile
             An AcisFile object.
         """
+        from .AcisFile import AcisFile
+
         return AcisFile()
 
     @staticmethod
@@ -206,6 +211,8 @@ class AcisMdb(MdbBase):
         Texterror
             Failed to read IGES file, The data in the IGES file are corrupted.
         """
+        from .AcisFile import AcisFile
+
         return AcisFile()
 
     @staticmethod
@@ -235,6 +242,8 @@ class AcisMdb(MdbBase):
         AcisFile
             An AcisFile object.
         """
+        from .AcisFile import AcisFile
+
         return AcisFile()
 
     @staticmethod
@@ -266,6 +275,8 @@ class AcisMdb(MdbBase):
         Texterror
             Failed to read STEP file, The data in the STEP file are corrupted.
         """
+        from .AcisFile import AcisFile
+
         return AcisFile()
 
     @staticmethod
@@ -294,6 +305,8 @@ class AcisMdb(MdbBase):
         Texterror
             Failed to read VDA file, The data in the VDA-FS file are corrupted.
         """
+        from .AcisFile import AcisFile
+
         return AcisFile()
 
     @staticmethod
@@ -330,4 +343,6 @@ class AcisMdb(MdbBase):
         Texterror
             Failed to read Solidworks file, The data in the Solidworks file are corrupted.
         """
+        from .AcisFile import AcisFile
+
         return AcisFile()
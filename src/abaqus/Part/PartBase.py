@@ -629,12 +629,15 @@ class PartBase(PartFeature):
         nodes
             A sequence of (*nodeLabels*, **nodeCoords**) specifying the nodes of the mesh.
             **nodeLabels** is a sequence of Ints specifying the node labels, and **nodeCoords** is a
-            sequence of sequences of three Floats specifying the nodal coordinates.
+            sequence of sequences of three Floats specifying the nodal coordinates. A one-dimensional and a
+            two-dimensional NumPy array can be given instead; a C-contiguous array of float64 coordinates is
+            shared with the part without a copy (see :mod:`~abaqus.Mesh.BulkMesh`).
         elements
             A sequence of sequences of(*meshType*, **elementLabels**, **elementConns**) specifying the
             elements of the mesh. **meshType** is a String specifying the element type.
             **elementlabels** is a sequence of Ints specifying the element labels. **elementConns** is a
-            sequence of sequences of node labels specifying the element connectivity.
+            sequence of sequences of node labels specifying the element connectivity. NumPy arrays can be
+            given instead.
         twist
             A boolean specifying whether the part is defined with twist. This option has meaning
             only when **dimensionality** = AXISYMMETRIC. Possible values are ON and OFF. The default
@@ -644,8 +647,24 @@ class PartBase(PartFeature):
         -------
         part: Part
             A Part object
+
+        Raises
+        ------
+        KeyError
+            If an element refers to a node label that is not in **nodes**.
+        ValueError
+            If a label is repeated, or if the labels and the coordinates or the connectivity do not match.
         """
-        ...
+        from ..Mesh.BulkMesh import addElements, addNodes
+        from .Part import Part
+
+        part = Part(name, dimensionality, type, twist)
+        nodeLabels, nodeCoords = nodes
+        addNodes(part, MeshNode, nodeLabels, nodeCoords)
+        index = part.nodes._labelIndex()
+        for meshType, elementLabels, elementConns in elements:
+            addElements(part, MeshElement, elementLabels, elementConns, index, type=SymbolicConstant(meshType))
+        return part
 
     @abaqus_method_doc
     def PartFromOdb(
@@ -1340,8 +1359,28 @@ class PartBase(PartFeature):
             - UNSUPPORTED_NON_STRUCTURAL_MASS_PROPORTIONAL: Non-structural mass with Mass Proportional
               distribution is not supported. Results are computed using Volume Proportional
               distribution.
+
+        Notes
+        -----
+        The mass properties are computed from the mesh of the part, whose elements are integrated with Gauss
+        rules and cached until the mesh changes, and from the density of the materials of the sections assigned
+        to the elements. The regions without elements, such as the cells, are ignored. The shells are lumped in
+        their mid-surface, and the axisymmetric elements, the beams, the trusses and the point elements are not
+        supported.
         """
-        ...
+        from ..Mesh.MassProperties import massProperties
+        from ..Mesh.MeshQuality import entityPositions
+
+        positions = entityPositions(self.elements, regions, "elements") if regions else None
+        return massProperties(
+            ((self, positions, None),),
+            specifyDensity,
+            float(density) if specifyDensity else 0,
+            specifyThickness,
+            float(thickness) if specifyThickness else 0,
+            miAboutCenterOfMass,
+            miAboutPoint,
+        )
 
     @abaqus_method_doc
     def getFeatureFaces(self, name: str):
@@ -1821,12 +1860,35 @@ class PartBase(PartFeature):
         """This method smooths the given nodes of a native mesh, moving them locally to a more optimal location
         that improves the quality of the mesh.
 
+        Each node is moved to the average of the centroids of the elements around it. The nodes on the boundary
+        of the mesh and the nodes that are not corner nodes of elements with faces are not moved. The quality
+        metrics cached by the part are updated for the elements around the moved nodes only.
+
         Parameters
         ----------
         nodes
             A sequence of MeshNode objects or a Set object containing nodes.
         """
-        ...
+        import numpy as np
+
+        from ..Mesh.MeshQuality import (
+            boundaryNodes,
+            entityPositions,
+            meshQuality,
+            moveNodes,
+        )
+
+        positions = np.unique(entityPositions(self.nodes, nodes, "nodes"))
+        positions = positions[~np.isin(positions, boundaryNodes(self), assume_unique=True)]
+        quality = meshQuality(self)
+        owners, elements = quality.incidence(positions)
+        counts = np.bincount(owners, minlength=len(positions))
+        centroids = quality.centroids(elements)
+        smoothed = np.stack(
+            [np.bincount(owners, centroids[:, axis], minlength=len(positions)) for axis in range(3)], axis=1
+        )
+        moved = counts > 0
+        moveNodes(self, positions[moved], smoothed[moved] / counts[moved, None])
 
     @abaqus_method_doc
     def Lock(self):
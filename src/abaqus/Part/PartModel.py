@@ -1,9 +1,10 @@
+from __future__ import annotations
+
 from typing_extensions import Literal
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ..Model.ModelBase import ModelBase
-from ..Part.Part import Part
 from ..UtilityAndView.abaqusConstants import OFF, Boolean
 from ..UtilityAndView.SymbolicConstant import abaqusConstants as C
 
@@ -53,5 +54,7 @@ class PartModel(ModelBase):
         Part
             A Part object.
         """
+        from ..Part.Part import Part
+
         self.parts[name] = part = Part(name, dimensionality, type, twist)
         return part
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
 from typing_extensions import Literal
 
@@ -8,9 +8,11 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ..Session.SessionBase import SessionBase
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
-from .Path import Path
-from .Spectrum import Spectrum
-from .Stream import Stream
+
+if TYPE_CHECKING:
+    from .Path import Path
+    from .Spectrum import Spectrum
+    from .Stream import Stream
 
 
 @abaqus_class_doc
@@ -108,6 +110,8 @@ class PathSession(SessionBase):
             When **type** = CIRCUMFERENTIAL or RADIAL, the three points specified in
             **expression** are collinear.
         """
+        from .Path import Path
+
         self.paths[name] = path = Path(
             name,
             type,
@@ -144,6 +148,8 @@ class PathSession(SessionBase):
         Spectrum
             A Spectrum object.
         """
+        from .Spectrum import Spectrum
+
         self.spectrums[name] = spectrum = Spectrum(name, colors)
         return spectrum
 
@@ -183,5 +189,7 @@ class PathSession(SessionBase):
         Stream
             A Stream object.
         """
+        from .Stream import Stream
+
         self.streams[name] = stream = Stream(name, numPointsOnRake, pointA, pointB, path)
         return stream
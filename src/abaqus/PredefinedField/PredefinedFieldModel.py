@@ -1,14 +1,12 @@
 from __future__ import annotations
 
-from typing import Sequence, Union
+from typing import TYPE_CHECKING, Sequence, Union
 
 from typing_extensions import Literal
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
-from ..Assembly.PartInstanceArray import PartInstanceArray
 from ..Model.ModelBase import ModelBase
-from ..Region.Region import Region
 from ..UtilityAndView.abaqusConstants import (
     CONSTANT_RATIO,
     CONSTANT_THROUGH_THICKNESS,
@@ -22,17 +20,20 @@ from ..UtilityAndView.abaqusConstants import (
     Boolean,
 )
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
-from .Field import Field
-from .FluidCavityPressure import FluidCavityPressure
-from .InitialState import InitialState
-from .KinematicHardening import KinematicHardening
-from .MaterialAssignment import MaterialAssignment
-from .PorePressure import PorePressure
-from .Saturation import Saturation
-from .Stress import Stress
-from .Temperature import Temperature
-from .Velocity import Velocity
-from .VoidsRatio import VoidsRatio
+
+if TYPE_CHECKING:
+    from ..Assembly.PartInstanceArray import PartInstanceArray
+    from ..Region.Region import Region
+    from .FluidCavityPressure import FluidCavityPressure
+    from .InitialState import InitialState
+    from .KinematicHardening import KinematicHardening
+    from .MaterialAssignment import MaterialAssignment
+    from .PorePressure import PorePressure
+    from .Saturation import Saturation
+    from .Stress import Stress
+    from .Temperature import Temperature
+    from .Velocity import Velocity
+    from .VoidsRatio import VoidsRatio
 
 
 @abaqus_class_doc
@@ -68,6 +69,8 @@ class PredefinedFieldModel(ModelBase):
         FluidCavityPressure
             A FluidCavityPressure object.
         """
+        from .FluidCavityPressure import FluidCavityPressure
+
         self.predefinedFields[name] = predefinedField = FluidCavityPressure(name, fluidCavity, fluidPressure)
         return predefinedField
 
@@ -114,6 +117,8 @@ class PredefinedFieldModel(ModelBase):
         InitialState
             An InitialState object.
         """
+        from .InitialState import InitialState
+
         self.predefinedFields[name] = predefinedField = InitialState(
             name,
             instances,
@@ -178,6 +183,8 @@ class PredefinedFieldModel(ModelBase):
         KinematicHardening
             A KinematicHardening object.
         """
+        from .KinematicHardening import KinematicHardening
+
         self.predefinedFields[name] = predefinedField = KinematicHardening(
             name,
             region,
@@ -240,6 +247,8 @@ class PredefinedFieldModel(ModelBase):
         MaterialAssignment
             A MaterialAssignment object.
         """
+        from .MaterialAssignment import MaterialAssignment
+
         self.predefinedFields[name] = predefinedField = MaterialAssignment(
             name, instanceList, useFields, assignmentList, fieldList, colorList
         )
@@ -314,6 +323,8 @@ class PredefinedFieldModel(ModelBase):
         -------
             A PorePressure object.
         """
+        from .PorePressure import PorePressure
+
         self.predefinedFields[name] = predefinedField = PorePressure(
             name,
             region,
@@ -456,6 +467,8 @@ class PredefinedFieldModel(ModelBase):
         Temperature
             A Temperature object.
         """
+        from .Temperature import Temperature
+
         self.predefinedFields[name] = predefinedField = Temperature(
             name,
             createStepName,
@@ -530,6 +543,8 @@ class PredefinedFieldModel(ModelBase):
         Velocity
             A Velocity object.
         """
+        from .Velocity import Velocity
+
         self.predefinedFields[name] = predefinedField = Velocity(
             name,
             region,
@@ -581,6 +596,8 @@ class PredefinedFieldModel(ModelBase):
         -------
             A Saturation object.
         """
+        from .Saturation import Saturation
+
         self.predefinedFields[name] = predefinedField = Saturation(
             name,
             region,
@@ -640,6 +657,8 @@ class PredefinedFieldModel(ModelBase):
         -------
             A Stress object.
         """
+        from .Stress import Stress
+
         self.predefinedFields[name] = predefinedField = Stress(
             name,
             region,
@@ -779,6 +798,8 @@ class PredefinedFieldModel(ModelBase):
         -------
             A Field object.
         """
+        from .Field import Field
+
         self.predefinedFields[name] = predefinedField = Field(
             name,
             createStepName,
@@ -868,6 +889,8 @@ class PredefinedFieldModel(ModelBase):
         -------
             A VoidsRatio object.
         """
+        from .VoidsRatio import VoidsRatio
+
         self.predefinedFields[name] = predefinedField = VoidsRatio(
             name,
             region,
@@ -142,6 +142,9 @@ class PropertyPart(PartBase):
             A SectionAssignment object
         """
         sectionAssignment = SectionAssignment(region, sectionName, thicknessAssignment, offset, offsetType, offsetField)
+        if "sectionAssignments" not in self.__dict__:
+            # The default list of the class is shared by all the parts, so that the part gets its own list.
+            self.sectionAssignments = []
         self.sectionAssignments.append(sectionAssignment)
         return sectionAssignment
 
@@ -104,7 +104,12 @@ class SectionAssignment:
         SectionAssignment
             A SectionAssignment object.
         """
-        ...
+        self.region = region
+        self.sectionName = sectionName
+        self.thicknessAssignment = thicknessAssignment
+        self.offset = offset
+        self.offsetType = offsetType
+        self.offsetField = offsetField
 
     @abaqus_method_doc
     def resume(self):
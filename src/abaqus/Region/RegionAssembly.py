@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import Sequence, Union, overload
 
+from typing_extensions import Literal
+
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ..BasicGeometry.Cell import Cell
@@ -13,9 +15,12 @@ from ..Mesh.MeshNode import MeshNode
 from ..Sketcher.ConstrainedSketchVertex.ConstrainedSketchVertex import (
     ConstrainedSketchVertex,
 )
+from ..UtilityAndView.abaqusConstants import UNION
+from ..UtilityAndView.abaqusConstants import abaqusConstants as C
 from .Region import Region
 from .RegionAssemblyBase import RegionAssemblyBase
-from .Set import Set
+from .Set import Set as SetType
+from .Set import booleanSet
 from .Surface import Surface
 
 
@@ -205,7 +210,7 @@ class RegionAssembly(RegionAssemblyBase):
         skinFaces: tuple[tuple[str, Sequence[Face]], ...] = ...,
         skinEdges: tuple[tuple[str, Sequence[Edge]], ...] = ...,
         stringerEdges: tuple[tuple[str, Sequence[Edge]], ...] = ...,
-    ) -> Set:
+    ) -> SetType:
         """This method creates a set from a sequence of objects in a model database.
 
         .. note::
@@ -263,7 +268,7 @@ class RegionAssembly(RegionAssemblyBase):
 
     @overload
     @abaqus_method_doc
-    def Set(self, name: str, objectToCopy: Set) -> Set:
+    def Set(self, name: str, objectToCopy: SetType) -> SetType:
         """This method copies a set from an existing set.
 
         .. note::
@@ -286,6 +291,38 @@ class RegionAssembly(RegionAssemblyBase):
         """
         ...
 
-    def Set(self, name, *args, **kwargs) -> Set:
-        self.sets[name] = aSet = Set(name, *args, **kwargs)
+    def Set(self, name, *args, **kwargs) -> SetType:
+        self.sets[name] = aSet = SetType(name, *args, **kwargs)
+        return aSet
+
+    @abaqus_method_doc
+    def SetByBoolean(
+        self, name: str, sets: Sequence[SetType], operation: Literal[C.UNION, C.INTERSECTION, C.DIFFERENCE] = UNION
+    ) -> SetType:
+        """This method creates a set by performing a boolean operation on two or more input sets.
+
+        .. note::
+            This function can be accessed by::
+
+                mdb.models[name].parts[name].SetByBoolean
+                mdb.models[name].rootAssembly.SetByBoolean
+
+        Parameters
+        ----------
+        name
+            A String specifying the repository key.
+        sets
+            A sequence of Set objects.
+        operation
+            A SymbolicConstant specifying the boolean operation to perform. Possible values are
+            UNION, INTERSECTION, and DIFFERENCE. The default value is UNION. Note that if DIFFERENCE
+            is specified, the order of the given input sets is important; All sets specified after
+            the first one are subtracted from the first one.
+
+        Returns
+        -------
+        Set
+            A Set object.
+        """
+        self.sets[name] = aSet = booleanSet(name, sets, operation)
         return aSet
@@ -11,6 +11,8 @@ from ..BasicGeometry.Edge import Edge
 from ..BasicGeometry.Face import Face
 from ..BasicGeometry.ReferencePoint import ReferencePoint
 from ..BasicGeometry.Vertex import Vertex
+from ..Mesh.Mask import Mask
+from ..Mesh.MeshArrayCache import labelIndexOf
 from ..Mesh.MeshEdge import MeshEdge
 from ..Mesh.MeshElement import MeshElement
 from ..Mesh.MeshFace import MeshFace
@@ -20,6 +22,7 @@ from ..UtilityAndView.abaqusConstants import abaqusConstants as C
 from .Region import Region
 from .RegionPartBase import RegionPartBase
 from .Set import Set as SetType
+from .Set import booleanSet, setFromMask
 from .Skin import Skin as SkinType
 from .Stringer import Stringer
 from .Surface import Surface as SurfaceType
@@ -447,7 +450,8 @@ class RegionPart(RegionPartBase):
         Set
             A Set object.
         """
-        return SetType(name)
+        self.sets[name] = aSet = booleanSet(name, sets, operation, {"nodes": self.nodes, "elements": self.elements})
+        return aSet
 
     @abaqus_method_doc
     def SetFromColor(self, name: str, color: tuple) -> SetType:
@@ -505,8 +509,15 @@ class RegionPart(RegionPartBase):
         -------
         Set
             A Set object.
+
+        Raises
+        ------
+        KeyError
+            If there is no element with one of the labels.
         """
-        return SetType(name)
+        positions = labelIndexOf(self, "elements", self.elements).require(elementLabels, "element label")
+        self.sets[name] = aSet = setFromMask(name, "elements", self.elements, Mask.fromIndices(positions))
+        return aSet
 
     @abaqus_method_doc
     def SetFromNodeLabels(self, name: str, nodeLabels: Sequence[int], unsorted: Boolean = False) -> SetType:
@@ -542,8 +553,19 @@ class RegionPart(RegionPartBase):
         -------
         Set
             A Set object.
+
+        Raises
+        ------
+        KeyError
+            If there is no node with one of the labels.
         """
-        return SetType(name)
+        positions = labelIndexOf(self, "nodes", self.nodes).require(nodeLabels, "node label")
+        if unsorted:
+            aSet = SetType(name, nodes=[self.nodes[index] for index in positions.tolist()])
+        else:
+            aSet = setFromMask(name, "nodes", self.nodes, Mask.fromIndices(positions))
+        self.sets[name] = aSet
+        return aSet
 
     @abaqus_method_doc
     def MapSetsFromOdb(self, odbPath: str, odbSets: str, partSets: str = "", method: str = OVERWRITE) -> SetType:
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Sequence, overload
+from functools import reduce
+from operator import and_, or_
+from typing import Any, Dict, List, Sequence, Tuple, Union, overload
 
 from typing_extensions import Literal
 
@@ -16,11 +18,20 @@ from ..BasicGeometry.ReferencePoint import ReferencePoint
 from ..BasicGeometry.ReferencePointArray import ReferencePointArray
 from ..BasicGeometry.Vertex import Vertex
 from ..BasicGeometry.VertexArray import VertexArray
+from ..Mesh.LabelIndex import LabelIndex
+from ..Mesh.Mask import Mask
+from ..Mesh.MeshArrayCache import MeshArrayCache
 from ..Mesh.MeshElement import MeshElement
 from ..Mesh.MeshElementArray import MeshElementArray
 from ..Mesh.MeshNode import MeshNode
 from ..Mesh.MeshNodeArray import MeshNodeArray
-from ..UtilityAndView.abaqusConstants import OVERWRITE, UNION, Boolean
+from ..UtilityAndView.abaqusConstants import (
+    DIFFERENCE,
+    INTERSECTION,
+    OVERWRITE,
+    UNION,
+    Boolean,
+)
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
 from .Region import Region
 
@@ -58,11 +69,8 @@ class Set(Region):
             mdb.models[name].rootAssembly.sets[name]
     """
 
-    #: A MeshElementArray object.
-    elements: MeshElementArray = MeshElementArray([])
-
-    #: A MeshNodeArray object.
-    nodes: MeshNodeArray = MeshNodeArray([])
+    #: A String specifying the repository key.
+    name: str = ""
 
     #: A VertexArray object.
     vertices: VertexArray = VertexArray([])
@@ -198,7 +206,67 @@ class Set(Region):
 
     @abaqus_method_doc
     def __init__(self, *args, **kwargs) -> None:
-        ...
+        name, *arguments = args or (kwargs.pop("name"),)
+        objectToCopy = kwargs.pop("objectToCopy", arguments[0] if arguments and isinstance(arguments[0], Set) else None)
+        self.name = name
+        self._members: Dict[str, Union[list, Tuple[Sequence, Mask]]] = {}
+        if objectToCopy is not None:
+            for attribute, members in objectToCopy._members.items():
+                self._members[attribute] = members if isinstance(members, tuple) else type(members)(members)
+            return
+        nodes, elements = (arguments + [None, None])[:2]
+        nodes, elements = kwargs.get("nodes", nodes), kwargs.get("elements", elements)
+        if nodes is not None:
+            self.nodes = MeshNodeArray(_flatten(nodes))
+            self.nodes._shareOwner(nodes)
+        if elements is not None:
+            self.elements = MeshElementArray(_flatten(elements))
+            self.elements._shareOwner(elements)
+
+    @property
+    def elements(self) -> MeshElementArray:
+        """A MeshElementArray object."""
+        return self._materialize("elements", MeshElementArray)
+
+    @elements.setter
+    def elements(self, elements: MeshElementArray):
+        self._members["elements"] = elements
+
+    @property
+    def nodes(self) -> MeshNodeArray:
+        """A MeshNodeArray object."""
+        return self._materialize("nodes", MeshNodeArray)
+
+    @nodes.setter
+    def nodes(self, nodes: MeshNodeArray):
+        self._members["nodes"] = nodes
+
+    def _materialize(self, attribute: str, arrayType: type) -> Any:
+        """Return the nodes or elements of the set, building their array the first time they are accessed if the
+        set is stored as a mask over the positions of the nodes or elements of a source sequence."""
+        members: Any = self._members.get(attribute)
+        source = members
+        if isinstance(members, tuple):
+            source, mask = members
+            members = [source[index] for index in mask.indices().tolist()]
+        if not isinstance(members, arrayType):
+            members = self._members[attribute] = arrayType(members or [])
+            members._shareOwner(source)
+        return members
+
+    def _mask(self, attribute: str, source: Sequence) -> Mask | None:
+        """Return the mask of the positions of the nodes or elements of the set in a source sequence, or None if
+        some of them are not in the sequence."""
+        import numpy as np
+
+        members = self._members.get(attribute, [])
+        if isinstance(members, tuple):
+            if members[0] is source:
+                return members[1]
+            members = [members[0][index] for index in members[1].indices().tolist()]
+        identities = np.fromiter(map(id, members), dtype=np.int64, count=len(members))
+        positions = _identityIndex(source).indices(identities)
+        return None if np.any(positions < 0) else Mask.fromIndices(positions)
 
     def SetByBoolean(
         self, name: str, sets: Sequence[Set], operation: Literal[C.UNION, C.INTERSECTION, C.DIFFERENCE] = UNION
@@ -228,7 +296,7 @@ class Set(Region):
         Set
             A Set object.
         """
-        return Set(name)
+        return booleanSet(name, sets, operation)
 
     @abaqus_method_doc
     def SetFromColor(self, name: str, color: tuple) -> Set:
@@ -352,3 +420,121 @@ class Set(Region):
             A Set object or a tuple of Set objects.
         """
         return Set("")
+
+
+def booleanSet(
+    name: str,
+    sets: Sequence[Set],
+    operation: Literal[C.UNION, C.INTERSECTION, C.DIFFERENCE] = UNION,
+    sources: Dict[str, Sequence] | None = None,
+) -> Set:
+    """Return a set created by performing a boolean operation on two or more sets, used by the ``SetByBoolean``
+    methods.
+
+    The nodes and the elements of the sets are combined as masks over their positions in a source sequence, such
+    as the nodes of a part, and the resulting set stores the masks until its members are accessed. The source
+    sequence is given by **sources**, or else shared by sets resulting from the same source, or else made of the
+    members of the sets.
+
+    Parameters
+    ----------
+    name
+        A String specifying the repository key.
+    sets
+        A sequence of Set objects.
+    operation
+        A SymbolicConstant specifying the boolean operation to perform. Possible values are UNION, INTERSECTION,
+        and DIFFERENCE. The default value is UNION.
+    sources
+        A dictionary mapping "nodes" and "elements" to the sequences of nodes and elements containing the members
+        of the sets. The default value is None.
+
+    Returns
+    -------
+    Set
+        A Set object.
+    """
+    if operation not in (UNION, INTERSECTION, DIFFERENCE):
+        raise ValueError(f"Invalid boolean operation: {operation}")
+    aSet = Set(name)
+    for attribute in ("nodes", "elements"):
+        if not any(attribute in item._members for item in sets):
+            continue
+        source = (sources or {}).get(attribute)
+        if source is None:
+            # Sets resulting from boolean operations on the same source share it.
+            lazy = [item._members.get(attribute) for item in sets]
+            if isinstance(lazy[0], tuple) and all(isinstance(item, tuple) and item[0] is lazy[0][0] for item in lazy):
+                source = lazy[0][0]
+        found = [item._mask(attribute, source) for item in sets] if source is not None else []
+        masks = [mask for mask in found if mask is not None]
+        if source is None or len(masks) < len(sets):
+            source, masks = _gathered(sets, attribute)
+        if operation == UNION:
+            result = reduce(or_, masks)
+        elif operation == INTERSECTION:
+            result = reduce(and_, masks)
+        else:
+            result = masks[0] - reduce(or_, masks[1:], Mask())
+        aSet._members[attribute] = (source, result)
+    return aSet
+
+
+def setFromMask(name: str, attribute: str, source: Sequence, mask: Mask) -> Set:
+    """Return a set of the nodes or elements at the positions of a mask in a source sequence, such as the nodes of
+    a part, stored as the mask until its members are accessed.
+
+    Parameters
+    ----------
+    name
+        A String specifying the repository key.
+    attribute
+        A String specifying the members of the set, "nodes" or "elements".
+    source
+        A sequence of the nodes or elements containing the members of the set.
+    mask
+        A Mask object specifying the positions of the members of the set in **source**.
+
+    Returns
+    -------
+    Set
+        A Set object.
+    """
+    aSet = Set(name)
+    aSet._members[attribute] = (source, mask)
+    return aSet
+
+
+def _gathered(sets: Sequence[Set], attribute: str) -> Tuple[list, List[Mask]]:
+    """Return the nodes or elements of some sets gathered in order of first appearance, and the masks of the
+    positions of the members of each set in this sequence."""
+    import numpy as np
+
+    members = [getattr(item, attribute) for item in sets]
+    gathered = [member for items in members for member in items]
+    identities = np.fromiter(map(id, gathered), dtype=np.int64, count=len(gathered))
+    _, first, inverse = np.unique(identities, return_index=True, return_inverse=True)
+    order = np.argsort(first)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    positions = rank[inverse.ravel()]
+    bounds = np.cumsum([0] + [len(items) for items in members])
+    masks = [Mask.fromIndices(positions[start:end]) for start, end in zip(bounds[:-1], bounds[1:])]
+    return [gathered[index] for index in first[order].tolist()], masks
+
+
+def _flatten(members: Sequence) -> list:
+    """Return the nodes or elements of a sequence, or of a sequence of sequences for each part instance."""
+    return (
+        [member for item in members for member in item]
+        if members and isinstance(members[0], Sequence)
+        else list(members)
+    )
+
+
+def _identityIndex(source: Sequence) -> LabelIndex:
+    """Return the index of the identities of the nodes or elements of a source sequence, cached by the mesh
+    arrays."""
+    if isinstance(source, MeshArrayCache):
+        return source._cached("identityIndex", lambda: LabelIndex(map(id, source)))
+    return LabelIndex(map(id, source))
@@ -241,6 +241,10 @@ class HomogeneousShellSection(GeometryShellSection):
             A HomogeneousShellSection object.
         """
         super().__init__()
+        self.name = name
+        self.material = material
+        self.thickness = thickness
+        self.thicknessType = thicknessType
 
     @abaqus_method_doc
     def setValues(
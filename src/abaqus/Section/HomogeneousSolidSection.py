@@ -70,6 +70,9 @@ class HomogeneousSolidSection(SolidSection):
         RangeError
         """
         super().__init__()
+        self.name = name
+        self.material = material
+        self.thickness = thickness
 
     @abaqus_method_doc
     def setValues(self, thickness: float = 1) -> None:
@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
 from typing_extensions import Literal
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
-from ..Connector.ConnectorBehaviorOptionArray import ConnectorBehaviorOptionArray
 from ..Model.ModelBase import ModelBase
 from ..UtilityAndView.abaqusConstants import (
     CONSTANT,
@@ -26,24 +25,27 @@ from ..UtilityAndView.abaqusConstants import (
     Boolean,
 )
 from ..UtilityAndView.SymbolicConstant import abaqusConstants as C
-from .AcousticInfiniteSection import AcousticInfiniteSection
-from .AcousticInterfaceSection import AcousticInterfaceSection
-from .BeamSection import BeamSection
-from .CohesiveSection import CohesiveSection
-from .CompositeShellSection import CompositeShellSection
-from .CompositeSolidSection import CompositeSolidSection
-from .ConnectorSection import ConnectorSection
-from .EulerianSection import EulerianSection
-from .GasketSection import GasketSection
-from .GeneralStiffnessSection import GeneralStiffnessSection
-from .HomogeneousShellSection import HomogeneousShellSection
-from .HomogeneousSolidSection import HomogeneousSolidSection
-from .MembraneSection import MembraneSection
-from .MPCSection import MPCSection
-from .PEGSection import PEGSection
-from .SectionLayerArray import SectionLayerArray
-from .SurfaceSection import SurfaceSection
-from .TrussSection import TrussSection
+
+if TYPE_CHECKING:
+    from ..Connector.ConnectorBehaviorOptionArray import ConnectorBehaviorOptionArray
+    from .AcousticInfiniteSection import AcousticInfiniteSection
+    from .AcousticInterfaceSection import AcousticInterfaceSection
+    from .BeamSection import BeamSection
+    from .CohesiveSection import CohesiveSection
+    from .CompositeShellSection import CompositeShellSection
+    from .CompositeSolidSection import CompositeSolidSection
+    from .ConnectorSection import ConnectorSection
+    from .EulerianSection import EulerianSection
+    from .GasketSection import GasketSection
+    from .GeneralStiffnessSection import GeneralStiffnessSection
+    from .HomogeneousShellSection import HomogeneousShellSection
+    from .HomogeneousSolidSection import HomogeneousSolidSection
+    from .MembraneSection import MembraneSection
+    from .MPCSection import MPCSection
+    from .PEGSection import PEGSection
+    from .SectionLayerArray import SectionLayerArray
+    from .SurfaceSection import SurfaceSection
+    from .TrussSection import TrussSection
 
 
 @abaqus_class_doc
@@ -92,6 +94,8 @@ class SectionModel(ModelBase):
         InvalidNameError
         RangeError
         """
+        from .AcousticInfiniteSection import AcousticInfiniteSection
+
         self.sections[name] = section = AcousticInfiniteSection(name, material, thickness, order)
         return section
 
@@ -123,6 +127,8 @@ class SectionModel(ModelBase):
         InvalidNameError
         RangeError
         """
+        from .AcousticInterfaceSection import AcousticInterfaceSection
+
         self.sections[name] = section = AcousticInterfaceSection(name, thickness)
         return section
 
@@ -270,6 +276,8 @@ class SectionModel(ModelBase):
         BeamSection
             A BeamSection object.
         """
+        from .BeamSection import BeamSection
+
         self.sections[name] = section = BeamSection(
             name,
             integration,
@@ -353,6 +361,8 @@ class SectionModel(ModelBase):
         ------
         RangeError and InvalidNameError
         """
+        from .CohesiveSection import CohesiveSection
+
         self.sections[name] = section = CohesiveSection(
             name,
             response,
@@ -469,6 +479,8 @@ class SectionModel(ModelBase):
         CompositeShellSection
             A CompositeShellSection object.
         """
+        from .CompositeShellSection import CompositeShellSection
+
         self.sections[name] = section = CompositeShellSection(
             name,
             layup,
@@ -524,6 +536,8 @@ class SectionModel(ModelBase):
         CompositeSolidSection
             A CompositeSolidSection object.
         """
+        from .CompositeSolidSection import CompositeSolidSection
+
         self.sections[name] = section = CompositeSolidSection(name, layup, symmetric, layupName)
         return section
 
@@ -685,6 +699,8 @@ class SectionModel(ModelBase):
         InvalidNameError
         RangeError
         """
+        from .ConnectorSection import ConnectorSection
+
         self.sections[name] = section = ConnectorSection(
             name,
             assembledType,
@@ -731,6 +747,8 @@ class SectionModel(ModelBase):
         EulerianSection
             An EulerianSection object.
         """
+        from .EulerianSection import EulerianSection
+
         self.sections[name] = section = EulerianSection(name, data)
         return section
 
@@ -783,6 +801,8 @@ class SectionModel(ModelBase):
         GasketSection
             A GasketSection object. and ValueError.
         """
+        from .GasketSection import GasketSection
+
         self.sections[name] = section = GasketSection(
             name,
             material,
@@ -864,6 +884,8 @@ class SectionModel(ModelBase):
         GeneralStiffnessSection
             A GeneralStiffnessSection object.
         """
+        from .GeneralStiffnessSection import GeneralStiffnessSection
+
         self.sections[name] = section = GeneralStiffnessSection(
             name,
             stiffnessMatrix,
@@ -988,6 +1010,8 @@ class SectionModel(ModelBase):
         HomogeneousShellSection
             A HomogeneousShellSection object.
         """
+        from .HomogeneousShellSection import HomogeneousShellSection
+
         self.sections[name] = section = HomogeneousShellSection(
             name,
             material,
@@ -1044,6 +1068,8 @@ class SectionModel(ModelBase):
         InvalidNameError
         RangeError
         """
+        from .HomogeneousSolidSection import HomogeneousSolidSection
+
         self.sections[name] = section = HomogeneousSolidSection(name, material, thickness)
         return section
 
@@ -1104,6 +1130,8 @@ class SectionModel(ModelBase):
         ------
         RangeError and InvalidNameError
         """
+        from .MembraneSection import MembraneSection
+
         self.sections[name] = section = MembraneSection(
             name,
             material,
@@ -1156,6 +1184,8 @@ class SectionModel(ModelBase):
         ------
         RangeError and InvalidNameError
         """
+        from .MPCSection import MPCSection
+
         self.sections[name] = section = MPCSection(name, mpcType, userMode, userType)
         return section
 
@@ -1202,6 +1232,8 @@ class SectionModel(ModelBase):
         InvalidNameError
         RangeError
         """
+        from .PEGSection import PEGSection
+
         self.sections[name] = section = PEGSection(name, material, thickness, wedgeAngle1, wedgeAngle2)
         return section
 
@@ -1235,6 +1267,8 @@ class SectionModel(ModelBase):
         ------
         RangeError and InvalidNameError
         """
+        from .SurfaceSection import SurfaceSection
+
         self.sections[name] = section = SurfaceSection(name, useDensity, density)
         return section
 
@@ -1267,5 +1301,7 @@ class SectionModel(ModelBase):
         ------
         RangeError and InvalidNameError
         """
+        from .TrussSection import TrussSection
+
         self.sections[name] = section = TrussSection(name, material, area)
         return section
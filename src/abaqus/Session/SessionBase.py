@@ -1,72 +1,75 @@
 from __future__ import annotations
 
-from typing import Sequence
+from typing import TYPE_CHECKING, Sequence
 
 from typing_extensions import Literal
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
+from abqpy.lazy import lazy_attribute
 
-from ..Animation.AnimationOptions import AnimationOptions
-from ..Animation.AVIOptions import AVIOptions
-from ..Animation.ImageAnimation import ImageAnimation
-from ..Animation.ImageAnimationOptions import ImageAnimationOptions
-from ..Animation.Movie import Movie
-from ..Animation.QuickTimeOptions import QuickTimeOptions
-from ..Canvas.Canvas import Canvas
-from ..Canvas.DrawingArea import DrawingArea
-from ..Canvas.Viewport import Viewport
-from ..CustomKernel.RepositorySupport import RepositorySupport
-from ..DisplayGroup.DisplayGroup import DisplayGroup
-from ..DisplayOptions.GraphicsInfo import GraphicsInfo
-from ..DisplayOptions.GraphicsOptions import GraphicsOptions
-from ..DisplayOptions.LightOptions import LightOptions
-from ..DisplayOptions.ViewportAnnotationOptions import ViewportAnnotationOptions
-from ..FieldReport.FieldReportOptions import FieldReportOptions
-from ..FieldReport.FreeBodyReportOptions import FreeBodyReportOptions
-from ..Job.Queue import Queue
-from ..Mesh.MesherOptions import MesherOptions
-from ..Odb.Odb import Odb
-from ..Odb.ScratchOdb import ScratchOdb
-from ..OdbDisplay.DefaultOdbDisplay import DefaultOdbDisplay
-from ..OdbDisplay.ViewerOptions import ViewerOptions
-from ..PathAndProbe.CurrentProbeValues import CurrentProbeValues
-from ..PathAndProbe.FreeBody import FreeBody
-from ..PathAndProbe.NodeQuery import NodeQuery
-from ..PathAndProbe.Path import Path
-from ..PathAndProbe.ProbeOptions import ProbeOptions
-from ..PathAndProbe.ProbeReport import ProbeReport
-from ..PathAndProbe.SelectedProbeValues import SelectedProbeValues
-from ..PathAndProbe.Spectrum import Spectrum
-from ..PathAndProbe.Stream import Stream
-from ..PlotOptions.MdbData import MdbData
-from ..PlotOptions.OdbData import OdbData
-from ..PredefinedField.TiffOptions import TiffOptions
-from ..Print.EpsOptions import EpsOptions
-from ..Print.PageSetupOptions import PageSetupOptions
-from ..Print.PngOptions import PngOptions
-from ..Print.PrintOptions import PrintOptions
-from ..Print.PsOptions import PsOptions
-from ..Print.SvgOptions import SvgOptions
-from ..Sketcher.ConstrainedSketchOptions.ConstrainedSketcherOptions import (
-    ConstrainedSketcherOptions,
-)
 from ..UtilityAndView.abaqusConstants import AVI, OFF, PNG, Boolean
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
 from ..UtilityAndView.View import View
-from ..XY.Chart import Chart
-from ..XY.DefaultChartOptions import DefaultChartOptions
-from ..XY.DefaultPlot import DefaultPlot
-from ..XY.XYCurve import XYCurve
-from ..XY.XYData import XYData
-from ..XY.XYPlot import XYPlot
-from ..XY.XYReportOptions import XYReportOptions
-from .AutoColors import AutoColors
-from .Color import Color
-from .Drawing import Drawing
-from .Image import Image
-from .JournalOptions import JournalOptions
-from .MemoryReductionOptions import MemoryReductionOptions
-from .NetworkDatabaseConnector import NetworkDatabaseConnector
+
+if TYPE_CHECKING:
+    from ..Animation.AnimationOptions import AnimationOptions
+    from ..Animation.AVIOptions import AVIOptions
+    from ..Animation.ImageAnimation import ImageAnimation
+    from ..Animation.ImageAnimationOptions import ImageAnimationOptions
+    from ..Animation.Movie import Movie
+    from ..Animation.QuickTimeOptions import QuickTimeOptions
+    from ..Canvas.Canvas import Canvas
+    from ..Canvas.DrawingArea import DrawingArea
+    from ..Canvas.Viewport import Viewport
+    from ..CustomKernel.RepositorySupport import RepositorySupport
+    from ..DisplayGroup.DisplayGroup import DisplayGroup
+    from ..DisplayOptions.GraphicsInfo import GraphicsInfo
+    from ..DisplayOptions.GraphicsOptions import GraphicsOptions
+    from ..DisplayOptions.LightOptions import LightOptions
+    from ..DisplayOptions.ViewportAnnotationOptions import ViewportAnnotationOptions
+    from ..FieldReport.FieldReportOptions import FieldReportOptions
+    from ..FieldReport.FreeBodyReportOptions import FreeBodyReportOptions
+    from ..Job.Queue import Queue
+    from ..Mesh.MesherOptions import MesherOptions
+    from ..Odb.Odb import Odb
+    from ..Odb.ScratchOdb import ScratchOdb
+    from ..OdbDisplay.DefaultOdbDisplay import DefaultOdbDisplay
+    from ..OdbDisplay.ViewerOptions import ViewerOptions
+    from ..PathAndProbe.CurrentProbeValues import CurrentProbeValues
+    from ..PathAndProbe.FreeBody import FreeBody
+    from ..PathAndProbe.NodeQuery import NodeQuery
+    from ..PathAndProbe.Path import Path
+    from ..PathAndProbe.ProbeOptions import ProbeOptions
+    from ..PathAndProbe.ProbeReport import ProbeReport
+    from ..PathAndProbe.SelectedProbeValues import SelectedProbeValues
+    from ..PathAndProbe.Spectrum import Spectrum
+    from ..PathAndProbe.Stream import Stream
+    from ..PlotOptions.MdbData import MdbData
+    from ..PlotOptions.OdbData import OdbData
+    from ..PredefinedField.TiffOptions import TiffOptions
+    from ..Print.EpsOptions import EpsOptions
+    from ..Print.PageSetupOptions import PageSetupOptions
+    from ..Print.PngOptions import PngOptions
+    from ..Print.PrintOptions import PrintOptions
+    from ..Print.PsOptions import PsOptions
+    from ..Print.SvgOptions import SvgOptions
+    from ..Sketcher.ConstrainedSketchOptions.ConstrainedSketcherOptions import (
+        ConstrainedSketcherOptions,
+    )
+    from ..XY.Chart import Chart
+    from ..XY.DefaultChartOptions import DefaultChartOptions
+    from ..XY.DefaultPlot import DefaultPlot
+    from ..XY.XYCurve import XYCurve
+    from ..XY.XYData import XYData
+    from ..XY.XYPlot import XYPlot
+    from ..XY.XYReportOptions import XYReportOptions
+    from .AutoColors import AutoColors
+    from .Color import Color
+    from .Drawing import Drawing
+    from .Image import Image
+    from .JournalOptions import JournalOptions
+    from .MemoryReductionOptions import MemoryReductionOptions
+    from .NetworkDatabaseConnector import NetworkDatabaseConnector
 
 
 @abaqus_class_doc
@@ -102,52 +105,62 @@ class SessionBase:
 
     #: A JournalOptions object specifying how to record selection of geometry in the journal
     #: and replay files.
-    journalOptions: JournalOptions = JournalOptions()
+    journalOptions: JournalOptions = lazy_attribute(".JournalOptions", "JournalOptions")
 
     #: A MemoryReductionOptions object specifying options for running in reduced memory mode.
-    memoryReductionOptions: MemoryReductionOptions = MemoryReductionOptions()
+    memoryReductionOptions: MemoryReductionOptions = lazy_attribute(".MemoryReductionOptions", "MemoryReductionOptions")
 
     #: A NodeQuery object specifying nodes and their coordinates in a path.
-    nodeQuery: NodeQuery = NodeQuery()
+    nodeQuery: NodeQuery = lazy_attribute("..PathAndProbe.NodeQuery", "NodeQuery")
 
     #: A ConstrainedSketcherOptions object specifying common options for all sketches.
-    sketcherOptions: ConstrainedSketcherOptions = ConstrainedSketcherOptions()
+    sketcherOptions: ConstrainedSketcherOptions = lazy_attribute(
+        "..Sketcher.ConstrainedSketchOptions.ConstrainedSketcherOptions", "ConstrainedSketcherOptions"
+    )
 
     #: A ViewerOptions object.
-    viewerOptions: ViewerOptions = ViewerOptions()
+    viewerOptions: ViewerOptions = lazy_attribute("..OdbDisplay.ViewerOptions", "ViewerOptions")
 
     #: An AnimationOptions object.
-    animationOptions: AnimationOptions = AnimationOptions()
+    animationOptions: AnimationOptions = lazy_attribute("..Animation.AnimationOptions", "AnimationOptions")
 
     #: An AVIOptions object.
-    aviOptions: AVIOptions = AVIOptions()
+    aviOptions: AVIOptions = lazy_attribute("..Animation.AVIOptions", "AVIOptions")
 
     #: An ImageAnimationOptions object.
-    imageAnimationOptions: ImageAnimationOptions = ImageAnimationOptions()
+    imageAnimationOptions: ImageAnimationOptions = lazy_attribute(
+        "..Animation.ImageAnimationOptions", "ImageAnimationOptions"
+    )
 
     #: An ImageAnimation object.
-    imageAnimation: ImageAnimation = ImageAnimation("img", AVI)
+    imageAnimation: ImageAnimation = lazy_attribute("..Animation.ImageAnimation", "ImageAnimation", "img", AVI)
 
     #: A QuickTimeOptions object.
-    quickTimeOptions: QuickTimeOptions = QuickTimeOptions()
+    quickTimeOptions: QuickTimeOptions = lazy_attribute("..Animation.QuickTimeOptions", "QuickTimeOptions")
 
     #: A repository of Viewport objects.
     viewports: dict[str, Viewport] = {}
 
     #: A RepositorySupport object.
-    customData: RepositorySupport = RepositorySupport()
+    customData: RepositorySupport = lazy_attribute("..CustomKernel.RepositorySupport", "RepositorySupport")
 
     #: A FieldReportOptions object.
-    defaultFieldReportOptions: FieldReportOptions = FieldReportOptions()
+    defaultFieldReportOptions: FieldReportOptions = lazy_attribute(
+        "..FieldReport.FieldReportOptions", "FieldReportOptions"
+    )
 
     #: A FreeBodyReportOptions object.
-    defaultFreeBodyReportOptions: FreeBodyReportOptions = FreeBodyReportOptions()
+    defaultFreeBodyReportOptions: FreeBodyReportOptions = lazy_attribute(
+        "..FieldReport.FreeBodyReportOptions", "FreeBodyReportOptions"
+    )
 
     #: A FieldReportOptions object.
-    fieldReportOptions: FieldReportOptions = FieldReportOptions()
+    fieldReportOptions: FieldReportOptions = lazy_attribute("..FieldReport.FieldReportOptions", "FieldReportOptions")
 
     #: A FreeBodyReportOptions object.
-    freeBodyReportOptions: FreeBodyReportOptions = FreeBodyReportOptions()
+    freeBodyReportOptions: FreeBodyReportOptions = lazy_attribute(
+        "..FieldReport.FreeBodyReportOptions", "FreeBodyReportOptions"
+    )
 
     #: A repository of Odb objects.
     odbs: dict[str, Odb] = {}
@@ -156,13 +169,13 @@ class SessionBase:
     scratchOdbs: dict[str, ScratchOdb] = {}
 
     #: A DefaultOdbDisplay object.
-    defaultOdbDisplay: DefaultOdbDisplay = DefaultOdbDisplay()
+    defaultOdbDisplay: DefaultOdbDisplay = lazy_attribute("..OdbDisplay.DefaultOdbDisplay", "DefaultOdbDisplay")
 
     #: A DefaultPlot object.
-    defaultPlot: DefaultPlot = DefaultPlot()
+    defaultPlot: DefaultPlot = lazy_attribute("..XY.DefaultPlot", "DefaultPlot")
 
     #: A DefaultChartOptions object.
-    defaultChartOptions: DefaultChartOptions = DefaultChartOptions()
+    defaultChartOptions: DefaultChartOptions = lazy_attribute("..XY.DefaultChartOptions", "DefaultChartOptions")
 
     #: A repository of OdbData objects.
     odbData: dict[str, OdbData] = {}
@@ -183,49 +196,51 @@ class SessionBase:
     spectrums: dict[str, Spectrum] = {}
 
     #: A CurrentProbeValues object.
-    currentProbeValues: CurrentProbeValues = CurrentProbeValues()
+    currentProbeValues: CurrentProbeValues = lazy_attribute("..PathAndProbe.CurrentProbeValues", "CurrentProbeValues")
 
     #: A ProbeOptions object.
-    defaultProbeOptions: ProbeOptions = ProbeOptions()
+    defaultProbeOptions: ProbeOptions = lazy_attribute("..PathAndProbe.ProbeOptions", "ProbeOptions")
 
     #: A ProbeOptions object.
-    probeOptions: ProbeOptions = ProbeOptions()
+    probeOptions: ProbeOptions = lazy_attribute("..PathAndProbe.ProbeOptions", "ProbeOptions")
 
     #: A ProbeReport object.
-    probeReport: ProbeReport = ProbeReport()
+    probeReport: ProbeReport = lazy_attribute("..PathAndProbe.ProbeReport", "ProbeReport")
 
     #: A ProbeReport object.
-    defaultProbeReport: ProbeReport = ProbeReport()
+    defaultProbeReport: ProbeReport = lazy_attribute("..PathAndProbe.ProbeReport", "ProbeReport")
 
     #: A SelectedProbeValues object.
-    selectedProbeValues: SelectedProbeValues = SelectedProbeValues()
+    selectedProbeValues: SelectedProbeValues = lazy_attribute(
+        "..PathAndProbe.SelectedProbeValues", "SelectedProbeValues"
+    )
 
     #: A PrintOptions object.
-    printOptions: PrintOptions = PrintOptions()
+    printOptions: PrintOptions = lazy_attribute("..Print.PrintOptions", "PrintOptions")
 
     #: An EpsOptions object.
-    epsOptions: EpsOptions = EpsOptions()
+    epsOptions: EpsOptions = lazy_attribute("..Print.EpsOptions", "EpsOptions")
 
     #: A PageSetupOptions object.
-    pageSetupOptions: PageSetupOptions = PageSetupOptions()
+    pageSetupOptions: PageSetupOptions = lazy_attribute("..Print.PageSetupOptions", "PageSetupOptions")
 
     #: A PngOptions object.
-    pngOptions: PngOptions = PngOptions()
+    pngOptions: PngOptions = lazy_attribute("..Print.PngOptions", "PngOptions")
 
     #: A PsOptions object.
-    psOptions: PsOptions = PsOptions()
+    psOptions: PsOptions = lazy_attribute("..Print.PsOptions", "PsOptions")
 
     #: A SvgOptions object.
-    svgOptions: SvgOptions = SvgOptions()
+    svgOptions: SvgOptions = lazy_attribute("..Print.SvgOptions", "SvgOptions")
 
     #: A TiffOptions object.
-    tiffOptions: TiffOptions = TiffOptions()
+    tiffOptions: TiffOptions = lazy_attribute("..PredefinedField.TiffOptions", "TiffOptions")
 
     #: An AutoColors object specifying the color palette to be used for color coding.
-    autoColors: AutoColors = AutoColors()
+    autoColors: AutoColors = lazy_attribute(".AutoColors", "AutoColors")
 
     #: An AutoColors object specifying the color palette to be used forXYCurve objects.
-    xyColors: AutoColors = AutoColors()
+    xyColors: AutoColors = lazy_attribute(".AutoColors", "AutoColors")
 
     #: A repository of XYData objects.
     xyDataObjects: dict[str, XYData] = {}
@@ -240,10 +255,10 @@ class SessionBase:
     charts: dict[str, Chart] = {}
 
     #: An XYReportOptions object.
-    defaultXYReportOptions: XYReportOptions = XYReportOptions()
+    defaultXYReportOptions: XYReportOptions = lazy_attribute("..XY.XYReportOptions", "XYReportOptions")
 
     #: An XYReportOptions object.
-    xyReportOptions: XYReportOptions = XYReportOptions()
+    xyReportOptions: XYReportOptions = lazy_attribute("..XY.XYReportOptions", "XYReportOptions")
 
     #: A repository of View objects.
     views: dict[str, View] = {}
@@ -255,16 +270,18 @@ class SessionBase:
     displayGroups: dict[str, DisplayGroup] = {}
 
     #: A GraphicsInfo object.
-    graphicsInfo: GraphicsInfo = GraphicsInfo()
+    graphicsInfo: GraphicsInfo = lazy_attribute("..DisplayOptions.GraphicsInfo", "GraphicsInfo")
 
     #: A GraphicsOptions object.
-    defaultGraphicsOptions: GraphicsOptions = GraphicsOptions()
+    defaultGraphicsOptions: GraphicsOptions = lazy_attribute("..DisplayOptions.GraphicsOptions", "GraphicsOptions")
 
     #: A GraphicsOptions object.
-    graphicsOptions: GraphicsOptions = GraphicsOptions()
+    graphicsOptions: GraphicsOptions = lazy_attribute("..DisplayOptions.GraphicsOptions", "GraphicsOptions")
 
     #: A ViewportAnnotationOptions object.
-    defaultViewportAnnotationOptions: ViewportAnnotationOptions = ViewportAnnotationOptions()
+    defaultViewportAnnotationOptions: ViewportAnnotationOptions = lazy_attribute(
+        "..DisplayOptions.ViewportAnnotationOptions", "ViewportAnnotationOptions"
+    )
 
     #: A repository of Queue objects.
     queues: dict[str, Queue] = {}
@@ -284,13 +301,13 @@ class SessionBase:
     movies: dict[str, Movie] = {}
 
     #: A LightOptions object.
-    defaultLightOptions: LightOptions = LightOptions()
+    defaultLightOptions: LightOptions = lazy_attribute("..DisplayOptions.LightOptions", "LightOptions")
 
     #: A DrawingArea object.
-    drawingArea: DrawingArea = DrawingArea()
+    drawingArea: DrawingArea = lazy_attribute("..Canvas.DrawingArea", "DrawingArea")
 
     #: A MesherOptions object specifying how to control default settings in the Mesh module.
-    defaultMesherOptions: MesherOptions = MesherOptions()
+    defaultMesherOptions: MesherOptions = lazy_attribute("..Mesh.MesherOptions", "MesherOptions")
 
     #: A repository of Drawing objects.
     drawings: dict[str, Drawing] = {}
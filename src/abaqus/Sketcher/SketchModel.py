@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ..Model.ModelBase import ModelBase
-from .ConstrainedSketch import ConstrainedSketch
+
+if TYPE_CHECKING:
+    from .ConstrainedSketch import ConstrainedSketch
 
 
 @abaqus_class_doc
@@ -54,5 +58,7 @@ class SketchModel(ModelBase):
         sketch: ConstrainedSketch
             A ConstrainedSketch object.
         """
+        from .ConstrainedSketch import ConstrainedSketch
+
         self.sketches[name] = sketch = ConstrainedSketch(name, sheetSize, gridSpacing, transform)
         return sketch
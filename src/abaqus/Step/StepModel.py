@@ -1,77 +1,12 @@
 from __future__ import annotations
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
 from typing_extensions import Literal
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ..Model.ModelBase import ModelBase
-from ..Region.Region import Region
-from ..Step.AnnealStep import AnnealStep
-from ..Step.BuckleStep import BuckleStep
-from ..Step.ComplexFrequencyStep import ComplexFrequencyStep
-from ..Step.CoupledTempDisplacementStep import CoupledTempDisplacementStep
-from ..Step.CoupledThermalElectricalStructuralStep import (
-    CoupledThermalElectricalStructuralStep,
-)
-from ..Step.CoupledThermalElectricStep import CoupledThermalElectricStep
-from ..Step.DirectCyclicStep import DirectCyclicStep
-from ..Step.EmagTimeHarmonicStep import EmagTimeHarmonicStep
-from ..Step.ExplicitDynamicsStep import ExplicitDynamicsStep
-from ..Step.FrequencyStep import FrequencyStep
-from ..Step.GeostaticStep import GeostaticStep
-from ..Step.HeatTransferStep import HeatTransferStep
-from ..Step.ImplicitDynamicsStep import ImplicitDynamicsStep
-from ..Step.MassDiffusionStep import MassDiffusionStep
-from ..Step.ModalDynamicsStep import ModalDynamicsStep
-from ..Step.RandomResponseStep import RandomResponseStep
-from ..Step.ResponseSpectrumStep import ResponseSpectrumStep
-from ..Step.SoilsStep import SoilsStep
-from ..Step.StaticLinearPerturbationStep import StaticLinearPerturbationStep
-from ..Step.StaticRiksStep import StaticRiksStep
-from ..Step.StaticStep import StaticStep
-from ..Step.SteadyStateDirectStep import SteadyStateDirectStep
-from ..Step.SteadyStateModalStep import SteadyStateModalStep
-from ..Step.SteadyStateSubspaceStep import SteadyStateSubspaceStep
-from ..Step.SubspaceDynamicsStep import SubspaceDynamicsStep
-from ..Step.SubstructureGenerateStep import SubstructureGenerateStep
-from ..Step.TempDisplacementDynamicsStep import TempDisplacementDynamicsStep
-from ..Step.ViscoStep import ViscoStep
-from ..StepMiscellaneous.CompositeDamping import CompositeDamping
-from ..StepMiscellaneous.DirectDamping import DirectDamping
-from ..StepMiscellaneous.DirectDampingByFrequency import DirectDampingByFrequency
-from ..StepMiscellaneous.EmagTimeHarmonicFrequencyArray import (
-    EmagTimeHarmonicFrequencyArray,
-)
-from ..StepMiscellaneous.MassScalingArray import MassScalingArray
-from ..StepMiscellaneous.RandomResponseFrequencyArray import (
-    RandomResponseFrequencyArray,
-)
-from ..StepMiscellaneous.RayleighDamping import RayleighDamping
-from ..StepMiscellaneous.RayleighDampingByFrequency import RayleighDampingByFrequency
-from ..StepMiscellaneous.ResponseSpectrumComponentArray import (
-    ResponseSpectrumComponentArray,
-)
-from ..StepMiscellaneous.SteadyStateDirectFrequencyArray import (
-    SteadyStateDirectFrequencyArray,
-)
-from ..StepMiscellaneous.SteadyStateModalFrequencyArray import (
-    SteadyStateModalFrequencyArray,
-)
-from ..StepMiscellaneous.SteadyStateSubspaceFrequencyArray import (
-    SteadyStateSubspaceFrequencyArray,
-)
-from ..StepMiscellaneous.StructuralDamping import StructuralDamping
-from ..StepMiscellaneous.StructuralDampingByFrequency import (
-    StructuralDampingByFrequency,
-)
-from ..StepMiscellaneous.SubstructureGenerateFrequencyArray import (
-    SubstructureGenerateFrequencyArray,
-)
-from ..StepMiscellaneous.SubstructureGenerateModesArray import (
-    SubstructureGenerateModesArray,
-)
 from ..UtilityAndView.abaqusConstants import (
     ABS,
     AC_ON,
@@ -109,6 +44,75 @@ from ..UtilityAndView.abaqusConstants import (
 )
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
 
+if TYPE_CHECKING:
+    from ..Region.Region import Region
+    from ..Step.AnnealStep import AnnealStep
+    from ..Step.BuckleStep import BuckleStep
+    from ..Step.ComplexFrequencyStep import ComplexFrequencyStep
+    from ..Step.CoupledTempDisplacementStep import CoupledTempDisplacementStep
+    from ..Step.CoupledThermalElectricalStructuralStep import (
+        CoupledThermalElectricalStructuralStep,
+    )
+    from ..Step.CoupledThermalElectricStep import CoupledThermalElectricStep
+    from ..Step.DirectCyclicStep import DirectCyclicStep
+    from ..Step.EmagTimeHarmonicStep import EmagTimeHarmonicStep
+    from ..Step.ExplicitDynamicsStep import ExplicitDynamicsStep
+    from ..Step.FrequencyStep import FrequencyStep
+    from ..Step.GeostaticStep import GeostaticStep
+    from ..Step.HeatTransferStep import HeatTransferStep
+    from ..Step.ImplicitDynamicsStep import ImplicitDynamicsStep
+    from ..Step.MassDiffusionStep import MassDiffusionStep
+    from ..Step.ModalDynamicsStep import ModalDynamicsStep
+    from ..Step.RandomResponseStep import RandomResponseStep
+    from ..Step.ResponseSpectrumStep import ResponseSpectrumStep
+    from ..Step.SoilsStep import SoilsStep
+    from ..Step.StaticLinearPerturbationStep import StaticLinearPerturbationStep
+    from ..Step.StaticRiksStep import StaticRiksStep
+    from ..Step.StaticStep import StaticStep
+    from ..Step.SteadyStateDirectStep import SteadyStateDirectStep
+    from ..Step.SteadyStateModalStep import SteadyStateModalStep
+    from ..Step.SteadyStateSubspaceStep import SteadyStateSubspaceStep
+    from ..Step.SubspaceDynamicsStep import SubspaceDynamicsStep
+    from ..Step.SubstructureGenerateStep import SubstructureGenerateStep
+    from ..Step.TempDisplacementDynamicsStep import TempDisplacementDynamicsStep
+    from ..Step.ViscoStep import ViscoStep
+    from ..StepMiscellaneous.CompositeDamping import CompositeDamping
+    from ..StepMiscellaneous.DirectDamping import DirectDamping
+    from ..StepMiscellaneous.DirectDampingByFrequency import DirectDampingByFrequency
+    from ..StepMiscellaneous.EmagTimeHarmonicFrequencyArray import (
+        EmagTimeHarmonicFrequencyArray,
+    )
+    from ..StepMiscellaneous.MassScalingArray import MassScalingArray
+    from ..StepMiscellaneous.RandomResponseFrequencyArray import (
+        RandomResponseFrequencyArray,
+    )
+    from ..StepMiscellaneous.RayleighDamping import RayleighDamping
+    from ..StepMiscellaneous.RayleighDampingByFrequency import (
+        RayleighDampingByFrequency,
+    )
+    from ..StepMiscellaneous.ResponseSpectrumComponentArray import (
+        ResponseSpectrumComponentArray,
+    )
+    from ..StepMiscellaneous.SteadyStateDirectFrequencyArray import (
+        SteadyStateDirectFrequencyArray,
+    )
+    from ..StepMiscellaneous.SteadyStateModalFrequencyArray import (
+        SteadyStateModalFrequencyArray,
+    )
+    from ..StepMiscellaneous.SteadyStateSubspaceFrequencyArray import (
+        SteadyStateSubspaceFrequencyArray,
+    )
+    from ..StepMiscellaneous.StructuralDamping import StructuralDamping
+    from ..StepMiscellaneous.StructuralDampingByFrequency import (
+        StructuralDampingByFrequency,
+    )
+    from ..StepMiscellaneous.SubstructureGenerateFrequencyArray import (
+        SubstructureGenerateFrequencyArray,
+    )
+    from ..StepMiscellaneous.SubstructureGenerateModesArray import (
+        SubstructureGenerateModesArray,
+    )
+
 
 @abaqus_class_doc
 class StepModel(ModelBase):
@@ -157,6 +161,8 @@ class StepModel(ModelBase):
         step: AnnealStep
             An AnnealStep object.
         """
+        from ..Step.AnnealStep import AnnealStep
+
         self.steps[name] = step = AnnealStep(name, previous, description, refTemp, maintainAttributes)
         return step
 
@@ -228,6 +234,8 @@ class StepModel(ModelBase):
         step: BuckleStep
             A BuckleStep object.
         """
+        from ..Step.BuckleStep import BuckleStep
+
         self.steps[name] = step = BuckleStep(
             name,
             previous,
@@ -310,6 +318,8 @@ class StepModel(ModelBase):
         step: ComplexFrequencyStep
             A ComplexFrequencyStep object.
         """
+        from ..Step.ComplexFrequencyStep import ComplexFrequencyStep
+
         self.steps[name] = step = ComplexFrequencyStep(
             name,
             previous,
@@ -443,6 +453,8 @@ class StepModel(ModelBase):
         step: CoupledTempDisplacementStep
             A CoupledTempDisplacementStep object.
         """
+        from ..Step.CoupledTempDisplacementStep import CoupledTempDisplacementStep
+
         self.steps[name] = step = CoupledTempDisplacementStep(
             name,
             previous,
@@ -585,6 +597,10 @@ class StepModel(ModelBase):
         step: CoupledThermalElectricalStructuralStep
             A CoupledThermalElectricalStructuralStep object.
         """
+        from ..Step.CoupledThermalElectricalStructuralStep import (
+            CoupledThermalElectricalStructuralStep,
+        )
+
         self.steps[name] = step = CoupledThermalElectricalStructuralStep(
             name,
             previous,
@@ -705,6 +721,8 @@ class StepModel(ModelBase):
         step: CoupledThermalElectricStep
             A CoupledThermalElectricStep object.
         """
+        from ..Step.CoupledThermalElectricStep import CoupledThermalElectricStep
+
         self.steps[name] = step = CoupledThermalElectricStep(
             name,
             previous,
@@ -851,6 +869,8 @@ class StepModel(ModelBase):
         step: DirectCyclicStep
             A DirectCyclicStep object.
         """
+        from ..Step.DirectCyclicStep import DirectCyclicStep
+
         self.steps[name] = step = DirectCyclicStep(
             name,
             previous,
@@ -918,6 +938,8 @@ class StepModel(ModelBase):
         step: EmagTimeHarmonicStep
             An EmagTimeHarmonicStep object.
         """
+        from ..Step.EmagTimeHarmonicStep import EmagTimeHarmonicStep
+
         self.steps[name] = step = EmagTimeHarmonicStep(name, previous, frequencyRange, description, factorization)
         return step
 
@@ -1007,6 +1029,8 @@ class StepModel(ModelBase):
         step: ExplicitDynamicsStep
             An ExplicitDynamicsStep object.
         """
+        from ..Step.ExplicitDynamicsStep import ExplicitDynamicsStep
+
         self.steps[name] = step = ExplicitDynamicsStep(
             name,
             previous,
@@ -1171,6 +1195,8 @@ class StepModel(ModelBase):
         step: FrequencyStep
             A FrequencyStep object.
         """
+        from ..Step.FrequencyStep import FrequencyStep
+
         self.steps[name] = step = FrequencyStep(
             name,
             previous,
@@ -1294,6 +1320,8 @@ class StepModel(ModelBase):
         step: GeostaticStep
             A GeostaticStep object.
         """
+        from ..Step.GeostaticStep import GeostaticStep
+
         self.steps[name] = step = GeostaticStep(
             name,
             previous,
@@ -1418,6 +1446,8 @@ class StepModel(ModelBase):
         step: HeatTransferStep
             A HeatTransferStep object.
         """
+        from ..Step.HeatTransferStep import HeatTransferStep
+
         self.steps[name] = step = HeatTransferStep(
             name,
             previous,
@@ -1574,6 +1604,8 @@ class StepModel(ModelBase):
         step: ImplicitDynamicsStep
             An ImplicitDynamicsStep object.
         """
+        from ..Step.ImplicitDynamicsStep import ImplicitDynamicsStep
+
         self.steps[name] = step = ImplicitDynamicsStep(
             name,
             previous,
@@ -1685,6 +1717,8 @@ class StepModel(ModelBase):
         step: MassDiffusionStep
             A MassDiffusionStep object.
         """
+        from ..Step.MassDiffusionStep import MassDiffusionStep
+
         self.steps[name] = step = MassDiffusionStep(
             name,
             previous,
@@ -1767,6 +1801,8 @@ class StepModel(ModelBase):
         step: ModalDynamicsStep
             A ModalDynamicsStep object.
         """
+        from ..Step.ModalDynamicsStep import ModalDynamicsStep
+
         self.steps[name] = step = ModalDynamicsStep(
             name,
             previous,
@@ -1845,6 +1881,8 @@ class StepModel(ModelBase):
         step: RandomResponseStep
             A RandomResponseStep object.
         """
+        from ..Step.RandomResponseStep import RandomResponseStep
+
         self.steps[name] = step = RandomResponseStep(
             name,
             previous,
@@ -1929,6 +1967,8 @@ class StepModel(ModelBase):
         step: ResponseSpectrumStep
             A ResponseSpectrumStep object.
         """
+        from ..Step.ResponseSpectrumStep import ResponseSpectrumStep
+
         self.steps[name] = step = ResponseSpectrumStep(
             name,
             previous,
@@ -2074,6 +2114,8 @@ class StepModel(ModelBase):
         step: SoilsStep
             A SoilsStep object.
         """
+        from ..Step.SoilsStep import SoilsStep
+
         self.steps[name] = step = SoilsStep(
             name,
             previous,
@@ -2170,6 +2212,8 @@ class StepModel(ModelBase):
         step: StaticLinearPerturbationStep
             A StaticLinearPerturbationStep object.
         """
+        from ..Step.StaticLinearPerturbationStep import StaticLinearPerturbationStep
+
         self.steps[name] = step = StaticLinearPerturbationStep(
             name,
             previous,
@@ -2298,6 +2342,8 @@ class StepModel(ModelBase):
         step: StaticRiksStep
             A StaticRiksStep object.
         """
+        from ..Step.StaticRiksStep import StaticRiksStep
+
         self.steps[name] = step = StaticRiksStep(
             name,
             previous,
@@ -2452,6 +2498,8 @@ class StepModel(ModelBase):
         step: StaticRiksStep
             A StaticRiksStep object.
         """
+        from ..Step.StaticStep import StaticStep
+
         self.steps[name] = step = StaticStep(
             name,
             previous,
@@ -2539,6 +2587,8 @@ class StepModel(ModelBase):
         step: SteadyStateDirectStep
             A SteadyStateDirectStep object.
         """
+        from ..Step.SteadyStateDirectStep import SteadyStateDirectStep
+
         self.steps[name] = step = SteadyStateDirectStep(
             name,
             previous,
@@ -2618,6 +2668,8 @@ class StepModel(ModelBase):
         step: SteadyStateModalStep
             A SteadyStateModalStep object.
         """
+        from ..Step.SteadyStateModalStep import SteadyStateModalStep
+
         self.steps[name] = step = SteadyStateModalStep(
             name,
             previous,
@@ -2708,6 +2760,8 @@ class StepModel(ModelBase):
         step: SteadyStateSubspaceStep
             A SteadyStateSubspaceStep object.
         """
+        from ..Step.SteadyStateSubspaceStep import SteadyStateSubspaceStep
+
         self.steps[name] = step = SteadyStateSubspaceStep(
             name,
             previous,
@@ -2780,6 +2834,8 @@ class StepModel(ModelBase):
         step: SubspaceDynamicsStep
             A SubspaceDynamicsStep object.
         """
+        from ..Step.SubspaceDynamicsStep import SubspaceDynamicsStep
+
         self.steps[name] = step = SubspaceDynamicsStep(
             name,
             previous,
@@ -2894,6 +2950,8 @@ class StepModel(ModelBase):
         step: SubstructureGenerateStep
             A SubstructureGenerateStep object.
         """
+        from ..Step.SubstructureGenerateStep import SubstructureGenerateStep
+
         self.steps[name] = step = SubstructureGenerateStep(
             name,
             previous,
@@ -2999,6 +3057,8 @@ class StepModel(ModelBase):
         step: TempDisplacementDynamicsStep
             A TempDisplacementDynamicsStep object.
         """
+        from ..Step.TempDisplacementDynamicsStep import TempDisplacementDynamicsStep
+
         self.steps[name] = step = TempDisplacementDynamicsStep(
             name,
             previous,
@@ -3134,6 +3194,8 @@ class StepModel(ModelBase):
         step: ViscoStep
             A ViscoStep object.
         """
+        from ..Step.ViscoStep import ViscoStep
+
         self.steps[name] = step = ViscoStep(
             name,
             previous,
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
-from typing import Sequence, Union
+from typing import TYPE_CHECKING, Sequence, Union
 
 from typing_extensions import Literal
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ..Model.ModelBase import ModelBase
-from ..Region.Region import Region
 from ..UtilityAndView.abaqusConstants import (
     ALL,
     DEFAULT,
@@ -26,10 +25,13 @@ from ..UtilityAndView.abaqusConstants import (
     SymbolicConstant,
 )
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
-from .FieldOutputRequest import FieldOutputRequest
-from .HistoryOutputRequest import HistoryOutputRequest
-from .IntegratedOutputSection import IntegratedOutputSection
-from .TimePoint import TimePoint
+
+if TYPE_CHECKING:
+    from ..Region.Region import Region
+    from .FieldOutputRequest import FieldOutputRequest
+    from .HistoryOutputRequest import HistoryOutputRequest
+    from .IntegratedOutputSection import IntegratedOutputSection
+    from .TimePoint import TimePoint
 
 
 @abaqus_class_doc
@@ -162,6 +164,8 @@ class OutputModel(ModelBase):
         FieldOutputRequest
             A FieldOutputRequest object.
         """
+        from .FieldOutputRequest import FieldOutputRequest
+
         self.fieldOutputRequests[name] = FieldOutputRequest(
             name,
             createStepName,
@@ -312,6 +316,8 @@ class OutputModel(ModelBase):
         HistoryOutputRequest
             A HistoryOutputRequest object.
         """
+        from .HistoryOutputRequest import HistoryOutputRequest
+
         self.historyOutputRequests[name] = HistoryOutputRequest(
             name,
             createStepName,
@@ -397,6 +403,8 @@ class OutputModel(ModelBase):
         IntegratedOutputSection
             An IntegratedOutputSection object.
         """
+        from .IntegratedOutputSection import IntegratedOutputSection
+
         self.integratedOutputSections[name] = integratedOutputSection = IntegratedOutputSection(
             name,
             surface,
@@ -435,5 +443,7 @@ class OutputModel(ModelBase):
         InvalidNameError
         RangeError
         """
+        from .TimePoint import TimePoint
+
         self.timePoints[name] = timePoint = TimePoint(name, points)
         return timePoint
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from enum import Enum
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Iterator, Mapping, Tuple
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
@@ -49,8 +50,6 @@ class SymbolicConstant(str):
         SymbolicConstant
             A SymbolicConstant object.
         """
-        if not text.isupper() or not text.isidentifier():
-            raise ValueError(f"SymbolicConstant name {text} may only contain upper case, digit or underscore")
         self.text = text
 
     def getId(self) -> int:
@@ -59,16 +58,106 @@ class SymbolicConstant(str):
     def getText(self) -> str:
         return self.text
 
+    if not TYPE_CHECKING:
+        # The members of the former ``abaqusConstants`` Enum had a name and a value, they are kept for compatibility
+
+        @property
+        def name(self) -> str:
+            return self.text
+
+        @property
+        def value(self) -> SymbolicConstant:
+            return self
+
     def __new__(cls, name: str) -> SymbolicConstant:
+        # SymbolicConstant objects are singletons, ON and OFF are the AbaqusBoolean singletons
         if name == "ON":
-            return AbaqusBoolean(1)
+            return ON
         elif name == "OFF":
-            return AbaqusBoolean(0)
-        else:
-            return super().__new__(cls, name)
+            return OFF
+        constant = _symbolicConstants.get(name)
+        if constant is None:
+            if not name.isupper() or not name.isidentifier():
+                raise ValueError(f"SymbolicConstant name {name} may only contain upper case, digit or underscore")
+            constant = _symbolicConstants[name] = super().__new__(cls, name)
+        return constant
+
+    def __repr__(self) -> str:
+        return self.getText()
+
+
+ON = AbaqusBoolean(1)
+OFF = AbaqusBoolean(0)
+
+#: The cache of all the SymbolicConstant objects created so far, keyed by their text
+_symbolicConstants: Dict[str, SymbolicConstant] = {}
+
+
+class _ConstantTableMeta(type):
+    """Metaclass of :class:`abaqusConstants` at runtime.
+
+    The string attributes in the class body form the precomputed name table of the constants, they are removed
+    from the class namespace and each constant is only created (as an interned SymbolicConstant object) when it is
+    accessed for the first time. This avoids building thousands of Enum members when importing the package.
+
+    The table keeps the mapping interface of the former Enum (``abaqusConstants.NAME``, ``abaqusConstants["NAME"]``,
+    iteration, ``len`` and ``__members__``), and its constants keep their ``name`` and ``value`` attributes, but
+    the constants are plain SymbolicConstant objects rather than Enum members: ``isinstance(constant, Enum)`` is
+    False, use ``isinstance(constant, SymbolicConstant)`` instead.
+    """
+
+    _member_table_: Dict[str, str]
+
+    def __new__(mcs, name: str, bases: tuple, namespace: dict):
+        table = {key: value for key, value in namespace.items() if not key.startswith("_") and isinstance(value, str)}
+        cls = super().__new__(mcs, name, bases, {key: value for key, value in namespace.items() if key not in table})
+        cls._member_table_ = table
+        return cls
+
+    @property
+    def _member_names_(cls) -> Tuple[str, ...]:
+        return tuple(cls._member_table_)
+
+    @property
+    def __members__(cls) -> Mapping[str, SymbolicConstant]:
+        return MappingProxyType({name: getattr(cls, name) for name in cls._member_table_})
+
+    def __getattr__(cls, name: str) -> SymbolicConstant:
+        try:
+            text = cls._member_table_[name]
+        except KeyError:
+            raise AttributeError(f"type object '{cls.__name__}' has no attribute '{name}'") from None
+        constant = SymbolicConstant(text)
+        setattr(cls, name, constant)
+        return constant
+
+    def __getitem__(cls, name: str) -> SymbolicConstant:
+        if name not in cls._member_table_:
+            raise KeyError(name)
+        return getattr(cls, name)
+
+    def __contains__(cls, name: str) -> bool:
+        return name in cls._member_table_
+
+    def __iter__(cls) -> Iterator[SymbolicConstant]:
+        return (getattr(cls, name) for name in cls._member_table_)
+
+    def __len__(cls) -> int:
+        return len(cls._member_table_)
+
+    def __dir__(cls):
+        return [*super().__dir__(), *cls._member_table_]
+
+
+if TYPE_CHECKING:
+    from enum import Enum as _ConstantTable
+else:
+
+    class _ConstantTable(metaclass=_ConstantTableMeta):
+        pass
 
 
-class abaqusConstants(SymbolicConstant, Enum):
+class abaqusConstants(SymbolicConstant, _ConstantTable):
     def __str__(self) -> str:
         return self.name
 
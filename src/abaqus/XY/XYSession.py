@@ -1,13 +1,11 @@
 from __future__ import annotations
 
-from typing import Sequence, Union, overload
+from typing import TYPE_CHECKING, Sequence, Union, overload
 
 from typing_extensions import Literal
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
-from ..Odb.Odb import Odb
-from ..PathAndProbe.Path import Path
 from ..UtilityAndView.abaqusConstants import (
     FILLED_CIRCLE,
     NONE,
@@ -18,14 +16,18 @@ from ..UtilityAndView.abaqusConstants import (
     Boolean,
 )
 from ..UtilityAndView.SymbolicConstant import abaqusConstants as C
-from .AreaStyle import AreaStyle
-from .LineStyle import LineStyle
-from .QuantityType import QuantityType
-from .SymbolStyle import SymbolStyle
-from .TextStyle import TextStyle
-from .XYData import XYData as XYDataType
 from .XYSessionBase import XYSessionBase
 
+if TYPE_CHECKING:
+    from ..Odb.Odb import Odb
+    from ..PathAndProbe.Path import Path
+    from .AreaStyle import AreaStyle
+    from .LineStyle import LineStyle
+    from .QuantityType import QuantityType
+    from .SymbolStyle import SymbolStyle
+    from .TextStyle import TextStyle
+    from .XYData import XYData as XYDataType
+
 
 @abaqus_class_doc
 class XYSession(XYSessionBase):
@@ -61,6 +63,8 @@ class XYSession(XYSessionBase):
         ------
         ColorError
         """
+        from .AreaStyle import AreaStyle
+
         areaStyle = AreaStyle(color, fill, style)
         return areaStyle
 
@@ -105,6 +109,8 @@ class XYSession(XYSessionBase):
         ------
         ColorError
         """
+        from .LineStyle import LineStyle
+
         lineStyle = LineStyle(color, show, style, thickness)
         return lineStyle
 
@@ -282,6 +288,8 @@ class XYSession(XYSessionBase):
         QuantityType
             A QuantityType object.
         """
+        from .QuantityType import QuantityType
+
         quantityType = QuantityType(label, type)
         return quantityType
 
@@ -351,6 +359,8 @@ class XYSession(XYSessionBase):
         ------
         ColorError
         """
+        from .SymbolStyle import SymbolStyle
+
         symbolStyle = SymbolStyle(color, show, marker, size)
         return symbolStyle
 
@@ -389,6 +399,8 @@ class XYSession(XYSessionBase):
         ------
         ColorError
         """
+        from .TextStyle import TextStyle
+
         textStyle = TextStyle(color, show, font, rotationAngle)
         return textStyle
 
@@ -484,6 +496,8 @@ class XYSession(XYSessionBase):
     @staticmethod
     @abaqus_method_doc
     def XYData(*args, **kwargs) -> XYDataType:
+        from .XYData import XYData as XYDataType
+
         return XYDataType(())
 
     def XYDataFromFile(
@@ -562,6 +576,8 @@ class XYSession(XYSessionBase):
         InvalidNameError
         RangeError
         """
+        from .XYData import XYData as XYDataType
+
         self.xyDataObjects[name] = xyData = XYDataType(())
         return xyData
 
@@ -639,6 +655,8 @@ class XYSession(XYSessionBase):
         InvalidNameError
         RangeError
         """
+        from .XYData import XYData as XYDataType
+
         self.xyDataObjects[name] = xyData = XYDataType(())
         return xyData
 
@@ -809,6 +827,8 @@ class XYSession(XYSessionBase):
         InvalidNameError
         RangeError
         """
+        from .XYData import XYData as XYDataType
+
         self.xyDataObjects["name"] = xyData = XYDataType(())
         return [xyData]
 
@@ -866,6 +886,8 @@ class XYSession(XYSessionBase):
         InvalidNameError
         RangeError
         """
+        from .XYData import XYData as XYDataType
+
         self.xyDataObjects["name"] = xyData = XYDataType(())
         return [xyData]
 
@@ -992,6 +1014,8 @@ class XYSession(XYSessionBase):
         InvalidNameError
         RangeError
         """
+        from .XYData import XYData as XYDataType
+
         self.xyDataObjects["name"] = xyData = XYDataType(())
         return [xyData]
 
@@ -1171,5 +1195,7 @@ class XYSession(XYSessionBase):
         ErrorDeformedMagTupleInPathExtract: Deformed magnification tuple must contain X, Y and Z values
             If **deformedMag** does not contain three Floats.
         """
+        from .XYData import XYData as XYDataType
+
         self.xyDataObjects[name] = xyData = XYDataType(())
         return xyData
@@ -3,9 +3,10 @@ from __future__ import annotations
 import auto_all
 
 from abqpy import run  # noqa
+from abqpy.lazy import lazy_object
 
 run(cae=True)
-auto_all.start_all()
+auto_all.start_all(globals())
 
 from math import *  # noqa
 
@@ -21,12 +22,13 @@ from .UtilityAndView.BackwardCompatibility import BackwardCompatibility  # noqa
 from .UtilityAndView.SymbolicConstant import SymbolicConstant  # noqa
 from .UtilityAndView.User import *  # noqa
 
-session = Session()
-mdb = Mdb()
-
 backwardCompatibility = BackwardCompatibility()
 
 YES = abaqusConstants.YES
 NO = abaqusConstants.NO
 
-auto_all.end_all()
+# The session and mdb objects are created on first access, the toolsets they use are imported on demand
+session: Session = lazy_object(Session)
+mdb: Mdb = lazy_object(Mdb)
+
+auto_all.end_all(globals())
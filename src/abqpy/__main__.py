@@ -4,6 +4,7 @@ import fire
 
 from .cli import AbqpyCLI
 from .config import config
+from .jobs import JobResult
 
 
 def main():
@@ -11,7 +12,10 @@ def main():
     # Print to stdout, a workaround from https://github.com/google/python-fire/issues/188#issuecomment-1528976874
     fire.core.Display = lambda lines, out: out.write("\n".join(lines) + "\n")
     sys.tracebacklimit = config.cli_traceback_limit
-    fire.Fire(AbqpyCLI())
+    # Exit with the status of the Abaqus command, instead of printing its result
+    result = fire.Fire(AbqpyCLI(), serialize=lambda result: None if isinstance(result, JobResult) else result)
+    if isinstance(result, JobResult):
+        sys.exit(result.returncode)
 
 
 if __name__ == "__main__":
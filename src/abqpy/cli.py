@@ -1,14 +1,35 @@
 from __future__ import annotations
 
+import json
 import os
+import sys
+from concurrent.futures import Future
 
 from typeguard import typechecked
 from typing_extensions import Self
 
+from .jobs import JobResult, JobRunner, JobSpec, analysis_tokens, execute
+
 
 @typechecked
 class AbqpyCLIBase:
-    """Base class for Abaqus/CAE command line interface to run Abaqus commands."""
+    """Base class for Abaqus/CAE command line interface to run Abaqus commands.
+
+    Parameters
+    ----------
+    runner : JobRunner, optional
+        The runner the commands are submitted to, by default None to run each command in the foreground and wait for
+        it, with its output printed
+    timeout : float, optional
+        The time in seconds after which a command is killed, by default None for no timeout
+    cwd : str, optional
+        The working directory of the commands, by default None for the current working directory
+    """
+
+    def __init__(self, runner: JobRunner | None = None, *, timeout: float | None = None, cwd: str | None = None):
+        self._runner = runner
+        self._timeout = timeout
+        self._cwd = cwd
 
     def _parse_options(self, **options: str | int | bool | None) -> str:
         """Parse options to be passed to Abaqus/CAE command line interface.
@@ -20,12 +41,31 @@ class AbqpyCLIBase:
         return " ".join([f"{k}={v}" if isinstance(v, (str, int)) and not isinstance(v, bool) else
                          k for k, v in options.items() if v])  # fmt: skip
 
-    def run(self, cmd: str):
-        """Run custom command."""
-        cmd = cmd.strip()
-        message = f"Running the following command: {cmd}"
+    def run(self, cmd: str, *, cpus: int = 1, tokens: int = 0) -> JobResult | Future[JobResult]:
+        """Run custom command.
+
+        Parameters
+        ----------
+        cmd : str
+            The command, run through the shell.
+        cpus : int, optional
+            The number of processors held by the command in the runner, by default 1
+        tokens : int, optional
+            The number of license tokens held by the command in the runner, by default 0
+
+        Returns
+        -------
+        JobResult or Future
+            The result of the command, with its exit status, or the future of the result if the command is submitted
+            to a runner, with its output captured.
+        """
+        spec = JobSpec(cmd.strip(), cpus=cpus, tokens=tokens, timeout=self._timeout, cwd=self._cwd,
+                       capture=self._runner is not None)  # fmt: skip
+        if self._runner is not None:
+            return self._runner.submit(spec)
+        message = f"Running the following command: {spec.command}"
         print("", "-" * len(message), message, "-" * len(message), sep="\n")
-        os.system(cmd)
+        return execute(spec)
 
     def abaqus(self, *args, **options):
         """Run custom Abaqus command: ``abaqus {args} {options}``, arguments are separated by space, options are
@@ -35,10 +75,24 @@ class AbqpyCLIBase:
         ----------
         args, options
             Arguments and options to be passed to the Abaqus command.
+
+        Returns
+        -------
+        JobResult or Future
+            The result of the command, or its future if the command is submitted to a runner, see :meth:`run`. An
+            analysis (with a ``job`` option) submitted to a runner is run with the ``interactive`` option, so that it
+            holds its processors and license tokens in the runner until it ends.
         """
         abaqus = os.environ.get("ABAQUS_BAT_PATH", "abaqus")
+        # An analysis holds its processors and the license tokens they check out while it runs in the foreground,
+        # which an analysis submitted to a runner does unless interactive=False is given
+        if options.get("job") and self._runner is not None:
+            options.setdefault("interactive", True)
+        cpus = options.get("cpus") or 1
+        tokens = analysis_tokens(cpus) if options.get("job") and options.get("interactive") else 0
         args, options = " ".join(args), self._parse_options(**options)
-        self.run(abaqus + (f" {args}" if args else "") + (f" {options}" if options else ""))
+        return self.run(abaqus + (f" {args}" if args else "") + (f" {options}" if options else ""), cpus=cpus,
+                        tokens=tokens)  # fmt: skip
 
 
 @typechecked
@@ -108,7 +162,7 @@ class AbqpyCLI(AbqpyCLIBase):
         args = ("--", *args) if args else ()
 
         # Execute command
-        self.abaqus("cae", options, *args)
+        return self.abaqus("cae", options, *args)
 
     viewer = cae
 
@@ -126,7 +180,7 @@ class AbqpyCLI(AbqpyCLIBase):
         """
         cae_opts = self._parse_options(**options)
         args = (*scripts,) + ((f"script={script}",) if script else ()) + ("-pde",) + ((cae_opts,) if cae_opts else ())
-        self.abaqus("pde", *args)
+        return self.abaqus("pde", *args)
 
     def python(
         self,
@@ -152,7 +206,7 @@ class AbqpyCLI(AbqpyCLIBase):
         options = self._parse_options(sim=sim, log=log)
 
         # Execute command
-        self.abaqus("python", script, options, *args)
+        return self.abaqus("python", script, options, *args)
 
     @typechecked
     def optimization(
@@ -189,140 +243,183 @@ class AbqpyCLI(AbqpyCLIBase):
             The name of the directory used for scratch files.
         """
         # Execute command
-        self.abaqus("optimization", task=task, job=job, cpus=cpus, gpus=gpus, memory=memory,
-                    interactive=interactive, globalmodel=globalmodel, scratch=scratch)  # fmt: skip
+        return self.abaqus("optimization", task=task, job=job, cpus=cpus, gpus=gpus, memory=memory,
+                           interactive=interactive, globalmodel=globalmodel, scratch=scratch)  # fmt: skip
+
+    def importtime(
+        self,
+        module: str = "abaqus",
+        *,
+        repeat: int = 1,
+        top: int = 10,
+        budget: float | None = None,
+        budgets: dict | None = None,
+        output: str | None = None,
+    ):
+        """Measure the import time of a module, aggregated per ``abaqus.<Subpackage>``, and check it against budgets.
+
+        The report is printed as JSON, and the command exits with a non-zero status if a budget is exceeded.
+
+        Parameters
+        ----------
+        module : str, optional
+            The module to import, by default "abaqus"
+        repeat : int, optional
+            The number of fresh interpreters to run, the minimum time of each module is kept, by default 1
+        top : int, optional
+            The number of the slowest modules to include in the report, by default 10
+        budget : float, optional
+            The budget of the total import time in milliseconds, by default None
+        budgets : dict, optional
+            The budgets of the self import time in milliseconds of each group, such as ``{'abaqus.Odb': 100}``,
+            by default None
+        output : str, optional
+            The name of the JSON file to write the report to, by default None to print it to stdout
+        """
+        from .importtime import check_budget, profile_imports
+
+        report = profile_imports(module, repeat=repeat, top=top)
+        report["violations"] = check_budget(report, budget, budgets)
+        text = json.dumps(report, indent=2)
+        if output:
+            with open(output, "w") as file:
+                file.write(text + "\n")
+        else:
+            print(text)
+        if report["violations"]:
+            sys.exit("Import time budget exceeded: " + "; ".join(report["violations"]))
 
     def help(self, *args, **options):
-        self.abaqus("help", *args, **options)
+        return self.abaqus("help", *args, **options)
 
     def information(self, *args, **options):
-        self.abaqus("information", *args, **options)
+        return self.abaqus("information", *args, **options)
 
     def whereami(self, *args, **options):
-        self.abaqus("whereami", *args, **options)
+        return self.abaqus("whereami", *args, **options)
 
     def cse(self, *args, **options):
-        self.abaqus("cse", *args, **options)
+        return self.abaqus("cse", *args, **options)
 
     def cosimulation(self, *args, **options):
-        self.abaqus("cosimulation", *args, **options)
+        return self.abaqus("cosimulation", *args, **options)
 
     def fmu(self, *args, **options):
-        self.abaqus("fmu", *args, **options)
+        return self.abaqus("fmu", *args, **options)
 
     def script(self, *args, **options):
-        self.abaqus("script", *args, **options)
+        return self.abaqus("script", *args, **options)
 
     def doc(self, *args, **options):
-        self.abaqus("doc", *args, **options)
+        return self.abaqus("doc", *args, **options)
 
     def licensing(self, *args, **options):
-        self.abaqus("licensing", *args, **options)
+        return self.abaqus("licensing", *args, **options)
 
     def ascfil(self, *args, **options):
-        self.abaqus("ascfil", *args, **options)
+        return self.abaqus("ascfil", *args, **options)
 
     def append(self, *args, **options):
-        self.abaqus("append", *args, **options)
+        return self.abaqus("append", *args, **options)
 
     def findkeyword(self, *args, **options):
-        self.abaqus("findkeyword", *args, **options)
+        return self.abaqus("findkeyword", *args, **options)
 
     def fetch(self, *args, **options):
-        self.abaqus("fetch", *args, **options)
+        return self.abaqus("fetch", *args, **options)
 
     def make(self, *args, **options):
-        self.abaqus("make", *args, **options)
+        return self.abaqus("make", *args, **options)
 
     def upgrade(self, *args, **options):
-        self.abaqus("upgrade", *args, **options)
+        return self.abaqus("upgrade", *args, **options)
 
     def sim_version(self, *args, **options):
-        self.abaqus("sim_version", *args, **options)
+        return self.abaqus("sim_version", *args, **options)
 
     def odb2sim(self, *args, **options):
-        self.abaqus("odb2sim", *args, **options)
+        return self.abaqus("odb2sim", *args, **options)
 
     def odbreport(self, *args, **options):
-        self.abaqus("odbReport", *args, **options)
+        return self.abaqus("odbReport", *args, **options)
 
     def restartjoin(self, *args, **options):
-        self.abaqus("restartjoin", *args, **options)
+        return self.abaqus("restartjoin", *args, **options)
 
     def substructurecombine(self, *args, **options):
-        self.abaqus("substructurecombine", *args, **options)
+        return self.abaqus("substructurecombine", *args, **options)
 
     def substructurerecover(self, *args, **options):
-        self.abaqus("substructurerecover", *args, **options)
+        return self.abaqus("substructurerecover", *args, **options)
 
     def odbcombine(self, *args, **options):
-        self.abaqus("odbcombine", *args, **options)
+        return self.abaqus("odbcombine", *args, **options)
 
     def networkDBConnector(self, *args, **options):
-        self.abaqus("networkDBConnector", *args, **options)
+        return self.abaqus("networkDBConnector", *args, **options)
 
     def emloads(self, *args, **options):
-        self.abaqus("emloads", *args, **options)
+        return self.abaqus("emloads", *args, **options)
 
     def mtxasm(self, *args, **options):
-        self.abaqus("mtxasm", *args, **options)
+        return self.abaqus("mtxasm", *args, **options)
 
     def fromnastran(self, *args, **options):
-        self.abaqus("fromnastran", *args, **options)
+        return self.abaqus("fromnastran", *args, **options)
 
     def tonastran(self, *args, **options):
-        self.abaqus("tonastran", *args, **options)
+        return self.abaqus("tonastran", *args, **options)
 
     def fromansys(self, *args, **options):
-        self.abaqus("fromansys", *args, **options)
+        return self.abaqus("fromansys", *args, **options)
 
     def frompamcrash(self, *args, **options):
-        self.abaqus("frompamcrash", *args, **options)
+        return self.abaqus("frompamcrash", *args, **options)
 
     def fromradioss(self, *args, **options):
-        self.abaqus("fromradioss", *args, **options)
+        return self.abaqus("fromradioss", *args, **options)
 
     def toOutput2(self, *args, **options):
-        self.abaqus("toOutput2", *args, **options)
+        return self.abaqus("toOutput2", *args, **options)
 
     def fromdyna(self, *args, **options):
-        self.abaqus("fromdyna", *args, **options)
+        return self.abaqus("fromdyna", *args, **options)
 
     def tozaero(self, *args, **options):
-        self.abaqus("tozaero", *args, **options)
+        return self.abaqus("tozaero", *args, **options)
 
     def adams(self, *args, **options):
-        self.abaqus("adams", *args, **options)
+        return self.abaqus("adams", *args, **options)
 
     def tosimpack(self, *args, **options):
-        self.abaqus("tosimpack", *args, **options)
+        return self.abaqus("tosimpack", *args, **options)
 
     def fromsimpack(self, *args, **options):
-        self.abaqus("fromsimpack", *args, **options)
+        return self.abaqus("fromsimpack", *args, **options)
 
     def toexcite(self, *args, **options):
-        self.abaqus("toexcite", *args, **options)
+        return self.abaqus("toexcite", *args, **options)
 
     def moldflow(self, *args, **options):
-        self.abaqus("moldflow", *args, **options)
+        return self.abaqus("moldflow", *args, **options)
 
     def encrypt(self, *args, **options):
-        self.abaqus("encrypt", *args, **options)
+        return self.abaqus("encrypt", *args, **options)
 
     def decrypt(self, *args, **options):
-        self.abaqus("decrypt", *args, **options)
+        return self.abaqus("decrypt", *args, **options)
 
     def suspend(self, *args, **options):
-        self.abaqus("suspend", *args, **options)
+        return self.abaqus("suspend", *args, **options)
 
     def resume(self, *args, **options):
-        self.abaqus("resume", *args, **options)
+        return self.abaqus("resume", *args, **options)
 
     def terminate(self, *args, **options):
-        self.abaqus("terminate", *args, **options)
+        return self.abaqus("terminate", *args, **options)
 
     def sysVerify(self, *args, **options):
-        self.abaqus("sysVerify", *args, **options)
+        return self.abaqus("sysVerify", *args, **options)
 
 
 #: The abqpy command line interface, use this object to run abqpy commands from the python scripts
@@ -40,6 +40,7 @@ class AbaqusConfig(CompatibleBaseModel):
 
     debug: bool = False
     skip_abaqus: bool = False
+    run_jobs: bool = False
     make_docs: bool = False
     cli_traceback_limit: int = 0
 
@@ -94,6 +95,7 @@ config = AbaqusConfig(
     ),
     debug=os.environ.get("ABQPY_DEBUG", "false").lower() in trues,
     skip_abaqus=os.environ.get("ABQPY_SKIP_ABAQUS", "false").lower() in trues,
+    run_jobs=os.environ.get("ABQPY_RUN_JOBS", "false").lower() in trues,
     make_docs=os.environ.get("ABQPY_MAKE_DOCS", "false").lower() in trues,
     cli_traceback_limit=int(os.environ.get("ABQPY_CLI_TRACEBACK_LIMIT", 0)),
 )
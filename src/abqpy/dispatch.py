@@ -0,0 +1,334 @@
+"""Dispatch of Abaqus analyses to remote queues.
+
+An analysis dispatched to a queue is run in three steps: its input files are uploaded to the directory of the
+queue in a single compressed archive, the analysis is run there by the submit command of the queue with its log
+streamed back to the standard output, and its result files are downloaded in a single compressed archive. The
+archive is downloaded by byte ranges, so that an interrupted download resumes where it stopped. The archive and the
+partial download are named after the run of the analysis, and the archives of the previous runs of a job are
+deleted when its input files are uploaded, so that the results of a previous run are never downloaded or resumed.
+The run is recorded in a local ``<job>.dispatch`` file until its results are downloaded, so that a dispatch
+interrupted after the analysis, such as during the download of a large output database, can be resumed with
+``--resume`` without running the analysis again. The remote side only needs a POSIX shell with ``tar`` and ``gzip``.
+
+The commands are run on the remote side by a transport: :class:`LocalTransport` runs them on this machine, such as
+on a shared file system or for a local process pool, and :class:`SshTransport` runs them through ``ssh``. The
+submit command of a queue is looked up in :data:`QUEUE_COMMANDS` by the name of the queue, such as a Slurm ``srun``
+command, the analysis is run directly otherwise.
+
+This module is run with ``python -m abqpy.dispatch`` by :meth:`abaqus.Job.Job.Job.submit` for the jobs with a queue.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shlex
+import subprocess
+import sys
+import tarfile
+import uuid
+from typing import IO, Dict, List, Optional, Sequence, Union
+
+#: The submit commands of the queues, keyed by the name of the queue. A command must run the analysis and wait for
+#: it, with the log of the analysis on its standard output, and is formatted with the ``command``, ``job`` and
+#: ``cpus`` fields, such as ``"srun --job-name={job} --cpus-per-task={cpus} {command}"``.
+QUEUE_COMMANDS: Dict[str, str] = {}
+
+
+class LocalTransport:
+    """Run shell commands on this machine."""
+
+    def shell(self, script: str, stdin: Optional[IO] = None, stdout: Union[IO, int, None] = None) -> int:
+        """Run a POSIX shell script.
+
+        Parameters
+        ----------
+        script : str
+            The script.
+        stdin : file, optional
+            The standard input of the script, by default None for no input
+        stdout : file, optional
+            The standard output of the script, by default None for the standard output of this process
+
+        Returns
+        -------
+        int
+            The exit status of the script.
+        """
+        return subprocess.run(self.command(script), stdin=stdin or subprocess.DEVNULL, stdout=stdout).returncode
+
+    def command(self, script: str) -> List[str]:
+        """Return the command running a POSIX shell script."""
+        return ["sh", "-c", script]
+
+
+class SshTransport(LocalTransport):
+    """Run shell commands on a remote host through ``ssh``.
+
+    Parameters
+    ----------
+    host : str
+        The remote host, such as ``user@host``.
+    ssh : str, optional
+        The ssh command with its options, by default the ``ABQPY_SSH`` environment variable or
+        ``ssh -o BatchMode=yes``
+    """
+
+    def __init__(self, host: str, ssh: Optional[str] = None):
+        self.host = host
+        self.ssh = shlex.split(ssh or os.environ.get("ABQPY_SSH") or "ssh -o BatchMode=yes")
+
+    def command(self, script: str) -> List[str]:
+        return [*self.ssh, self.host, script]
+
+
+def transport(host: str = "") -> LocalTransport:
+    """Return the transport of a host, :class:`LocalTransport` for an empty host or ``localhost``."""
+    return LocalTransport() if host in ("", "localhost") else SshTransport(host)
+
+
+class Dispatcher:
+    """Run the analyses of jobs in the directory of a queue and copy their files back.
+
+    Parameters
+    ----------
+    transport : LocalTransport
+        The transport of the remote side.
+    directory : str
+        The remote directory of the analyses.
+    submit : str, optional
+        The submit command of the queue, see :data:`QUEUE_COMMANDS`, by default "{command}" to run the analyses
+        directly
+    files_to_copy : sequence of str, optional
+        The extensions of the result files copied back, by default None for all the files of the job except its
+        log, which is streamed back while the analysis runs
+    delete_after_copy : bool, optional
+        Delete the remote files of a job after they are copied back, by default False
+    retries : int, optional
+        The number of times an interrupted download is resumed, by default 3
+    """
+
+    def __init__(
+        self,
+        transport: LocalTransport,
+        directory: str,
+        submit: str = "{command}",
+        files_to_copy: Optional[Sequence[str]] = None,
+        delete_after_copy: bool = False,
+        retries: int = 3,
+    ):
+        self.transport = transport
+        self.directory = directory
+        self.submit = submit
+        self.files_to_copy = files_to_copy
+        self.delete_after_copy = delete_after_copy
+        self.retries = retries
+
+    def upload(self, files: Sequence[str], job: Optional[str] = None):
+        """Upload some local files to the remote directory, in a single compressed archive.
+
+        Parameters
+        ----------
+        files : sequence of str
+            The local files.
+        job : str, optional
+            The name of the job whose result archives of the previous runs are deleted from the remote directory,
+            by default None
+
+        Raises
+        ------
+        OSError
+            If the files cannot be uploaded.
+        """
+        directory = shlex.quote(self.directory)
+        script = f"mkdir -p {directory} && tar xzf - -C {directory}"
+        if job is not None:
+            script = f"rm -f {directory}/{shlex.quote(job)}.results.*; {script}"
+        process = subprocess.Popen(self.transport.command(script), stdin=subprocess.PIPE)
+        assert process.stdin is not None
+        with process.stdin, tarfile.open(fileobj=process.stdin, mode="w|gz") as archive:
+            for path in files:
+                archive.add(path, arcname=os.path.basename(path))
+        if process.wait():
+            raise OSError(f"Failed to upload {', '.join(files)} to {self.directory}")
+
+    def run(self, job: str, command: Sequence[str], cpus: int = 1) -> int:
+        """Run the analysis of a job in the remote directory with the submit command, and wait for it.
+
+        Parameters
+        ----------
+        job : str
+            The name of the job.
+        command : sequence of str
+            The command of the analysis.
+        cpus : int, optional
+            The number of processors of the analysis, by default 1
+
+        Returns
+        -------
+        int
+            The exit status of the submit command.
+        """
+        submit = self.submit.format(
+            command=" ".join(shlex.quote(argument) for argument in command), job=shlex.quote(job), cpus=cpus
+        )
+        sys.stdout.flush()
+        return self.transport.shell(f"cd {shlex.quote(self.directory)} && {submit}")
+
+    def download(self, job: str, local: str = ".", run: str = ""):
+        """Copy the result files of a job back to a local directory, in a single compressed archive.
+
+        The archive is created once in the remote directory and downloaded by byte ranges to a ``.part`` file,
+        from the size of the ``.part`` file, so that an interrupted download is resumed. The archive and the
+        ``.part`` file are named after the run, and the ``.part`` files of the other runs of the job are deleted,
+        so that a download is only resumed from the same archive.
+
+        Parameters
+        ----------
+        job : str
+            The name of the job.
+        local : str, optional
+            The local directory, by default the current working directory
+        run : str, optional
+            The identifier of the run of the analysis, such as the one generated by :meth:`dispatch`, by default
+            an empty string
+
+        Raises
+        ------
+        OSError
+            If the archive cannot be created or downloaded.
+        """
+        name = f"{job}.results.{run}.tar.gz" if run else f"{job}.results.tar.gz"
+        archive, remote = shlex.quote(name), shlex.quote(self.directory)
+        if self.files_to_copy is None:
+            patterns = f"{shlex.quote(job)}.*"
+        else:
+            patterns = " ".join(shlex.quote(f"{job}.{extension}") for extension in self.files_to_copy)
+        script = f"""cd {remote} || exit 1
+if [ ! -f {archive} ]; then
+    set --
+    for file in {patterns}; do
+        case "$file" in
+            {shlex.quote(job)}.results.*|{shlex.quote(job)}.log) ;;
+            *) [ -f "$file" ] && set -- "$@" "$file";;
+        esac
+    done
+    tar czf {archive}.tmp -T /dev/null "$@" && mv {archive}.tmp {archive} || exit 1
+fi
+wc -c < {archive}"""
+        result = subprocess.run(self.transport.command(script), stdin=subprocess.DEVNULL, stdout=subprocess.PIPE)
+        if result.returncode:
+            raise OSError(f"Failed to archive the files of {job} in {self.directory}")
+        size = int(result.stdout)
+        part = os.path.join(local, f"{name}.part")
+        prefix = f"{job}.results."
+        for stale in os.listdir(local):
+            if stale.startswith(prefix) and stale.endswith(".part") and stale != f"{name}.part":
+                os.remove(os.path.join(local, stale))
+        for _ in range(self.retries + 1):
+            offset = os.path.getsize(part) if os.path.exists(part) else 0
+            if offset >= size:
+                break
+            with open(part, "ab") as file:
+                self.transport.shell(f"tail -c +{offset + 1} {remote}/{archive}", stdout=file)
+        if not os.path.exists(part) or os.path.getsize(part) != size:
+            raise OSError(f"Failed to download {name} from {self.directory}")
+        with tarfile.open(part, "r:gz") as results:
+            _extract(results, local)
+        os.remove(part)
+        files = f"{archive} {patterns}" if self.delete_after_copy else archive
+        self.transport.shell(f"cd {remote} && rm -f {files}")
+
+    def dispatch(
+        self,
+        job: str,
+        command: Sequence[str],
+        inputs: Sequence[str],
+        cpus: int = 1,
+        copy: bool = True,
+        resume: bool = False,
+    ) -> int:
+        """Upload the input files of a job, run its analysis and download its result files.
+
+        The run of the analysis and its exit status are recorded in the ``<job>.dispatch`` file of the current
+        working directory, which is deleted once the result files are downloaded.
+
+        Parameters
+        ----------
+        job : str
+            The name of the job.
+        command : sequence of str
+            The command of the analysis, run in the remote directory.
+        inputs : sequence of str
+            The local input files of the analysis.
+        cpus : int, optional
+            The number of processors of the analysis, by default 1
+        copy : bool, optional
+            Download the result files of the job, by default True
+        resume : bool, optional
+            Resume an interrupted dispatch of the job: if the ``<job>.dispatch`` file records a finished analysis,
+            only download its result files, resuming the partial download, by default False
+
+        Returns
+        -------
+        int
+            The exit status of the analysis.
+        """
+        path = f"{job}.dispatch"
+        state: Dict[str, Union[str, int]] = {}
+        if resume and os.path.exists(path):
+            with open(path) as file:
+                state = json.load(file)
+        if "returncode" not in state:
+            state = {"run": uuid.uuid4().hex[:12]}
+            _write_state(path, state)
+            self.upload(inputs, job)
+            state["returncode"] = self.run(job, command, cpus)
+            _write_state(path, state)
+        if copy:
+            self.download(job, run=str(state["run"]))
+        os.remove(path)
+        return int(state["returncode"])
+
+
+def _write_state(path: str, state: Dict[str, Union[str, int]]):
+    """Write the state of the dispatch of a job, replacing the previous state atomically."""
+    with open(f"{path}.tmp", "w") as file:
+        json.dump(state, file)
+    os.replace(f"{path}.tmp", path)
+
+
+def _extract(archive: tarfile.TarFile, directory: str):
+    """Extract the regular files of an archive to a directory."""
+    for member in archive.getmembers():
+        if member.isfile() and os.path.basename(member.name) == member.name:
+            archive.extract(member, directory)
+
+
+def main(args: Optional[Sequence[str]] = None) -> int:
+    """Dispatch the analysis of a job to a queue, from the command line arguments."""
+    parser = argparse.ArgumentParser(prog="python -m abqpy.dispatch", description=__doc__.splitlines()[0])
+    parser.add_argument("job", help="name of the job")
+    parser.add_argument("command", nargs="+", help="command of the analysis")
+    parser.add_argument("--host", default="", help="remote host, empty to run the analysis on this machine")
+    parser.add_argument("--directory", required=True, help="remote directory of the analysis")
+    parser.add_argument("--submit", default="{command}", help="submit command of the queue")
+    parser.add_argument("--input", action="append", default=[], help="local input file of the analysis")
+    parser.add_argument("--files", help="comma separated extensions of the result files to copy back")
+    parser.add_argument("--cpus", type=int, default=1, help="number of processors of the analysis")
+    parser.add_argument("--delete", action="store_true", help="delete the remote files after they are copied")
+    parser.add_argument("--no-copy", action="store_true", help="do not copy the result files back")
+    parser.add_argument(
+        "--resume", action="store_true", help="only download the results if the analysis of the job already ran"
+    )
+    options = parser.parse_args(args)
+    files = options.files.split(",") if options.files else None
+    dispatcher = Dispatcher(transport(options.host), options.directory, options.submit, files, options.delete)
+    return dispatcher.dispatch(
+        options.job, options.command, options.input, options.cpus, not options.no_copy, options.resume
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional
+
+#: The line written to the standard error by the child interpreters right before importing the module, so that the
+#: modules imported at the interpreter startup are left out of the report
+MARKER = "abqpy-importtime-start"
+
+
+def parse_importtime(stderr: str) -> Dict[str, Dict[str, float]]:
+    """Parse the output of ``python -X importtime``.
+
+    Parameters
+    ----------
+    stderr : str
+        The standard error output of the Python interpreter run with the ``-X importtime`` option.
+
+    Returns
+    -------
+    dict
+        The self and cumulative import time in milliseconds of each imported module, keyed by the module name.
+    """
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or line.count("|") != 2:
+            continue
+        self_time, cumulative, name = line[len("import time:") :].split("|")
+        if not self_time.strip().isdigit():  # the header line
+            continue
+        modules[name.strip()] = {"self": int(self_time) / 1000, "cumulative": int(cumulative) / 1000}
+    return modules
+
+
+def import_total(stderr: str) -> float:
+    """Return the cumulative import time in milliseconds of the top level imports in the output of
+    ``python -X importtime``, the modules they import included.
+
+    Parameters
+    ----------
+    stderr : str
+        The standard error output of the Python interpreter run with the ``-X importtime`` option.
+    """
+    total = 0.0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or line.count("|") != 2:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        # The nested imports are indented by two more spaces than the top level ones
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            total += int(cumulative) / 1000
+    return total
+
+
+def module_group(name: str) -> str:
+    """Return the group a module is aggregated to, ``abaqus.<Subpackage>`` for modules in the `abaqus` package and
+    the top level package name for the others."""
+    parts = name.split(".")
+    return ".".join(parts[:2]) if parts[0] == "abaqus" else parts[0]
+
+
+def profile_imports(module: str = "abaqus", repeat: int = 1, top: int = 10) -> Dict[str, Any]:
+    """Measure the import time of a module in fresh interpreters and aggregate it per subpackage.
+
+    The module is imported ``repeat`` times with ``python -X importtime`` and the minimum time of each module over
+    the runs is kept. Only the modules imported by the module are reported, not the ones imported at the startup
+    of the interpreter. Abaqus is never launched: ``ABQPY_SKIP_ABAQUS`` is set for the child interpreters.
+
+    Parameters
+    ----------
+    module : str, optional
+        The module to import, by default "abaqus"
+    repeat : int, optional
+        The number of fresh interpreters to run, by default 1
+    top : int, optional
+        The number of the slowest modules (by self time) to include in the report, by default 10
+
+    Returns
+    -------
+    dict
+        The import time report, with the total import time (the cumulative import time of the module), the self
+        time and module count of each group, and the slowest modules, all times are in milliseconds.
+    """
+    env = dict(os.environ, ABQPY_SKIP_ABAQUS="true")
+    code = f"import sys; sys.stderr.write({MARKER!r} + '\\n'); sys.stderr.flush(); import {module}"
+    runs, totals = [], []
+    for _ in range(max(repeat, 1)):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code], env=env, capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"Failed to import {module}:\n{result.stderr.strip()}")
+        stderr = result.stderr.split(MARKER, 1)[-1]
+        runs.append(parse_importtime(stderr))
+        totals.append(import_total(stderr))
+
+    modules = {
+        name: {key: min(run[name][key] for run in runs if name in run) for key in ("self", "cumulative")}
+        for name in runs[0]
+    }
+    groups: Dict[str, Dict[str, float]] = {}
+    for name, times in modules.items():
+        group = groups.setdefault(module_group(name), {"self": 0.0, "modules": 0})
+        group["self"] += times["self"]
+        group["modules"] += 1
+
+    return {
+        "module": module,
+        "python": sys.version.split()[0],
+        "repeat": len(runs),
+        "total": round(min(totals), 3),
+        "groups": {
+            name: {"self": round(group["self"], 3), "modules": group["modules"]}
+            for name, group in sorted(groups.items(), key=lambda item: -item[1]["self"])
+        },
+        "modules": [
+            {"name": name, **times} for name, times in sorted(modules.items(), key=lambda item: -item[1]["self"])[:top]
+        ],
+    }
+
+
+def check_budget(
+    report: Dict[str, Any], budget: Optional[float] = None, budgets: Optional[Dict[str, float]] = None
+) -> List[str]:
+    """Check an import time report against the configured budgets.
+
+    Parameters
+    ----------
+    report : dict
+        The import time report returned by :func:`profile_imports`.
+    budget : float, optional
+        The budget of the total import time in milliseconds, by default None
+    budgets : dict, optional
+        The budgets of the self import time in milliseconds of each group, keyed by the group name, such as
+        ``{"abaqus.Odb": 100}``, by default None
+
+    Returns
+    -------
+    list of str
+        The descriptions of the exceeded budgets, empty if all the budgets are met.
+    """
+    violations = []
+    if budget is not None and report["total"] > budget:
+        violations.append(f"total: {report['total']:.1f} ms > {budget:.1f} ms")
+    for group, limit in (budgets or {}).items():
+        actual = report["groups"].get(group, {"self": 0.0})["self"]
+        if actual > limit:
+            violations.append(f"{group}: {actual:.1f} ms > {limit:.1f} ms")
+    return violations
@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+import os
+import shutil
+import signal
+import subprocess
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+
+def analysis_tokens(cpus: int) -> int:
+    """Return the number of Abaqus analysis license tokens checked out by an analysis run on some processors.
+
+    Parameters
+    ----------
+    cpus : int
+        The number of processors of the analysis.
+
+    Returns
+    -------
+    int
+        The number of tokens, ``int(5 * cpus ** 0.422)``.
+    """
+    return int(5 * max(cpus, 1) ** 0.422)
+
+
+def resolve_command(command: Union[str, Sequence[str]]) -> Union[str, List[str]]:
+    """Return a command with its executable resolved on Windows, where a command given as a sequence is run
+    without a shell and only finds the ``.exe`` executables, not batch files such as ``abaqus.bat``.
+
+    Parameters
+    ----------
+    command : str or sequence of str
+        The command, run through the shell if it is a string.
+
+    Returns
+    -------
+    str or list of str
+        The command, whose executable is replaced by its path found with the ``PATHEXT`` extensions on Windows.
+    """
+    if isinstance(command, str):
+        return command
+    command = list(command)
+    if os.name == "nt" and command:
+        command[0] = shutil.which(command[0]) or command[0]
+    return command
+
+
+def kill_tree(process: subprocess.Popen):
+    """Kill a process with its child processes, such as the solver started by the ``abaqus`` driver or the
+    commands run by a shell.
+
+    On POSIX, the process must have been started in a new session, whose process group is killed. On Windows,
+    the process tree is killed by ``taskkill /T /F``.
+
+    Parameters
+    ----------
+    process : subprocess.Popen
+        The process.
+    """
+    if process.poll() is not None:
+        return
+    if os.name == "posix":
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    else:
+        subprocess.run(["taskkill", "/T", "/F", "/PID", str(process.pid)], stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL)  # fmt: skip
+        if process.poll() is None:
+            process.kill()
+
+
+@dataclass(frozen=True)
+class JobSpec:
+    """A command to be run as a job, with the resources it holds while running.
+
+    Parameters
+    ----------
+    command : str or sequence of str
+        The command, run through the shell if it is a string.
+    cpus : int, optional
+        The number of processors held by the job, by default 1
+    tokens : int, optional
+        The number of license tokens held by the job, by default 0
+    timeout : float, optional
+        The time in seconds after which the job is killed, by default None for no timeout
+    cwd : str, optional
+        The working directory of the job, by default None for the current working directory
+    env : dict, optional
+        The environment variables added to the environment of the job, by default None
+    capture : bool, optional
+        Capture the standard output and error of the job instead of printing them, by default True
+    """
+
+    command: Union[str, Sequence[str]]
+    cpus: int = 1
+    tokens: int = 0
+    timeout: Optional[float] = None
+    cwd: Optional[str] = None
+    env: Optional[Dict[str, str]] = None
+    capture: bool = True
+
+
+@dataclass
+class JobResult:
+    """The result of a job.
+
+    Parameters
+    ----------
+    spec : JobSpec
+        The job.
+    returncode : int
+        The exit status of the job, negative if it was killed by a signal on POSIX.
+    stdout : str, optional
+        The standard output of the job, None if it was not captured.
+    stderr : str, optional
+        The standard error of the job, None if it was not captured.
+    duration : float
+        The wall time of the job in seconds.
+    timed_out : bool, optional
+        Whether the job was killed because it exceeded its timeout, by default False
+    """
+
+    spec: JobSpec
+    returncode: int
+    stdout: Optional[str] = field(default=None, repr=False)
+    stderr: Optional[str] = field(default=None, repr=False)
+    duration: float = 0.0
+    timed_out: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """Whether the job exited with a zero status before its timeout."""
+        return self.returncode == 0 and not self.timed_out
+
+    def check(self) -> JobResult:
+        """Return the result, raising an exception if the job failed.
+
+        Raises
+        ------
+        subprocess.TimeoutExpired
+            If the job exceeded its timeout.
+        subprocess.CalledProcessError
+            If the job exited with a non-zero status.
+        """
+        if self.timed_out:
+            raise subprocess.TimeoutExpired(self.spec.command, self.spec.timeout or 0, self.stdout, self.stderr)
+        if self.returncode:
+            raise subprocess.CalledProcessError(self.returncode, self.spec.command, self.stdout, self.stderr)
+        return self
+
+
+def execute(spec: JobSpec) -> JobResult:
+    """Run a job in a subprocess and wait for it.
+
+    The job is killed with its child processes if it exceeds its timeout, see :func:`kill_tree`, which requires it
+    to be started in a new process group on POSIX.
+
+    Parameters
+    ----------
+    spec : JobSpec
+        The job.
+
+    Returns
+    -------
+    JobResult
+        The result of the job.
+    """
+    pipe = subprocess.PIPE if spec.capture else None
+    env = {**os.environ, **spec.env} if spec.env else None
+    session = spec.timeout is not None and os.name == "posix"
+    start = time.perf_counter()
+    with subprocess.Popen(resolve_command(spec.command), shell=isinstance(spec.command, str), cwd=spec.cwd, env=env,
+                          stdout=pipe, stderr=pipe, text=True, start_new_session=session) as process:  # fmt: skip
+        timed_out = False
+        try:
+            stdout, stderr = process.communicate(timeout=spec.timeout)
+        except subprocess.TimeoutExpired:
+            timed_out = True
+            kill_tree(process)
+            stdout, stderr = process.communicate()
+    return JobResult(spec, process.returncode, stdout, stderr, time.perf_counter() - start, timed_out)
+
+
+class JobRunner:
+    """A queue of jobs run in subprocesses, with a bounded number of jobs in flight.
+
+    A job starts when a worker is free and when the processors and license tokens it holds are available, so that
+    the jobs running at the same time never hold more than the processors and tokens of the runner.
+
+    Parameters
+    ----------
+    workers : int, optional
+        The maximum number of jobs running at the same time, by default the number of processors of the runner
+    cpus : int, optional
+        The number of processors shared by the jobs, by default the number of processors of the machine
+    tokens : int, optional
+        The number of license tokens shared by the jobs, by default None for no limit
+
+    Examples
+    --------
+    Run a grid search with at most 4 Abaqus analyses of 2 processors at the same time, using at most 30 tokens:
+
+    .. code-block:: python
+
+        from abqpy.jobs import JobRunner, analysis_tokens
+
+        with JobRunner(workers=4, tokens=30) as runner:
+            futures = [runner.submit(f"abaqus job=Job-{i} cpus=2 interactive", cpus=2, tokens=analysis_tokens(2))
+                       for i in range(10)]
+            results = [future.result() for future in futures]
+    """
+
+    def __init__(self, workers: Optional[int] = None, cpus: Optional[int] = None, tokens: Optional[int] = None):
+        self.cpus = cpus or os.cpu_count() or 1
+        self.tokens = tokens
+        self.workers = workers or self.cpus
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="abqpy-job")
+        self._condition = threading.Condition()
+        self._used_cpus = self._used_tokens = 0
+
+    def submit(self, command: Union[str, Sequence[str], JobSpec], **options) -> Future[JobResult]:
+        """Add a job to the queue.
+
+        Parameters
+        ----------
+        command : str, sequence of str or JobSpec
+            The command of the job, or the job.
+        options
+            The other fields of the :class:`JobSpec` of the job, if a command is given.
+
+        Returns
+        -------
+        Future
+            The future of the :class:`JobResult` of the job.
+
+        Raises
+        ------
+        ValueError
+            If the job holds more processors or tokens than the runner.
+        """
+        spec = command if isinstance(command, JobSpec) else JobSpec(command, **options)
+        if spec.cpus > self.cpus or (self.tokens is not None and spec.tokens > self.tokens):
+            raise ValueError(
+                f"The job holds {spec.cpus} cpus and {spec.tokens} tokens, "
+                f"more than the {self.cpus} cpus and {self.tokens} tokens of the runner"
+            )
+        return self._executor.submit(self._run, spec)
+
+    def map(self, commands: Iterable[Union[str, Sequence[str], JobSpec]], **options) -> List[JobResult]:
+        """Run some jobs and wait for them.
+
+        Parameters
+        ----------
+        commands : iterable
+            The commands of the jobs, or the jobs.
+        options
+            The other fields of the :class:`JobSpec` of each job given by a command.
+
+        Returns
+        -------
+        list of JobResult
+            The results of the jobs, in the order of the commands.
+        """
+        futures = [self.submit(command, **options) for command in commands]
+        return [future.result() for future in futures]
+
+    def shutdown(self, wait: bool = True):
+        """Stop accepting jobs.
+
+        Parameters
+        ----------
+        wait : bool, optional
+            Wait for the jobs in the queue to finish, by default True
+        """
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self) -> JobRunner:
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+    def _fits(self, spec: JobSpec) -> bool:
+        """Whether the processors and tokens held by a job are available."""
+        tokens = self.tokens is None or self._used_tokens + spec.tokens <= self.tokens
+        return self._used_cpus + spec.cpus <= self.cpus and tokens
+
+    def _run(self, spec: JobSpec) -> JobResult:
+        """Wait for the resources of a job, and run it."""
+        with self._condition:
+            self._condition.wait_for(lambda: self._fits(spec))
+            self._used_cpus += spec.cpus
+            self._used_tokens += spec.tokens
+        try:
+            return execute(spec)
+        finally:
+            with self._condition:
+                self._used_cpus -= spec.cpus
+                self._used_tokens -= spec.tokens
+                self._condition.notify_all()
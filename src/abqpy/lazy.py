@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Callable
+
+
+class LazyAttribute:
+    """A class attribute whose value is created the first time it is accessed.
+
+    The module defining the class of the value is only imported at that time, then the value replaces this
+    descriptor in the class that owns it, so that it is shared by all the instances like a plain class attribute.
+
+    Parameters
+    ----------
+    module : str
+        The name of the module defining the class of the value, relative to the package of the owner class if it
+        starts with a dot.
+    name : str
+        The name of the class of the value.
+    args, kwargs
+        The arguments passed to the class to create the value.
+    """
+
+    def __init__(self, module: str, name: str, *args: Any, **kwargs: Any):
+        self.module, self.name, self.args, self.kwargs = module, name, args, kwargs
+
+    def __set_name__(self, owner: type, attribute: str):
+        self.owner, self.attribute = owner, attribute
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        package = self.owner.__module__.rpartition(".")[0]
+        value = getattr(import_module(self.module, package), self.name)(*self.args, **self.kwargs)
+        setattr(self.owner, self.attribute, value)
+        return value
+
+    def __repr__(self) -> str:
+        return f"{self.name}()"
+
+
+def lazy_attribute(module: str, name: str, *args: Any, **kwargs: Any) -> Any:
+    """Return a :class:`LazyAttribute` to be used as the default value of a class attribute.
+
+    The return type is ``Any`` so that the class attribute keeps its declared type for type checkers, e.g.::
+
+        journalOptions: JournalOptions = lazy_attribute(".JournalOptions", "JournalOptions")
+    """
+    return LazyAttribute(module, name, *args, **kwargs)
+
+
+#: The value of a LazyObject which is not created yet
+_MISSING = object()
+
+
+class LazyObject:
+    """A proxy of an object created the first time one of its attributes is accessed.
+
+    The proxy forwards the attribute access, assignment and deletion to the object, and reports its class, so that
+    ``isinstance`` checks still hold. It is used for the module level singletons that are star-exported, such as
+    ``abaqus.session``, so that ``from abaqus import *`` does not create them.
+
+    Parameters
+    ----------
+    factory : callable
+        The function creating the object, called without arguments.
+    """
+
+    def __init__(self, factory: Callable[[], Any]):
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_value", _MISSING)
+
+    def _resolve(self) -> Any:
+        """Return the object, created on the first call."""
+        value = object.__getattribute__(self, "_value")
+        if value is _MISSING:
+            value = object.__getattribute__(self, "_factory")()
+            object.__setattr__(self, "_value", value)
+        return value
+
+    if not TYPE_CHECKING:
+
+        @property
+        def __class__(self) -> type:
+            return type(self._resolve())
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+
+    def __setattr__(self, name: str, value: Any):
+        setattr(self._resolve(), name, value)
+
+    def __delattr__(self, name: str):
+        delattr(self._resolve(), name)
+
+    def __dir__(self):
+        return dir(self._resolve())
+
+    def __repr__(self) -> str:
+        return repr(self._resolve())
+
+
+def lazy_object(factory: Callable[[], Any]) -> Any:
+    """Return a :class:`LazyObject` creating its object with a factory.
+
+    The return type is ``Any`` so that the variable keeps its declared type for type checkers, e.g.::
+
+        session: Session = lazy_object(Session)
+    """
+    return LazyObject(factory)
+
+
+def created(value: Any) -> Any:
+    """Return the object of a :class:`LazyObject`, or None if it is not created yet, and any other value as is."""
+    if type(value) is LazyObject:
+        value = object.__getattribute__(value, "_value")
+        return None if value is _MISSING else value
+    return value
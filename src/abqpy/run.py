@@ -43,9 +43,9 @@ def run(cae: bool = True) -> None:
         warnings.warn(
             "You are running the script in debug mode, the script will be opened in Abaqus PDE where you can debug it."
         )
-        abaqus.pde(script=filePath)
+        result = abaqus.pde(script=filePath)
     elif cae:
-        abaqus.cae(filePath, *sys.argv[1:], **config.cae.model_dump())
+        result = abaqus.cae(filePath, *sys.argv[1:], **config.cae.model_dump())
     else:
-        abaqus.python(filePath, *sys.argv[1:], **config.python.model_dump())
-    sys.exit(0)
+        result = abaqus.python(filePath, *sys.argv[1:], **config.python.model_dump())
+    sys.exit(result.returncode)
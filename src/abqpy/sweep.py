@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import hashlib
+import itertools
+import json
+import os
+import random
+import shutil
+import sys
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from .jobs import JobResult, JobRunner, JobSpec
+
+#: The name of the file describing a run in its cache directory
+MANIFEST = "manifest.json"
+
+
+def grid(**axes: Sequence[Any]) -> List[Dict[str, Any]]:
+    """Return the parameters of the runs of a full factorial grid.
+
+    Parameters
+    ----------
+    axes : sequence
+        The values of each parameter, keyed by the parameter name.
+
+    Returns
+    -------
+    list of dict
+        The parameters of each run, the last parameter varying the fastest.
+    """
+    names = list(axes)
+    return [dict(zip(names, values)) for values in itertools.product(*axes.values())]
+
+
+def sample(count: int, seed: Optional[int] = 0, **bounds: Tuple[float, float]) -> List[Dict[str, float]]:
+    """Return the parameters of some runs sampled uniformly at random.
+
+    Parameters
+    ----------
+    count : int
+        The number of runs.
+    seed : int, optional
+        The seed of the random generator, by default 0 so that the same runs, which are then cached, are sampled
+        again, or None for other runs each time
+    bounds : tuple of float
+        The lower and upper bounds of each parameter, keyed by the parameter name.
+
+    Returns
+    -------
+    list of dict
+        The parameters of each run.
+    """
+    generator = random.Random(seed)
+    return [{name: generator.uniform(low, high) for name, (low, high) in bounds.items()} for _ in range(count)]
+
+
+def file_digest(path: str) -> str:
+    """Return the SHA-256 digest of the contents of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def sweep_key(script: str, parameters: Mapping[str, Any], dependencies: Sequence[str] = ()) -> str:
+    """Return the key of a run in the cache, which changes with the contents of the model script and of its
+    dependencies, with the parameters of the run and with the version of abqpy.
+
+    Parameters
+    ----------
+    script : str
+        The path of the model script.
+    parameters : dict
+        The parameters of the run, which must be serializable to JSON.
+    dependencies : sequence of str, optional
+        The paths of other files read by the model script, by default ()
+
+    Returns
+    -------
+    str
+        The SHA-256 digest of the inputs of the run.
+    """
+    from . import __semver__
+
+    inputs = {
+        "script": file_digest(script),
+        "dependencies": [file_digest(path) for path in dependencies],
+        "parameters": parameters,
+        "abqpy": __semver__,
+    }
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def sweep(
+    script: str,
+    parameters: Iterable[Mapping[str, Any]],
+    *,
+    cache: str = ".abqpy-sweep",
+    arguments: Optional[Callable[[Mapping[str, Any]], List[str]]] = None,
+    collect: Optional[Callable[[str], Mapping[str, Any]]] = None,
+    dependencies: Sequence[str] = (),
+    runner: Optional[JobRunner] = None,
+    workers: Optional[int] = None,
+    cpus: int = 1,
+    tokens: int = 0,
+    timeout: Optional[float] = None,
+    frame: bool = False,
+) -> Any:
+    """Run a model script for each set of parameters of a sweep, reusing the results of the runs already done.
+
+    Each run is keyed by the hash of the model script, its dependencies, its parameters and the version of abqpy,
+    see :func:`sweep_key`, and its files are kept in the ``<cache>/<key[:2]>/<key>`` directory. The runs whose
+    directory exists are not run again, and the other runs are run at the same time with ``python <script>
+    <arguments>`` in a new directory, which is moved to the cache when the run succeeds. The output of each run is
+    written to the ``stdout.txt`` and ``stderr.txt`` files of its directory.
+
+    Parameters
+    ----------
+    script : str
+        The path of the model script, run in the directory of each run.
+    parameters : iterable of dict
+        The parameters of each run, such as the runs of :func:`grid` or :func:`sample`.
+    cache : str, optional
+        The cache directory, by default ".abqpy-sweep"
+    arguments : callable, optional
+        The function returning the command line arguments of the model script for the parameters of a run, by
+        default one ``<name>=<value>`` argument per parameter
+    collect : callable, optional
+        The function returning the results of a run from its directory, by default the contents of its
+        ``results.json`` file if it exists
+    dependencies : sequence of str, optional
+        The paths of other files read by the model script, which are part of the key of the runs, by default ()
+    runner : JobRunner, optional
+        The runner of the runs, by default a runner with ``workers`` workers, shut down at the end of the sweep
+    workers : int, optional
+        The maximum number of runs at the same time if no runner is given, by default the number of processors
+    cpus : int, optional
+        The number of processors held by each run in the runner, by default 1
+    tokens : int, optional
+        The number of license tokens held by each run in the runner, by default 0
+    timeout : float, optional
+        The time in seconds after which a run is killed, by default None for no timeout
+    frame : bool, optional
+        Return a pandas DataFrame instead of a list of dicts, by default False
+
+    Returns
+    -------
+    list of dict or pandas.DataFrame
+        The table of the runs, with one row per set of parameters, in order: the parameters, followed by the
+        ``key``, ``directory``, ``cached``, ``returncode`` and ``duration`` columns and by the collected results.
+        A failed run is not cached, its files are kept in the ``<key>.failed`` directory and it has no results.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from abqpy.sweep import grid, sweep
+
+        table = sweep("compression.py", grid(E=[1e2, 1e3], nu=[0.2, 0.3]), workers=4, frame=True)
+    """
+    script = os.path.abspath(script)
+    runs = [dict(run) for run in parameters]
+    keys = [sweep_key(script, run, dependencies) for run in runs]
+    pending = {key: run for key, run in zip(keys, runs) if not os.path.isdir(_entry(cache, key))}
+
+    owned = runner is None
+    runner = runner or JobRunner(workers=workers)
+    try:
+        futures = {}
+        for key, run in pending.items():
+            directory = _entry(cache, key) + f".{os.getpid()}.tmp"
+            shutil.rmtree(directory, ignore_errors=True)
+            os.makedirs(directory)
+            command = [sys.executable, script, *(arguments or _arguments)(run)]
+            spec = JobSpec(command, cpus=cpus, tokens=tokens, timeout=timeout, cwd=directory)
+            futures[key] = runner.submit(spec)
+        results = {key: _store(cache, key, pending[key], future.result()) for key, future in futures.items()}
+    finally:
+        if owned:
+            runner.shutdown()
+
+    rows = []
+    for key, run in zip(keys, runs):
+        succeeded = results.get(key, True)
+        directory = _entry(cache, key) + ("" if succeeded else ".failed")
+        with open(os.path.join(directory, MANIFEST)) as file:
+            manifest = json.load(file)
+        row = {**run, "key": key, "directory": directory, "cached": key not in pending}
+        row.update(returncode=manifest["returncode"], duration=manifest["duration"])
+        if succeeded:
+            row.update((collect or _collect)(directory))
+        rows.append(row)
+    if frame:
+        import pandas as pd
+
+        return pd.DataFrame(rows)
+    return rows
+
+
+def _entry(cache: str, key: str) -> str:
+    """Return the directory of a run in the cache."""
+    return os.path.join(os.path.abspath(cache), key[:2], key)
+
+
+def _arguments(parameters: Mapping[str, Any]) -> List[str]:
+    """Return the default command line arguments of a run."""
+    return [f"{name}={value}" for name, value in parameters.items()]
+
+
+def _collect(directory: str) -> Mapping[str, Any]:
+    """Return the default results of a run."""
+    path = os.path.join(directory, "results.json")
+    if not os.path.exists(path):
+        return {}
+    with open(path) as file:
+        return json.load(file)
+
+
+def _store(cache: str, key: str, parameters: Mapping[str, Any], result: JobResult) -> bool:
+    """Write the output and the manifest of a run to its directory, and move the directory to the cache if the
+    run succeeded, returning whether it did."""
+    directory = result.spec.cwd or ""
+    for name, text in (("stdout.txt", result.stdout), ("stderr.txt", result.stderr)):
+        with open(os.path.join(directory, name), "w") as file:
+            file.write(text or "")
+    manifest: Dict[str, Any] = {"key": key, "parameters": parameters, "command": result.spec.command}
+    manifest.update(returncode=result.returncode, timed_out=result.timed_out, duration=result.duration)
+    with open(os.path.join(directory, MANIFEST), "w") as file:
+        json.dump(manifest, file, indent=2, default=str)
+    target = _entry(cache, key)
+    if not result.ok:
+        target += ".failed"
+        shutil.rmtree(target, ignore_errors=True)
+    try:
+        os.replace(directory, target)
+    except OSError:
+        # Another sweep has stored the same run in the meantime
+        shutil.rmtree(directory, ignore_errors=True)
+    return result.ok
@@ -5,7 +5,7 @@ import auto_all
 from abqpy import run
 
 run(cae=False)
-auto_all.start_all()
+auto_all.start_all(globals())
 
 from math import *  # noqa
 
@@ -23,4 +23,4 @@ from abaqusConstants import *  # noqa
 
 backwardCompatibility = BackwardCompatibility()
 
-auto_all.end_all()
+auto_all.end_all(globals())
@@ -0,0 +1,54 @@
+import os
+
+import pytest
+
+from abaqus.UtilityAndView import abaqusConstants as constants
+from abaqus.UtilityAndView.abaqusConstants import (
+    OFF,
+    ON,
+    AbaqusBoolean,
+    SymbolicConstant,
+    abaqusConstants,
+)
+
+
+def test_constants_are_interned():
+    assert constants.C3D8R is abaqusConstants.C3D8R
+    assert SymbolicConstant("C3D8R") is abaqusConstants.C3D8R
+    assert repr(abaqusConstants.C3D8R) == str(abaqusConstants.C3D8R) == "C3D8R"
+    assert SymbolicConstant("ON") is ON and SymbolicConstant("OFF") is OFF
+    assert isinstance(ON, AbaqusBoolean) and ON and not OFF
+
+
+def test_constants_table():
+    assert "YES" in abaqusConstants and "ON" not in abaqusConstants
+    assert abaqusConstants["NO"] is constants.NO
+    assert len(abaqusConstants) == len(abaqusConstants._member_names_) == len(list(abaqusConstants))
+    assert set(abaqusConstants._member_names_) <= set(constants.__all__)
+
+
+def test_unknown_constants():
+    with pytest.raises(AttributeError):
+        constants.NOT_A_CONSTANT
+    with pytest.raises(AttributeError):
+        abaqusConstants.NOT_A_CONSTANT
+    with pytest.raises(ValueError):
+        SymbolicConstant("lower_case")
+
+
+def test_constants_enum_compatibility():
+    assert abaqusConstants.C3D8R.name == "C3D8R" and abaqusConstants.C3D8R.value is abaqusConstants.C3D8R
+    assert abaqusConstants.__members__["YES"] is constants.YES and len(abaqusConstants.__members__) == len(
+        abaqusConstants
+    )
+
+
+def test_import_is_lazy():
+    import subprocess
+    import sys
+
+    # Importing the module only creates a few constants, not the whole table
+    code = "import abaqus.UtilityAndView.abaqusConstants, abaqus.UtilityAndView.SymbolicConstant as s"
+    env = {**os.environ, "PYTHONPATH": os.path.abspath("../src")}
+    output = subprocess.check_output([sys.executable, "-c", f"{code}; print(len(s._symbolicConstants))"], env=env)
+    assert int(output) < 100
@@ -0,0 +1,145 @@
+import numpy as np
+import pytest
+
+from abaqus import *
+from abaqus.Odb.FieldEnvelope import FieldEnvelope
+from abaqus.Odb.FieldInvariants import computeInvariants
+from abaqus.Odb.FieldOutput import FieldOutput
+from abaqus.Odb.OdbInstance import OdbInstance
+from abaqus.Odb.OdbMeshElement import OdbMeshElement
+from abaqus.Odb.OdbPart import OdbPart
+from abaqusConstants import *
+from odbAccess import *
+
+
+@pytest.fixture
+def field():
+    instance = OdbInstance("PART-1-1", OdbPart("PART-1", THREE_D, DEFORMABLE_BODY))
+    field = FieldOutput(name="S", description="Stress", type=TENSOR_3D_FULL)
+    field.setComponentLabels(("S11", "S22", "S33", "S12", "S13", "S23"))
+    field.addData(position=INTEGRATION_POINT, instance=instance, labels=(1, 2, 3), data=np.arange(144).reshape(24, 6))
+    field.addData(position=NODAL, instance=instance, labels=(1, 2, 3, 4), data=np.ones((4, 6)))
+    return field
+
+
+def test_as_arrays(field):
+    arrays = field.asArrays()
+    assert len(arrays) == 28 and arrays.data.shape == (28, 6)
+    assert arrays.positions == (INTEGRATION_POINT, NODAL)
+    assert arrays.elementLabels.tolist() == [1] * 8 + [2] * 8 + [3] * 8 + [-1] * 4
+    assert arrays.nodeLabels.tolist() == [-1] * 24 + [1, 2, 3, 4]
+    assert arrays.integrationPoints[:9].tolist() == [1, 2, 3, 4, 5, 6, 7, 8, 1]
+    assert arrays["S22"][:2].tolist() == [1.0, 7.0]
+
+
+def test_subsets_are_views(field):
+    integrationPoints = field.getSubset(position=INTEGRATION_POINT)
+    assert integrationPoints.bulkDataBlocks == field.bulkDataBlocks[:1]
+    assert np.shares_memory(integrationPoints.asArrays().data, field.bulkDataBlocks[0].data)
+
+    element = OdbMeshElement.__new__(OdbMeshElement)
+    element.label = 2
+    subset = integrationPoints.getSubset(region=element)
+    assert subset.asArrays().elementLabels.tolist() == [2] * 8
+    assert np.shares_memory(subset.bulkDataBlocks[0].data, field.bulkDataBlocks[0].data)
+
+
+def test_invariants():
+    uniaxial = computeInvariants(np.array([[100.0, 0, 0, 0, 0, 0]]), TENSOR_3D_FULL)
+    assert {invariant: value[0] for invariant, value in uniaxial.items()} == pytest.approx(
+        {MISES: 100, TRESCA: 100, PRESS: -100 / 3, INV3: 100, MAX_PRINCIPAL: 100, MID_PRINCIPAL: 0, MIN_PRINCIPAL: 0}
+    )
+    shear = computeInvariants(np.array([[0.0, 0, 0, 2]]), TENSOR_3D_PLANAR, isEngineeringTensor=True)
+    assert shear[MAX_INPLANE_PRINCIPAL][0] == pytest.approx(1) and shear[MIN_PRINCIPAL][0] == pytest.approx(-1)
+    assert computeInvariants(np.array([[3.0, 4, 0]]), VECTOR)[MAGNITUDE][0] == 5
+    with pytest.raises(ValueError):
+        computeInvariants(np.zeros((1, 6)), TENSOR_3D_FULL, invariants=(MAX_INPLANE_PRINCIPAL,))
+
+
+def test_scalar_field_and_envelope(field):
+    mises = field.getScalarField(invariant=MISES)
+    assert mises.type == SCALAR and mises.asArrays().data.shape == (28, 1)
+    assert field.getScalarField(componentLabel="S22").asArrays().data[:2, 0].tolist() == [1.0, 7.0]
+
+    tresca = field.getScalarField(invariant=TRESCA)
+    envelope, index = minEnvelope([tresca, mises])
+    assert envelope.asArrays().data[:, 0] == pytest.approx(mises.asArrays().data[:, 0])
+    assert set(index.asArrays().data[:24, 0].tolist()) == {1}
+    envelope, index = maxEnvelope([field, field], "S11")
+    assert index.asArrays().data[:, 0].tolist() == [0] * 28
+    assert envelope.asArrays().data[:3, 0].tolist() == [0.0, 6.0, 12.0]
+
+
+def test_chunked_parallel_and_merged_envelopes(field, monkeypatch):
+    rng = np.random.default_rng(0)
+    fields = []
+    for _ in range(7):
+        other = FieldOutput(field)
+        other.bulkDataBlocks = [
+            block._replace(data=rng.normal(size=block.data.shape)) for block in field.bulkDataBlocks
+        ]
+        fields.append(other)
+    values = np.stack([other.getScalarField(MISES).asArrays().data[:, 0] for other in fields])
+
+    # The invariants are computed with the reduction of each chunk, not through scalar fields in this process
+    monkeypatch.delattr(FieldOutput, "getScalarField")
+    expected = FieldEnvelope(True, MISES).add(fields, chunkSize=1)
+    assert expected.values.tolist() == values.max(axis=0).tolist()
+    assert expected.indices.tolist() == values.argmax(axis=0).tolist()
+    for envelope in (
+        FieldEnvelope(True, MISES).add(fields, chunkSize=3),
+        FieldEnvelope(True, MISES).add(iter(fields), chunkSize=2, processes=2),
+        FieldEnvelope(True, MISES).add(fields[:4]).merge(FieldEnvelope(True, MISES).add(fields[4:])),
+    ):
+        assert envelope.count == 7
+        assert envelope.values.tolist() == expected.values.tolist()
+        assert envelope.indices.tolist() == expected.indices.tolist()
+    minimum, index = FieldEnvelope(False, MISES).add(fields).getFields()
+    assert index.asArrays().data[:, 0].tolist() == values.argmin(axis=0).tolist()
+
+
+def test_region_subsets_match_instances():
+    from abaqus.Odb.OdbMeshNode import OdbMeshNode
+    from abaqus.Odb.OdbSet import OdbSet
+
+    part = OdbPart("PART-1", THREE_D, DEFORMABLE_BODY)
+    instances = [OdbInstance(name, part) for name in ("A", "B")]
+    for instance in instances:
+        instance.nodes = [OdbMeshNode.__new__(OdbMeshNode) for _ in range(3)]
+        for label, node in enumerate(instance.nodes, 1):
+            node.label = label
+    field = FieldOutput(name="U", description="Displacement", type=VECTOR)
+    for instance in instances:
+        field.addData(position=NODAL, instance=instance, labels=(1, 2, 3), data=np.zeros((3, 3)))
+
+    def selected(subset):
+        return [(block.instance.name, block.nodeLabels.tolist()) for block in subset.bulkDataBlocks]
+
+    nodeSet = OdbSet("SET", [])
+    nodeSet.instanceNames, nodeSet.nodes = ("A", "B"), [instances[0].nodes[:1], instances[1].nodes[1:]]
+    assert selected(field.getSubset(region=nodeSet)) == [("A", [1]), ("B", [2, 3])]
+    assert selected(field.getSubset(region=OdbSet("SET", instances[1].nodes[:2]))) == [("B", [1, 2])]
+    assert selected(field.getSubset(region=instances[1].nodes[2])) == [("B", [3])]
+    rotated = ((0, 1, 0), (-1, 0, 0), (0, 0, 1))
+    field.addData(position=NODAL, instance=instances[0], labels=(4, 5), data=np.ones((2, 3)), localCoordSystem=rotated)
+    assert selected(field.getSubset(localCoordSystem=rotated)) == [("A", [4, 5])]
+    assert selected(field.getSubset(localCoordSystem=np.eye(3).tolist())) == []
+
+
+def test_add_data_validation():
+    from abaqus.Odb.OdbMeshNode import OdbMeshNode
+    from abaqus.Odb.OdbSet import OdbSet
+
+    instance = OdbInstance("A", OdbPart("PART-1", THREE_D, DEFORMABLE_BODY))
+    instance.nodes = [OdbMeshNode.__new__(OdbMeshNode) for _ in range(2)]
+    for label, node in enumerate(instance.nodes, 1):
+        node.label = label
+    field = FieldOutput(name="S", description="Stress", type=TENSOR_3D_FULL)
+    with pytest.raises(ValueError):
+        field.addData(position=INTEGRATION_POINT, instance=instance, labels=(1, 2), data=np.zeros((5, 6)))
+    with pytest.raises(ValueError):
+        field.addData(position=NODAL, instance=instance, labels=(1, 2), data=np.zeros((4, 6)))
+    with pytest.raises(ValueError):
+        field.addData(position=NODAL, set=OdbSet("SET", instance.nodes), data=np.zeros((2, 6)))
+    field.addData(position=NODAL, set=instance.NodeSet("SET", instance.nodes), data=np.zeros((2, 6)))
+    assert field.bulkDataBlocks[0].instance is instance and field.bulkDataBlocks[0].nodeLabels.tolist() == [1, 2]
@@ -0,0 +1,116 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from abaqus.BasicGeometry.Edge import Edge
+from abaqus.BasicGeometry.EdgeArray import EdgeArray
+from abaqus.BasicGeometry.Face import Face
+from abaqus.BasicGeometry.FaceArray import FaceArray
+from abaqus.BasicGeometry.PointLocator import PointLocator
+from abaqus.BasicGeometry.Vertex import Vertex
+from abaqus.BasicGeometry.VertexArray import VertexArray
+from abaqus.Mesh.MeshArrayCache import invalidateMeshCaches
+from abaqus.Part.Part import Part
+from abaqusConstants import DEFORMABLE_BODY, THREE_D
+
+
+@pytest.fixture
+def points():
+    return np.random.default_rng(0).uniform(0.0, 10.0, size=(2000, 3))
+
+
+@pytest.fixture
+def edges(points):
+    edges = EdgeArray([Edge() for _ in points])
+    for index, (edge, point) in enumerate(zip(edges, points)):
+        edge.index, edge.pointOn = index, (tuple(point),)
+    return edges
+
+
+def test_point_locator(points):
+    locator = PointLocator(np.concatenate((points, points[:10])), np.r_[np.arange(len(points)), np.arange(10) - 10])
+    queries = np.concatenate((points[::-7] + 1e-7, [[-1.0, -1.0, -1.0]]))
+    expected = np.r_[np.arange(len(points))[::-7], -1]
+    expected[expected < 10] -= 10
+    assert locator.find(queries).tolist() == expected[:-1].tolist() + [-1]
+    assert PointLocator(np.empty((0, 3)), []).find(queries).tolist() == [-1] * len(queries)
+
+
+def test_find_at(edges, points):
+    assert edges.findAt(tuple(points[42])) is edges[42]
+    assert edges.findAt(coordinates=tuple(points[42] + 1e-7)) is edges[42]
+    with pytest.warns(UserWarning, match=r"\(-1.0, 0.0, 0.0\)"):
+        assert edges.findAt((-1.0, 0.0, 0.0)) is None
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        found = edges.findAt((tuple(points[5]),), (tuple(points[3]),), ((-1.0, 0.0, 0.0),), printWarning=False)
+        assert isinstance(found, EdgeArray) and found == [edges[5], edges[3]]
+        assert edges.findAt(coordinates=((tuple(points[7]),),)) == [edges[7]]
+
+    edges.append(edges.pop(7))
+    assert edges.findAt(tuple(points[7])) is edges[-1]
+    edges[-1].pointOn = ((-1.0, 0.0, 0.0),)
+    invalidateMeshCaches()
+    assert edges.findAt((-1.0, 0.0, 0.0)) is edges[-1]
+
+
+def test_find_at_vertices():
+    part = Part("part", THREE_D, DEFORMABLE_BODY)
+    part.vertices = VertexArray([Vertex() for _ in range(3)])
+    for vertex, point in zip(part.vertices, ((0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (1.0, 1.0, 0.0))):
+        vertex.pointOn = (point,)
+    part.faces = FaceArray([Face()])
+    part.faces[0].pointOn, part.faces[0].getVertices = ((0.5, 0.2, 0.0), (0.0, 0.0, 1.0)), lambda: (0, 1, 2)
+    part.faces._setOwner(part)
+    face = part.faces[0]
+    assert part.faces.findAt((0.5, 0.2, 0.0)) is face and part.faces.findAt((1.0, 1.0, 1e-7)) is face
+    with pytest.warns(UserWarning):
+        assert part.faces.findAt((0.0, 0.0, 1.0)) is None
+    assert part.faces.findAt(((1.0, 0.0, 0.0),))._owner() is part
+
+
+def test_find_at_without_geometry():
+    from abaqus import mdb
+
+    sketch = mdb.models["Model-1"].ConstrainedSketch(name="sketch", sheetSize=1.0)
+    sketch.rectangle((0, 0), (1, 1))
+    part = mdb.models["Model-1"].Part(name="part", dimensionality=THREE_D, type=DEFORMABLE_BODY)
+    part.BaseSolidExtrude(sketch=sketch, depth=1)
+    # The stubs create no B-rep data, so that findAt returns placeholder entities as it did before
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert isinstance(part.faces.findAt((0.5, 0.5, 1.0)), Face)
+        found = part.cells.findAt(coordinates=((0.5, 0.5, 0.5),))
+        assert len(found) == 1 and found._owner() is part.cells._owner()
+
+
+def test_mask(edges):
+    selected = EdgeArray(edges[3:5])
+    assert selected.getMask() == "[#18 ]"
+    assert edges.getSequenceFromMask(mask=(selected.getMask(),)) == selected
+    assert edges.getSequenceFromMask("[#8 ]") is edges[3]
+    assert selected.getSequenceFromMask(edges.getMask()) == selected
+
+
+def test_exterior_edges():
+    part = Part("part", THREE_D, DEFORMABLE_BODY)
+    part.edges, part.faces = EdgeArray([Edge() for _ in range(5)]), FaceArray([Face(), Face()])
+    for face, edges in zip(part.faces, ((0, 1, 2), (1, 3, 4))):
+        face.getEdges = lambda edges=edges: edges
+    with pytest.raises(ValueError):
+        part.faces.getExteriorEdges()
+    part.faces._setOwner(part)
+    exterior = part.faces.getExteriorEdges()
+    assert exterior == [part.edges[0], part.edges[2], part.edges[3], part.edges[4]] and exterior._owner() is part
+
+    other = Part("other", THREE_D, DEFORMABLE_BODY)
+    other.edges = EdgeArray([Edge() for _ in range(5)])
+    assembly = type("Assembly", (), {"instances": {"A": part, "B": other}})()
+    faces = FaceArray(list(part.faces))
+    for face, instanceName in zip(faces, ("A", "B")):
+        face.instanceName = instanceName
+    faces._setOwner(assembly)
+    exterior = faces.getExteriorEdges()
+    assert exterior == [part.edges[index] for index in (0, 1, 2)] + [other.edges[index] for index in (1, 3, 4)]
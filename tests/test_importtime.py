@@ -0,0 +1,39 @@
+from abqpy.importtime import (
+    check_budget,
+    import_total,
+    module_group,
+    parse_importtime,
+    profile_imports,
+)
+
+STDERR = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   abaqus.UtilityAndView.SymbolicConstant
+import time:      1500 |       1620 |     abaqus.Odb.FieldOutput
+import time:       800 |       2420 | abaqus
+"""
+
+
+def test_parse_importtime():
+    modules = parse_importtime(STDERR)
+    assert modules["abaqus.Odb.FieldOutput"] == {"self": 1.5, "cumulative": 1.62}
+    assert list(modules) == ["abaqus.UtilityAndView.SymbolicConstant", "abaqus.Odb.FieldOutput", "abaqus"]
+    assert import_total(STDERR) == 2.42
+
+
+def test_module_group():
+    assert module_group("abaqus.Odb.FieldOutput") == "abaqus.Odb"
+    assert module_group("abaqus") == "abaqus"
+    assert module_group("pydantic.main") == "pydantic"
+
+
+def test_profile_imports():
+    report = profile_imports("json", repeat=2, top=3)
+    assert report["repeat"] == 2 and len(report["modules"]) <= 3
+    assert report["groups"]["json"]["modules"] >= 1 and "encodings" not in report["groups"]
+    assert report["total"] >= max(module["cumulative"] for module in report["modules"])
+    assert check_budget(report, budget=1e9, budgets={"json": 1e9}) == []
+    assert check_budget(report, budget=0, budgets={"json": 0, "missing": 0}) == [
+        f"total: {report['total']:.1f} ms > 0.0 ms",
+        f"json: {report['groups']['json']['self']:.1f} ms > 0.0 ms",
+    ]
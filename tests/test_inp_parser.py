@@ -0,0 +1,133 @@
+import pytest
+
+from abaqus.InputFileParser.AbaqusNDarray import AbaqusNDarray
+from abaqus.InputFileParser.InputFileReader import readBlocks
+from inpParser import InputFile
+
+MAIN = """*Heading
+** Job name: test
+*Part, name=Part-1
+*Node
+      1,           0.,           0.
+      2,           1.,         0.5
+      3,           1.,           1.
+*Element, type=CPS3
+1, 1, 2,
+3
+*Elset, elset="Set 1"
+1,
+*End Part
+*Include, input=material.inp
+*INCLUDE, INPUT=missing.inp
+*Step, name=Step-1
+*Static
+0.1, 1., 1e-05, 1.
+*Boundary
+Part-1.all, 1, 2
+*End Step
+"""
+
+
+@pytest.fixture
+def deck(tmp_path):
+    (tmp_path / "main.inp").write_text(MAIN)
+    (tmp_path / "material.inp").write_text("*Material, name=Steel\n*Elastic\n210000., 0.3\n")
+    return tmp_path
+
+
+def test_parse(deck):
+    inputFile = InputFile("main.inp", str(deck))
+    keywords = inputFile.parse(usePyArray=True)
+    assert [keyword.name for keyword in keywords][:4] == ["Heading", "Part", "Node", "Element"]
+    assert keywords[0].comments == ("** Job name: test",)
+    assert keywords[4].parameter == {"elset": "Set 1"}
+    assert inputFile.includes == (str(deck / "material.inp"),)
+    assert inputFile.missingIncludes == (str(deck / "missing.inp"),)
+    assert [keyword.name for keyword in keywords][7:10] == ["Elastic", "INCLUDE", "Step"]
+
+    nodes = keywords[2].data
+    assert isinstance(nodes, AbaqusNDarray) and nodes.shape == (3, 3) and nodes.colZeroIsInt
+    assert nodes[1][0] == 2 and type(nodes[1][0]) is int and type(nodes[1, 2]) is float
+    assert nodes.tolist()[1] == [2, 1.0, 0.5]
+    elements = keywords[3].data
+    assert elements.tolist() == [[1, 1, 2, 3]] and not elements.colZeroIsInt and type(elements[0, 0]) is int
+    assert keywords[-2].data == [["Part-1.all", 1, 2]]
+
+    with pytest.raises(ValueError):
+        inputFile.parse()
+
+
+def test_parse_lists_and_organize(deck):
+    keywords = InputFile(str(deck / "main.inp")).parse(organize=True, bulk=False)
+    assert [keyword.name for keyword in keywords] == ["Heading", "Part", "Material", "Elastic", "INCLUDE", "Step"]
+    assert [keyword.name for keyword in keywords[1].suboptions] == ["Node", "Element", "Elset", "End Part"]
+    assert keywords[1].suboptions[0].data == []
+    assert keywords[3].data == [[210000.0, 0.3]]
+
+
+def test_blocks_across_chunks(deck):
+    blocks = list(readBlocks(str(deck / "main.inp"), chunkSize=7))
+    assert "".join(blocks) == MAIN
+    assert [block.split("\n", 1)[0] for block in blocks][:2] == ["*Heading", "*Part, name=Part-1"]
+
+
+def test_iter_keywords(deck):
+    inputFile = InputFile("main.inp", str(deck))
+    keywords = inputFile.iterKeywords(usePyArray=True, skip=("elset",))
+    assert [next(keywords).name for _ in range(6)] == ["Heading", "Part", "Node", "Element", "Elset", "End Part"]
+    assert inputFile.includes == ()
+    material = next(keywords)
+    assert material.name == "Material" and inputFile.includes == (str(deck / "material.inp"),)
+    remaining = list(keywords)
+    assert inputFile.missingIncludes == (str(deck / "missing.inp"),)
+    assert [keyword.name for keyword in remaining][:2] == ["Elastic", "INCLUDE"]
+
+    elset = next(keyword for keyword in inputFile.iterKeywords() if keyword.name == "Elset")
+    assert elset.data == [[1]]
+    assert next(keyword for keyword in inputFile.iterKeywords(bulk=False) if keyword.name == "Node").data == []
+
+
+def test_parse_in_parallel(deck):
+    (deck / "material.inp").write_text("*Material, name=Steel\n*Include, input=sub/elastic.inp\n** Density\n")
+    (deck / "sub").mkdir()
+    (deck / "sub" / "elastic.inp").write_text("*Elastic\n210000., 0.3\n*Node\n1, 0.5\n")
+    sequential, parallel = InputFile(str(deck / "main.inp")), InputFile(str(deck / "main.inp"))
+    expected = sequential.parse(usePyArray=True)
+    keywords = parallel.parse(usePyArray=True, processes=2)
+    assert [(keyword.name, keyword.parameter, keyword.comments) for keyword in keywords] == [
+        (keyword.name, keyword.parameter, keyword.comments) for keyword in expected
+    ]
+    assert [repr(keyword.data) for keyword in keywords] == [repr(keyword.data) for keyword in expected]
+    assert parallel.includes == sequential.includes == (str(deck / "material.inp"), str(deck / "sub" / "elastic.inp"))
+    assert parallel.missingIncludes == sequential.missingIncludes
+    nodes = next(keyword.data for keyword in keywords if keyword.name == "Node" and len(keyword.data) == 1)
+    assert nodes.colZeroIsInt and type(nodes[0, 0]) is int
+
+
+def test_leading_comments(deck):
+    (deck / "main.inp").write_text("** first\n** second\n*Heading\n*Include, input=material.inp\n")
+    (deck / "material.inp").write_text("** material\n*Material, name=Steel\n")
+    for processes in (1, 2):
+        keywords = InputFile("main.inp", str(deck)).parse(organize=False, processes=processes)
+        assert [(keyword.name, keyword.comments) for keyword in keywords] == [
+            ("Heading", ("** first", "** second")),
+            ("Material", ("** material",)),
+        ]
+
+
+def test_repeated_and_cyclic_includes(deck):
+    (deck / "main.inp").write_text("*Heading\n*Include, input=material.inp\n*Include, input=material.inp\n")
+    (deck / "material.inp").write_text("** steel\n*Material, name=Steel\n")
+    for processes in (0, 2):
+        keywords = InputFile("main.inp", str(deck)).parse(organize=False, processes=processes)
+        assert [(keyword.name, keyword.comments) for keyword in keywords] == [
+            ("Heading", ()),
+            ("Material", ("** steel",)),
+            ("Material", ("** steel",)),
+        ]
+        assert keywords[1] is not keywords[2]
+
+    (deck / "material.inp").write_text("*Material, name=Steel\n*Include, input=main.inp\n")
+    for processes in (0, 2):
+        with pytest.raises(ValueError):
+            InputFile("main.inp", str(deck)).parse(processes=processes)
@@ -0,0 +1,423 @@
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from abqpy.cli import AbqpyCLI
+from abqpy.jobs import JobRunner, analysis_tokens
+
+pytestmark = pytest.mark.skipif(os.name != "posix", reason="the fake abaqus executable is a POSIX script")
+
+# A fake abaqus executable, which prints its arguments and its start and end times, sleeps for ``sleep=<seconds>``
+# and exits with the status ``exit=<status>``
+FAKE_ABAQUS = f"""\
+#!{sys.executable}
+import sys, time
+options = dict(arg.split("=", 1) for arg in sys.argv[1:] if "=" in arg)
+print("start", time.time(), flush=True)
+time.sleep(float(options.get("sleep", 0)))
+print("args", *sys.argv[1:])
+print("end", time.time())
+print("error", file=sys.stderr)
+sys.exit(int(options.get("exit", 0)))
+"""
+
+
+@pytest.fixture
+def fake_abaqus(tmp_path, monkeypatch):
+    path = tmp_path / "abaqus"
+    path.write_text(textwrap.dedent(FAKE_ABAQUS))
+    path.chmod(0o755)
+    monkeypatch.setenv("ABAQUS_BAT_PATH", str(path))
+    return path
+
+
+def times(result):
+    """Return the start and end times printed by the fake abaqus executable."""
+    lines = dict(line.split(" ", 1) for line in result.stdout.splitlines())
+    return float(lines["start"]), float(lines["end"])
+
+
+def max_overlap(results):
+    """Return the maximum number of jobs running at the same time."""
+    events = sorted((time, step) for result in results for time, step in zip(times(result), (1, -1)))
+    running = overlap = 0
+    for _, step in events:
+        running += step
+        overlap = max(overlap, running)
+    return overlap
+
+
+def test_run_exit_status(fake_abaqus):
+    result = AbqpyCLI().python("script.py", "exit=3")
+    assert result.returncode == 3 and not result.ok and result.stdout is None
+    with pytest.raises(subprocess.CalledProcessError):
+        result.check()
+
+
+def test_runner_captures_output(fake_abaqus, tmp_path):
+    with JobRunner(workers=2) as runner:
+        result = AbqpyCLI(runner, cwd=str(tmp_path)).python("script.py", "x=1", log="out.log").result()
+    assert result.ok and "args python script.py log=out.log x=1" in result.stdout
+    assert result.stderr == "error\n" and result.spec.cwd == str(tmp_path)
+
+
+def test_runner_limits(fake_abaqus):
+    with JobRunner(workers=4, cpus=2) as runner:
+        cli = AbqpyCLI(runner)
+        results = [future.result() for future in [cli.abaqus("sleep=0.3") for _ in range(6)]]
+    assert all(result.ok for result in results) and max_overlap(results) == 2
+
+    # An analysis on one processor holds 5 tokens, so that only one of them runs at a time
+    assert analysis_tokens(1) == 5 and analysis_tokens(4) == 8
+    with JobRunner(workers=4, cpus=4, tokens=9) as runner:
+        cli = AbqpyCLI(runner)
+        results = [future.result() for future in [cli.abaqus(job=f"Job-{i}", sleep="0.2") for i in range(3)]]
+        assert max_overlap(results) == 1 and all("interactive" in result.stdout.split() for result in results)
+        with pytest.raises(ValueError):
+            cli.abaqus(job="Job", cpus=8)
+
+
+def test_runner_timeout(fake_abaqus):
+    with JobRunner() as runner:
+        result = AbqpyCLI(runner, timeout=0.5).abaqus("sleep=10").result()
+    assert result.timed_out and result.duration < 5 and result.returncode != 0
+    with pytest.raises(subprocess.TimeoutExpired):
+        result.check()
+
+
+def test_kill_tree():
+    import time
+
+    from abqpy.jobs import kill_tree
+
+    process = subprocess.Popen(["sh", "-c", "sleep 30 & echo $!; wait"], stdout=subprocess.PIPE, text=True,
+                               start_new_session=True)  # fmt: skip
+    child = int(process.stdout.readline())
+    kill_tree(process)
+    process.wait(5)
+    process.stdout.close()
+    for _ in range(50):
+        try:
+            os.kill(child, 0)
+        except ProcessLookupError:
+            break
+        time.sleep(0.1)
+    else:
+        pytest.fail("the child process was not killed")
+
+
+# A fake analysis, which writes the files of a job and follows the directives ``sleep=<seconds>`` and
+# ``exit=<status>`` of its input file
+FAKE_ANALYSIS = f"""\
+#!{sys.executable}
+import sys, time
+options = dict(arg.split("=", 1) for arg in sys.argv[1:] if "=" in arg)
+name = options["job"]
+directives = dict(line.split("=", 1) for line in open(options["input"]).read().split())
+print("Begin Abaqus/Standard Analysis", flush=True)
+with open(name + ".msg", "w") as msg:
+    msg.write(" ***WARNING: THE ELEMENTS ARE DISTORTED\\n")
+with open(name + ".sta", "w") as sta:
+    sta.write(" STEP  INC ATT SEVERE EQUIL TOTAL  TOTAL      STEP       INC OF       DOF    IF\\n")
+    sta.write("   1     1   1     0     1     1  0.100      0.100      0.1000\\n")
+    sta.flush()
+    time.sleep(float(directives.get("sleep", 0)))
+    sta.write("   1     2   1U    4     0     4  0.100      0.100      0.02500\\n")
+    status = int(directives.get("exit", 0))
+    sta.write(" THE ANALYSIS HAS " + ("NOT BEEN COMPLETED" if status else "COMPLETED SUCCESSFULLY") + "\\n")
+print("End Abaqus/Standard Analysis")
+sys.exit(status)
+"""
+
+
+@pytest.fixture
+def fake_analysis(tmp_path, monkeypatch):
+    import abaqus  # noqa: F401, imported while Abaqus is skipped, so that it does not run the tests in Abaqus
+    from abqpy.config import config
+
+    path = tmp_path / "abaqus"
+    path.write_text(FAKE_ANALYSIS)
+    path.chmod(0o755)
+    monkeypatch.setenv("ABAQUS_BAT_PATH", str(path))
+    monkeypatch.setattr(config, "run_jobs", True)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_job_wait_for_completion(fake_analysis):
+    from abaqus import mdb
+    from abaqusConstants import COMPLETED, NONE
+
+    (fake_analysis / "ok.inp").write_text("sleep=0.2")
+    job = mdb.JobFromInputFile("Job-ok", "ok.inp")
+    job.submit()
+    job.waitForCompletion()
+    assert job.status == COMPLETED
+    types = [str(message.type) for message in job.messages]
+    assert types == ["JOB_SUBMITTED", "STARTED", "WARNING", "STATUS", "STATUS", "COMPLETED", "JOB_COMPLETED"]
+    assert job.messages[4].data["increment"] == 2 and not job.messages[4].data["converged"]
+    assert job.messages[4].data["timeIncrement"] == 0.025
+    job.clearMessage()
+    assert job.messages == [] and job.status == NONE
+
+
+def test_job_opt_in(fake_analysis, monkeypatch):
+    from abaqus import mdb
+    from abaqusConstants import NONE
+    from abqpy.config import config
+
+    job = mdb.Job("Job-model", "Model-1")
+    assert job.status == NONE and mdb.JobFromInputFile("Job-file", "ok.inp").status == NONE
+    with pytest.raises(FileNotFoundError):
+        job.submit()
+    monkeypatch.setattr(config, "run_jobs", False)
+    job.submit()
+    job.waitForCompletion()
+    assert job.status == NONE and job.messages == [] and os.listdir(fake_analysis) == ["abaqus"]
+
+
+def test_job_async(fake_analysis):
+    import asyncio
+
+    from abaqus import mdb
+    from abaqusConstants import ABORTED, COMPLETED, TERMINATED
+
+    (fake_analysis / "ok.inp").write_text("sleep=0.5")
+    (fake_analysis / "fail.inp").write_text("exit=1")
+    (fake_analysis / "long.inp").write_text("sleep=30")
+    jobs = [mdb.JobFromInputFile(f"Job-{i}", "ok.inp") for i in range(20)]
+    failed, long = mdb.JobFromInputFile("Job-fail", "fail.inp"), mdb.JobFromInputFile("Job-long", "long.inp")
+
+    async def run(job):
+        await job.submitAsync()
+        return [message.type async for message in job.watch(interval=0.05)]
+
+    async def main():
+        task = asyncio.ensure_future(long.submitAsync())
+        await task
+        waiting = asyncio.ensure_future(long.waitForCompletionAsync(interval=0.05))
+        types = await asyncio.gather(*map(run, jobs + [failed]))
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        return types
+
+    types = asyncio.run(main())
+    assert all(job.status == COMPLETED for job in jobs) and all(len(job_types) == 7 for job_types in types[:-1])
+    assert failed.status == ABORTED and types[-1][-2:] == [ABORTED, "JOB_ABORTED"]
+    assert long.status == TERMINATED and str(long.messages[-1].type) == "JOB_ABORTED"
+
+
+def test_job_kill_solver(fake_analysis, monkeypatch):
+    import time
+
+    from abaqus import mdb
+    from abaqusConstants import TERMINATED
+
+    # A fake driver starting the fake analysis as a child process, like the abaqus driver starts the solver
+    driver = fake_analysis / "driver"
+    driver.write_text(f'#!/bin/sh\n{fake_analysis / "abaqus"} "$@" &\necho $! > solver.pid\nwait\n')
+    driver.chmod(0o755)
+    monkeypatch.setenv("ABAQUS_BAT_PATH", str(driver))
+    (fake_analysis / "long.inp").write_text("sleep=30")
+    job = mdb.JobFromInputFile("Job-long", "long.inp")
+    job.submit()
+    while not (fake_analysis / "solver.pid").exists() or not (fake_analysis / "solver.pid").read_text():
+        time.sleep(0.05)
+    solver = int((fake_analysis / "solver.pid").read_text())
+    job.kill()
+    assert job.status == TERMINATED
+    for _ in range(50):
+        try:
+            os.kill(solver, 0)
+        except ProcessLookupError:
+            break
+        time.sleep(0.1)
+    else:
+        pytest.fail("the solver process was not killed")
+
+
+def test_job_queue(fake_analysis, monkeypatch):
+    from abaqus import mdb, session
+    from abaqusConstants import COMPLETED, ON
+    from abqpy import dispatch
+
+    # A fake ssh command dropping the host, and a fake srun command dropping its options
+    for name, script in (
+        ("ssh", 'shift\nexec sh -c "$1"'),
+        ("srun", 'while [ "${1#--}" != "$1" ]; do shift; done\nexec "$@"'),
+    ):
+        (fake_analysis / name).write_text(f"#!/bin/sh\n{script}\n")
+        (fake_analysis / name).chmod(0o755)
+    monkeypatch.setenv("ABQPY_SSH", str(fake_analysis / "ssh"))
+    monkeypatch.setenv("PYTHONPATH", os.path.dirname(os.path.dirname(dispatch.__file__)))
+    monkeypatch.setitem(dispatch.QUEUE_COMMANDS, "slurm", f"{fake_analysis / 'srun'} --job-name={{job}} {{command}}")
+
+    remote = fake_analysis / "remote"
+    session.Queue("cluster", "slurm", hostName="cluster", directory=str(remote), driver=os.environ["ABAQUS_BAT_PATH"],
+                  filesToCopy=("msg", "sta"), deleteAfterCopy=ON)  # fmt: skip
+    (fake_analysis / "local").mkdir()
+    monkeypatch.chdir(fake_analysis / "local")
+    (fake_analysis / "local" / "ok.inp").write_text("sleep=0.2")
+    job = mdb.JobFromInputFile("Job-queue", "ok.inp", queue="cluster")
+    job.submit()
+    job.waitForCompletion()
+    assert job.status == COMPLETED
+    types = [str(message.type) for message in job.messages]
+    assert types == ["JOB_SUBMITTED", "STARTED", "WARNING", "STATUS", "STATUS", "COMPLETED", "JOB_COMPLETED"]
+    assert sorted(os.listdir(remote)) == ["ok.inp"]
+    assert sorted(os.listdir(".")) == ["Job-queue.log", "Job-queue.msg", "Job-queue.sta", "ok.inp"]
+    queue = session.Queue("odb", "slurm", hostName="cluster", directory=str(remote), filesToCopy="odb")
+    assert "--files=odb" in queue._dispatchCommand("Job-odb", ["abaqus", "job=Job-odb"])
+
+
+def test_dispatch_resume(tmp_path):
+    from abqpy.dispatch import Dispatcher, LocalTransport
+
+    class FlakyTransport(LocalTransport):
+        """A transport interrupting the first downloads after 100 bytes."""
+
+        downloads = 0
+
+        def shell(self, script, stdin=None, stdout=None):
+            if script.startswith("tail"):
+                self.downloads += 1
+                script += " | head -c 100" if self.downloads < 3 else ""
+            return super().shell(script, stdin, stdout)
+
+    remote = tmp_path / "remote"
+    remote.mkdir()
+    (remote / "Job-1.odb").write_bytes(os.urandom(1000))
+    (remote / "Job-1.log").write_text("log")
+    transport = FlakyTransport()
+    Dispatcher(transport, str(remote)).download("Job-1", str(tmp_path))
+    assert transport.downloads == 3 and sorted(os.listdir(remote)) == ["Job-1.log", "Job-1.odb"]
+    assert (tmp_path / "Job-1.odb").read_bytes() == (remote / "Job-1.odb").read_bytes()
+    assert not (tmp_path / "Job-1.log").exists()
+
+
+def test_dispatch_resume_after_interruption(tmp_path, monkeypatch):
+    from abqpy.dispatch import Dispatcher, LocalTransport
+
+    class InterruptedTransport(LocalTransport):
+        """A transport whose downloads stop after 100 bytes while it is interrupted."""
+
+        interrupted, offsets = True, []
+
+        def shell(self, script, stdin=None, stdout=None):
+            if script.startswith("tail"):
+                self.offsets.append(int(script.split()[2]))
+                script += " | head -c 100" if self.interrupted else ""
+            return super().shell(script, stdin, stdout)
+
+    remote = tmp_path / "remote"
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "Job-1.inp").write_text("input")
+    command = ["sh", "-c", "echo run >> runs.txt && head -c 1000 /dev/urandom > Job-1.odb"]
+    transport = InterruptedTransport()
+    dispatcher = Dispatcher(transport, str(remote), retries=0)
+    with pytest.raises(OSError):
+        dispatcher.dispatch("Job-1", command, ["Job-1.inp"])
+    assert os.path.exists("Job-1.dispatch") and not os.path.exists("Job-1.odb")
+    transport.interrupted = False
+    assert dispatcher.dispatch("Job-1", command, ["Job-1.inp"], resume=True) == 0
+    assert (remote / "runs.txt").read_text() == "run\n" and transport.offsets == [1, 101]
+    assert (tmp_path / "Job-1.odb").read_bytes() == (remote / "Job-1.odb").read_bytes()
+    assert sorted(os.listdir(tmp_path)) == ["Job-1.inp", "Job-1.odb", "remote"]
+
+
+def test_dispatch_stale_run(tmp_path):
+    from abqpy.dispatch import Dispatcher, LocalTransport
+
+    remote, local = tmp_path / "remote", tmp_path / "local"
+    remote.mkdir()
+    local.mkdir()
+    (remote / "Job-1.results.old.tar.gz").write_bytes(b"stale archive")
+    (local / "Job-1.results.old.tar.gz.part").write_bytes(b"stale part")
+    (local / "Job-1.inp").write_text("new input")
+    dispatcher = Dispatcher(LocalTransport(), str(remote))
+    dispatcher.upload([str(local / "Job-1.inp")], "Job-1")
+    assert sorted(os.listdir(remote)) == ["Job-1.inp"]
+    (remote / "Job-1.odb").write_text("new results")
+    (local / "Job-1.results.new.tar.gz.part").write_bytes(b"")
+    dispatcher.download("Job-1", str(local), run="new")
+    assert (local / "Job-1.odb").read_text() == "new results"
+    assert sorted(os.listdir(local)) == ["Job-1.inp", "Job-1.odb"]
+
+
+def test_message_tail_explicit(tmp_path):
+    from abaqus.Job.JobMonitor import MessageTail
+    from abaqusConstants import COMPLETED, EXPLICIT_PHASE, STATUS, STEP
+
+    path = tmp_path / "Job-1.sta"
+    tail = MessageTail(str(path))
+    assert tail.messages() == []
+    path.write_text(
+        " Abaqus/Explicit 2023                  DATE 01-Jan-2023  TIME 10:00:00\n"
+        "  STEP 2  ORIGIN 1.0000E-03\n"
+        "              STEP     TOTAL      CPU      STABLE    CRITICAL    KINETIC      TOTAL\n"
+        "INCREMENT     TIME      TIME      TIME   INCREMENT    ELEMENT     ENERGY     ENERGY\n"
+        "         0  0.000E+00 1.000E-03  00:00:00 1.000E-06       10  0.000E+00  0.000E+00\n"
+        "INSTANCE WITH CRITICAL ELEMENT: PART-1-1\n"
+        "       500  5.000E-04 1.500E-03  00:01:05 1.000E-06"
+    )
+    messages = tail.messages()
+    assert [message.type for message in messages] == [STEP, STATUS]
+    with path.open("a") as file:
+        file.write("       12  1.234E+00  5.678E+00\n\n  THE ANALYSIS HAS COMPLETED SUCCESSFULLY\n")
+    messages = tail.messages()
+    assert [message.type for message in messages] == [STATUS, COMPLETED]
+    assert messages[0].data == {
+        "step": 2,
+        "increment": 500,
+        "stepTime": 5e-4,
+        "totalTime": 1.5e-3,
+        "cpuTime": 65.0,
+        "timeIncrement": 1e-6,
+        "criticalElement": 12,
+        "kineticEnergy": 1.234,
+        "totalEnergy": 5.678,
+        "phase": EXPLICIT_PHASE,
+    }
+
+
+def test_monitor_jobs(fake_analysis):
+    from abaqus import mdb
+    from abaqus.Job.JobMonitor import monitorJobs
+    from abaqusConstants import COMPLETED, STATUS
+
+    (fake_analysis / "ok.inp").write_text("sleep=0.2")
+    jobs = [mdb.JobFromInputFile(f"Job-{i}", "ok.inp") for i in range(3)]
+    for job in jobs:
+        job.submit()
+    messages = list(monitorJobs(jobs, interval=0.05))
+    assert all(job.status == COMPLETED for job in jobs)
+    assert [(job, message) for job in jobs for message in job.messages] == sorted(
+        messages, key=lambda item: jobs.index(item[0])
+    )
+    statuses = [message for _, message in messages if message.type == STATUS]
+    assert len(statuses) == 6 and all(0 <= message.data["wallclockTime"] < 60 for message in statuses)
+
+
+def test_monitor_jobs_run_jobs(fake_analysis):
+    code = textwrap.dedent(
+        """\
+        from abaqus import mdb
+        from abaqus.Job.JobMonitor import monitorJobs
+
+        jobs = [mdb.JobFromInputFile(f"Job-{i}", "ok.inp") for i in range(3)]
+        for job in jobs:
+            job.submit()
+        messages = [(job.name, str(message.type)) for job, message in monitorJobs(jobs, interval=0.05)]
+        print(len(messages), *sorted({type for _, type in messages}), *(job.status for job in jobs))
+        """
+    )
+    (fake_analysis / "ok.inp").write_text("sleep=0.2")
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path), ABQPY_SKIP_ABAQUS="true", ABQPY_RUN_JOBS="true")
+    result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+    assert result.stdout.split() == [
+        "21", "COMPLETED", "JOB_COMPLETED", "JOB_SUBMITTED", "STARTED", "STATUS", "WARNING"
+    ] + ["COMPLETED"] * 3  # fmt: skip
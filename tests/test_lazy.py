@@ -0,0 +1,49 @@
+import os
+import subprocess
+import sys
+
+from abqpy.lazy import LazyAttribute, LazyObject, created
+
+
+def test_lazy_singletons():
+    import abaqus
+
+    assert "session" in abaqus.__all__ and "mdb" in abaqus.__all__
+    assert abaqus.session is abaqus.session
+    assert abaqus.mdb is abaqus.mdb
+    assert isinstance(abaqus.session, abaqus.Session) and isinstance(abaqus.mdb, abaqus.Mdb)
+    abaqus.mdb.lazyTestAttribute = 1
+    assert created(abaqus.mdb).__dict__["lazyTestAttribute"] == 1
+    del abaqus.mdb.lazyTestAttribute
+
+
+def test_lazy_object():
+    calls = []
+    value = LazyObject(lambda: calls.append(1) or ValueError("lazy"))
+    assert created(value) is None and not calls
+    assert isinstance(value, ValueError) and value.args == ("lazy",) and calls == [1]
+    assert created(value) is created(value) and calls == [1]
+
+
+def test_lazy_attribute():
+    from abaqus.Session.JournalOptions import JournalOptions
+    from abaqus.Session.SessionBase import SessionBase
+
+    assert isinstance(SessionBase.__dict__["journalOptions"], LazyAttribute)
+    options = SessionBase().journalOptions
+    assert isinstance(options, JournalOptions)
+    assert SessionBase.__dict__["journalOptions"] is options is SessionBase().journalOptions
+
+
+def test_toolsets_are_deferred():
+    code = "import sys, abaqus; print(any(name == 'abaqus.Material.Material' for name in sys.modules))"
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
+
+
+def test_star_import_is_lazy():
+    code = "import sys; from abaqus import *; print(any(name == 'abaqus.Material.Material' for name in sys.modules))"
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,414 @@
+import numpy as np
+import pytest
+
+from abaqus.Mesh.LabelIndex import LabelIndex
+from abaqus.Mesh.Mask import Mask
+from abaqus.Mesh.MassProperties import MassIntegrals
+from abaqus.Mesh.MeshArrayCache import invalidateMeshCaches, labelIndexOf
+from abaqus.Mesh.MeshElement import MeshElement
+from abaqus.Mesh.MeshElementArray import MeshElementArray
+from abaqus.Mesh.MeshNode import MeshNode
+from abaqus.Mesh.MeshNodeArray import MeshNodeArray
+from abaqus.Mesh.MeshQuality import MeshQuality, meshQuality
+from abaqus.Odb.OdbInstance import OdbInstance
+from abaqus.Odb.OdbMeshNode import OdbMeshNode
+from abaqus.Odb.OdbPart import OdbPart
+from abaqus.Part.Part import Part
+from abaqus.Region.Set import Set, booleanSet
+from abaqusConstants import (
+    ASPECT_RATIO,
+    C3D4,
+    C3D6,
+    C3D8R,
+    CPS4R,
+    DEFORMABLE_BODY,
+    DIFFERENCE,
+    FACE1,
+    HEX,
+    INTERSECTION,
+    MAX_FREQUENCY,
+    S4R,
+    SHAPE_FACTOR,
+    SHORTEST_EDGE,
+    SPOS,
+    THREE_D,
+    UNION,
+)
+
+
+@pytest.fixture
+def coordinates():
+    return np.random.default_rng(0).uniform(0.0, 10.0, size=(5000, 3))
+
+
+@pytest.fixture
+def nodes(coordinates):
+    return MeshNodeArray([MeshNode(point, label=label) for label, point in enumerate(map(tuple, coordinates), 1)])
+
+
+def labels(nodes):
+    return [node.label - 1 for node in nodes]
+
+
+def test_spatial_queries(nodes, coordinates):
+    low, high = np.array([2.0, 3.0, 1.0]), np.array([4.0, 6.0, 2.5])
+    inside = np.all((coordinates >= low) & (coordinates <= high), axis=1)
+    assert labels(nodes.getByBoundingBox(*low, *high)) == np.flatnonzero(inside).tolist()
+
+    center, radius = np.array([5.0, 5.0, 5.0]), 1.5
+    distances = np.linalg.norm(coordinates - center, axis=1)
+    assert labels(nodes.getByBoundingSphere(tuple(center), radius)) == np.flatnonzero(distances <= radius).tolist()
+
+    along = (coordinates[:, 0] - 1.0) / 8.0
+    radial = np.hypot(coordinates[:, 1] - 5.0, coordinates[:, 2] - 5.0)
+    expected = np.flatnonzero((along >= 0) & (along <= 1) & (radial <= 1.0)).tolist()
+    assert labels(nodes.getByBoundingCylinder((1.0, 5.0, 5.0), (9.0, 5.0, 5.0), 1.0)) == expected
+
+    assert nodes.getClosest(tuple(center)).label - 1 == np.argmin(distances)
+    assert labels(nodes.getClosest(tuple(center), numToFind=3)) == np.argsort(distances)[:3].tolist()
+    assert nodes.getClosest([tuple(center), (0.0, 0.0, 0.0)])[0].label - 1 == np.argmin(distances)
+    assert nodes.getClosest((-100.0, 0.0, 0.0), numToFind=2, searchTolerance=1.0) == []
+    assert nodes.getBoundingBox()["low"] == tuple(coordinates.min(axis=0))
+
+
+def test_spatial_index_is_invalidated(nodes):
+    index = nodes._spatialIndex()
+    assert nodes._spatialIndex() is index
+    nodes.append(MeshNode((100.0, 100.0, 100.0), label=0))
+    assert nodes._spatialIndex() is not index
+    assert labels(nodes.getByBoundingSphere((100.0, 100.0, 100.0), 1.0)) == [-1]
+
+    nodes[-1].coordinates = (200.0, 200.0, 200.0)
+    invalidateMeshCaches()
+    assert labels(nodes.getByBoundingSphere((200.0, 200.0, 200.0), 1.0)) == [-1]
+
+
+@pytest.mark.parametrize("step", [1, 1000])
+def test_label_index(step):
+    labels = np.random.default_rng(0).permutation(1_000_000) * step + 7
+    index = LabelIndex(labels)
+    assert index.dense == (step == 1)
+    queried = np.concatenate((labels[::-3], [-1, 6, labels.max() + 1]))
+    positions = index.indices(queried)
+    assert (labels[positions[:-3]] == queried[:-3]).all() and (positions[-3:] == -1).all()
+    assert index.index(labels[42]) == 42 and index.index(-1) == -1
+    assert LabelIndex([3, 5, 3]).index(3) == 0
+    assert LabelIndex([]).indices([1]).tolist() == [-1]
+
+
+def test_label_lookups(nodes):
+    assert nodes.getFromLabel(42) is nodes[41]
+    assert [node.label for node in nodes.sequenceFromLabels((5, 3, 5))] == [5, 3, 5]
+    with pytest.raises(KeyError):
+        nodes.getFromLabel(0)
+    with pytest.raises(KeyError):
+        nodes.sequenceFromLabels((1, 5001))
+    nodes.append(MeshNode((0.0, 0.0, 0.0), label=0))
+    assert nodes.getFromLabel(0) is nodes[-1]
+    nodes[0].setValues(label=9000)
+    assert nodes.getFromLabel(9000) is nodes[0]
+    with pytest.raises(KeyError):
+        nodes.getFromLabel(1)
+    part = Part("part", THREE_D, DEFORMABLE_BODY)
+    hexahedra = part.elements = list(elements(grid(1), C3D8R))
+    assert labelIndexOf(part, "elements", hexahedra).index(1) == 0
+    hexahedra[0].setValues(label=5)
+    assert labelIndexOf(part, "elements", hexahedra).index(5) == 0
+
+
+def test_odb_label_lookups():
+    instance = OdbInstance("PART-1-1", None)
+    instance.nodes = [OdbMeshNode() for _ in range(10)]
+    instance.nodeSets = {}
+    for label, node in enumerate(instance.nodes, 101):
+        node.label = label
+    assert instance.getNodeFromLabel(105) is instance.nodes[4]
+    with pytest.raises(KeyError):
+        instance.getNodeFromLabel(1)
+    nodeSet = instance.NodeSetFromNodeLabels("SET-1", (110, 101))
+    assert instance.nodeSets["SET-1"] is nodeSet and nodeSet.nodes == instance.nodes[::-9]
+    assert nodeSet.NodeSetFromNodeLabels("SET-2", (101,)).nodes == instance.nodes[:1]
+
+
+def test_mask():
+    assert str(Mask.fromIndices([0, 1, 2, 3, 4, 5, 6, 7])) == "[#ff ]"
+    assert str(Mask.fromIndices([78])) == "[#0:2 #4000 ]"
+    assert str(Mask()) == "[#0 ]"
+    assert Mask.fromString("[#0:2 #4000 ]").indices().tolist() == [78]
+    assert Mask.fromString(("[#1 ]", "[#ffffffff:2 #1F ]")).indices().tolist() == list(range(69))
+
+    indices = np.flatnonzero(np.random.default_rng(0).random(100_000) < 0.3)
+    mask = Mask.fromIndices(indices)
+    words = [int(word[1:], 16) for word in str(mask)[1:-2].split()]
+    assert sum(word << 32 * i for i, word in enumerate(words)) == sum(1 << int(i) for i in indices)
+    assert Mask.fromString(str(mask)) == mask and len(mask) == len(indices)
+
+    other = Mask.fromIndices(indices[::2] + 7)
+    assert (mask | other).indices().tolist() == np.union1d(indices, indices[::2] + 7).tolist()
+    assert (mask & other).indices().tolist() == np.intersect1d(indices, indices[::2] + 7).tolist()
+    assert (mask - other).indices().tolist() == np.setdiff1d(indices, indices[::2] + 7).tolist()
+    assert mask.contains([indices[0], -1, 10**9]).tolist() == [True, False, False]
+    with pytest.raises(ValueError):
+        Mask.fromString("[#fffffffff ]")
+    with pytest.raises(ValueError):
+        Mask.fromString("[#f:x ]")
+
+
+def test_mask_of_arrays(nodes):
+    assert nodes.getSequenceFromMask(mask=("[#18 ]",)) == nodes[3:5]
+    assert nodes.getSequenceFromMask(nodes.getMask()) == nodes
+    with pytest.raises(ValueError):
+        nodes.getSequenceFromMask("[#0:1000 #1 ]")
+
+
+def test_set_by_boolean(nodes):
+    part = Part.__new__(Part)
+    part.nodes, part.sets = nodes, {}
+    first = part.SetFromNodeLabels("first", range(1, 3001))
+    second = part.SetFromNodeLabels("second", range(2001, 5001))
+    union = part.SetByBoolean("union", (first, second), UNION)
+    intersection = part.SetByBoolean("intersection", (union, second), INTERSECTION)
+    difference = part.SetByBoolean("difference", (intersection, first), DIFFERENCE)
+    assert part.sets["difference"] is difference and isinstance(difference._members["nodes"], tuple)
+    assert difference._members["nodes"][0] is nodes
+    assert [node.label for node in difference.nodes] == list(range(3001, 5001))
+    assert len(union.nodes) == 5000 and len(Set("copy", objectToCopy=intersection).nodes) == 3000
+
+    other = Set("other", nodes=[MeshNode((0.0, 0.0, 0.0), label=1), nodes[0]])
+    assembled = booleanSet("assembled", (first, other), INTERSECTION)
+    assert assembled.nodes == [nodes[0]] and len(booleanSet("all", (other, first)).nodes) == 3001
+
+
+def grid(n, dimensions=3):
+    """Return the connectivity of a structured grid of n hexahedra or quadrilaterals along each axis."""
+    ids = np.arange((n + 1) ** dimensions).reshape((n + 1,) * dimensions)
+    corners = ids[(slice(None, -1),) * dimensions].ravel()
+    if dimensions == 2:
+        return np.stack((corners, corners + n + 1, corners + n + 2, corners + 1), axis=1)
+    dx, dy = (n + 1) ** 2, n + 1
+    bottom = np.stack((corners, corners + dx, corners + dx + dy, corners + dy), axis=1)
+    return np.concatenate((bottom, bottom + 1), axis=1)
+
+
+def elements(connectivity, elementType, start=1):
+    array = MeshElementArray([MeshElement() for _ in connectivity])
+    for label, (element, nodes) in enumerate(zip(array, connectivity.tolist()), start):
+        element.label, element.type, element.connectivity = label, elementType, tuple(nodes)
+    return array
+
+
+def test_exterior_faces():
+    n, hexahedra = 4, grid(4)
+    faces = elements(hexahedra, C3D8R).getExteriorFaces()
+    assert len(faces) == 6 * n**2 and (faces[0].label, faces[0].face) == (1, FACE1)
+    assert len(elements(hexahedra, C3D8R).getExteriorEdges()) == 0
+    splits = ((0, 1, 2, 6), (0, 2, 3, 6), (0, 3, 7, 6), (0, 7, 4, 6), (0, 4, 5, 6), (0, 5, 1, 6))
+    tetrahedra = np.concatenate([hexahedra[:, split] for split in splits])
+    assert len(elements(tetrahedra, C3D4).getExteriorFaces()) == 12 * n**2
+
+    # Half of the block is meshed with wedges, whose triangles split the top and bottom faces.
+    half = len(hexahedra) // 2
+    wedges = np.concatenate((hexahedra[half:, [0, 1, 2, 4, 5, 6]], hexahedra[half:, [0, 2, 3, 4, 6, 7]]))
+    mixed = MeshElementArray(list(elements(hexahedra[:half], C3D8R)) + list(elements(wedges, C3D6, half + 1)))
+    assert len(mixed.getExteriorFaces()) == 7 * n**2
+
+    quadrilaterals = grid(n, 2)
+    assert len(elements(quadrilaterals, CPS4R).getExteriorFaces()) == 4 * n
+    shells = elements(quadrilaterals, S4R)
+    assert len(shells.getExteriorFaces()) == 2 * n**2 and shells.getExteriorFaces()[0].face == SPOS
+    edges = shells.getExteriorEdges()
+    assert len(edges) == 4 * n and (edges[0].label, edges[0].edge) == (1, 1)
+
+
+def test_bulk_construction():
+    n, hexahedra = 3, grid(3)
+    coordinates = np.indices((n + 1,) * 3, dtype=np.float64).reshape(3, -1).T.copy()
+    labels = np.arange(1, len(coordinates) + 1)
+    part = Part("part", THREE_D, DEFORMABLE_BODY).PartFromNodesAndElements(
+        "part", THREE_D, DEFORMABLE_BODY, (labels, coordinates), (("C3D8R", np.arange(1, n**3 + 1), hexahedra + 1),)
+    )
+    assert part.nodes._peek("coordinates") is coordinates and part.nodes[5].coordinates == (0.0, 1.0, 1.0)
+    assert part.elements[0].connectivity == tuple(hexahedra[0]) and part.elements[0].type == C3D8R
+    assert "coordinates" not in vars(part.nodes[5]) and "connectivity" not in vars(part.elements[0])
+    part.nodes[5].coordinates = (1.0, 1.0, 1.0)
+    assert part.nodes[5].coordinates == (1.0, 1.0, 1.0) and part.nodes[4].coordinates == (0.0, 1.0, 0.0)
+    assert part.elements.getFromLabel(n**3).label == n**3 and len(part.elements.getExteriorFaces()) == 6 * n**2
+    assert [node.label for node in part.nodes.sequenceFromLabels([7, 2])] == [7, 2]
+    added = part.Node(coordinates=((9.0, 9.0, 9.0), (8.0, 8.0, 8.0)))
+    assert [node.label for node in added] == [65, 66] and part.nodes.getFromLabel(66).coordinates == (8.0, 8.0, 8.0)
+    with pytest.raises(ValueError):
+        part.Node(coordinates=((1.0, 2.0, 3.0),), label=(5,))
+    with pytest.raises(ValueError):
+        part.PartFromNodesAndElements("other", THREE_D, DEFORMABLE_BODY, ((1, 1), ((0.0,) * 3,) * 2), ())
+    with pytest.raises(KeyError):
+        part.PartFromNodesAndElements(
+            "other", THREE_D, DEFORMABLE_BODY, ((1,), ((0.0,) * 3,)), (("T3D2", (1,), ((1, 2),)),)
+        )
+
+    odbPart = OdbPart("part", THREE_D, DEFORMABLE_BODY)
+    odbPart.addNodes(np.column_stack((labels, coordinates)), "all")
+    odbPart.addNodes(labels=(100,), coordinates=((1.0, 2.0),))
+    odbPart.addElements(np.column_stack((np.arange(1, n**3 + 1), hexahedra + 1)), "C3D8R", "block")
+    assert len(odbPart.nodeSets["all"].nodes) == 64 and odbPart.nodes[-1].coordinates == (1.0, 2.0, 0.0)
+    assert odbPart.elementSets["block"].elements[-1].connectivity == tuple(hexahedra[-1] + 1)
+    assert OdbPart.nodes == []
+
+
+def test_element_spatial_queries():
+    n, hexahedra = 4, grid(4)
+    coordinates = np.indices((n + 1,) * 3, dtype=np.float64).reshape(3, -1).T.copy()
+    part = Part("part", THREE_D, DEFORMABLE_BODY).PartFromNodesAndElements(
+        "part",
+        THREE_D,
+        DEFORMABLE_BODY,
+        (np.arange(1, len(coordinates) + 1), coordinates),
+        (("C3D8R", np.arange(1, n**3 + 1), hexahedra + 1),),
+    )
+    elements = part.elements
+    centroids = np.array([coordinates[list(element.connectivity)].mean(axis=0) for element in elements])
+    inBox = elements.getByBoundingBox(0.0, 0.0, 0.0, 2.0, 2.0, 4.0)
+    assert [element.label for element in inBox] == [i + 1 for i in np.flatnonzero(centroids[:, :2].max(axis=1) < 2)]
+    assert len(elements.getByBoundingBox(0.5, 0.5, 0.5, 3.5, 3.5, 3.5)) == 8
+    assert len(elements.getByBoundingBox(0.5, 0.5, 0.5, 1.5, 1.5, 1.5)) == 0
+    assert len(elements.getByBoundingSphere((2.0, 2.0, 2.0), 1.8)) == 8
+    cylinder = elements.getByBoundingCylinder((2.0, 2.0, 0.0), (2.0, 2.0, 2.0), 1.5)
+    assert len(cylinder) == 8 and len(cylinder.getByBoundingSphere((1.5, 1.5, 0.5), 0.9)) == 1
+    assert elements.getBoundingBox() == {"low": (0.0, 0.0, 0.0), "high": (4.0, 4.0, 4.0)}
+    assert inBox.getBoundingBox()["high"] == (2.0, 2.0, 4.0)
+    closest = elements.getClosest(((0.1, 0.1, 0.1), (3.9, 3.9, 3.9)), numToFind=2)
+    assert [element.label for element in closest[0]][0] == 1 and closest[1][0].label == n**3
+    assert elements.getClosest((0.5, 0.5, 0.5)).label == 1 and elements.getClosest((9.0, 9.0, 9.0), 1, 1.0) is None
+    assert len(Set("set", elements=inBox).elements.getByBoundingSphere((1.0, 1.0, 1.0), 1.8)) == 8
+    part.editNode(nodes=part.nodes.sequenceFromLabels([1]), coordinates=((-1.0, -1.0, -1.0),))
+    assert elements.getBoundingBox()["low"] == (-1.0, -1.0, -1.0) and elements.getClosest((-0.5,) * 3).label == 1
+    with pytest.raises(ValueError):
+        MeshElementArray(list(elements)).getBoundingBox()
+
+
+def test_mesh_quality():
+    n = 4
+    coordinates = np.indices((n + 1,) * 3, dtype=np.float64).reshape(3, -1).T.copy()
+    part = Part("part", THREE_D, DEFORMABLE_BODY).PartFromNodesAndElements(
+        "part",
+        THREE_D,
+        DEFORMABLE_BODY,
+        (np.arange(1, len(coordinates) + 1), coordinates),
+        (("C3D8R", np.arange(1, n**3 + 1), grid(n) + 1),),
+    )
+    result = part.verifyMeshQuality(ASPECT_RATIO, threshold=1.5, elemShape=HEX)
+    assert (result["numElements"], result["worst"], result["failedElements"]) == (n**3, 1.0, [])
+    assert len(part.verifyMeshQuality(SHAPE_FACTOR)["naElements"]) == n**3
+    assert len(part.verifyMeshQuality(MAX_FREQUENCY, threshold=1.0)["failedElements"]) == 0
+    stats = part.getMeshStats(())
+    assert (stats.numHexElems, stats.numTetElems, stats.numNodes) == (n**3, 0, (n + 1) ** 3)
+
+    # The edits update the metrics of the elements around the moved nodes to their values computed from scratch.
+    quality = meshQuality(part)
+    center = part.nodes.getFromLabel(1 + 2 * (n + 1) ** 2 + 2 * (n + 1) + 2)
+    part.editNode(nodes=(center,), offset1=0.4)
+    assert center.coordinates == (2.4, 2.0, 2.0) and coordinates[62].tolist() == [2.0, 2.0, 2.0]
+    assert len(part.verifyMeshQuality(ASPECT_RATIO, threshold=1.5)["failedElements"]) == 4
+    part.smoothNodes(nodes=part.nodes)
+    assert center.coordinates == pytest.approx((2.05, 2.0, 2.0)) and part.nodes[0].coordinates == (0.0, 0.0, 0.0)
+    fresh = MeshQuality(part.elements, part.nodes._coordinates())
+    assert meshQuality(part) is quality
+    assert all(np.allclose(values, fresh.metrics[name], equal_nan=True) for name, values in quality.metrics.items())
+    with pytest.raises(ValueError):
+        part.editNode(nodes=(center,), coordinate1=0.0, offset1=0.1)
+
+    # Two cubes sharing a face are meshed with duplicate nodes, and a third cube duplicates the second one.
+    cube = coordinates.reshape(n + 1, n + 1, n + 1, 3)[:2, :2, :2].reshape(-1, 3)[[0, 4, 6, 2, 1, 5, 7, 3]]
+    part = Part("part", THREE_D, DEFORMABLE_BODY).PartFromNodesAndElements(
+        "part",
+        THREE_D,
+        DEFORMABLE_BODY,
+        (range(1, 25), np.concatenate((cube, cube + [1, 0, 0], cube + [1, 0, 0]))),
+        (("C3D8R", (1, 2, 3), np.arange(1, 25).reshape(3, 8)),),
+    )
+    quality = meshQuality(part)
+    part.mergeNodes(nodes=part.nodes, tolerance=1e-3)
+    assert (len(part.nodes), len(part.elements), len(part.elements.getExteriorFaces())) == (12, 2, 10)
+    part.mergeNodes(part.nodes[0], part.nodes[1], keepHighLabels=True)
+    assert part.nodes[0].label == 2 and part.nodes[0].coordinates == (0.5, 0.0, 0.0)
+    assert part.verifyMeshQuality(SHORTEST_EDGE, threshold=0.1)["failedElements"] == [part.elements[0]]
+    fresh = MeshQuality(part.elements, part.nodes._coordinates())
+    assert all(np.allclose(values, fresh.metrics[name], equal_nan=True) for name, values in quality.metrics.items())
+
+
+def test_mass_properties():
+    from abaqus import mdb
+
+    n, size = 4, np.array([1.0, 2.0, 3.0])
+    coordinates = np.indices((n + 1,) * 3, dtype=np.float64).reshape(3, -1).T * size + 100.0
+    part = Part("part", THREE_D, DEFORMABLE_BODY).PartFromNodesAndElements(
+        "part",
+        THREE_D,
+        DEFORMABLE_BODY,
+        (np.arange(1, len(coordinates) + 1), coordinates),
+        (("C3D8R", np.arange(1, n**3 + 1), grid(n) + 1),),
+    )
+    properties = part.getMassProperties()
+    assert properties["volume"] == pytest.approx(6 * n**3) and properties["mass"] is None
+    assert properties["warnings"] == ("MISSING_SECTION_DEFINITION",)
+
+    model = mdb.models["Model-1"]
+    model.parts["massProperties"] = part
+    model.Material("massProperties").Density(table=((7.8,),))
+    model.HomogeneousSolidSection("massProperties", "massProperties")
+    part.SectionAssignment(part.Set(name="all", elements=part.elements), "massProperties")
+    properties = part.getMassProperties()
+    mass, (a, b, c) = 7.8 * 6 * n**3, n * size
+    assert properties["mass"] == pytest.approx(mass) and properties["warnings"] == ()
+    assert properties["centerOfMass"] == pytest.approx(100.0 + n * size / 2)
+    inertia = (
+        mass * (b**2 + c**2) / 12,
+        mass * (a**2 + c**2) / 12,
+        mass * (a**2 + b**2) / 12,
+        0.0,
+        0.0,
+        0.0,
+    )
+    assert properties["momentOfInertia"] == pytest.approx(inertia, abs=1e-6)
+    instance = model.rootAssembly.Instance(name="massProperties", part=part, dependent=True)
+    assert model.rootAssembly.getMassProperties(regions=(instance,))["mass"] == pytest.approx(mass)
+
+    # Moving a node discards the cached integrals of the elements.
+    part.editNode(nodes=(part.nodes[0],), offset1=-0.5, offset2=-0.5)
+    volume = MassIntegrals(part.elements, part.nodes._coordinates()).measure.sum()
+    assert volume > 6 * n**3 and part.getMassProperties()["volume"] == pytest.approx(volume)
+
+
+def test_instance_transforms():
+    from abaqus import mdb
+
+    cube = np.indices((2, 2, 2), dtype=np.float64).reshape(3, -1).T
+    part = Part("part", THREE_D, DEFORMABLE_BODY).PartFromNodesAndElements(
+        "part", THREE_D, DEFORMABLE_BODY, (range(1, 9), cube), (("C3D8R", (1,), grid(1) + 1),)
+    )
+    model = mdb.models["Model-1"]
+    model.parts["transforms"] = part
+    model.Material("transforms").Density(table=((2.0,),))
+    model.HomogeneousSolidSection("transforms", "transforms")
+    part.SectionAssignment(part.Set(name="all", elements=part.elements), "transforms")
+    assembly = model.rootAssembly
+    instance = assembly.Instance(name="transforms", part=part, dependent=True)
+    instance.translate((1.0, 2.0, 3.0))
+    instance.rotateAboutAxis((0.0, 0.0, 0.0), (0.0, 0.0, 1.0), 90.0)
+    assert instance.getTranslation() == pytest.approx((-2.0, 1.0, 3.0))
+    point, axis, angle = instance.getRotation()
+    assert point == pytest.approx((-1.5, -0.5, 0.0)) and axis == pytest.approx((0, 0, 1)) and angle == 90.0
+    assert np.allclose(instance._coordinates(), cube @ [[0, 1, 0], [-1, 0, 0], [0, 0, 1]] + [-2.0, 1.0, 3.0])
+
+    copies = assembly.LinearInstancePattern(("transforms",), 3, 2.0, 2, 1.0, direction2=(0.0, 0.0, 5.0))
+    assert [copy.name for copy in copies][:2] == ["transforms-lin-1-2", "transforms-lin-2-1"]
+    assert len(copies) == 5 and copies[-1].getTranslation() == pytest.approx((2.0, 1.0, 4.0))
+    rotated = assembly.RadialInstancePattern(("transforms",), 4, 360.0)
+    assert rotated[0].getTranslation() == pytest.approx((-1.0, -2.0, 3.0))
+    assembly.translate([copy.name for copy in copies], (0.0, 0.0, -1.0))
+    assert copies[-1].getTranslation() == pytest.approx((2.0, 1.0, 3.0))
+
+    # The mass properties of the instances are computed from those of the part, moved by each transform.
+    instances = (instance, *copies, *rotated)
+    properties = assembly.getMassProperties(regions=instances)
+    centers = np.array([copy._coordinates().mean(axis=0) for copy in instances])
+    assert properties["mass"] == pytest.approx(18.0) and properties["centerOfMass"] == pytest.approx(centers.mean(0))
@@ -0,0 +1,56 @@
+import pytest
+
+from abaqus import *
+from abaqus.Odb.OdbStep import OdbStep
+from abaqusConstants import *
+from odbAccess import *
+
+
+@pytest.mark.parametrize("prefetch", [0, 2, 10])
+def test_iter_frames(prefetch):
+    step = OdbStep(name="Step-1", description="", domain=TIME, timePeriod=1.0)
+    step.frames = []
+    for increment in range(5):
+        frame = step.Frame(incrementNumber=increment, frameValue=increment / 5)
+        frame.fieldOutputs = {}
+        frame.FieldOutput(name="U", description="Displacement", type=VECTOR)
+        if increment:
+            frame.FieldOutput(name="S", description="Stress", type=TENSOR_3D_FULL)
+
+    frames = list(step.iterFrames(("S",), prefetch=prefetch))
+    assert [frame for frame, _ in frames] == step.frames
+    assert [list(fields) for _, fields in frames] == [[]] + [["S"]] * 4
+    assert [list(fields) for _, fields in step.iterFrames(prefetch=prefetch)][:2] == [["U"], ["U", "S"]]
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_iter_frames_releases(prefetch):
+    import gc
+    import weakref
+
+    from abaqus.Odb.OdbFrame import OdbFrame
+    from abaqus.Odb.OdbFrameArray import OdbFrameSequence
+
+    def read(index):
+        frame = OdbFrame(incrementNumber=index, frameValue=index / 5)
+        frame.incrementNumber, frame.fieldOutputs = index, {}
+        frame.FieldOutput(name="U", description="Displacement", type=VECTOR)
+        return frame
+
+    step = OdbStep(name="Step-1", description="", domain=TIME, timePeriod=1.0)
+    step.frames = OdbFrameSequence(5, read)
+    references = []
+    for frame, fields in step.iterFrames(("U",), prefetch=prefetch):
+        gc.collect()
+        assert all(reference() is None for reference in references)
+        references.append(weakref.ref(fields["U"]))
+        assert frame.incrementNumber == len(references) - 1
+        del frame, fields
+    assert len(references) == 5 and step.frames[-1].incrementNumber == 4
+
+    step.frames = [read(index) for index in range(3)]
+    outputs = []
+    for frame, fields in step.iterFrames(release=ON):
+        assert all(not earlier.fieldOutputs for earlier in step.frames[: frame.incrementNumber])
+        outputs.append(fields["U"])
+    assert len(outputs) == 3 and all(frame.fieldOutputs == {} for frame in step.frames)
@@ -0,0 +1,46 @@
+import json
+
+from abqpy.sweep import grid, sample, sweep, sweep_key
+
+# A fake model script, which writes the product of its parameters to its results and fails if ``x`` is negative
+SCRIPT = """\
+import json, sys
+parameters = {name: float(value) for name, value in (arg.split("=") for arg in sys.argv[1:])}
+if parameters["x"] < 0:
+    sys.exit("negative x")
+with open("results.json", "w") as file:
+    json.dump({"product": parameters["x"] * parameters["y"]}, file)
+"""
+
+
+def test_grid_and_sample():
+    assert grid(x=[1, 2], y=[3]) == [{"x": 1, "y": 3}, {"x": 2, "y": 3}]
+    runs = sample(3, x=(0.0, 1.0))
+    assert len(runs) == 3 and all(0 <= run["x"] <= 1 for run in runs) and runs == sample(3, x=(0.0, 1.0))
+
+
+def test_sweep_cache(tmp_path):
+    script, cache = tmp_path / "model.py", str(tmp_path / "cache")
+    script.write_text(SCRIPT)
+    runs = grid(x=[1, 2, -1], y=[10, 20])
+
+    table = sweep(str(script), runs, cache=cache, workers=3)
+    assert [row["product"] for row in table if row["returncode"] == 0] == [10, 20, 20, 40]
+    assert not any(row["cached"] for row in table)
+    failed = [row for row in table if row["returncode"]]
+    assert len(failed) == 2 and all(row["directory"].endswith(".failed") and "product" not in row for row in failed)
+    with open(f"{failed[0]['directory']}/stderr.txt") as file:
+        assert file.read() == "negative x\n"
+    with open(f"{table[0]['directory']}/manifest.json") as file:
+        assert json.load(file)["parameters"] == {"x": 1, "y": 10}
+
+    # The successful runs are cached, the failed ones are run again
+    table = sweep(str(script), runs, cache=cache)
+    assert [row["cached"] for row in table] == [True] * 4 + [False] * 2
+    assert table[3]["product"] == 40
+
+    # The runs are keyed by the contents of the script
+    key = sweep_key(str(script), runs[0])
+    script.write_text(SCRIPT + "\n")
+    assert sweep_key(str(script), runs[0]) != key
+    assert not any(row["cached"] for row in sweep(str(script), runs[:1], cache=cache))